@@ -17,16 +17,98 @@
 
 """API client"""
 
+import asyncio
 import json
 import os
-from typing import Dict
+import threading
+from typing import Dict, Optional, Tuple
 
+import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .._shared_files.config import get_config
+
+# Long-lived sessions keyed by (dispatcher address, adapter id); these
+# are reset in forked children since sockets can't be shared across
+# processes.
+_sessions: Dict[Tuple[str, Optional[int]], requests.Session] = {}
+_sessions_lock = threading.Lock()
+_sessions_pid = os.getpid()
+
+# Responses with these status codes are retried for idempotent methods
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+def _connection_error_message(url: str) -> str:
+    return f"The Covalent server cannot be reached at {url}. Local servers can be started using `covalent start` in the terminal. If you are using a remote Covalent server, contact your systems administrator to report an outage."
+
+
+def _get_pool_settings() -> Tuple[int, int, float]:
+    """Returns (pool_size, retries, backoff_factor) from the SDK config."""
+    return (
+        int(get_config("sdk.http_pool_size")),
+        int(get_config("sdk.http_retries")),
+        float(get_config("sdk.http_backoff_factor")),
+    )
+
+
+def _default_adapter() -> HTTPAdapter:
+    pool_size, retries, backoff_factor = _get_pool_settings()
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+
+def _reset_sessions():
+    global _sessions_lock, _sessions_pid
+    # Don't close the parent's sessions; just forget them
+    _sessions.clear()
+    _sessions_lock = threading.Lock()
+    _sessions_pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sessions)
+
+
+def _get_session(dispatcher_addr: str, adapter: Optional[HTTPAdapter]) -> requests.Session:
+    """Get or create the pooled session for a dispatcher address."""
+
+    if os.getpid() != _sessions_pid:
+        _reset_sessions()
+
+    key = (dispatcher_addr, id(adapter) if adapter else None)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = adapter or _default_adapter()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+    return session
+
+
+def close_sessions():
+    """Close all pooled sessions in the current process."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
 
 
 class CovalentAPIClient:
-    """Thin wrapper around Requests to centralize error handling."""
+    """Thin wrapper around Requests to centralize error handling.
+
+    Requests to the same dispatcher address share a pooled
+    `requests.Session` with keep-alive and retries.
+    """
 
     def __init__(self, dispatcher_addr: str, adapter: HTTPAdapter = None, auto_raise: bool = True):
         self.dispatcher_addr = dispatcher_addr
@@ -41,112 +123,128 @@ class CovalentAPIClient:
         headers.update(extra_headers)
         return headers
 
-    def get(self, endpoint: str, **kwargs):
+    @property
+    def session(self) -> requests.Session:
+        return _get_session(self.dispatcher_addr, self.adapter)
+
+    def _request(self, method: str, endpoint: str, **kwargs):
         headers = self.prepare_headers(kwargs)
         url = self.dispatcher_addr + endpoint
         try:
-            with requests.Session() as session:
-                if self.adapter:
-                    session.mount("http://", self.adapter)
-                    session.mount("https://", self.adapter)
-
-                r = session.get(url, headers=headers, **kwargs)
+            r = getattr(self.session, method)(url, headers=headers, **kwargs)
 
             if self.auto_raise:
                 r.raise_for_status()
 
         except requests.exceptions.ConnectionError:
-            message = f"The Covalent server cannot be reached at {url}. Local servers can be started using `covalent start` in the terminal. If you are using a remote Covalent server, contact your systems administrator to report an outage."
-            print(message)
+            print(_connection_error_message(url))
             raise
 
         return r
 
+    def get(self, endpoint: str, **kwargs):
+        return self._request("get", endpoint, **kwargs)
+
     def patch(self, endpoint: str, **kwargs):
-        headers = self.prepare_headers(kwargs)
-        url = self.dispatcher_addr + endpoint
-        try:
-            with requests.Session() as session:
-                if self.adapter:
-                    session.mount("http://", self.adapter)
-                    session.mount("https://", self.adapter)
+        return self._request("patch", endpoint, **kwargs)
 
-                r = session.patch(url, headers=headers, **kwargs)
+    def put(self, endpoint: str, **kwargs):
+        return self._request("put", endpoint, **kwargs)
 
-            if self.auto_raise:
-                r.raise_for_status()
-        except requests.exceptions.ConnectionError:
-            message = f"The Covalent server cannot be reached at {url}. Local servers can be started using `covalent start` in the terminal. If you are using a remote Covalent server, contact your systems administrator to report an outage."
-            print(message)
-            raise
+    def post(self, endpoint: str, **kwargs):
+        return self._request("post", endpoint, **kwargs)
 
-        return r
+    def delete(self, endpoint: str, **kwargs):
+        return self._request("delete", endpoint, **kwargs)
 
-    def put(self, endpoint: str, **kwargs):
-        headers = self.prepare_headers(kwargs)
-        url = self.dispatcher_addr + endpoint
-        try:
-            with requests.Session() as session:
-                if self.adapter:
-                    session.mount("http://", self.adapter)
-                    session.mount("https://", self.adapter)
+    @classmethod
+    def get_extra_headers(headers: Dict) -> Dict:
+        # This is expected to be a JSONified dictionary
+        data = os.environ.get("COVALENT_EXTRA_HEADERS")
+        if data:
+            return json.loads(data)
+        else:
+            return {}
 
-                r = session.put(url, headers=headers, **kwargs)
 
-            if self.auto_raise:
-                r.raise_for_status()
-        except requests.exceptions.ConnectionError:
-            message = f"The Covalent server cannot be reached at {url}. Local servers can be started using `covalent start` in the terminal. If you are using a remote Covalent server, contact your systems administrator to report an outage."
-            print(message)
-            raise
+class AsyncCovalentAPIClient:
+    """Async counterpart of `CovalentAPIClient` for concurrent requests.
 
-        return r
+    Holds an `aiohttp.ClientSession` whose connector is limited to the
+    configured pool size. Use as an async context manager or call
+    `close()` when done.
 
-    def post(self, endpoint: str, **kwargs):
-        headers = self.prepare_headers(kwargs)
-        url = self.dispatcher_addr + endpoint
-        try:
-            with requests.Session() as session:
-                if self.adapter:
-                    session.mount("http://", self.adapter)
-                    session.mount("https://", self.adapter)
+    Response bodies are read before returning, so `await r.json()` and
+    `await r.read()` can be called after the connection is released.
+    """
 
-                r = session.post(url, headers=headers, **kwargs)
+    IDEMPOTENT_METHODS = {"GET", "PUT", "DELETE", "HEAD", "OPTIONS"}
 
-            if self.auto_raise:
-                r.raise_for_status()
-        except requests.exceptions.ConnectionError:
-            message = f"The Covalent server cannot be reached at {url}. Local servers can be started using `covalent start` in the terminal. If you are using a remote Covalent server, contact your systems administrator to report an outage."
-            print(message)
-            raise
+    def __init__(self, dispatcher_addr: str, auto_raise: bool = True):
+        self.dispatcher_addr = dispatcher_addr
+        self.auto_raise = auto_raise
+        self.pool_size, self.retries, self.backoff_factor = _get_pool_settings()
+        self._session = None
+        self._pid = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # Sessions can't be reused across a fork or after being closed
+        if self._session is None or self._session.closed or self._pid != os.getpid():
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._pid = os.getpid()
+        return self._session
+
+    async def _request(self, method: str, endpoint: str, **kwargs) -> aiohttp.ClientResponse:
+        headers = kwargs.pop("headers", {})
+        headers.update(CovalentAPIClient.get_extra_headers())
+        url = self.dispatcher_addr + endpoint
+
+        method = method.upper()
+        attempts = self.retries + 1 if method in self.IDEMPOTENT_METHODS else 1
+        for attempt in range(attempts):
+            try:
+                async with self.session.request(method, url, headers=headers, **kwargs) as r:
+                    await r.read()
+                if r.status in RETRY_STATUS_CODES and attempt < attempts - 1:
+                    await asyncio.sleep(self.backoff_factor * 2**attempt)
+                    continue
+                break
+            except aiohttp.ClientConnectionError:
+                if attempt < attempts - 1:
+                    await asyncio.sleep(self.backoff_factor * 2**attempt)
+                    continue
+                print(_connection_error_message(url))
+                raise
+
+        if self.auto_raise:
+            r.raise_for_status()
 
         return r
 
-    def delete(self, endpoint: str, **kwargs):
-        headers = self.prepare_headers(kwargs)
-        url = self.dispatcher_addr + endpoint
-        try:
-            with requests.Session() as session:
-                if self.adapter:
-                    session.mount("http://", self.adapter)
-                    session.mount("https://", self.adapter)
+    async def get(self, endpoint: str, **kwargs) -> aiohttp.ClientResponse:
+        return await self._request("get", endpoint, **kwargs)
 
-                r = session.delete(url, headers=headers, **kwargs)
+    async def patch(self, endpoint: str, **kwargs) -> aiohttp.ClientResponse:
+        return await self._request("patch", endpoint, **kwargs)
 
-            if self.auto_raise:
-                r.raise_for_status()
-        except requests.exceptions.ConnectionError:
-            message = f"The Covalent server cannot be reached at {url}. Local servers can be started using `covalent start` in the terminal. If you are using a remote Covalent server, contact your systems administrator to report an outage."
-            print(message)
-            raise
+    async def put(self, endpoint: str, **kwargs) -> aiohttp.ClientResponse:
+        return await self._request("put", endpoint, **kwargs)
 
-        return r
+    async def post(self, endpoint: str, **kwargs) -> aiohttp.ClientResponse:
+        return await self._request("post", endpoint, **kwargs)
 
-    @classmethod
-    def get_extra_headers(headers: Dict) -> Dict:
-        # This is expected to be a JSONified dictionary
-        data = os.environ.get("COVALENT_EXTRA_HEADERS")
-        if data:
-            return json.loads(data)
-        else:
-            return {}
+    async def delete(self, endpoint: str, **kwargs) -> aiohttp.ClientResponse:
+        return await self._request("delete", endpoint, **kwargs)
+
+    async def close(self):
+        if self._session is not None and self._pid == os.getpid():
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -15,24 +15,24 @@
 # limitations under the License.
 
 import base64
+import graphlib
+import io
 import os
 import tarfile
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from copy import deepcopy
 from functools import wraps
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 from .._api.apiclient import CovalentAPIClient as APIClient
 from .._file_transfer import FileTransfer
 from .._results_manager.result import Result
-from .._results_manager.results_manager import get_result, get_result_manager
-from .._serialize.result import (
-    extract_assets,
-    merge_response_manifest,
-    serialize_result,
-    strip_local_uris,
-)
+from .._results_manager.results_manager import cancel, get_result, get_result_manager
+from .._serialize.result import merge_response_manifest, serialize_result, strip_local_uris
 from .._shared_files import logger
 from .._shared_files.config import get_config
 from .._shared_files.schemas.asset import AssetSchema
@@ -128,6 +128,10 @@ class LocalDispatcher(BaseDispatcher):
 
         Returns:
             Wrapper function which takes the inputs of the workflow as arguments
+
+        If the `sdk.pipelined_dispatch` config option is enabled, the
+        workflow is started as soon as it is registered and its assets
+        are uploaded while the first tasks run.
         """
 
         # Extract triggers here
@@ -154,6 +158,11 @@ class LocalDispatcher(BaseDispatcher):
                 The dispatch id of the workflow.
             """
 
+            if not disable_run and get_config("sdk.pipelined_dispatch") == "true":
+                return LocalDispatcher.register(orig_lattice, dispatcher_addr, start=True)(
+                    *args, **kwargs
+                )
+
             dispatch_id = LocalDispatcher.register(orig_lattice, dispatcher_addr)(*args, **kwargs)
 
             if triggers_data:
@@ -170,6 +179,8 @@ class LocalDispatcher(BaseDispatcher):
     def register(
         orig_lattice: Lattice,
         dispatcher_addr: str = None,
+        *,
+        start: bool = False,
     ) -> Callable:
         """
         Wrapping the dispatching functionality to allow input passing
@@ -182,6 +193,11 @@ class LocalDispatcher(BaseDispatcher):
             orig_lattice: The lattice/workflow to send to the dispatcher server.
             dispatcher_addr: The address of the dispatcher server.  If None then then defaults to the address set in Covalent's config.
 
+        Kwargs:
+            start: Whether to start the dispatch before uploading its
+                assets. The server runs each task once its assets have
+                arrived. The dispatch is cancelled if an upload fails.
+
         Returns:
             Wrapper function which takes the inputs of the workflow as arguments
         """
@@ -223,7 +239,16 @@ class LocalDispatcher(BaseDispatcher):
                 with open(path, "w") as f:
                     f.write(manifest.model_dump_json())
 
-                LocalDispatcher.upload_assets(manifest)
+                if not start:
+                    LocalDispatcher.upload_assets(manifest)
+                    return dispatch_id
+
+                LocalDispatcher.start(dispatch_id, dispatcher_addr)
+                try:
+                    LocalDispatcher.upload_assets(manifest)
+                except Exception:
+                    cancel(dispatch_id, dispatcher_addr=dispatcher_addr)
+                    raise
 
                 return dispatch_id
 
@@ -522,28 +547,99 @@ class LocalDispatcher(BaseDispatcher):
         return merge_response_manifest(manifest, parsed_resp)
 
     @staticmethod
-    def upload_assets(manifest: ResultSchema):
-        assets = extract_assets(manifest)
-        LocalDispatcher._upload(assets)
+    def upload_assets(manifest: ResultSchema) -> Dict:
+        """Upload a manifest's assets.
+
+        Node assets are uploaded in topological order, followed by the
+        workflow assets, so that the earliest tasks of a running dispatch
+        can start first.
+        """
+        return LocalDispatcher._upload(_get_upload_order(manifest))
 
     @staticmethod
-    def _upload(assets: List[AssetSchema]):
+    def _upload(assets: List[AssetSchema]) -> Dict:
+        """Upload assets concurrently.
+
+        Assets without a local or remote URI are skipped, as are
+        zero-byte assets since the server creates those itself.
+
+        Returns:
+            A summary of the form {"uploaded": int, "skipped": int,
+            "bytes": int, "seconds": float}
+        """
+
         total = len(assets)
+        pending = [asset for asset in assets if asset.remote_uri and asset.uri and asset.size != 0]
+        num_skipped = total - len(pending)
+        app_log.debug(f"Skipping {num_skipped} out of {total} assets")
+
+        start_time = time.monotonic()
+        # More workers than pooled connections would only open and
+        # discard extra connections
+        max_workers = min(
+            int(get_config("sdk.asset_upload_workers")), int(get_config("sdk.http_pool_size"))
+        )
         number_uploaded = 0
-        for i, asset in enumerate(assets):
-            if not asset.remote_uri or not asset.uri:
-                app_log.debug(f"Skipping asset {i + 1} out of {total}")
-                continue
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as pool:
+            futures = [
+                pool.submit(_upload_asset, asset.uri, asset.remote_uri) for asset in pending
+            ]
+            try:
+                for fut in as_completed(futures):
+                    fut.result()
+                    number_uploaded += 1
+                    app_log.debug(f"Uploaded asset {number_uploaded} out of {len(pending)}.")
+            except Exception:
+                for fut in futures:
+                    fut.cancel()
+                raise
+
+        stats = {
+            "uploaded": number_uploaded,
+            "skipped": num_skipped,
+            "bytes": sum(asset.size for asset in pending),
+            "seconds": time.monotonic() - start_time,
+        }
+        app_log.debug(
+            f"uploaded {stats['uploaded']} assets ({stats['bytes']} bytes) "
+            f"in {stats['seconds']:.3f} seconds."
+        )
+        return stats
 
-            _upload_asset(asset.uri, asset.remote_uri)
-            number_uploaded += 1
-        app_log.debug(f"Uploaded asset {i + 1} out of {total}.")
-        app_log.debug(f"uploaded {number_uploaded} assets.")
+
+def _get_upload_order(manifest: ResultSchema) -> List[AssetSchema]:
+    tg = manifest.lattice.transport_graph
+    sorter = graphlib.TopologicalSorter({node.id: [] for node in tg.nodes})
+    for edge in tg.links:
+        sorter.add(edge.target, edge.source)
+
+    nodes = {node.id: node for node in tg.nodes}
+    assets = []
+    for node_id in sorter.static_order():
+        assets.extend(asset for _, asset in nodes[node_id].assets)
+
+    # Workflow-level assets aren't needed to run tasks
+    assets.extend(asset for _, asset in manifest.lattice.assets)
+    assets.extend(asset for _, asset in manifest.assets)
+    return assets
 
 
 def _upload_asset(local_uri, remote_uri):
-    _, ft = FileTransfer(local_uri, remote_uri).cp()
-    ft()
+    parsed = urlparse(remote_uri)
+    if parsed.scheme not in ("http", "https"):
+        _, ft = FileTransfer(local_uri, remote_uri).cp()
+        ft()
+        return
+
+    # Reuse the pooled connections to the upload host
+    session = APIClient(f"{parsed.scheme}://{parsed.netloc}").session
+    local_path = urlparse(local_uri).path
+    filesize = os.path.getsize(local_path)
+    with open(local_path, "rb") as f:
+        # Workaround for Requests bug when streaming from empty files
+        data = f.read() if filesize < 50 else f
+        r = session.put(remote_uri, headers={"Content-Length": str(filesize)}, data=data)
+    r.raise_for_status()
 
 
 # Archive staging directory and manifest
@@ -551,7 +647,8 @@ def _upload_asset(local_uri, remote_uri):
 # submit the sublattice to the control plane
 def pack_staging_dir(staging_dir, manifest: ResultSchema) -> str:
     # save manifest json to staging root
-    with open(os.path.join(staging_dir, "manifest.json"), "w") as f:
+    manifest_path = os.path.join(staging_dir, "manifest.json")
+    with open(manifest_path, "w") as f:
         f.write(manifest.model_dump_json())
 
     # Tar up staging dir
@@ -559,7 +656,17 @@ def pack_staging_dir(staging_dir, manifest: ResultSchema) -> str:
         tar_path = f.name
 
     with tarfile.TarFile(tar_path, "w") as tar:
-        tar.add(staging_dir, recursive=True)
+        # Archive the manifest first so that the tarball can be
+        # imported as a stream
+        manifest_info = tar.gettarinfo(manifest_path)
+        with open(manifest_path, "rb") as f:
+            tar.addfile(manifest_info, f)
+
+        tar.add(
+            staging_dir,
+            recursive=True,
+            filter=lambda info: None if info.name == manifest_info.name else info,
+        )
     return tar_path
 
 
@@ -581,31 +688,31 @@ def untar_staging_dir(tar_name) -> Tuple[str, ResultSchema]:
 
         tar.extractall(path=work_dir, filter="tar")
 
+    rewrite_staging_uris(manifest, work_dir)
+
+    return work_dir, manifest
+
+
+def rewrite_staging_uris(manifest: ResultSchema, work_dir: str) -> None:
+    """Point the asset URIs of a packed manifest into the directory where
+    the staging tarball is extracted."""
+
     # prepend work_dir to each asset path
     scheme_prefix = "file://"
-    for _, asset in manifest.assets:
-        if asset.uri:
-            path = asset.uri[len(scheme_prefix) :]
-            asset.uri = f"{scheme_prefix}{work_dir}{path}"
-            print("Rewrote asset uri ", asset.uri)
-    for _, asset in manifest.lattice.assets:
+    assets = [asset for _, asset in manifest.assets]
+    assets.extend(asset for _, asset in manifest.lattice.assets)
+    for node in manifest.lattice.transport_graph.nodes:
+        assets.extend(asset for _, asset in node.assets)
+
+    for asset in assets:
         if asset.uri:
             path = asset.uri[len(scheme_prefix) :]
             asset.uri = f"{scheme_prefix}{work_dir}{path}"
-            print("Rewrote asset uri ", asset.uri)
-
-    for node in manifest.lattice.transport_graph.nodes:
-        for _, asset in node.assets:
-            if asset.uri:
-                path = asset.uri[len(scheme_prefix) :]
-                asset.uri = f"{scheme_prefix}{work_dir}{path}"
-                print("Rewrote asset uri ", asset.uri)
-
-    return work_dir, manifest
+            app_log.debug(f"Rewrote asset uri {asset.uri}")
 
 
 # Consumed by server-side tarball importer (`import_b64_staging_tarball`)
-# TODO: support streaming decode to avoid having to load the entire buffer in mem
+# Prefer `b64_decode_stream` for large tarballs
 def decode_b64_tar(b64_buffer: str) -> str:
     with tempfile.NamedTemporaryFile(suffix=".tar") as tar_file:
         tar_path = tar_file.name
@@ -614,3 +721,54 @@ def decode_b64_tar(b64_buffer: str) -> str:
         tar_file.write(base64.b64decode(b64_buffer.encode("utf-8")))
 
     return tar_path
+
+
+class _B64DecodingReader(io.RawIOBase):
+    """Raw stream of the data decoded from chunks of base64 text."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        # Undecoded text which doesn't fill a 4-character group
+        self._tail = b""
+        self._decoded = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def _decode_next(self) -> bool:
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            if not self._tail:
+                return False
+            # Raises on truncated input
+            encoded, self._tail = self._tail, b""
+        else:
+            data = self._tail + chunk
+            split = len(data) - len(data) % 4
+            encoded, self._tail = data[:split], data[split:]
+        self._decoded = memoryview(base64.b64decode(encoded))
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._decoded:
+            if not self._decode_next():
+                return 0
+        n = min(len(b), len(self._decoded))
+        b[:n] = self._decoded[:n]
+        self._decoded = self._decoded[n:]
+        return n
+
+
+# Consumed by server-side tarball importer (`import_staging_tarball_stream`)
+def b64_decode_stream(chunks: Iterable[bytes]) -> io.BufferedReader:
+    """Decode base64 text incrementally.
+
+    Args:
+        chunks: The base64-encoded data in chunks of any size.
+
+    Returns:
+        A file-like object from which the decoded data can be read
+        without holding all of it in memory.
+    """
+
+    return io.BufferedReader(_B64DecodingReader(chunks))
@@ -15,6 +15,7 @@
 # limitations under the License.
 
 """Result object."""
+
 import os
 import re
 from datetime import datetime
@@ -92,6 +93,9 @@ class Result:
 
         self._result = None
 
+        # Resolves deferred outputs on first access (see `get_result(lazy=True)`)
+        self._asset_loader = None
+
         self._num_nodes = -1
 
         self._error = None
@@ -201,6 +205,8 @@ Node Outputs
         """
         Encoded final result of current dispatch
         """
+        if self._result is None and self._asset_loader is not None:
+            self._result = self._asset_loader.load_result()
         return self._result
 
     @property
@@ -209,7 +215,8 @@ Node Outputs
         Final result of current dispatch.
         """
 
-        return self._result.get_deserialized() if self._result is not None else None
+        encoded_result = self.encoded_result
+        return encoded_result.get_deserialized() if encoded_result is not None else None
 
     @property
     def inputs(self) -> dict:
@@ -379,7 +386,10 @@ Node Outputs
         Returns:
             The output of said node. Will return None if error occurred in execution.
         """
-        return self._lattice.transport_graph.get_node_value(node_id, "output")
+        output = self._lattice.transport_graph.get_node_value(node_id, "output")
+        if output is None and self._asset_loader is not None:
+            output = self._asset_loader.load_node_output(node_id)
+        return output
 
     def _get_node_error(self, node_id: int) -> Union[None, str]:
         """
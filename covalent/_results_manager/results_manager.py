@@ -19,13 +19,19 @@ from __future__ import annotations
 
 import contextlib
 import os
+import shutil
+import tarfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
+from urllib.parse import urlparse
 
 from .._api.apiclient import CovalentAPIClient
 from .._file_transfer import FileTransfer
-from .._serialize.common import load_asset
+from .._serialize.common import AssetType, load_asset
 from .._serialize.electron import ASSET_FILENAME_MAP as ELECTRON_ASSET_FILENAMES
 from .._serialize.electron import ASSET_TYPES as ELECTRON_ASSET_TYPES
 from .._serialize.lattice import ASSET_FILENAME_MAP as LATTICE_ASSET_FILENAMES
@@ -66,6 +72,11 @@ DEFERRED_KEYS = {
     "result",
 }
 
+ASSET_CACHE_SIZE = get_config("sdk.asset_memory_cache_size")
+
+# Directory under results_dir holding digest-addressed asset downloads
+ASSET_CACHE_DIR = ".asset_cache"
+
 
 def _delete_result(
     dispatch_id: str,
@@ -193,11 +204,15 @@ def _get_default_assets(rm: ResultManager):
     tg.lattice_metadata = rm.result_object.lattice.metadata
     rm.result_object.lattice.__doc__ = rm.result_object.lattice.__dict__.pop("doc")
 
-    for key in ELECTRON_ASSET_TYPES.keys():
-        if key not in DEFERRED_KEYS:
-            for node_id in tg._graph.nodes:
-                rm.download_node_asset(node_id, key)
-                rm.load_node_asset(node_id, key)
+    node_assets = [
+        (node_id, key)
+        for key in ELECTRON_ASSET_TYPES.keys()
+        if key not in DEFERRED_KEYS
+        for node_id in tg._graph.nodes
+    ]
+    rm.download_node_assets(node_assets)
+    for node_id, key in node_assets:
+        rm.load_node_asset(node_id, key)
 
 
 # Functions for computing local URIs
@@ -257,6 +272,83 @@ def _download_node_asset(manifest: dict, results_dir: str, node_id: int, key: st
         node_assets[key]["uri"] = f"file://{local_path}"
 
 
+def _download_node_asset_bundle(
+    api_client: CovalentAPIClient,
+    manifest: dict,
+    results_dir: str,
+    node_assets: List[Tuple[int, str]],
+):
+    dispatch_id = manifest["metadata"]["dispatch_id"]
+    nodes = manifest["lattice"]["transport_graph"]["nodes"]
+    requested = {f"node_{node_id}/{key}": (node_id, key) for node_id, key in node_assets}
+
+    endpoint = f"{BASE_ENDPOINT}/{dispatch_id}/electrons/assets/bundle"
+    body = {"assets": [{"node_id": node_id, "key": key} for node_id, key in node_assets]}
+    with api_client.post(endpoint, json=body, stream=True) as r:
+        # Fall back to individual downloads for servers without the
+        # bundle endpoint
+        if r.status_code in (404, 405):
+            app_log.debug(f"Asset bundles unavailable for {dispatch_id}, downloading singly")
+            for node_id, key in node_assets:
+                _download_node_asset(manifest, results_dir, node_id, key)
+            return
+
+        r.raise_for_status()
+        with tarfile.open(fileobj=r.raw, mode="r|") as tar:
+            for member in tar:
+                if member.name not in requested or not member.isfile():
+                    continue
+                node_id, key = requested[member.name]
+                local_path = get_node_asset_path(results_dir, node_id, key)
+                with tar.extractfile(member) as src, open(local_path, "wb") as dest:
+                    shutil.copyfileobj(src, dest)
+                nodes[node_id]["assets"][key]["uri"] = f"file://{local_path}"
+
+
+def _download_node_assets(
+    manifest: dict,
+    results_dir: str,
+    node_assets: List[Tuple[int, str]],
+    dispatcher_addr: str,
+):
+    """Download many electron assets concurrently.
+
+    Assets served over HTTP by the dispatcher are fetched in batches
+    through the bundle endpoint; any others are downloaded individually.
+    """
+
+    nodes = manifest["lattice"]["transport_graph"]["nodes"]
+    bundled = []
+    singles = []
+    for node_id, key in node_assets:
+        asset = nodes[node_id]["assets"][key]
+        if not asset["size"] > 0:
+            continue
+        if urlparse(asset["remote_uri"]).scheme in ("http", "https"):
+            bundled.append((node_id, key))
+        else:
+            singles.append((node_id, key))
+
+    batch_size = max(int(get_config("sdk.asset_download_batch_size")), 1)
+    batches = [bundled[i : i + batch_size] for i in range(0, len(bundled), batch_size)]
+    if not batches and not singles:
+        return
+
+    api_client = CovalentAPIClient(dispatcher_addr, auto_raise=False)
+    max_workers = max(int(get_config("sdk.asset_download_workers")), 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(_download_node_asset_bundle, api_client, manifest, results_dir, batch)
+            for batch in batches
+        ]
+        futures.extend(
+            pool.submit(_download_node_asset, manifest, results_dir, node_id, key)
+            for node_id, key in singles
+        )
+        for fut in futures:
+            fut.result()
+
+
 def _load_result_asset(manifest: dict, key: str):
     asset_meta = AssetSchema(**manifest["assets"][key])
     return load_asset(asset_meta, RESULT_ASSET_TYPES[key])
@@ -273,11 +365,79 @@ def _load_node_asset(manifest: dict, node_id: int, key: str):
     return load_asset(asset_meta, ELECTRON_ASSET_TYPES[key])
 
 
+# Deserialized assets keyed by their digest-addressed cache path
+@lru_cache(maxsize=ASSET_CACHE_SIZE)
+def _load_cached_asset(path: str, size: int, data_type: AssetType) -> Any:
+    return load_asset(AssetSchema(uri=f"file://{path}", size=size), data_type)
+
+
+class LazyAssetLoader:
+    """Resolves a result's deferred outputs on first access.
+
+    Downloads are stored under `results_dir` by digest, so they are reused
+    across `get_result` calls, and deserialized values are kept in a
+    bounded in-memory LRU.
+    """
+
+    def __init__(
+        self, manifest: dict, results_dir: str, *, result: bool = True, outputs: bool = True
+    ):
+        self._manifest = manifest
+        self._results_dir = results_dir
+        self._load_result = result
+        self._load_outputs = outputs
+
+    def load_result(self) -> Any:
+        if not self._load_result:
+            return None
+        return self._load(self._manifest["assets"]["result"], RESULT_ASSET_TYPES["result"])
+
+    def load_node_output(self, node_id: int) -> Any:
+        if not self._load_outputs:
+            return None
+        node = self._manifest["lattice"]["transport_graph"]["nodes"][node_id]
+        return self._load(node["assets"]["output"], ELECTRON_ASSET_TYPES["output"])
+
+    def _load(self, asset: dict, data_type: AssetType) -> Any:
+        if not asset["size"]:
+            return None
+        if not asset["digest"]:
+            return self._load_uncached(asset, data_type)
+
+        cache_dir = os.path.join(self._results_dir, ASSET_CACHE_DIR)
+        path = os.path.join(cache_dir, f"{asset['digest_alg']}-{asset['digest']}")
+        if not os.path.exists(path):
+            os.makedirs(cache_dir, exist_ok=True)
+            # Download to a private file first so that concurrent readers
+            # never observe a partial asset
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            download_asset(asset["remote_uri"], tmp_path)
+            os.replace(tmp_path, path)
+
+        return _load_cached_asset(path, asset["size"], data_type)
+
+    def _load_uncached(self, asset: dict, data_type: AssetType) -> Any:
+        # Assets without a digest can't be cached by content
+        os.makedirs(self._results_dir, exist_ok=True)
+        tmp_path = os.path.join(
+            self._results_dir, f"asset.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            download_asset(asset["remote_uri"], tmp_path)
+            return load_asset(AssetSchema(uri=f"file://{tmp_path}", size=asset["size"]), data_type)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+
 class ResultManager:
-    def __init__(self, manifest: ResultSchema, results_dir: str):
+    def __init__(
+        self, manifest: ResultSchema, results_dir: str, dispatcher_addr: Optional[str] = None
+    ):
         self.result_object = deserialize_result(manifest)
         self._manifest = manifest.model_dump()
         self._results_dir = results_dir
+        self._dispatcher_addr = dispatcher_addr
 
         # Compute Result._error message from electron statuses
         tg = manifest.lattice.transport_graph
@@ -308,6 +468,10 @@ class ResultManager:
     def download_node_asset(self, node_id: int, key: str):
         _download_node_asset(self._manifest, self._results_dir, node_id, key)
 
+    def download_node_assets(self, node_assets: List[Tuple[int, str]]):
+        dispatcher_addr = self._dispatcher_addr or format_server_url()
+        _download_node_assets(self._manifest, self._results_dir, node_assets, dispatcher_addr)
+
     def load_result_asset(self, key: str):
         data = _load_result_asset(self._manifest, key)
         if data is not None:
@@ -351,7 +515,7 @@ class ResultManager:
         # sort the nodes
         manifest.lattice.transport_graph.nodes.sort(key=lambda x: x.id)
 
-        rm = ResultManager(manifest, results_dir)
+        rm = ResultManager(manifest, results_dir, dispatcher_addr)
         result_object = rm.result_object
         result_object._results_dir = results_dir
         Path(results_dir).mkdir(parents=True, exist_ok=True)
@@ -380,6 +544,7 @@ def _get_result_multistage(
     workflow_output: bool = True,
     intermediate_outputs: bool = True,
     sublattice_results: bool = True,
+    lazy: bool = False,
 ) -> Result:
     """
     Get the results of a dispatch from a file.
@@ -396,6 +561,7 @@ def _get_result_multistage(
         workflow_output: Whether to return the workflow output. Defaults to True.
         intermediate_outputs: Whether to return all intermediate outputs in the compute graph. Defaults to True.
         sublattice_results: Whether to recursively retrieve sublattice results. Default is True.
+        lazy: Whether to defer downloading the workflow and intermediate outputs until they are first accessed. Default is False.
 
     Returns:
         The Result object from the Covalent server
@@ -414,35 +580,56 @@ def _get_result_multistage(
         rm = get_result_manager(dispatch_id, results_dir, wait, dispatcher_addr)
         _get_default_assets(rm)
 
-        if workflow_output:
+        if lazy:
+            rm.result_object._asset_loader = LazyAssetLoader(
+                rm._manifest,
+                rm._results_dir,
+                result=workflow_output,
+                outputs=intermediate_outputs,
+            )
+
+        if workflow_output and not lazy:
             rm.download_result_asset("result")
             rm.load_result_asset("result")
 
-        if intermediate_outputs:
+        if intermediate_outputs and not lazy:
             tg = rm.result_object.lattice.transport_graph
-            for node_id in tg._graph.nodes:
-                rm.download_node_asset(node_id, "output")
-                rm.load_node_asset(node_id, "output")
+            outputs = [(node_id, "output") for node_id in tg._graph.nodes]
+            rm.download_node_assets(outputs)
+            for node_id, key in outputs:
+                rm.load_node_asset(node_id, key)
 
         # Fetch sublattice result objects recursively
         tg = rm.result_object.lattice.transport_graph
+        sub_dispatches = {}
         for node_id in tg._graph.nodes:
             sub_dispatch_id = tg.get_node_value(node_id, "sub_dispatch_id")
             if sublattice_results and sub_dispatch_id:
-                sub_result = _get_result_multistage(
-                    sub_dispatch_id,
-                    wait,
-                    dispatcher_addr,
-                    status_only,
-                    results_dir=results_dir,
-                    workflow_output=workflow_output,
-                    intermediate_outputs=intermediate_outputs,
-                    sublattice_results=sublattice_results,
-                )
-                tg.set_node_value(node_id, "sublattice_result", sub_result)
+                sub_dispatches[node_id] = sub_dispatch_id
             else:
                 tg.set_node_value(node_id, "sublattice_result", None)
 
+        if sub_dispatches:
+            max_workers = max(int(get_config("sdk.asset_download_workers")), 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    node_id: pool.submit(
+                        _get_result_multistage,
+                        sub_dispatch_id,
+                        wait,
+                        dispatcher_addr,
+                        status_only,
+                        results_dir=results_dir,
+                        workflow_output=workflow_output,
+                        intermediate_outputs=intermediate_outputs,
+                        sublattice_results=sublattice_results,
+                        lazy=lazy,
+                    )
+                    for node_id, sub_dispatch_id in sub_dispatches.items()
+                }
+                for node_id, fut in futures.items():
+                    tg.set_node_value(node_id, "sublattice_result", fut.result())
+
     except MissingLatticeRecordError as ex:
         app_log.warning(
             f"Dispatch ID {dispatch_id} was not found in the database. Incorrect dispatch id."
@@ -463,6 +650,7 @@ def get_result(
     workflow_output: bool = True,
     intermediate_outputs: bool = True,
     sublattice_results: bool = True,
+    lazy: bool = False,
 ) -> Result:
     """
     Get the results of a dispatch.
@@ -478,6 +666,7 @@ def get_result(
         workflow_output: Whether to return the workflow output. Defaults to True.
         intermediate_outputs: Whether to return all intermediate outputs in the compute graph. Defaults to True.
         sublattice_results: Whether to recursively retrieve sublattice results. Default is True.
+        lazy: Whether to defer downloading the workflow and intermediate outputs until they are first accessed. Default is False.
 
     Returns:
         The Result object from the Covalent server
@@ -492,4 +681,5 @@ def get_result(
         workflow_output=workflow_output,
         intermediate_outputs=intermediate_outputs,
         sublattice_results=sublattice_results,
+        lazy=lazy,
     )
@@ -14,13 +14,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-""" Serialization/Deserialization methods for Assets """
+"""Serialization/Deserialization methods for Assets"""
 
 import hashlib
 import json
+import os
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, Optional
 
 import cloudpickle
 
@@ -119,15 +121,27 @@ def _sha1_asset(data: bytes) -> str:
     return hashlib.sha1(data).hexdigest()
 
 
-def save_asset(data: Any, data_type: AssetType, storage_path: str, filename: str) -> AssetSchema:
+def save_asset(
+    data: Any,
+    data_type: AssetType,
+    storage_path: str,
+    filename: str,
+    known_assets: Optional[Dict[str, str]] = None,
+) -> AssetSchema:
     """
     Save the asset data to the storage path
 
+    Empty assets are described by their digest and size without
+    writing a file.
+
     Args:
         data: Data to save
         data_type: Type of the Asset data to save
         storage_path: Path to save the data to
         filename: Name of the file to save the data to
+        known_assets: Optional mapping from digest to the URI of saved
+            data. Identical data is referenced rather than written again,
+            and new data is added to the mapping.
 
     Returns:
         AssetSchema object containing metadata about the saved data
@@ -141,14 +155,37 @@ def save_asset(data: Any, data_type: AssetType, storage_path: str, filename: str
 
     serialized = serialize_asset(data, data_type)
     digest = _sha1_asset(serialized)
-    path = Path(storage_path) / filename
-    path = path.resolve()
-    with open(path, "wb") as f:
-        f.write(serialized)
+    if not serialized:
+        return AssetSchema(digest_alg=CHECKSUM_ALGORITHM, digest=digest, size=0)
+
+    path = os.path.join(_resolve_dir(str(storage_path)), filename)
     uri = f"{scheme}://{path}"
+
+    # Atomic, so concurrent writers of the same data agree on one file
+    if known_assets is not None:
+        known_uri = known_assets.setdefault(digest, uri)
+        if known_uri != uri:
+            return AssetSchema(
+                digest_alg=CHECKSUM_ALGORITHM, digest=digest, size=len(serialized), uri=known_uri
+            )
+
+    # Directories are only created for assets which are written
+    try:
+        f = open(path, "wb")
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        f = open(path, "wb")
+    with f:
+        f.write(serialized)
     return AssetSchema(digest_alg=CHECKSUM_ALGORITHM, digest=digest, size=len(serialized), uri=uri)
 
 
+@lru_cache(maxsize=1024)
+def _resolve_dir(storage_path: str) -> str:
+    # Assets are usually saved in batches to the same directory
+    return str(Path(storage_path).resolve())
+
+
 def load_asset(asset_meta: AssetSchema, data_type: AssetType) -> Any:
     """
     Load the asset data from the storage path
@@ -166,7 +203,9 @@ def load_asset(asset_meta: AssetSchema, data_type: AssetType) -> Any:
     uri = asset_meta.uri
 
     if not uri:
-        return None
+        # Empty assets are saved without a file
+        empty = asset_meta.digest and asset_meta.size == 0
+        return deserialize_asset(b"", data_type) if empty else None
 
     path = uri[len(scheme_prefix) :] if uri.startswith(scheme_prefix) else uri
 
@@ -16,7 +16,7 @@
 
 """Functions to convert node -> ElectronSchema"""
 
-from typing import Dict
+from typing import Dict, Optional
 
 from .._shared_files.schemas.electron import (
     ASSET_FILENAME_MAP,
@@ -51,6 +51,7 @@ def _serialize_node_metadata(node_attrs: dict, node_storage_path: str) -> Electr
     name = node_attrs["name"]
     executor = node_attrs["metadata"]["executor"]
     executor_data = node_attrs["metadata"]["executor_data"]
+    inline = node_attrs["metadata"].get("inline", False)
 
     # Optional
     status = node_attrs.get("status", RESULT_STATUS.NEW_OBJECT)
@@ -68,6 +69,7 @@ def _serialize_node_metadata(node_attrs: dict, node_storage_path: str) -> Electr
         name=name,
         executor=executor,
         executor_data=executor_data,
+        inline=inline,
         status=str(status),
         start_time=start_time,
         end_time=end_time,
@@ -75,7 +77,7 @@ def _serialize_node_metadata(node_attrs: dict, node_storage_path: str) -> Electr
 
 
 def _deserialize_node_metadata(meta: ElectronMetadata) -> dict:
-    return {
+    node_attrs = {
         "task_group_id": meta.task_group_id,
         "name": meta.name,
         "status": Status(meta.status),
@@ -87,15 +89,21 @@ def _deserialize_node_metadata(meta: ElectronMetadata) -> dict:
             "executor_data": meta.executor_data,
         },
     }
+    if meta.inline:
+        node_attrs["metadata"]["inline"] = True
+    return node_attrs
 
 
-def _serialize_node_assets(node_attrs: dict, node_storage_path: str) -> ElectronAssets:
+def _serialize_node_assets(
+    node_attrs: dict, node_storage_path: str, known_assets: Optional[Dict[str, str]] = None
+) -> ElectronAssets:
     function = node_attrs["function"]
     function_asset = save_asset(
         function,
         ASSET_TYPES["function"],
         node_storage_path,
         ASSET_FILENAME_MAP["function"],
+        known_assets,
     )
 
     function_string = node_attrs.get("function_string", None)
@@ -104,6 +112,7 @@ def _serialize_node_assets(node_attrs: dict, node_storage_path: str) -> Electron
         ASSET_TYPES["function_string"],
         node_storage_path,
         ASSET_FILENAME_MAP["function_string"],
+        known_assets,
     )
 
     node_value = node_attrs.get("value", None)
@@ -112,6 +121,7 @@ def _serialize_node_assets(node_attrs: dict, node_storage_path: str) -> Electron
         ASSET_TYPES["value"],
         node_storage_path,
         ASSET_FILENAME_MAP["value"],
+        known_assets,
     )
 
     node_output = node_attrs.get("output", None)
@@ -120,6 +130,7 @@ def _serialize_node_assets(node_attrs: dict, node_storage_path: str) -> Electron
         ASSET_TYPES["output"],
         node_storage_path,
         ASSET_FILENAME_MAP["output"],
+        known_assets,
     )
 
     node_stdout = node_attrs.get("stdout", None)
@@ -128,6 +139,7 @@ def _serialize_node_assets(node_attrs: dict, node_storage_path: str) -> Electron
         ASSET_TYPES["stdout"],
         node_storage_path,
         ASSET_FILENAME_MAP["stdout"],
+        known_assets,
     )
 
     node_stderr = node_attrs.get("stderr", None)
@@ -136,6 +148,7 @@ def _serialize_node_assets(node_attrs: dict, node_storage_path: str) -> Electron
         ASSET_TYPES["stderr"],
         node_storage_path,
         ASSET_FILENAME_MAP["stderr"],
+        known_assets,
     )
 
     node_error = node_attrs.get("error", None)
@@ -144,11 +157,16 @@ def _serialize_node_assets(node_attrs: dict, node_storage_path: str) -> Electron
         ASSET_TYPES["error"],
         node_storage_path,
         ASSET_FILENAME_MAP["error"],
+        known_assets,
     )
 
     hooks = node_attrs["metadata"]["hooks"]
     hooks_asset = save_asset(
-        hooks, ASSET_TYPES["hooks"], node_storage_path, ASSET_FILENAME_MAP["hooks"]
+        hooks,
+        ASSET_TYPES["hooks"],
+        node_storage_path,
+        ASSET_FILENAME_MAP["hooks"],
+        known_assets,
     )
     return ElectronAssets(
         function=function_asset,
@@ -192,9 +210,14 @@ def _get_node_custom_assets(node_attrs: dict) -> Dict[str, AssetSchema]:
         return {key: AssetSchema(size=0) for key in node_attrs["metadata"]["custom_asset_keys"]}
 
 
-def serialize_node(node_id: int, node_attrs: dict, node_storage_path) -> ElectronSchema:
+def serialize_node(
+    node_id: int,
+    node_attrs: dict,
+    node_storage_path,
+    known_assets: Optional[Dict[str, str]] = None,
+) -> ElectronSchema:
     meta = _serialize_node_metadata(node_attrs, node_storage_path)
-    assets = _serialize_node_assets(node_attrs, node_storage_path)
+    assets = _serialize_node_assets(node_attrs, node_storage_path, known_assets)
     assets._custom = _get_node_custom_assets(node_attrs)
     return ElectronSchema(id=node_id, metadata=meta, assets=assets)
 
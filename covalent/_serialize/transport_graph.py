@@ -16,12 +16,13 @@
 
 """Functions to convert tg -> TransportGraphSchema"""
 
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 
 import networkx as nx
 
+from .._shared_files.config import get_config
 from .._shared_files.schemas.edge import EdgeMetadata, EdgeSchema
 from .._shared_files.schemas.electron import ElectronSchema
 from .._shared_files.schemas.transport_graph import TransportGraphSchema
@@ -79,6 +80,10 @@ def _serialize_nodes(g: nx.MultiDiGraph, storage_path: str) -> List[ElectronSche
     """
     Serialize nodes in a graph
 
+    Nodes are serialized concurrently since most of the work is file
+    I/O and hashing. Identical assets, such as the functions of
+    electrons called repeatedly, are written once and shared.
+
     Args:
         g: NetworkX graph
         storage_path: Path to store serialized object
@@ -88,13 +93,20 @@ def _serialize_nodes(g: nx.MultiDiGraph, storage_path: str) -> List[ElectronSche
 
     """
 
-    results = []
     base_path = Path(storage_path)
-    for i in g.nodes:
+    known_assets = {}
+
+    def _serialize(i: int) -> ElectronSchema:
+        # The node directory is created when the first asset is written
         node_storage_path = base_path / f"node_{i}"
-        os.mkdir(node_storage_path)
-        results.append(serialize_node(i, g.nodes[i], node_storage_path))
-    return results
+        return serialize_node(i, g.nodes[i], node_storage_path, known_assets)
+
+    max_workers = int(get_config("sdk.manifest_serialize_workers"))
+    if max_workers <= 1:
+        return [_serialize(i) for i in g.nodes]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_serialize, g.nodes))
 
 
 def _serialize_edges(g: nx.MultiDiGraph) -> List[EdgeSchema]:
@@ -67,6 +67,33 @@ def get_default_sdk_config():
             + "/covalent/dispatches"
         ),
         "task_packing": "true" if os.environ.get("COVALENT_ENABLE_TASK_PACKING") else "false",
+        # Pack chains of electrons with the same executor into task
+        # groups when building the graph
+        "auto_task_packing": "true" if os.environ.get("COVALENT_AUTO_TASK_PACKING") else "false",
+        "auto_task_packing_max_size": int(
+            os.environ.get("COVALENT_AUTO_TASK_PACKING_MAX_SIZE", 16)
+        ),
+        # Max pooled connections per dispatcher address
+        "http_pool_size": int(os.environ.get("COVALENT_HTTP_POOL_SIZE", 10)),
+        "http_retries": int(os.environ.get("COVALENT_HTTP_RETRIES", 3)),
+        "http_backoff_factor": float(os.environ.get("COVALENT_HTTP_BACKOFF_FACTOR", 0.1)),
+        # Number of assets to upload concurrently when submitting a workflow
+        "asset_upload_workers": int(os.environ.get("COVALENT_ASSET_UPLOAD_WORKERS", 16)),
+        # Threads writing and hashing electron assets when building a manifest
+        "manifest_serialize_workers": int(
+            os.environ.get("COVALENT_MANIFEST_SERIALIZE_WORKERS", 8)
+        ),
+        # Start dispatches as soon as they are registered and upload
+        # assets in topological order while the first tasks run
+        "pipelined_dispatch": "true" if os.environ.get("COVALENT_PIPELINED_DISPATCH") else "false",
+        # Electron assets fetched per bundle request and concurrent
+        # downloads when retrieving results
+        "asset_download_batch_size": int(
+            os.environ.get("COVALENT_ASSET_DOWNLOAD_BATCH_SIZE", 1000)
+        ),
+        "asset_download_workers": int(os.environ.get("COVALENT_ASSET_DOWNLOAD_WORKERS", 4)),
+        # Max deserialized assets kept in memory for lazily loaded results
+        "asset_memory_cache_size": int(os.environ.get("COVALENT_ASSET_MEMORY_CACHE_SIZE", 128)),
         "results_dir": os.environ.get(
             "COVALENT_RESULTS_DIR"
         )  # COVALENT_RESULTS_DIR is where the client downloads workflow artifacts during get_result() which is different from COVALENT_DATA_DIR
@@ -112,6 +139,34 @@ def get_default_dispatcher_config():
         ),
         "use_async_dispatcher": os.environ.get("COVALENT_USE_ASYNC_DISPATCHER", "true") or "false",
         "asset_cache_size": int(os.environ.get("COVALENT_ASSET_CACHE_SIZE", 32)),
+        # Algorithm for digests of stored assets (sha1, blake3, xxh3_128, ...)
+        "asset_digest_algorithm": os.environ.get("COVALENT_ASSET_DIGEST_ALGORITHM", "sha1"),
+        # Store identical workflow assets once in a content-addressed blob store
+        "asset_dedup": "true" if os.environ.get("COVALENT_ASSET_DEDUP") else "false",
+        # Worker threads copying reused assets of redispatches
+        "asset_copy_workers": int(os.environ.get("COVALENT_ASSET_COPY_WORKERS", 8)),
+        # Don't store outputs consumed only within their task group
+        "discard_internal_outputs": (
+            "true" if os.environ.get("COVALENT_DISCARD_INTERNAL_OUTPUTS") else "false"
+        ),
+        # Max number of node status events to coalesce; 1 disables batching
+        "event_batch_size": int(os.environ.get("COVALENT_EVENT_BATCH_SIZE", 1)),
+        # Max seconds to wait for a batch to fill up
+        "event_batch_linger": float(os.environ.get("COVALENT_EVENT_BATCH_LINGER", 0.01)),
+        # Max number of dispatches whose DAL result objects are cached
+        "result_object_cache_size": int(os.environ.get("COVALENT_RESULT_OBJECT_CACHE_SIZE", 256)),
+        # Datastore worker threads (ignored for SQLite, which uses one thread)
+        "datastore_read_workers": int(os.environ.get("COVALENT_DATASTORE_READ_WORKERS", 8)),
+        # Number of sequential write lanes; writes are routed by dispatch id
+        "datastore_write_workers": int(os.environ.get("COVALENT_DATASTORE_WRITE_WORKERS", 4)),
+        # Evaluate built-in nodes such as getitem and postprocessing in the dispatcher
+        "inline_tasks": "true" if os.environ.get("COVALENT_ENABLE_INLINE_TASKS") else "false",
+        # Max number of idle executor instances kept for reuse; 0 disables pooling
+        "executor_pool_size": int(os.environ.get("COVALENT_EXECUTOR_POOL_SIZE", 32)),
+        # Seconds after which idle pooled executor instances are dropped
+        "executor_pool_idle_timeout": float(
+            os.environ.get("COVALENT_EXECUTOR_POOL_IDLE_TIMEOUT", 300)
+        ),
     }
 
 
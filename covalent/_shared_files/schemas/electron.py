@@ -33,6 +33,7 @@ ELECTRON_METADATA_KEYS = {
     # user dependent metadata
     "executor",
     "executor_data",
+    "inline",
 }
 
 ELECTRON_ASSET_KEYS = {
@@ -92,6 +93,7 @@ class ElectronMetadata(BaseModel):
     name: str
     executor: str
     executor_data: dict
+    inline: bool = False
     sub_dispatch_id: Optional[str] = None
     status: StatusEnum
     start_time: Optional[datetime] = None
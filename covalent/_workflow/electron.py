@@ -74,6 +74,19 @@ app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 
 
+def _mark_inline(metadata: Dict) -> Dict:
+    """Mark a built-in node to be evaluated by the dispatcher.
+
+    Nodes with hooks are left to their executors since the hooks might
+    be needed to load their inputs.
+
+    """
+
+    if not any((metadata.get("hooks") or {}).values()):
+        metadata["inline"] = True
+    return metadata
+
+
 class Electron:
     """
     An electron (or task) object that is a modular component of a
@@ -86,6 +99,7 @@ class Electron:
         kwargs: Keyword arguments if any.
         task_group_id: the group to which the task be assigned when it is bound to a graph node. If unset, the group id will default to node id.
         packing_tasks: Flag to indicate whether task packing is enabled.
+        auto_pack: Whether the task may be packed automatically with its neighbors in a chain.
     """
 
     def __init__(
@@ -95,6 +109,7 @@ class Electron:
         metadata: dict = None,
         task_group_id: int = None,
         packing_tasks: bool = False,
+        auto_pack: bool = True,
     ) -> None:
         if metadata is None:
             metadata = {}
@@ -103,12 +118,17 @@ class Electron:
         self.metadata = metadata
         self.task_group_id = task_group_id
         self._packing_tasks = packing_tasks
+        self._auto_pack = auto_pack
         self._function_string = get_serialized_function_str(function)
 
     @property
     def packing_tasks(self) -> bool:
         return self._packing_tasks
 
+    @property
+    def auto_pack(self) -> bool:
+        return self._auto_pack
+
     def set_metadata(self, name: str, value: Any) -> None:
         """
         Function to add/edit metadata of given name and value
@@ -214,7 +234,7 @@ class Electron:
         # Mint an arithmetic electron and execute it using the
         # enclosing lattice's workflow_executor.
 
-        metadata = encode_metadata(DEFAULT_METADATA_VALUES.copy())
+        metadata = _mark_inline(encode_metadata(DEFAULT_METADATA_VALUES.copy()))
         op_electron = Electron(func_for_op, metadata=metadata)
 
         if active_lattice := active_lattice_manager.get_active_lattice():
@@ -275,11 +295,11 @@ class Electron:
 
         active_lattice = active_lattice_manager.get_active_lattice()
         return (
-            Electron(function=func, metadata=self.metadata.copy())
+            Electron(function=func, metadata=_mark_inline(self.metadata.copy()))
             if name.startswith(sublattice_prefix)
             else Electron(
                 function=func,
-                metadata=metadata,
+                metadata=_mark_inline(metadata),
                 task_group_id=self.task_group_id,
                 packing_tasks=True and active_lattice.task_packing,
             )
@@ -510,6 +530,7 @@ class Electron:
             node_id=self.node_id,
             task_group_id=self.task_group_id,
             packing_tasks=self.packing_tasks,
+            auto_pack=self.auto_pack,
         )
         active_lattice._bound_electrons[self.node_id] = bound_electron
         return bound_electron
@@ -537,7 +558,7 @@ class Electron:
             None
         """
 
-        collection_metadata = encode_metadata(DEFAULT_METADATA_VALUES.copy())
+        collection_metadata = _mark_inline(encode_metadata(DEFAULT_METADATA_VALUES.copy()))
         active_lattice = active_lattice_manager.get_active_lattice()
 
         if "executor" in self.metadata:
@@ -684,6 +705,7 @@ def electron(
     deps_module: Union[DepsModule, List[DepsModule], str, List[str]] = None,
     call_before: Union[List[DepsCall], DepsCall] = None,
     call_after: Union[List[DepsCall], DepsCall] = None,
+    auto_pack: bool = True,
 ) -> Callable:  # sourcery skip: assign-if-exp
     """
     Electron decorator to be called upon a function. Returns the wrapper function with the same functionality as `_func`.
@@ -701,6 +723,8 @@ def electron(
         call_before: An optional list of DepsCall objects specifying python functions to invoke before the electron
         call_after: An optional list of DepsCall objects specifying python functions to invoke after the electron
         files: An optional list of FileTransfer objects which copy files to/from remote or local filesystems.
+        auto_pack: Whether the electron may be packed into a task group with its neighbors in a chain of
+            electrons when automatic task packing is enabled (`sdk.auto_task_packing`).
 
     Returns:
         :obj:`Electron <covalent._workflow.electron.Electron>` : Electron object inside which the decorated function exists.
@@ -809,7 +833,7 @@ def electron(
 
         """
 
-        electron_object = Electron(func)
+        electron_object = Electron(func, auto_pack=auto_pack)
         for k, v in constraints.items():
             electron_object.set_metadata(k, v)
         electron_object.__doc__ = func.__doc__
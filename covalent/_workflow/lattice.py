@@ -34,6 +34,7 @@ from .._shared_files.utils import get_named_params, get_serialized_function_str,
 from .depsbash import DepsBash
 from .depscall import DepsCall
 from .depspip import DepsPip
+from .packing import pack_linear_chains
 from .postprocessing import Postprocessor
 from .transport import (
     TransportableObject,
@@ -241,6 +242,18 @@ class Lattice:
             else:
                 pp.add_reconstruct_postprocess_node(retval, self._bound_electrons.copy())
 
+        if get_config("sdk.auto_task_packing") == "true":
+            opted_out = [
+                node_id
+                for node_id, electron in self._bound_electrons.items()
+                if not electron.auto_pack
+            ]
+            pack_linear_chains(
+                self.transport_graph,
+                int(get_config("sdk.auto_task_packing_max_size")),
+                excluded=opted_out,
+            )
+
         self._bound_electrons = {}  # Reset bound electrons
 
         # Clear this temporary attribute
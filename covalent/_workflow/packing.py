@@ -0,0 +1,152 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Automatic task packing of linear electron chains."""
+
+from collections import Counter
+from typing import Dict, Iterable, Set
+
+import networkx as nx
+
+from .._shared_files import logger
+from .._shared_files.defaults import (
+    WAIT_EDGE_NAME,
+    parameter_prefix,
+    postprocess_prefix,
+    sublattice_prefix,
+)
+from .transport import _TransportGraph
+
+app_log = logger.app_log
+
+# Nodes which are handled specially by the dispatcher and are never packed
+_UNPACKABLE_PREFIXES = (parameter_prefix, sublattice_prefix, postprocess_prefix)
+
+
+def _supports_task_groups(executor: str) -> bool:
+    """Check whether an executor plugin can run packed task groups."""
+
+    from ..executor import _executor_manager
+
+    if not isinstance(executor, str):
+        return False
+    plugin_class = _executor_manager.executor_plugins_map.get(executor)
+    return bool(getattr(plugin_class, "SUPPORTS_MANAGED_EXECUTION", False))
+
+
+def _is_packable(tg: _TransportGraph, node_id: int, group_sizes: Counter) -> bool:
+    """Check whether a node may be packed automatically.
+
+    Nodes already packed with other nodes and parameter, sublattice
+    and postprocessing nodes are left alone.
+
+    """
+
+    attrs = tg._graph.nodes[node_id]
+    return (
+        group_sizes[attrs["task_group_id"]] == 1
+        and not attrs["name"].startswith(_UNPACKABLE_PREFIXES)
+        and _supports_task_groups(attrs["metadata"]["executor"])
+    )
+
+
+def _consumers(tg: _TransportGraph, node_id: int) -> Set[int]:
+    """Get the nodes which depend on a node.
+
+    Nodes waiting on the node through `wait_for` count as consumers,
+    since packing the node would hold them back until its whole group
+    completes. Only the postprocessing node, which waits for every
+    node anyway, is exempt from its wait edges.
+
+    """
+
+    g = tg._graph
+    return {
+        child
+        for child, edges in g.adj[node_id].items()
+        if not g.nodes[child]["name"].startswith(postprocess_prefix)
+        or any(attrs["edge_name"] != WAIT_EDGE_NAME for attrs in edges.values())
+    }
+
+
+def _runs_alike(tg: _TransportGraph, parent: int, child: int) -> bool:
+    """Check whether two nodes have the same executor and hooks."""
+
+    parent_metadata = tg._graph.nodes[parent]["metadata"]
+    child_metadata = tg._graph.nodes[child]["metadata"]
+    return all(
+        parent_metadata.get(key) == child_metadata.get(key)
+        for key in ("executor", "executor_data", "hooks")
+    )
+
+
+def pack_linear_chains(
+    tg: _TransportGraph, max_group_size: int, excluded: Iterable[int] = ()
+) -> Dict[int, int]:
+    """Pack chains of electrons into task groups.
+
+    A node joins its parent's task group if it is the only consumer of
+    the parent and the parent is its only dependency, counting wait-for
+    edges other than the postprocessing node's, both
+    run with the same executor and hooks, and the group has fewer than
+    `max_group_size` tasks. Each fused link saves a full submit, poll and receive cycle
+    without giving up any parallelism since the tasks of a chain run
+    one after another anyway.
+
+    Args:
+        tg: The transport graph to pack.
+        max_group_size: The maximum number of tasks in a group.
+        excluded: Nodes which are not to be packed, such as electrons
+            declared with `auto_pack=False`.
+
+    Returns:
+        A map from the id of each packed node to its new task group id.
+
+    """
+
+    g = tg._graph
+    group_sizes = Counter(gid for _, gid in g.nodes(data="task_group_id"))
+    excluded = set(excluded)
+    packed = {}
+
+    for node_id in nx.topological_sort(g):
+        parents = set(g.predecessors(node_id))
+        if len(parents) != 1:
+            continue
+        parent = parents.pop()
+        if parent in excluded or node_id in excluded:
+            continue
+        if _consumers(tg, parent) != {node_id}:
+            continue
+
+        gid = g.nodes[parent]["task_group_id"]
+        if group_sizes[gid] >= max_group_size:
+            continue
+
+        # The parent may already be part of a chain
+        parent_packable = parent in packed or _is_packable(tg, parent, group_sizes)
+        if not parent_packable or not _is_packable(tg, node_id, group_sizes):
+            continue
+        if not _runs_alike(tg, parent, node_id):
+            continue
+
+        group_sizes[g.nodes[node_id]["task_group_id"]] -= 1
+        group_sizes[gid] += 1
+        g.nodes[node_id]["task_group_id"] = gid
+        packed[node_id] = gid
+
+    app_log.debug(f"Packed {len(packed)} nodes into chains")
+    return packed
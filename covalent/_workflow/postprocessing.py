@@ -210,7 +210,7 @@ class Postprocessor:
             None
 
         """
-        from .electron import Electron, wait
+        from .electron import Electron, _mark_inline, wait
 
         node_id_refs = self._get_node_ids_from_retval(retval)
         referenced_electrons = {}
@@ -219,7 +219,7 @@ class Postprocessor:
             referenced_electrons[key] = bound_electrons[node_id]
 
         with active_lattice_manager.claim(self.lattice):
-            pp_metadata = self._get_electron_metadata()
+            pp_metadata = _mark_inline(self._get_electron_metadata())
             pp_electron = Electron(function=self._postprocess_recursively, metadata=pp_metadata)
 
             # Add pp_electron to the graph -- this will also add a
@@ -18,8 +18,10 @@
 
 import base64
 import json
+import os
+import pickle
 import platform
-from typing import Any, Callable, Tuple
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
 
 import cloudpickle
 
@@ -30,18 +32,41 @@ DATA_OFFSET_BYTES = 8
 HEADER_OFFSET = STRING_OFFSET_BYTES + DATA_OFFSET_BYTES
 BYTE_ORDER = "big"
 
+# Format version 1 stores the base64-encoded pickle in the data section.
+# Version 2 stores raw pickle bytes followed by any out-of-band buffers:
+#
+#  [magic (8 bytes)][buffer count (8 bytes)][pickle size (8 bytes)]
+#  [buffer sizes (8 bytes each)][pickle][buffer 0]...[buffer n-1]
+#
+# The magic starts with a NUL byte, which never occurs in base64 text.
+
+DATA_V2_MAGIC = b"\x00COVTO\x00\x02"
+SIZE_BYTES = 8
+PICKLE_PROTOCOL = 5
+
+# Default chunk size when streaming the object string
+STRING_CHUNK_SIZE = 1024 * 1024
+
+
+def _raw_view(buf) -> memoryview:
+    """Return a flat byte view of a buffer without copying it."""
+    if isinstance(buf, pickle.PickleBuffer):
+        return buf.raw()
+    return memoryview(buf).cast("B")
+
 
 class _TOArchive:
     """Archived transportable object."""
 
-    def __init__(self, header: bytes, object_string: bytes, data: bytes):
+    def __init__(self, header: bytes, object_string: bytes, data: bytes, buffers: Sequence = ()):
         """
         Initialize TOArchive.
 
         Args:
             header: Archived transportable object header.
             object_string: Archived transportable object string.
-            data: Archived transportable object data.
+            data: Archived transportable object pickle bytes.
+            buffers: Out-of-band pickle buffers.
 
         Returns:
             None
@@ -50,6 +75,7 @@ class _TOArchive:
         self.header = header
         self.object_string = object_string
         self.data = data
+        self.buffers = list(buffers)
 
     def cat(self) -> bytes:
         """
@@ -68,13 +94,32 @@ class _TOArchive:
         data_offset = data_offset.to_bytes(DATA_OFFSET_BYTES, BYTE_ORDER, signed=False)
         string_offset = string_offset.to_bytes(STRING_OFFSET_BYTES, BYTE_ORDER, signed=False)
 
-        return string_offset + data_offset + self.header + self.object_string + self.data
+        # Concatenate all sections in a single pass so that large
+        # buffers are copied only once
+        buffers = [_raw_view(buf) for buf in self.buffers]
+        sizes = [len(self.data)] + [buf.nbytes for buf in buffers]
+        return b"".join(
+            [
+                string_offset,
+                data_offset,
+                self.header,
+                self.object_string,
+                DATA_V2_MAGIC,
+                len(buffers).to_bytes(SIZE_BYTES, BYTE_ORDER, signed=False),
+                *(size.to_bytes(SIZE_BYTES, BYTE_ORDER, signed=False) for size in sizes),
+                self.data,
+                *buffers,
+            ]
+        )
 
     @staticmethod
     def load(serialized: bytes, header_only: bool, string_only: bool) -> "_TOArchive":
         """
         Load TOArchive object from serialized bytes.
 
+        The sections of the archive are returned as views into
+        `serialized` rather than copies.
+
         Args:
             serialized: Serialized transportable object.
             header_only: Load header only.
@@ -85,18 +130,22 @@ class _TOArchive:
 
         """
 
+        serialized = memoryview(serialized).cast("B")
         string_offset = TOArchiveUtils.string_offset(serialized)
         header = TOArchiveUtils.parse_header(serialized, string_offset)
         object_string = b""
         data = b""
+        buffers = []
 
         if not header_only:
             data_offset = TOArchiveUtils.data_offset(serialized)
             object_string = TOArchiveUtils.parse_string(serialized, string_offset, data_offset)
 
             if not string_only:
-                data = TOArchiveUtils.parse_data(serialized, data_offset)
-        return _TOArchive(header, object_string, data)
+                data, buffers = TOArchiveUtils.unpack_data(
+                    TOArchiveUtils.parse_data(serialized, data_offset)
+                )
+        return _TOArchive(header, object_string, data, buffers)
 
 
 class TOArchiveUtils:
@@ -119,7 +168,7 @@ class TOArchiveUtils:
 
     @staticmethod
     def data_byte_range(serialized: bytes) -> Tuple[int, int]:
-        """Return byte range for the b64 picklebytes"""
+        """Return byte range for the data section"""
         start_byte = TOArchiveUtils.data_offset(serialized)
         return start_byte, -1
 
@@ -136,6 +185,31 @@ class TOArchiveUtils:
     def parse_data(serialized: bytes, data_offset: int) -> bytes:
         return serialized[data_offset:]
 
+    @staticmethod
+    def unpack_data(data: memoryview) -> Tuple[memoryview, List[memoryview]]:
+        """Split a data section into the raw pickle and its out-of-band buffers"""
+
+        magic_size = len(DATA_V2_MAGIC)
+        if data[:magic_size] != DATA_V2_MAGIC:
+            # Format version 1
+            return memoryview(base64.b64decode(data)), []
+
+        pos = magic_size
+        num_buffers = int.from_bytes(data[pos : pos + SIZE_BYTES], BYTE_ORDER, signed=False)
+        pos += SIZE_BYTES
+
+        sizes = []
+        for _ in range(num_buffers + 1):
+            sizes.append(int.from_bytes(data[pos : pos + SIZE_BYTES], BYTE_ORDER, signed=False))
+            pos += SIZE_BYTES
+
+        sections = []
+        for size in sizes:
+            sections.append(data[pos : pos + size])
+            pos += size
+
+        return sections[0], sections[1:]
+
 
 class TransportableObject:
     """
@@ -143,16 +217,22 @@ class TransportableObject:
     and then whenever executing it, the transportable object is deserialized. The object
     will also contain additional info like the python version used to serialize it.
 
+    Large buffers such as NumPy arrays are pickled out-of-band and are
+    referenced rather than copied until the object is serialized.
+
     Attributes:
-        _object: The serialized object.
+        _object: The pickled object.
+        _buffers: Out-of-band buffers referenced by the pickle.
         python_version: The python version used on the client's machine.
     """
 
     def __init__(self, obj: Any) -> None:
-        b64object = base64.b64encode(cloudpickle.dumps(obj))
+        buffers = []
+        pickled = cloudpickle.dumps(obj, protocol=PICKLE_PROTOCOL, buffer_callback=buffers.append)
         object_string_u8 = str(obj).encode("utf-8")
 
-        self._object = b64object.decode("utf-8")
+        self._object = pickled
+        self._buffers = buffers
         self._object_string = object_string_u8.decode("utf-8")
 
         self._header = {
@@ -184,28 +264,68 @@ class TransportableObject:
         except AttributeError:
             return self.__dict__["object_string"]
 
+    def iter_object_string(self, chunk_size: int = STRING_CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterate over the UTF-8 encoded object string in chunks.
+
+        Args:
+            chunk_size: Maximum number of bytes in each chunk.
+
+        Returns:
+            An iterator over the chunks of the encoded string.
+        """
+
+        encoded = memoryview(self.object_string.encode("utf-8"))
+        for start in range(0, len(encoded), chunk_size):
+            yield bytes(encoded[start : start + chunk_size])
+
     def __eq__(self, obj) -> bool:
         if not isinstance(obj, TransportableObject):
             return False
-        return self.__dict__ == obj.__dict__
+        return self.__getstate__() == obj.__getstate__()
+
+    def __getstate__(self) -> dict:
+        # Views and pickle buffers can't be pickled or deep-copied
+        state = self.__dict__.copy()
+        state["_object"] = bytes(_raw_view(self._object))
+        state["_buffers"] = [bytes(_raw_view(buf)) for buf in self._buffers]
+        return state
 
-    def get_deserialized(self) -> Callable:
+    def __setstate__(self, state: dict) -> None:
+        state = state.copy()
+
+        # Objects from older versions hold a base64-encoded pickle
+        if isinstance(state.get("_object"), str):
+            state["_object"] = base64.b64decode(state["_object"].encode("utf-8"))
+        state.setdefault("_buffers", [])
+        self.__dict__ = state
+
+    def get_deserialized(self, *, zero_copy: bool = False) -> Callable:
         """
         Get the deserialized transportable object.
 
         Args:
-            None
+            zero_copy: Reconstruct out-of-band buffers such as NumPy
+                arrays directly on top of this object's memory instead
+                of copying them. Such buffers are shared between calls
+                and are read-only if the serialized data is.
 
         Returns:
             function: The deserialized object/callable function.
 
         """
 
-        return cloudpickle.loads(base64.b64decode(self._object.encode("utf-8")))
+        if zero_copy:
+            buffers = self._buffers
+        else:
+            buffers = [bytearray(_raw_view(buf)) for buf in self._buffers]
+        return cloudpickle.loads(self._object, buffers=buffers)
 
     def to_dict(self) -> dict:
         """Return a JSON-serializable dictionary representation of self"""
-        return {"type": "TransportableObject", "attributes": self.__dict__.copy()}
+        attributes = self.__dict__.copy()
+        attributes["_object"] = self.get_serialized()
+        attributes.pop("_buffers", None)
+        return {"type": "TransportableObject", "attributes": attributes}
 
     @staticmethod
     def from_dict(object_dict) -> "TransportableObject":
@@ -219,7 +339,7 @@ class TransportableObject:
         """
 
         sc = TransportableObject(None)
-        sc.__dict__ = object_dict["attributes"]
+        sc.__setstate__(object_dict["attributes"])
         return sc
 
     def get_serialized(self) -> str:
@@ -230,10 +350,14 @@ class TransportableObject:
             None
 
         Returns:
-            object: The serialized transportable object.
+            object: The base64-encoded pickle of the object, with any
+                out-of-band buffers stored in-band.
         """
 
-        return self._object
+        pickled = self._object
+        if self._buffers:
+            pickled = cloudpickle.dumps(self.get_deserialized(), protocol=PICKLE_PROTOCOL)
+        return base64.b64encode(pickled).decode("utf-8")
 
     def serialize(self) -> bytes:
         """
@@ -311,6 +435,23 @@ class TransportableObject:
         ar = _TOArchive.load(serialized, header_only, string_only)
         return _from_archive(ar)
 
+    @staticmethod
+    def load_lazy(path: str) -> "TransportableObject":
+        """
+        Lazily deserialize a transportable object stored in a file.
+
+        The header and string are read on first access and the pickle
+        data only when the object itself is needed.
+
+        Args:
+            path: Path to the serialized transportable object.
+
+        Returns:
+            object: The transportable object.
+        """
+
+        return _LazyTransportableObject(path)
+
     @staticmethod
     def deserialize_list(collection: list) -> list:
         """
@@ -358,6 +499,83 @@ class TransportableObject:
         return new_dict
 
 
+class _LazyTransportableObject(TransportableObject):
+    """Transportable object whose archive sections are read from a file on demand.
+
+    Sections are read by byte range rather than memory-mapped since asset
+    files can be rewritten in place, which would invalidate a mapping.
+    """
+
+    _METADATA_ATTRS = ("_header", "_object_string")
+    _DATA_ATTRS = ("_object", "_buffers")
+
+    def __init__(self, path: str) -> None:
+        # Fail early if the file is missing
+        os.stat(path)
+        self._path = str(path)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._METADATA_ATTRS:
+            self._load_metadata()
+        elif name in self._DATA_ATTRS:
+            self._load_data()
+        else:
+            raise AttributeError(name)
+        return self.__dict__[name]
+
+    def _load_metadata(self) -> None:
+        with open(self._path, "rb") as f:
+            prefix = f.read(HEADER_OFFSET)
+            string_offset, data_offset = TOArchiveUtils.string_byte_range(prefix)
+            header_and_string = f.read(data_offset - HEADER_OFFSET)
+
+        header_size = string_offset - HEADER_OFFSET
+        header = header_and_string[:header_size]
+        object_string = header_and_string[header_size:]
+        self._header = json.loads(header.decode("utf-8"))
+        self._object_string = object_string.decode("utf-8")
+
+    def _load_data(self) -> None:
+        with open(self._path, "rb") as f:
+            prefix = f.read(HEADER_OFFSET)
+            data_offset, _ = TOArchiveUtils.data_byte_range(prefix)
+            f.seek(data_offset)
+            data = f.read()
+
+        self._object, self._buffers = TOArchiveUtils.unpack_data(memoryview(data))
+
+    def iter_object_string(self, chunk_size: int = STRING_CHUNK_SIZE) -> Iterator[bytes]:
+        # Stream the string section from the file unless it is already loaded
+        if "_object_string" in self.__dict__:
+            yield from super().iter_object_string(chunk_size)
+            return
+
+        with open(self._path, "rb") as f:
+            prefix = f.read(HEADER_OFFSET)
+            string_offset, data_offset = TOArchiveUtils.string_byte_range(prefix)
+            f.seek(string_offset)
+            remaining = data_offset - string_offset
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    raise EOFError(f"Truncated transportable object {self._path}")
+                remaining -= len(chunk)
+                yield chunk
+
+    def _materialize(self) -> None:
+        for name in self._METADATA_ATTRS + self._DATA_ATTRS:
+            getattr(self, name)
+        self.__dict__.pop("_path", None)
+
+    def __getstate__(self) -> dict:
+        self._materialize()
+        return super().__getstate__()
+
+    def to_dict(self) -> dict:
+        self._materialize()
+        return super().to_dict()
+
+
 def _to_archive(to: TransportableObject) -> _TOArchive:
     """
     Convert a TransportableObject to a _TOArchive.
@@ -372,8 +590,9 @@ def _to_archive(to: TransportableObject) -> _TOArchive:
 
     header = json.dumps(to._header).encode("utf-8")
     object_string = to._object_string.encode("utf-8")
-    data = to._object.encode("utf-8")
-    return _TOArchive(header=header, object_string=object_string, data=data)
+    return _TOArchive(
+        header=header, object_string=object_string, data=to._object, buffers=to._buffers
+    )
 
 
 def _from_archive(ar: _TOArchive) -> TransportableObject:
@@ -388,12 +607,12 @@ def _from_archive(ar: _TOArchive) -> TransportableObject:
 
     """
 
-    decoded_object_str = ar.object_string.decode("utf-8")
-    decoded_data = ar.data.decode("utf-8")
-    decoded_header = json.loads(ar.header.decode("utf-8"))
+    decoded_object_str = str(ar.object_string, "utf-8")
+    decoded_header = json.loads(str(ar.header, "utf-8"))
     to = TransportableObject(None)
     to._header = decoded_header
     to._object_string = decoded_object_str or ""
-    to._object = decoded_data or ""
+    to._object = ar.data
+    to._buffers = ar.buffers
 
     return to
@@ -60,6 +60,10 @@ class _AbstractBaseExecutor(ABC):
 
     SUPPORTS_MANAGED_EXECUTION = False
 
+    # Whether tasks run on the dispatcher's host and can read and write
+    # assets in its local object store directly
+    SHARES_DISPATCHER_FILESYSTEM = False
+
     def __init__(
         self,
         log_stdout: str = "",
@@ -87,6 +87,7 @@ class LocalExecutor(BaseExecutor):
     """
 
     SUPPORTS_MANAGED_EXECUTION = MANAGED_EXECUTION
+    SHARES_DISPATCHER_FILESYSTEM = True
 
     def __init__(
         self, workdir: str = "", create_unique_workdir: Optional[bool] = None, *args, **kwargs
@@ -184,6 +185,7 @@ class LocalExecutor(BaseExecutor):
             self.workdir,
             task_group_metadata,
             server_url,
+            resources.model_dump(),
         )
 
         def handle_cancelled(fut):
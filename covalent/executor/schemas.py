@@ -57,6 +57,9 @@ class TaskSpec(BaseModel):
         args: The `node_id`s of the function's args
         kwargs: The `node_id`s of the function's kwargs {key: node_id}
         hooks_id: An opaque string representing the task's hooks.
+        persist_output: Whether to store the task's output. Outputs
+            consumed only by later tasks in the same task group need
+            not be stored.
 
     The attribute values can be used in conjunction with a
     `ResourceMap` to locate the actual resources in the compute
@@ -66,6 +69,7 @@ class TaskSpec(BaseModel):
     electron_id: int
     args: List[int]
     kwargs: Dict[str, int]
+    persist_output: bool = True
 
 
 class ResourceMap(BaseModel):
@@ -85,6 +89,12 @@ class ResourceMap(BaseModel):
         functions: A map from node id to the corresponding URI.
         inputs: A map from node id to the corresponding URI
         deps: A map from deps resource ids to their corresponding URIs.
+        outputs: A map from node id to the URI where the task's output
+            is to be written, for executors which write outputs
+            directly into the dispatcher's object store.
+
+    An empty URI means that the resource is to be fetched from the
+    dispatcher.
 
     """
 
@@ -97,6 +107,9 @@ class ResourceMap(BaseModel):
     # Includes deps, call_before, call_after
     hooks: Dict[int, str]
 
+    # Map node_id to URI
+    outputs: Dict[int, str] = {}
+
 
 class TaskGroup(BaseModel):
     """Description of a group of runnable graph nodes.
@@ -22,14 +22,17 @@ import io
 import json
 import os
 import sys
+import threading
 import traceback
+from collections import Counter
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
 
 from covalent._file_transfer import FileTransfer
+from covalent._shared_files.config import get_config
 from covalent._workflow.depsbash import DepsBash
 from covalent._workflow.depscall import RESERVED_RETVAL_KEY__FILES, DepsCall
 from covalent._workflow.depspip import DepsPip
@@ -37,6 +40,8 @@ from covalent._workflow.transport import TransportableObject
 from covalent.executor.utils import set_context
 from covalent.executor.utils.serialize import deserialize_node_asset, serialize_node_asset
 
+FILE_SCHEME_PREFIX = "file://"
+
 
 def wrapper_fn(
     function: TransportableObject,
@@ -155,12 +160,113 @@ def _gather_deps(deps, call_before_objs_json, call_after_objs_json) -> Tuple[Lis
 # for `AsyncBaseExecutor.send()`.
 
 
+def _load_node_asset(
+    server_url: str, dispatch_id: str, node_id: int, key: str, local_uri: str = ""
+) -> Any:
+    """Load a node asset, reading it from the local object store if
+    its location is known and otherwise downloading it."""
+
+    if local_uri:
+        with open(local_uri[len(FILE_SCHEME_PREFIX) :], "rb") as f:
+            return deserialize_node_asset(f.read(), key)
+
+    # Get remote uri
+    url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{node_id}/assets/{key}"
+    uri_resp = requests.get(url)
+    uri_resp.raise_for_status()
+    remote_uri = uri_resp.json()["remote_uri"]
+
+    resp = requests.get(remote_uri, stream=True)
+    resp.raise_for_status()
+    return deserialize_node_asset(resp.content, key)
+
+
+def _get_output_digest_algorithm() -> str:
+    """The digest algorithm of the dispatcher's object store.
+
+    Only used for outputs written directly to the local object store,
+    in which case the dispatcher is installed alongside the executor.
+    """
+
+    from covalent_dispatcher._object_store.hashing import resolve_algorithm
+
+    return resolve_algorithm(get_config("dispatcher.asset_digest_algorithm"))
+
+
+def _store_local_output(data: bytes, dest_uri: str, digest_alg: str) -> Tuple[str, str]:
+    """Write a task output to its location in the local object store.
+
+    Returns:
+        The path of the output and its digest.
+    """
+
+    from covalent_dispatcher._object_store.hashing import new_hasher
+
+    path = dest_uri[len(FILE_SCHEME_PREFIX) :]
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Replace the file instead of writing to it since it may be a link
+    # to data shared with other assets. Write to a private file first
+    # since other workers may be storing the same output.
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    h = new_hasher(digest_alg)
+    h.update(data)
+    return path, h.hexdigest()
+
+
+class _GroupOutputs:
+    """Outputs of tasks which are consumed by later tasks in the same
+    task group.
+
+    The outputs are handed to their consumers in memory instead of
+    being loaded from storage, and released once every consumer has
+    taken them.
+
+    """
+
+    def __init__(self, task_specs: List[Dict]):
+        task_ids = {task["electron_id"] for task in task_specs}
+        self._consumers = Counter(
+            node_id
+            for task in task_specs
+            for node_id in [*task["args"], *task["kwargs"].values()]
+            if node_id in task_ids
+        )
+        self._outputs = {}
+
+    def __contains__(self, node_id: int) -> bool:
+        return node_id in self._outputs
+
+    def add(self, node_id: int, output: TransportableObject) -> None:
+        """Keep a task's output if later tasks in the group need it."""
+        if self._consumers[node_id] > 0:
+            self._outputs[node_id] = output
+
+    def take(self, node_id: int) -> TransportableObject:
+        """Get a task's output for one of its consumers."""
+        output = self._outputs[node_id]
+        self._consumers[node_id] -= 1
+        if self._consumers[node_id] < 1:
+            del self._outputs[node_id]
+        return output
+
+
 def run_task_group(
     task_specs: List[Dict],
     output_uris: List[Tuple[str, str, str]],
     results_dir: str,
     task_group_metadata: dict,
     server_url: str,
+    resources: Optional[dict] = None,
 ):
     """
     Run a task group.
@@ -168,8 +274,24 @@ def run_task_group(
     This is appropriate for executors which can access the Covalent
     server url directly. Exampl: LocalExecutor.
 
+    Assets with `file://` URIs in `resources` are read from the
+    dispatcher's object store directly, and outputs with such URIs are
+    written there directly; other assets are transferred using the
+    server's API.
+
+    Outputs consumed by later tasks in the group are passed to them in
+    memory. Outputs of tasks whose spec sets `persist_output` to false
+    are not stored at all; only their size is reset to record this.
+
     """
 
+    if resources is None:
+        resources = {}
+    local_functions = resources.get("functions", {})
+    local_inputs = resources.get("inputs", {})
+    local_hooks = resources.get("hooks", {})
+    local_outputs = resources.get("outputs", {})
+
     outputs = {}
     results = []
     dispatch_id = task_group_metadata["dispatch_id"]
@@ -179,8 +301,21 @@ def run_task_group(
     os.environ["COVALENT_DISPATCHER_URL"] = server_url
     os.environ["COVALENT_TASKS"] = json.dumps([task for task in task_specs])
 
+    group_outputs = _GroupOutputs(task_specs)
+
+    output_digest_alg = _get_output_digest_algorithm() if any(local_outputs.values()) else ""
+
+    def load_input(node_id):
+        if node_id in group_outputs:
+            return group_outputs.take(node_id)
+        return _load_node_asset(
+            server_url, dispatch_id, node_id, "output", local_inputs.get(node_id)
+        )
+
     for i, task in enumerate(task_specs):
         result_uri, stdout_uri, stderr_uri = output_uris[i]
+        output_digest = None
+        discard_output = False
 
         with open(stdout_uri, "w") as stdout, open(stderr_uri, "w") as stderr:
             with redirect_stdout(stdout), redirect_stderr(stderr):
@@ -189,50 +324,19 @@ def run_task_group(
                     args = task["args"]
                     kwargs = task["kwargs"]
 
-                    function_uri = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets/function"
-
                     # Download function
-                    # Get remote uri
-                    uri_resp = requests.get(function_uri)
-                    uri_resp.raise_for_status()
-                    remote_uri = uri_resp.json()["remote_uri"]
-                    resp = requests.get(remote_uri, stream=True)
-
-                    resp.raise_for_status()
-                    serialized_fn = deserialize_node_asset(resp.content, "function")
-
-                    ser_args = []
-                    ser_kwargs = {}
+                    serialized_fn = _load_node_asset(
+                        server_url, dispatch_id, task_id, "function", local_functions.get(task_id)
+                    )
 
                     # Download args and kwargs
-                    for node_id in args:
-                        url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{node_id}/assets/output"
-                        uri_resp = requests.get(url)
-                        uri_resp.raise_for_status()
-                        remote_url = uri_resp.json()["remote_uri"]
-
-                        resp = requests.get(remote_url, stream=True)
-                        resp.raise_for_status()
-                        ser_args.append(deserialize_node_asset(resp.content, "output"))
-
-                    for k, node_id in kwargs.items():
-                        url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{node_id}/assets/output"
-                        uri_resp = requests.get(url)
-                        uri_resp.raise_for_status()
-                        remote_url = uri_resp.json()["remote_uri"]
-                        resp = requests.get(remote_url, stream=True)
-                        resp.raise_for_status()
-                        ser_kwargs[k] = deserialize_node_asset(resp.content, "output")
+                    ser_args = [load_input(node_id) for node_id in args]
+                    ser_kwargs = {k: load_input(node_id) for k, node_id in kwargs.items()}
 
                     # Download deps, call_before, and call_after
-                    hooks_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets/hooks"
-                    uri_resp = requests.get(hooks_url)
-                    uri_resp.raise_for_status()
-                    remote_url = uri_resp.json()["remote_uri"]
-
-                    resp = requests.get(remote_url, stream=True)
-                    resp.raise_for_status()
-                    hooks_json = deserialize_node_asset(resp.content, "hooks")
+                    hooks_json = _load_node_asset(
+                        server_url, dispatch_id, task_id, "hooks", local_hooks.get(task_id)
+                    )
                     deps_json = hooks_json.get("deps", {})
                     call_before_json = hooks_json.get("call_before", [])
                     call_after_json = hooks_json.get("call_after", [])
@@ -248,9 +352,21 @@ def run_task_group(
                             serialized_fn, call_before, call_after, *ser_args, **ser_kwargs
                         )
 
-                    ser_output = serialize_node_asset(transportable_output, "output")
-                    with open(result_uri, "wb") as f:
-                        f.write(ser_output)
+                    group_outputs.add(task_id, transportable_output)
+
+                    if not task.get("persist_output", True):
+                        # Only consumed by later tasks in the group
+                        discard_output = True
+                        result_uri = ""
+                    elif local_outputs.get(task_id):
+                        ser_output = serialize_node_asset(transportable_output, "output")
+                        result_uri, output_digest = _store_local_output(
+                            ser_output, local_outputs[task_id], output_digest_alg
+                        )
+                    else:
+                        ser_output = serialize_node_asset(transportable_output, "output")
+                        with open(result_uri, "wb") as f:
+                            f.write(ser_output)
 
                     outputs[task_id] = result_uri
 
@@ -282,11 +398,24 @@ def run_task_group(
                     if result_uri:
                         upload_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets/output"
                         headers = {"Content-Length": str(os.path.getsize(result_uri))}
+                        if output_digest:
+                            # The output is already in place; only
+                            # record its metadata
+                            headers["Digest-alg"] = output_digest_alg
+                            headers["Digest"] = output_digest
+                            headers["Object-stored"] = "true"
                         uri_resp = requests.post(upload_url, headers=headers)
                         uri_resp.raise_for_status()
                         remote_uri = uri_resp.json()["remote_uri"]
-                        _, cp = FileTransfer(f"file://{result_uri}", remote_uri).cp()
-                        cp()
+                        if not output_digest:
+                            _, cp = FileTransfer(f"file://{result_uri}", remote_uri).cp()
+                            cp()
+                    elif discard_output:
+                        # An empty output marks the task's output as
+                        # not stored
+                        upload_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets/output"
+                        uri_resp = requests.post(upload_url, headers={"Content-Length": "0"})
+                        uri_resp.raise_for_status()
 
                     sys.stdout.flush()
                     if stdout_uri:
@@ -362,6 +491,9 @@ def run_task_group_alt(
 
     Example: DaskExecutor.
 
+    Outputs consumed by later tasks in the group are passed to them in
+    memory; all outputs are still saved for Covalent to pull.
+
     """
 
     prefix = "file://"
@@ -377,6 +509,17 @@ def run_task_group_alt(
     # os.environ["COVALENT_DISPATCHER_URL"] = server_url
     # os.environ["COVALENT_TASKS"] = json.dumps([task for task in task_specs])
 
+    group_outputs = _GroupOutputs(task_specs)
+
+    def load_input(node_id):
+        if node_id in group_outputs:
+            return group_outputs.take(node_id)
+        uri = resources["inputs"][node_id]
+        if uri.startswith(prefix):
+            uri = uri[prefix_len:]
+        with open(uri, "rb") as f:
+            return deserialize_node_asset(f.read(), "output")
+
     for i, task in enumerate(task_specs):
         result_uri, stdout_uri, stderr_uri = output_uris[i]
 
@@ -396,22 +539,8 @@ def run_task_group_alt(
                         serialized_fn = deserialize_node_asset(f.read(), "function")
 
                     # Load args and kwargs
-                    ser_args = []
-                    ser_kwargs = {}
-
-                    args_uris = [resources["inputs"][index] for index in args]
-                    for uri in args_uris:
-                        if uri.startswith(prefix):
-                            uri = uri[prefix_len:]
-                        with open(uri, "rb") as f:
-                            ser_args.append(deserialize_node_asset(f.read(), "output"))
-
-                    kwargs_uris = {k: resources["inputs"][v] for k, v in kwargs.items()}
-                    for key, uri in kwargs_uris.items():
-                        if uri.startswith(prefix):
-                            uri = uri[prefix_len:]
-                        with open(uri, "rb") as f:
-                            ser_kwargs[key] = deserialize_node_asset(f.read(), "output")
+                    ser_args = [load_input(node_id) for node_id in args]
+                    ser_kwargs = {k: load_input(node_id) for k, node_id in kwargs.items()}
 
                     # Load deps, call_before, and call_after
                     hooks_uri = resources["hooks"][task_id]
@@ -436,14 +565,13 @@ def run_task_group_alt(
                             serialized_fn, call_before, call_after, *ser_args, **ser_kwargs
                         )
 
+                    group_outputs.add(task_id, transportable_output)
                     ser_output = serialize_node_asset(transportable_output, "output")
 
                     # Save output
                     with open(result_uri, "wb") as f:
                         f.write(ser_output)
 
-                    resources["inputs"][task_id] = result_uri
-
                     output_size = len(ser_output)
                     stdout.flush()
                     stderr.flush()
@@ -14,5 +14,4 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .data_modules.importer import copy_futures
 from .dispatcher import cancel_dispatch, run_dispatch  # nopycln: import
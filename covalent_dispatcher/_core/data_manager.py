@@ -19,7 +19,7 @@ Defines the core functionality of the result service
 """
 
 import traceback
-from typing import Dict
+from typing import Dict, List, Union
 
 from covalent._results_manager import Result
 from covalent._shared_files import logger
@@ -32,7 +32,8 @@ from .._db.write_result_to_db import resolve_electron_id
 from . import dispatcher
 from .data_modules import dispatch, electron  # nopycln: import
 from .data_modules import importer as manifest_importer
-from .data_modules.utils import run_in_executor
+from .data_modules.object_cache import _result_object_cache
+from .data_modules.utils import run_in_executor, run_in_write_executor
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
@@ -81,7 +82,19 @@ def generate_node_result(
 
 
 # Domain: result
-async def update_node_result(dispatch_id, node_result):
+async def update_node_result(dispatch_id, node_result: Union[Dict, List[Dict]]):
+    """Persist one or more node results and notify the dispatcher.
+
+    Args:
+        dispatch_id: The dispatch id
+        node_result: A node result as returned by `generate_node_result`
+            or a list of them. Lists of node results are written to the
+            DB in a single transaction.
+    """
+
+    if isinstance(node_result, list):
+        return await _update_node_results_bulk(dispatch_id, node_result)
+
     app_log.debug("Updating node result (run_planned_workflow).")
     valid_update = True
     try:
@@ -148,6 +161,62 @@ async def update_node_result(dispatch_id, node_result):
             await dispatcher.notify_node_status(dispatch_id, node_id, node_status, detail)
 
 
+async def _update_node_results_bulk(dispatch_id: str, node_results: List[Dict]):
+    if not node_results:
+        return
+    if len(node_results) == 1:
+        return await update_node_result(dispatch_id, node_results[0])
+
+    app_log.debug(f"Updating {len(node_results)} node results (run_planned_workflow).")
+
+    try:
+        node_ids = [node_result["node_id"] for node_result in node_results]
+        node_infos = await electron.get_bulk(dispatch_id, node_ids, ["type"])
+    except Exception as ex:
+        # As in the single-node path, fail the nodes but still notify
+        # the dispatcher so that the dispatch doesn't hang
+        app_log.exception(f"Error persisting node updates: {ex}")
+        for node_result in node_results:
+            node_result["status"] = Result.FAILED
+            await dispatcher.notify_node_status(
+                dispatch_id, node_result["node_id"], node_result["status"], {}
+            )
+        return
+
+    # Sublattice electrons may need to create or link a sub-dispatch,
+    # so they go through the single-node path.
+    bulk_results = []
+    sublattice_results = []
+    for node_result, node_info in zip(node_results, node_infos):
+        if node_info["type"] == "sublattice":
+            sublattice_results.append(node_result)
+        else:
+            bulk_results.append(node_result)
+
+    if bulk_results:
+        try:
+            valid_updates = await electron.update_bulk(dispatch_id, bulk_results)
+        except Exception as ex:
+            app_log.exception(f"Error persisting node updates: {ex}")
+            valid_updates = [True] * len(bulk_results)
+            for node_result in bulk_results:
+                node_result["status"] = Result.FAILED
+
+        for node_result, valid_update in zip(bulk_results, valid_updates):
+            node_id = node_result["node_id"]
+            node_status = node_result["status"]
+            if not valid_update:
+                app_log.warning(
+                    f"Invalid status update {node_status} for node {dispatch_id}:{node_id}"
+                )
+                continue
+            if node_status:
+                await dispatcher.notify_node_status(dispatch_id, node_id, node_status, {})
+
+    for node_result in sublattice_results:
+        await update_node_result(dispatch_id, node_result)
+
+
 def get_result_object(dispatch_id: str, bare: bool = True) -> SRVResult:
     app_log.debug(f"Getting result object from db, bare={bare}")
     return get_result_object_from_db(dispatch_id, bare)
@@ -155,6 +224,7 @@ def get_result_object(dispatch_id: str, bare: bool = True) -> SRVResult:
 
 def finalize_dispatch(dispatch_id: str):
     app_log.debug(f"Finalizing dispatch {dispatch_id}")
+    _result_object_cache.remove(dispatch_id)
 
 
 async def persist_result(dispatch_id: str):
@@ -217,14 +287,12 @@ def _import_sublattice_tarball(dispatch_id: str, node_result: Dict) -> ResultSch
     parent_node = result_object.lattice.transport_graph.get_node(node_id)
     parent_electron_id = parent_node._electron_id
 
-    # Extract the base64-encoded tarball from the graph builder output's `object_string` attribute.
-    # TODO: stream the base64 tarball to the decoder to avoid loading the entire
-    # tarball in memory
+    # The base64-encoded tarball is the graph builder output's
+    # `object_string`, which is streamed from the stored output asset
     bg_output = parent_node.get_value("output")
-    b64_tarball = bg_output.object_string
 
-    subl_manifest = manifest_importer.import_b64_staging_tarball(
-        b64_tarball, dispatch_id, parent_electron_id
+    subl_manifest = manifest_importer.import_staging_tarball_stream(
+        bg_output.iter_object_string(), dispatch_id, parent_electron_id
     )
 
     return subl_manifest
@@ -250,8 +318,9 @@ def generate_dispatch_result(
     }
 
 
-# Ensure that a dispatch is only run once; in the future, also check
-# if all assets have been uploaded
+# Ensure that a dispatch is only run once. Assets need not all have
+# been uploaded; each task waits for its own assets (see
+# `asset_manager.wait_for_uploads`).
 
 
 async def ensure_dispatch(dispatch_id: str) -> bool:
@@ -259,9 +328,9 @@ async def ensure_dispatch(dispatch_id: str) -> bool:
 
     The following criteria must be met:
     * The dispatch has not been run before.
-    * (later) all assets have been uploaded
     """
-    return await run_in_executor(
+    return await run_in_write_executor(
+        dispatch_id,
         SRVResult.ensure_run_once,
         dispatch_id,
     )
@@ -19,17 +19,54 @@ Utilties to transfer data between Covalent and compute backends
 """
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from covalent._shared_files import logger
+from covalent._shared_files.config import get_config
 from covalent._shared_files.schemas.asset import AssetUpdate
 
-from ..._dal.result import get_result_object as get_result_object
+from ..._dal.asset import (
+    Asset,
+    AssetCopy,
+    StorageType,
+    discard_asset_copies,
+    load_asset_copies,
+    materialize_asset_copy,
+    relocate_assets,
+)
+from ..._dal.electron import Electron
+from ..._dal.result import Result as SRVResult
+from ..._object_store.local import local_store
+from .object_cache import get_result_object
 
 app_log = logger.app_log
 am_pool = ThreadPoolExecutor()
 
+ASSET_COPY_WORKERS = int(get_config("dispatcher.asset_copy_workers"))
+
+# Workers copying the data of reused assets for redispatches
+copy_pool = ThreadPoolExecutor(max_workers=max(ASSET_COPY_WORKERS, 1))
+
+# Waits for each dispatch's copies and records their new locations
+_copy_coordinator = ThreadPoolExecutor(max_workers=1)
+
+# Progress of pending background copies keyed by dispatch id
+_copy_progress: Dict[str, Dict[str, int]] = {}
+_pending_copies: Dict[str, Future] = {}
+_copy_lock = threading.Lock()
+
+# Assets which clients have yet to upload, keyed by file path, and the
+# number of such assets for each node keyed by dispatch id
+_pending_uploads: Dict[str, Tuple[str, int]] = {}
+_pending_upload_counts: Dict[str, Dict[int, int]] = {}
+# Futures resolved once all of a node's assets have been uploaded
+_upload_waiters: Dict[str, Dict[int, asyncio.Future]] = {}
+_upload_lock = threading.Lock()
+
 
 # Consumed by Runner
 async def upload_asset_for_nodes(dispatch_id: str, key: str, dest_uris: dict):
@@ -63,6 +100,55 @@ def upload_asset_for_nodes_sync(dispatch_id: str, key: str, dest_uris: dict):
         asset.upload(dest_uri)
 
 
+# Consumed by Runner
+async def get_local_asset_uris(
+    dispatch_id: str, task_ids: List[int], known_nodes: List[int]
+) -> Dict[str, Dict[int, str]]:
+    """Locate the assets of a task group in the local object store.
+
+    Returns:
+        A `ResourceMap` of `file://` URIs for the tasks' functions,
+        hooks, and outputs and for the outputs of `known_nodes`. Assets
+        kept in other object stores have empty URIs.
+    """
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        am_pool,
+        get_local_asset_uris_sync,
+        dispatch_id,
+        task_ids,
+        known_nodes,
+    )
+
+
+def get_local_asset_uris_sync(
+    dispatch_id: str, task_ids: List[int], known_nodes: List[int]
+) -> Dict[str, Dict[int, str]]:
+    result_object = get_result_object(dispatch_id, bare=True)
+    tg = result_object.lattice.transport_graph
+
+    resources = {"functions": {}, "inputs": {}, "hooks": {}, "outputs": {}}
+    with result_object.session() as session:
+        for node_id in task_ids:
+            node = tg.get_node(node_id, session)
+            resources["functions"][node_id] = _local_uri(node.get_asset("function", session))
+            resources["hooks"][node_id] = _local_uri(node.get_asset("hooks", session))
+            resources["outputs"][node_id] = _local_uri(node.get_asset("output", session))
+
+        for node_id in known_nodes:
+            node = tg.get_node(node_id, session)
+            resources["inputs"][node_id] = _local_uri(node.get_asset("output", session))
+
+    return resources
+
+
+def _local_uri(asset: Asset) -> str:
+    if asset.storage_type != StorageType.LOCAL.value:
+        return ""
+    return asset.internal_uri
+
+
 async def download_assets_for_node(
     dispatch_id: str, node_id: int, asset_updates: Dict[str, AssetUpdate]
 ):
@@ -105,3 +191,298 @@ def download_assets_for_node_sync(
     for key, pending_download in assets_to_download.items():
         asset, remote_uri = pending_download
         asset.download(remote_uri)
+
+
+def copy_assets_in_background(
+    dispatch_id: str, assets_to_copy: List[AssetCopy]
+) -> Optional[Future]:
+    """Copy the data of reused assets without blocking the dispatch.
+
+    Reused assets initially refer to the parent dispatch's data. Each
+    asset is linked or copied into the dispatch's own storage in
+    parallel and then pointed at its own copy. Assets which fail to copy
+    keep referring to the parent's data and remain pending until the
+    copy is retried (see `resume_asset_copies`).
+
+    Args:
+        dispatch_id: The redispatch
+        assets_to_copy: The copies returned by `handle_redispatch`
+
+    Returns:
+        A future which completes once all copies are recorded, or None
+        if there is nothing to copy.
+    """
+
+    if not assets_to_copy:
+        return None
+
+    progress = {"total": len(assets_to_copy), "copied": 0, "failed": 0}
+    futures = [copy_pool.submit(_copy_asset, item, progress) for item in assets_to_copy]
+
+    with _copy_lock:
+        _copy_progress[dispatch_id] = progress
+        future = _copy_coordinator.submit(_finish_asset_copies, dispatch_id, futures)
+        _pending_copies[dispatch_id] = future
+
+    return future
+
+
+def get_asset_copy_progress(dispatch_id: str) -> Optional[Dict[str, int]]:
+    """Progress of a dispatch's pending background asset copies.
+
+    Returns:
+        A dictionary with the "total", "copied", and "failed" counts, or
+        None if no copies are pending for the dispatch.
+    """
+
+    with _copy_lock:
+        progress = _copy_progress.get(dispatch_id)
+        return dict(progress) if progress else None
+
+
+def wait_for_asset_copies(timeout: Optional[float] = None) -> None:
+    """Block until all pending background asset copies are recorded."""
+
+    with _copy_lock:
+        pending = list(_pending_copies.values())
+    wait_futures(pending, timeout=timeout)
+
+
+def _copy_asset(item: AssetCopy, progress: Dict[str, int]) -> Optional[AssetCopy]:
+    try:
+        materialize_asset_copy(item)
+    except Exception as ex:
+        app_log.warning(f"Failed to copy asset {item.src.internal_uri}: {ex}")
+        with _copy_lock:
+            progress["failed"] += 1
+        return None
+
+    with _copy_lock:
+        progress["copied"] += 1
+    return item
+
+
+def _finish_asset_copies(dispatch_id: str, futures: List[Future]) -> None:
+    try:
+        _record_asset_copies([fut.result() for fut in futures])
+        app_log.debug(f"Copied reused assets for dispatch {dispatch_id}")
+    finally:
+        with _copy_lock:
+            _copy_progress.pop(dispatch_id, None)
+            _pending_copies.pop(dispatch_id, None)
+
+
+def _record_asset_copies(copied: List[Optional[AssetCopy]]) -> None:
+    copied = [item for item in copied if item]
+    with SRVResult.session() as session:
+        relocate_assets(session, copied)
+        if copied:
+            discard_asset_copies(session, asset_ids=[item.dest.primary_key for item in copied])
+
+
+def resume_asset_copies() -> None:
+    """Restart the background copies of reused assets which were
+    interrupted by a restart or which previously failed."""
+
+    with SRVResult.session() as session:
+        pending = load_asset_copies(session)
+
+    for dispatch_id, assets_to_copy in pending.items():
+        app_log.debug(f"Resuming {len(assets_to_copy)} asset copies for dispatch {dispatch_id}")
+        copy_assets_in_background(dispatch_id, assets_to_copy)
+
+
+def materialize_borrowed_assets(dispatch_ids: List[str]) -> List[str]:
+    """Copy the data of reused assets which still refers to the data
+    of the given dispatches.
+
+    This must be done before deleting the dispatches' data. Pending
+    copies of the dispatches' own assets are dropped.
+
+    Args:
+        dispatch_ids: The dispatches whose data is to be deleted
+
+    Returns:
+        The dispatches whose data is still referenced by assets that
+        could not be copied.
+    """
+
+    # Let background copies finish first to avoid copying twice
+    wait_for_asset_copies()
+
+    with SRVResult.session() as session:
+        discard_asset_copies(session, dispatch_ids=dispatch_ids)
+
+    still_referenced = []
+    for dispatch_id in dispatch_ids:
+        with SRVResult.session() as session:
+            pending = load_asset_copies(session, stored_in=dispatch_id)
+        assets_to_copy = [item for items in pending.values() for item in items]
+        if not assets_to_copy:
+            continue
+
+        progress = {"total": len(assets_to_copy), "copied": 0, "failed": 0}
+        futures = [copy_pool.submit(_copy_asset, item, progress) for item in assets_to_copy]
+        _record_asset_copies([fut.result() for fut in futures])
+        if progress["failed"] > 0:
+            still_referenced.append(dispatch_id)
+
+    return still_referenced
+
+
+def expect_uploads(dispatch_id: str, paths_by_node: Dict[int, List[str]]) -> None:
+    """Track the node assets which a client has yet to upload.
+
+    Tasks are only submitted once their assets have arrived (see
+    `wait_for_uploads`), so a dispatch can be started before the
+    client has finished uploading.
+
+    Args:
+        dispatch_id: The dispatch being registered
+        paths_by_node: The file paths of each node's pending assets
+    """
+
+    with _upload_lock:
+        counts = _pending_upload_counts.setdefault(dispatch_id, {})
+        for node_id, paths in paths_by_node.items():
+            for path in paths:
+                path = os.path.realpath(path)
+                if path not in _pending_uploads:
+                    _pending_uploads[path] = (dispatch_id, node_id)
+                    counts[node_id] = counts.get(node_id, 0) + 1
+
+        if not counts:
+            del _pending_upload_counts[dispatch_id]
+
+
+# Consumed by Dispatcher
+async def restore_pending_uploads(dispatch_id: str, node_ids: List[int]) -> None:
+    """Track the uploads still missing after a dispatcher restart.
+
+    Pending uploads are only tracked in memory, so they are rebuilt
+    from the assets of nodes which have yet to start: assets with data
+    but no stored object are still being uploaded by the client.
+
+    Args:
+        dispatch_id: The dispatch being resumed
+        node_ids: The nodes which have yet to start
+    """
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(am_pool, restore_pending_uploads_sync, dispatch_id, node_ids)
+
+
+def restore_pending_uploads_sync(dispatch_id: str, node_ids: List[int]) -> None:
+    if not node_ids:
+        return
+
+    result_object = get_result_object(dispatch_id, bare=True)
+    tg = result_object.lattice.transport_graph
+    eid_node_id_map = {node._electron_id: node.node_id for node in tg.get_nodes(node_ids)}
+
+    with result_object.session() as session:
+        records = Electron.get_linked_assets(
+            session,
+            fields=[],
+            equality_filters={"parent_lattice_id": result_object._lattice_id},
+            membership_filters={"id": list(eid_node_id_map)},
+        )
+
+    paths_by_node = {}
+    for rec in records:
+        asset = rec["asset"]
+        if not asset.size or asset.storage_type != StorageType.LOCAL.value:
+            continue
+        path = os.path.join(asset.storage_path, asset.object_key)
+        if not os.path.exists(path):
+            paths_by_node.setdefault(eid_node_id_map[rec["meta_id"]], []).append(path)
+
+    if paths_by_node:
+        app_log.debug(f"Waiting for {len(paths_by_node)} nodes' uploads for {dispatch_id}")
+    expect_uploads(dispatch_id, paths_by_node)
+
+
+def mark_uploaded(paths: Iterable[str]) -> None:
+    """Record the arrival of uploaded asset data.
+
+    Args:
+        paths: The file paths which have been populated
+    """
+
+    with _upload_lock:
+        for path in paths:
+            entry = _pending_uploads.pop(os.path.realpath(path), None)
+            if entry is None:
+                continue
+
+            dispatch_id, node_id = entry
+            counts = _pending_upload_counts[dispatch_id]
+            counts[node_id] -= 1
+            if counts[node_id] > 0:
+                continue
+
+            del counts[node_id]
+            if not counts:
+                del _pending_upload_counts[dispatch_id]
+            app_log.debug(f"Received all assets for node {dispatch_id}:{node_id}")
+            _resolve_upload_waiter(dispatch_id, node_id)
+
+
+def has_pending_uploads(dispatch_id: str, node_ids: List[int]) -> bool:
+    """Whether any of the nodes' assets have yet to be uploaded."""
+
+    with _upload_lock:
+        counts = _pending_upload_counts.get(dispatch_id)
+        return bool(counts) and any(node_id in counts for node_id in node_ids)
+
+
+async def wait_for_uploads(dispatch_id: str, node_ids: List[int]) -> None:
+    """Wait until all of the nodes' assets have been uploaded."""
+
+    loop = asyncio.get_running_loop()
+    with _upload_lock:
+        counts = _pending_upload_counts.get(dispatch_id, {})
+        waiters = _upload_waiters.setdefault(dispatch_id, {})
+        futures = []
+        for node_id in node_ids:
+            if node_id in counts:
+                if node_id not in waiters:
+                    waiters[node_id] = loop.create_future()
+                futures.append(waiters[node_id])
+        if not waiters:
+            del _upload_waiters[dispatch_id]
+
+    if futures:
+        await asyncio.gather(*futures)
+
+
+def discard_pending_uploads(dispatch_id: str) -> None:
+    """Stop tracking a dispatch's pending uploads and release any
+    tasks waiting for them."""
+
+    local_store.discard_pending_links(dispatch_id)
+
+    with _upload_lock:
+        counts = _pending_upload_counts.pop(dispatch_id, {})
+        if counts:
+            for path in [p for p, e in _pending_uploads.items() if e[0] == dispatch_id]:
+                del _pending_uploads[path]
+        for node_id in list(_upload_waiters.get(dispatch_id, {})):
+            _resolve_upload_waiter(dispatch_id, node_id)
+
+
+# Must be called with _upload_lock held
+def _resolve_upload_waiter(dispatch_id: str, node_id: int) -> None:
+    waiters = _upload_waiters.get(dispatch_id)
+    if not waiters or node_id not in waiters:
+        return
+
+    fut = waiters.pop(node_id)
+    if not waiters:
+        del _upload_waiters[dispatch_id]
+    fut.get_loop().call_soon_threadsafe(_set_future_done, fut)
+
+
+def _set_future_done(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
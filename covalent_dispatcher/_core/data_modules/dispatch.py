@@ -20,18 +20,18 @@ Queries involving dispatches
 
 from typing import Dict, List
 
-from ..._dal.result import get_result_object
-from .utils import run_in_executor
+from .object_cache import get_result_object, refresh_dispatch_metadata
+from .utils import run_in_read_executor, run_in_write_executor
 
 
 def get_sync(dispatch_id: str, keys: List[str]) -> Dict:
-    refresh = False
     result_object = get_result_object(dispatch_id)
-    return result_object.get_values(keys, refresh=refresh)
+    refresh_dispatch_metadata(result_object, keys)
+    return result_object.get_values(keys, refresh=False)
 
 
 async def get(dispatch_id: str, keys: List[str]) -> Dict:
-    return await run_in_executor(
+    return await run_in_read_executor(
         get_sync,
         dispatch_id,
         keys,
@@ -54,7 +54,7 @@ async def get_incomplete_tasks(dispatch_id: str) -> Dict:
         {"cancelled": [node_ids], "failed": [node_ids]}
     """
 
-    return await run_in_executor(get_incomplete_tasks_sync, dispatch_id)
+    return await run_in_read_executor(get_incomplete_tasks_sync, dispatch_id)
 
 
 def update_sync(dispatch_id, dispatch_result):
@@ -63,4 +63,4 @@ def update_sync(dispatch_id, dispatch_result):
 
 
 async def update(dispatch_id, dispatch_result):
-    await run_in_executor(update_sync, dispatch_id, dispatch_result)
+    await run_in_write_executor(dispatch_id, update_sync, dispatch_id, dispatch_result)
@@ -20,8 +20,8 @@ Utilities for querying the transport graph
 
 from typing import Dict, List
 
-from ..._dal.result import get_result_object
-from .utils import run_in_executor
+from .object_cache import get_result_object
+from .utils import run_in_read_executor, run_in_write_executor
 
 
 def get_bulk_sync(dispatch_id: str, node_ids: List[int], keys: List[str]) -> List[Dict]:
@@ -64,7 +64,7 @@ async def get_bulk(dispatch_id: str, node_ids: List[int], keys: List[str]) -> Li
     ```
 
     """
-    return await run_in_executor(
+    return await run_in_read_executor(
         get_bulk_sync,
         dispatch_id,
         node_ids,
@@ -107,4 +107,19 @@ def update_sync(dispatch_id: str, node_result: Dict):
 
 async def update(dispatch_id: str, node_result: Dict):
     """Update a node's attributes"""
-    return await run_in_executor(update_sync, dispatch_id, node_result)
+    return await run_in_write_executor(dispatch_id, update_sync, dispatch_id, node_result)
+
+
+def update_bulk_sync(dispatch_id: str, node_results: List[Dict]) -> List[bool]:
+    result_object = get_result_object(dispatch_id, bare=True)
+    return result_object._update_nodes_bulk(node_results)
+
+
+async def update_bulk(dispatch_id: str, node_results: List[Dict]) -> List[bool]:
+    """Update the attributes of several nodes in one transaction.
+
+    Returns:
+        A list of booleans indicating whether each update was valid,
+        in the same order as `node_results`
+    """
+    return await run_in_write_executor(dispatch_id, update_bulk_sync, dispatch_id, node_results)
@@ -25,8 +25,8 @@ from typing import Dict, List
 
 import networkx as nx
 
-from ..._dal.result import get_result_object
-from .utils import run_in_executor
+from .object_cache import get_result_object
+from .utils import run_in_read_executor
 
 
 def get_incoming_edges_sync(dispatch_id: str, node_id: int):
@@ -83,7 +83,7 @@ def get_nodes_sync(dispatch_id: str) -> List[int]:
 
 
 async def get_incoming_edges(dispatch_id: str, node_id: int):
-    return await run_in_executor(get_incoming_edges_sync, dispatch_id, node_id)
+    return await run_in_read_executor(get_incoming_edges_sync, dispatch_id, node_id)
 
 
 async def get_node_successors(
@@ -91,12 +91,12 @@ async def get_node_successors(
     node_id: int,
     attrs: List[str] = ["task_group_id"],
 ) -> List[Dict]:
-    return await run_in_executor(get_node_successors_sync, dispatch_id, node_id, attrs)
+    return await run_in_read_executor(get_node_successors_sync, dispatch_id, node_id, attrs)
 
 
 async def get_nodes_links(dispatch_id: str) -> Dict:
-    return await run_in_executor(get_nodes_links_sync, dispatch_id)
+    return await run_in_read_executor(get_nodes_links_sync, dispatch_id)
 
 
 async def get_nodes(dispatch_id: str) -> List[int]:
-    return await run_in_executor(get_nodes_sync, dispatch_id)
+    return await run_in_read_executor(get_nodes_sync, dispatch_id)
@@ -18,26 +18,28 @@
 Functionality for importing dispatch submissions
 """
 
+import os
 import shutil
+import tarfile
+import tempfile
 import uuid
-from typing import Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from covalent._dispatcher_plugins.local import decode_b64_tar, untar_staging_dir
+from covalent._dispatcher_plugins.local import b64_decode_stream, rewrite_staging_uris
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 from covalent._shared_files.schemas.result import ResultSchema
+from covalent_dispatcher._dal.asset import Asset, AssetCopy, StorageType, local_store
 from covalent_dispatcher._dal.importers.result import handle_redispatch, import_result
 from covalent_dispatcher._dal.result import Result as SRVResult
 
+from .asset_manager import copy_assets_in_background, expect_uploads
 from .utils import run_in_executor
 
 BASE_PATH = get_config("dispatcher.results_dir")
 
 app_log = logger.app_log
 
-# Concurrent futures for copying assets during redispatch
-copy_futures = {}
-
 
 # Domain: result
 def get_unique_id() -> str:
@@ -97,6 +99,32 @@ def _pull_assets(manifest: ResultSchema) -> None:
     app_log.debug(f"imported {download_count} assets for dispatch {dispatch_id}")
 
 
+def _expect_uploads(manifest: ResultSchema) -> None:
+    """Track the node assets which the client will push.
+
+    These are the assets assigned an upload URI as well as those to be
+    linked to identical uploads once their data arrives.
+    """
+
+    dispatch_id = manifest.metadata.dispatch_id
+    linked_paths = local_store.get_pending_links()
+    paths_by_node = {}
+    for node in manifest.lattice.transport_graph.nodes:
+        paths = []
+        for key, asset in node.assets:
+            # Pulled and empty assets are populated during import
+            if asset.uri or asset.size == 0:
+                continue
+            storage_path, object_key = local_store.get_uri_components(dispatch_id, node.id, key)
+            path = os.path.join(storage_path, object_key)
+            if asset.remote_uri or path in linked_paths:
+                paths.append(path)
+        if paths:
+            paths_by_node[node.id] = paths
+
+    expect_uploads(dispatch_id, paths_by_node)
+
+
 async def import_manifest(
     manifest: ResultSchema,
     parent_dispatch_id: Optional[str],
@@ -106,6 +134,7 @@ async def import_manifest(
         _import_manifest, manifest, parent_dispatch_id, parent_electron_id
     )
     await run_in_executor(_pull_assets, filtered_manifest)
+    await run_in_executor(_expect_uploads, filtered_manifest)
 
     return filtered_manifest
 
@@ -114,13 +143,9 @@ def _import_derived_manifest(
     manifest: ResultSchema,
     parent_dispatch_id: str,
     reuse_previous_results: bool,
-) -> ResultSchema:
+) -> Tuple[ResultSchema, List[AssetCopy]]:
     filtered_manifest = _import_manifest(manifest, None, None)
-    filtered_manifest, assets_to_copy = handle_redispatch(
-        filtered_manifest, parent_dispatch_id, reuse_previous_results
-    )
-
-    return filtered_manifest
+    return handle_redispatch(filtered_manifest, parent_dispatch_id, reuse_previous_results)
 
 
 async def import_derived_manifest(
@@ -128,7 +153,7 @@ async def import_derived_manifest(
     parent_dispatch_id: str,
     reuse_previous_results: bool,
 ) -> ResultSchema:
-    filtered_manifest = await run_in_executor(
+    filtered_manifest, assets_to_copy = await run_in_executor(
         _import_derived_manifest,
         manifest,
         parent_dispatch_id,
@@ -136,6 +161,10 @@ async def import_derived_manifest(
     )
 
     await run_in_executor(_pull_assets, filtered_manifest)
+    await run_in_executor(_expect_uploads, filtered_manifest)
+
+    # Reused assets are copied while the redispatch runs
+    copy_assets_in_background(filtered_manifest.metadata.dispatch_id, assets_to_copy)
 
     return filtered_manifest
 
@@ -144,18 +173,135 @@ async def import_derived_manifest(
 # For handling sublattice dispatches
 def import_b64_staging_tarball(
     b64_buffer: str, parent_dispatch_id: str, parent_electron_id: str
-) -> Tuple[str, ResultSchema]:
-    tar_path = decode_b64_tar(b64_buffer)
-    work_dir, manifest = untar_staging_dir(tar_path)
-
-    app_log.debug(f"Extracted tarball to working directory {work_dir}")
-    filtered_manifest = _import_manifest(
-        manifest,
-        parent_dispatch_id,
-        parent_electron_id,
+) -> ResultSchema:
+    return import_staging_tarball_stream(
+        [b64_buffer.encode("utf-8")], parent_dispatch_id, parent_electron_id
     )
-    _pull_assets(filtered_manifest)
 
-    shutil.rmtree(work_dir)
-    app_log.debug(f"Cleaned up working directory {work_dir}")
+
+def import_staging_tarball_stream(
+    b64_chunks: Iterable[bytes], parent_dispatch_id: str, parent_electron_id: str
+) -> ResultSchema:
+    """Import a b64 tarball of a client-side staging directory as a stream.
+
+    The manifest is imported as soon as it is read, after which each
+    asset is written directly to its storage location as it is read from
+    the archive. Only assets preceding the manifest in the archive are
+    extracted to a temporary working directory.
+
+    Args:
+        b64_chunks: The base64-encoded tarball in chunks
+        parent_dispatch_id: The dispatch containing the sublattice electron
+        parent_electron_id: The id of the sublattice electron
+
+    Returns:
+        The filtered manifest of the imported dispatch
+    """
+
+    filtered_manifest = None
+    staged_assets = {}
+
+    with tempfile.TemporaryDirectory(prefix="postprocess-") as work_dir:
+        extracted = []
+        with tarfile.open(fileobj=b64_decode_stream(b64_chunks), mode="r|") as tar:
+            for member in tar:
+                if filtered_manifest is None and member.name.endswith("manifest.json"):
+                    manifest = ResultSchema.model_validate_json(tar.extractfile(member).read())
+                    rewrite_staging_uris(manifest, work_dir)
+                    filtered_manifest = _import_manifest(
+                        manifest, parent_dispatch_id, parent_electron_id
+                    )
+                    staged_assets = _get_staged_assets(filtered_manifest.metadata.dispatch_id)
+                    for path in extracted:
+                        _store_extracted_asset(staged_assets, path)
+
+                elif not member.isfile():
+                    continue
+
+                elif filtered_manifest is None:
+                    tar.extract(member, path=work_dir, filter="tar")
+                    extracted.append(os.path.join(work_dir, member.name))
+
+                else:
+                    assets = staged_assets.pop(os.path.join(work_dir, member.name), [])
+                    if assets:
+                        _store_asset_stream(assets[0], tar.extractfile(member))
+                        _share_stored_data(assets[0], assets[1:])
+
+        if filtered_manifest is None:
+            raise RuntimeError("Archive contains no manifest")
+
+        # Pull any remaining assets not contained in the archive
+        for assets in staged_assets.values():
+            for asset in assets:
+                asset.download(asset.remote_uri)
+
+    app_log.debug(
+        f"Imported staging tarball for dispatch {filtered_manifest.metadata.dispatch_id}"
+    )
     return filtered_manifest
+
+
+def _get_staged_assets(dispatch_id: str) -> Dict[str, List[Asset]]:
+    """Map the local path of the data of each asset to be pulled to the
+    assets sharing it."""
+
+    scheme_prefix = "file://"
+    assets = _get_all_assets(dispatch_id)
+    staged_assets = {}
+    for asset in assets["lattice"] + assets["nodes"]:
+        if asset.remote_uri:
+            path = asset.remote_uri
+            if path.startswith(scheme_prefix):
+                path = path[len(scheme_prefix) :]
+            staged_assets.setdefault(path, []).append(asset)
+    return staged_assets
+
+
+def _store_asset_stream(asset: Asset, src) -> None:
+    if asset.storage_type != StorageType.LOCAL.value:
+        with tempfile.NamedTemporaryFile() as f:
+            shutil.copyfileobj(src, f)
+            f.flush()
+            asset.download(f"file://{f.name}")
+        return
+
+    dest_path = os.path.join(asset.storage_path, asset.object_key)
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    tmp_path = f"{dest_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            shutil.copyfileobj(src, f)
+        os.replace(tmp_path, dest_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _store_extracted_asset(staged_assets: Dict[str, List[Asset]], path: str) -> None:
+    assets = staged_assets.pop(path, [])
+    if not assets:
+        return
+    asset = assets[0]
+    if asset.storage_type == StorageType.LOCAL.value:
+        dest_path = os.path.join(asset.storage_path, asset.object_key)
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        shutil.move(path, dest_path)
+    else:
+        asset.download(f"file://{path}")
+    _share_stored_data(asset, assets[1:])
+
+
+def _share_stored_data(src: Asset, assets: List[Asset]) -> None:
+    """Populate assets whose data is identical to that just stored for `src`."""
+
+    for asset in assets:
+        if src.storage_type == asset.storage_type == StorageType.LOCAL.value:
+            local_store.link_or_copy(
+                src.storage_path, src.object_key, asset.storage_path, asset.object_key
+            )
+        else:
+            asset.download(
+                f"{src.storage_type}://{os.path.join(src.storage_path, src.object_key)}"
+            )
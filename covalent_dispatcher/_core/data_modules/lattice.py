@@ -20,8 +20,8 @@ Queries involving lattice
 
 from typing import Dict, List
 
-from ..._dal.result import get_result_object
-from .utils import run_in_executor
+from .object_cache import get_result_object
+from .utils import run_in_read_executor
 
 
 def get_sync(dispatch_id: str, keys: List[str]) -> Dict:
@@ -31,7 +31,7 @@ def get_sync(dispatch_id: str, keys: List[str]) -> Dict:
 
 
 async def get(dispatch_id: str, keys: List[str]) -> Dict:
-    return await run_in_executor(
+    return await run_in_read_executor(
         get_sync,
         dispatch_id,
         keys,
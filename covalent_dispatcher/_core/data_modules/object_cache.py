@@ -0,0 +1,111 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Cache of bare DAL result objects for the dispatcher core
+"""
+
+import threading
+from collections import OrderedDict
+
+from covalent._shared_files import logger
+from covalent._shared_files.config import get_config
+
+from ..._dal.result import Result
+from ..._dal.result import get_result_object as get_result_object_from_db
+
+app_log = logger.app_log
+
+RESULT_OBJECT_CACHE_SIZE = int(get_config("dispatcher.result_object_cache_size"))
+
+# Dispatch metadata which never changes once a dispatch is registered.
+# Other keys, such as `status`, must be read through to the DB.
+STATIC_DISPATCH_KEYS = {"dispatch_id", "root_dispatch_id", "results_dir", "num_nodes"}
+
+
+class ResultObjectCache:
+    """LRU cache of bare `Result` objects keyed by dispatch id.
+
+    Bare result objects hold only static identifiers (record ids,
+    lattice id) and lazily populated asset links; node metadata is
+    always queried from the DB. Cached objects therefore stay valid for
+    the lifetime of a dispatch and are evicted when it is finalized.
+
+    Since each bare object is of constant size, bounding the number of
+    entries bounds the memory footprint of the cache.
+    """
+
+    def __init__(self, max_size: int = RESULT_OBJECT_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, dispatch_id: str) -> Result:
+        with self._lock:
+            result_object = self._entries.get(dispatch_id)
+            if result_object is not None:
+                self._entries.move_to_end(dispatch_id)
+                return result_object
+
+        # Build outside the lock so that a slow query doesn't block
+        # lookups for other dispatches
+        result_object = get_result_object_from_db(dispatch_id, bare=True)
+        if self.max_size < 1:
+            return result_object
+
+        with self._lock:
+            result_object = self._entries.setdefault(dispatch_id, result_object)
+            self._entries.move_to_end(dispatch_id)
+            while len(self._entries) > self.max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                app_log.debug(f"Evicted result object for {evicted}")
+        return result_object
+
+    def remove(self, dispatch_id: str):
+        with self._lock:
+            self._entries.pop(dispatch_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __contains__(self, dispatch_id: str) -> bool:
+        return dispatch_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_result_object_cache = ResultObjectCache()
+
+
+def get_result_object(dispatch_id: str, bare: bool = True) -> Result:
+    """Get a DAL result object, reusing cached bare objects.
+
+    Non-bare result objects hold a snapshot of every node's metadata and
+    are always loaded from the DB.
+    """
+    if bare:
+        return _result_object_cache.get(dispatch_id)
+    return get_result_object_from_db(dispatch_id, bare=False)
+
+
+def refresh_dispatch_metadata(result_object: Result, keys: list):
+    """Read through dynamic dispatch metadata in a single query."""
+    if not STATIC_DISPATCH_KEYS.issuperset(keys):
+        with result_object.session() as session:
+            result_object._refresh_metadata(session)
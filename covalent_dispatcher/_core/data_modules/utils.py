@@ -19,13 +19,64 @@ Utils for the data service
 """
 
 import asyncio
+import zlib
 from concurrent.futures import ThreadPoolExecutor
+from typing import List
 
-# Worker thread for Datastore I/O Clamp this threadpool to one
-# thread because Sqlite only supports a single writer.
-dm_pool = ThreadPoolExecutor(max_workers=1)
+from covalent._shared_files.config import get_config
+
+from ..._db.datastore import workflow_db
+
+READ_WORKERS = int(get_config("dispatcher.datastore_read_workers"))
+WRITE_WORKERS = int(get_config("dispatcher.datastore_write_workers"))
+
+
+def _create_pools(single_writer: bool, read_workers: int, write_workers: int):
+    """Create the read pool and the per-dispatch write lanes.
+
+    Each write lane is a single thread, so writes submitted for the
+    same dispatch run in submission order. For single-writer backends
+    (SQLite) every operation shares one thread.
+    """
+
+    if single_writer:
+        pool = ThreadPoolExecutor(max_workers=1)
+        return pool, [pool]
+
+    read_pool = ThreadPoolExecutor(max_workers=max(read_workers, 1))
+    write_lanes = [ThreadPoolExecutor(max_workers=1) for _ in range(max(write_workers, 1))]
+    return read_pool, write_lanes
+
+
+read_pool, write_lanes = _create_pools(workflow_db.is_sqlite, READ_WORKERS, WRITE_WORKERS)
+
+# Worker thread for Datastore I/O not tied to a particular dispatch
+dm_pool = write_lanes[0]
+
+
+def _write_lane(dispatch_id: str, lanes: List[ThreadPoolExecutor]) -> ThreadPoolExecutor:
+    return lanes[zlib.crc32(dispatch_id.encode()) % len(lanes)]
 
 
 def run_in_executor(func, *args) -> asyncio.Future:
     loop = asyncio.get_running_loop()
     return loop.run_in_executor(dm_pool, func, *args)
+
+
+def run_in_read_executor(func, *args) -> asyncio.Future:
+    """Run a read-only datastore query.
+
+    Reads may run concurrently with each other and with writes.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(read_pool, func, *args)
+
+
+def run_in_write_executor(dispatch_id: str, func, *args) -> asyncio.Future:
+    """Run a datastore write for a dispatch.
+
+    Writes for the same dispatch are executed sequentially in the
+    order in which they were submitted.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(_write_lane(dispatch_id, write_lanes), func, *args)
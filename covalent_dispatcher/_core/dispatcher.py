@@ -21,21 +21,25 @@ Defines the core functionality of the dispatcher
 import asyncio
 import traceback
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 
 import networkx as nx
 
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
-from covalent._shared_files.defaults import WAIT_EDGE_NAME, parameter_prefix
+from covalent._shared_files.defaults import WAIT_EDGE_NAME, parameter_prefix, sublattice_prefix
 from covalent._shared_files.util_classes import RESULT_STATUS
 
 from . import data_manager as datasvc
 from . import runner_ng
+from .data_modules import asset_manager as am
 from .data_modules import graph as tg_utils
 from .data_modules import job_manager as jbmgr
+from .dispatcher_modules.adjacency import _adjacency_cache
 from .dispatcher_modules.caches import _task_group_cache, _workflow_run_cache
+from .dispatcher_modules.metrics import _event_metrics
 from .runner_modules.cancel import cancel_tasks
+from .runner_modules.inline import is_inline_eligible, run_inline_task
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
@@ -47,6 +51,36 @@ _global_event_listener = None
 
 SYNC_DISPATCHES = get_config("dispatcher.use_async_dispatcher") == "false"
 
+# Node status events are coalesced into batches of at most this size
+EVENT_BATCH_SIZE = int(get_config("dispatcher.event_batch_size"))
+EVENT_BATCH_LINGER = float(get_config("dispatcher.event_batch_linger"))
+DISCARD_INTERNAL_OUTPUTS = get_config("dispatcher.discard_internal_outputs") == "true"
+INLINE_TASKS = get_config("dispatcher.inline_tasks") == "true"
+
+
+# Domain: dispatcher
+async def _get_incoming_edges(dispatch_id: str, node_id: int) -> List[Dict]:
+    index = _adjacency_cache.get(dispatch_id)
+    if index:
+        return index.get_incoming_edges(node_id)
+    return await tg_utils.get_incoming_edges(dispatch_id, node_id)
+
+
+# Domain: dispatcher
+async def _get_node_successors(dispatch_id: str, node_id: int) -> List[Dict]:
+    index = _adjacency_cache.get(dispatch_id)
+    if index:
+        return index.get_successors(node_id)
+    return await tg_utils.get_node_successors(dispatch_id, node_id)
+
+
+# Domain: dispatcher
+async def _get_task_group_id(dispatch_id: str, node_id: int) -> int:
+    index = _adjacency_cache.get(dispatch_id)
+    if index:
+        return index.get_task_group_id(node_id)
+    return (await datasvc.electron.get(dispatch_id, node_id, ["task_group_id"]))["task_group_id"]
+
 
 # Domain: dispatcher
 async def _get_abstract_task_inputs(dispatch_id: str, node_id: int, node_name: str) -> dict:
@@ -64,7 +98,7 @@ async def _get_abstract_task_inputs(dispatch_id: str, node_id: int, node_name: s
 
     abstract_task_input = {"args": [], "kwargs": {}}
 
-    for edge in await tg_utils.get_incoming_edges(dispatch_id, node_id):
+    for edge in await _get_incoming_edges(dispatch_id, node_id):
         parent = edge["source"]
 
         d = edge["attrs"]
@@ -82,15 +116,44 @@ async def _get_abstract_task_inputs(dispatch_id: str, node_id: int, node_name: s
     return abstract_task_input
 
 
+# Domain: dispatcher
+async def _get_internal_outputs(dispatch_id: str, sorted_nodes: List[int]) -> Set[int]:
+    """Find the tasks in a task group whose outputs are consumed only
+    by other tasks in the group.
+
+    Outputs of tasks without successors are needed for the workflow
+    result, and sublattice outputs are needed by the dispatcher, so
+    those are never considered internal.
+
+    Args:
+        dispatch_id: id of the current dispatch
+        sorted_nodes: The tasks in the task group
+
+    Returns:
+        The node ids of the tasks whose outputs need not be stored.
+    """
+
+    sorted_nodes_set = set(sorted_nodes)
+    names = await datasvc.electron.get_bulk(dispatch_id, sorted_nodes, ["name"])
+
+    internal = set()
+    for node_id, record in zip(sorted_nodes, names):
+        if record["name"].startswith(sublattice_prefix):
+            continue
+        successors = await _get_node_successors(dispatch_id, node_id)
+        if successors and all(child["node_id"] in sorted_nodes_set for child in successors):
+            internal.add(node_id)
+
+    return internal
+
+
 # Domain: dispatcher
 async def _handle_completed_node(dispatch_id: str, node_id: int):
     next_task_groups = []
     app_log.debug(f"Node {node_id} completed")
 
-    parent_gid = (await datasvc.electron.get(dispatch_id, node_id, ["task_group_id"]))[
-        "task_group_id"
-    ]
-    for child in await tg_utils.get_node_successors(dispatch_id, node_id):
+    parent_gid = await _get_task_group_id(dispatch_id, node_id)
+    for child in await _get_node_successors(dispatch_id, node_id):
         node_id = child["node_id"]
         gid = child["task_group_id"]
         app_log.debug(f"dispatch {dispatch_id}: parent gid {parent_gid}, child gid {gid}")
@@ -133,6 +196,10 @@ async def _get_initial_tasks_and_deps(dispatch_id: str) -> Tuple[int, int, Dict]
     g_node_link = await tg_utils.get_nodes_links(dispatch_id)
     g = nx.readwrite.node_link_graph(g_node_link)
 
+    # The graph is immutable from now on; serve all subsequent edge
+    # and successor queries from memory
+    _adjacency_cache.build(dispatch_id, g)
+
     # Topologically sort each task group
     sorted_task_groups = {}
     for node_id in nx.topological_sort(g):
@@ -157,8 +224,31 @@ async def _get_initial_tasks_and_deps(dispatch_id: str) -> Tuple[int, int, Dict]
     return initial_task_groups, pending_parents, sorted_task_groups
 
 
+# Domain: dispatcher
+async def _submit_task_group_after_uploads(
+    dispatch_id: str, sorted_nodes: List[int], task_group_id: int
+):
+    try:
+        await am.wait_for_uploads(dispatch_id, sorted_nodes)
+        app_log.debug(f"Assets for task group {dispatch_id}:{task_group_id} have been uploaded")
+        await _submit_task_group(dispatch_id, sorted_nodes, task_group_id)
+    except Exception as ex:
+        await _abort_dispatch(dispatch_id, ex)
+
+
 # Domain: dispatcher
 async def _submit_task_group(dispatch_id: str, sorted_nodes: List[int], task_group_id: int):
+    # Dispatches may be started while the client is still uploading
+    # assets; defer task groups whose assets have yet to arrive
+    if am.has_pending_uploads(dispatch_id, sorted_nodes):
+        app_log.debug(f"Waiting for assets of task group {dispatch_id}:{task_group_id}")
+        fut = asyncio.create_task(
+            _submit_task_group_after_uploads(dispatch_id, sorted_nodes, task_group_id)
+        )
+        _background_tasks.add(fut)
+        fut.add_done_callback(_background_tasks.discard)
+        return
+
     # Handle parameter nodes
     # Get name of the node for the current task
     node_name = (await datasvc.electron.get(dispatch_id, sorted_nodes[0], ["name"]))["name"]
@@ -193,12 +283,25 @@ async def _submit_task_group(dispatch_id: str, sorted_nodes: List[int], task_gro
             filter(lambda record: record["status"] != RESULT_STATUS.PENDING_REUSE, statuses)
         )
 
+        if incomplete and INLINE_TASKS and len(sorted_nodes) == 1:
+            # Built-in nodes are evaluated without a round trip to an executor
+            node_id = sorted_nodes[0]
+            inline = (await datasvc.electron.get(dispatch_id, node_id, ["inline"]))["inline"]
+            if is_inline_eligible(node_name, inline):
+                abs_task_input = await _get_abstract_task_inputs(dispatch_id, node_id, node_name)
+                if await run_inline_task(dispatch_id, node_id, node_name, abs_task_input):
+                    return
+
         if incomplete:
             # Gather inputs for each task and send the task spec sequence to the runner
             task_specs = []
 
             sorted_nodes_set = set(sorted_nodes)
 
+            internal_outputs = set()
+            if DISCARD_INTERNAL_OUTPUTS and len(sorted_nodes) > 1:
+                internal_outputs = await _get_internal_outputs(dispatch_id, sorted_nodes)
+
             for node_id in sorted_nodes:
                 app_log.debug(f"Gathering inputs for task {node_id} (run_planned_workflow).")
 
@@ -216,6 +319,7 @@ async def _submit_task_group(dispatch_id: str, sorted_nodes: List[int], task_gro
                     "name": node_name,
                     "args": abs_task_input["args"],
                     "kwargs": abs_task_input["kwargs"],
+                    "persist_output": node_id not in internal_outputs,
                 }
                 # Task inputs that don't belong to the task group have already beeen resolved
                 external_task_args = filter(
@@ -347,16 +451,22 @@ async def cancel_dispatch(dispatch_id: str, task_ids: List[int] = None) -> None:
     if not dispatch_id:
         return
 
+    cancel_all = not task_ids
     if task_ids:
         app_log.debug(f"Cancelling tasks {task_ids} in dispatch {dispatch_id}")
     else:
-        task_ids = await tg_utils.get_nodes(dispatch_id)
+        index = _adjacency_cache.get(dispatch_id)
+        task_ids = index.get_nodes() if index else await tg_utils.get_nodes(dispatch_id)
 
         app_log.debug(f"Cancelling dispatch {dispatch_id}")
 
     await jbmgr.set_cancel_requested(dispatch_id, task_ids)
     await cancel_tasks(dispatch_id, task_ids)
 
+    # Release any tasks waiting for uploads so that they are cancelled
+    if cancel_all:
+        am.discard_pending_uploads(dispatch_id)
+
     # Recursively cancel running sublattice dispatches
     attrs = await datasvc.electron.get_bulk(dispatch_id, task_ids, ["sub_dispatch_id"])
     sub_ids = list(map(lambda x: x["sub_dispatch_id"], attrs))
@@ -364,6 +474,79 @@ async def cancel_dispatch(dispatch_id: str, task_ids: List[int] = None) -> None:
         await cancel_dispatch(sub_dispatch_id)
 
 
+async def resume_dispatch(dispatch_id: str) -> bool:
+    """Resume a running dispatch after a dispatcher restart.
+
+    The dispatch's run state is restored from the last snapshot of the
+    dispatcher caches. Snapshots can miss the last node events before
+    the restart, so the pending parent counts are reconciled with the
+    node statuses in the DB. Executions of ready task groups were lost
+    with the previous process and are resubmitted.
+
+    Args:
+        dispatch_id: The id of a dispatch in the RUNNING state
+
+    Returns:
+        Whether the dispatch's run state could be restored.
+    """
+
+    if not await _task_group_cache.restore(dispatch_id):
+        return False
+    if not await _workflow_run_cache.restore(dispatch_id):
+        return False
+
+    g_node_link = await tg_utils.get_nodes_links(dispatch_id)
+    g = nx.readwrite.node_link_graph(g_node_link)
+    _adjacency_cache.build(dispatch_id, g)
+
+    node_ids = list(g.nodes)
+    records = await datasvc.electron.get_bulk(dispatch_id, node_ids, ["status", "sub_dispatch_id"])
+    node_info = dict(zip(node_ids, records))
+
+    pending_parents = {g.nodes[node_id]["task_group_id"]: 0 for node_id in node_ids}
+    for parent, child in g.edges():
+        parent_gid = g.nodes[parent]["task_group_id"]
+        child_gid = g.nodes[child]["task_group_id"]
+        if parent_gid != child_gid and node_info[parent]["status"] != RESULT_STATUS.COMPLETED:
+            pending_parents[child_gid] += 1
+
+    ready_task_groups = {}
+    num_unresolved = 0
+    for gid, num_pending in pending_parents.items():
+        sorted_nodes = await _task_group_cache.get_task_group(dispatch_id, gid)
+        await _task_group_cache.set(dispatch_id, gid, num_pending, sorted_nodes)
+        if num_pending > 0:
+            continue
+
+        unfinished = [
+            node_id
+            for node_id in sorted_nodes
+            if not RESULT_STATUS.is_terminal(node_info[node_id]["status"])
+        ]
+        num_unresolved += len(unfinished)
+        for node_id in unfinished:
+            if node_info[node_id]["status"] == RESULT_STATUS.DISPATCHING:
+                # Sublattices complete along with their sub-dispatch
+                run_dispatch(node_info[node_id]["sub_dispatch_id"])
+            else:
+                ready_task_groups[gid] = sorted_nodes
+
+    await _workflow_run_cache.set_unresolved(dispatch_id, num_unresolved)
+    app_log.debug(f"Resuming dispatch {dispatch_id} with {num_unresolved} unresolved tasks")
+
+    # The client may still be uploading the assets of unstarted tasks
+    new_nodes = [
+        node_id for node_id in node_ids if node_info[node_id]["status"] == RESULT_STATUS.NEW_OBJECT
+    ]
+    await am.restore_pending_uploads(dispatch_id, new_nodes)
+
+    for gid, sorted_nodes in ready_task_groups.items():
+        await _submit_task_group(dispatch_id, sorted_nodes, gid)
+
+    await _finalize_if_resolved(dispatch_id)
+    return True
+
+
 def run_dispatch(dispatch_id: str) -> asyncio.Future:
     fut = asyncio.create_task(run_workflow(dispatch_id))
     _background_tasks.add(fut)
@@ -506,14 +689,63 @@ async def _handle_dispatch_exception(dispatch_id: str, ex: Exception) -> RESULT_
 # }
 async def _node_event_listener():
     app_log.debug("Starting event listener")
+    if EVENT_BATCH_SIZE > 1:
+        await _batched_node_event_listener(EVENT_BATCH_SIZE, EVENT_BATCH_LINGER)
+        return
+
     while True:
         msg = await _global_status_queue.get()
+        _event_metrics.record(1)
 
         fut = asyncio.create_task(_handle_event(msg))
         _background_tasks.add(fut)
         fut.add_done_callback(_background_tasks.discard)
 
 
+async def _batched_node_event_listener(max_batch_size: int, linger: float):
+    """Event listener which coalesces status updates into micro-batches.
+
+    Each batch is split by dispatch and the updates for each dispatch
+    are handled together by `_handle_event_batch()`.
+    """
+    app_log.debug(f"Coalescing node events (batch size {max_batch_size}, linger {linger}s)")
+    while True:
+        batch = await _get_event_batch(max_batch_size, linger)
+        _event_metrics.record(len(batch))
+
+        msgs_by_dispatch = {}
+        for msg in batch:
+            msgs_by_dispatch.setdefault(msg["dispatch_id"], []).append(msg)
+
+        for dispatch_id, msgs in msgs_by_dispatch.items():
+            fut = asyncio.create_task(_handle_event_batch(dispatch_id, msgs))
+            _background_tasks.add(fut)
+            fut.add_done_callback(_background_tasks.discard)
+
+
+async def _get_event_batch(max_batch_size: int, linger: float) -> List[Dict]:
+    """Wait for at least one event, then drain the queue for up to
+    `linger` seconds or until `max_batch_size` events are collected."""
+    loop = asyncio.get_running_loop()
+    batch = [await _global_status_queue.get()]
+    deadline = loop.time() + linger
+    while len(batch) < max_batch_size:
+        try:
+            batch.append(_global_status_queue.get_nowait())
+            continue
+        except asyncio.QueueEmpty:
+            pass
+
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(_global_status_queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
 async def _handle_event(msg: Dict):
     dispatch_id = msg["dispatch_id"]
     node_id = msg["node_id"]
@@ -524,13 +756,100 @@ async def _handle_event(msg: Dict):
         await _handle_node_status_update(dispatch_id, node_id, node_status, detail)
 
     except Exception as ex:
-        dispatch_status = await _handle_dispatch_exception(dispatch_id, ex)
-        await datasvc.persist_result(dispatch_id)
-        fut = _futures.get(dispatch_id)
-        if fut:
-            fut.set_result(dispatch_status)
-        return dispatch_status
+        return await _abort_dispatch(dispatch_id, ex)
+
+    return await _finalize_if_resolved(dispatch_id)
+
+
+async def _handle_event_batch(dispatch_id: str, msgs: List[Dict]):
+    try:
+        await _handle_node_status_updates(dispatch_id, msgs)
+
+    except Exception as ex:
+        return await _abort_dispatch(dispatch_id, ex)
+
+    return await _finalize_if_resolved(dispatch_id)
+
+
+async def _handle_node_status_updates(dispatch_id: str, msgs: List[Dict]):
+    """Apply a batch of node status updates for a single dispatch.
+
+    Pending parent counters for all affected task groups are
+    decremented in a single cache update, and the task groups which
+    become ready are submitted together.
+    """
+    app_log.debug(f"Received {len(msgs)} node status updates for {dispatch_id}")
+
+    # task_group_id -> number of completed in-edges from other groups
+    decrements = {}
+    num_terminal = 0
+    for msg in msgs:
+        node_id = msg["node_id"]
+        node_status = msg["status"]
+
+        if node_status == RESULT_STATUS.RUNNING:
+            continue
+
+        if node_status == RESULT_STATUS.DISPATCHING:
+            sub_dispatch_id = msg["detail"]["sub_dispatch_id"]
+            run_dispatch(sub_dispatch_id)
+            app_log.debug(f"Running sublattice dispatch {sub_dispatch_id}")
+            continue
+
+        num_terminal += 1
+
+        if node_status == RESULT_STATUS.COMPLETED:
+            parent_gid = await _get_task_group_id(dispatch_id, node_id)
+            for child in await _get_node_successors(dispatch_id, node_id):
+                gid = child["task_group_id"]
+                if gid != parent_gid:
+                    decrements[gid] = decrements.get(gid, 0) + 1
+
+        if node_status == RESULT_STATUS.FAILED:
+            await _handle_failed_node(dispatch_id, node_id)
+
+        if node_status == RESULT_STATUS.CANCELLED:
+            await _handle_cancelled_node(dispatch_id, node_id)
+
+    ready_task_groups = []
+    if decrements:
+        now_pending = await _task_group_cache.decrement_bulk(dispatch_id, decrements)
+        for gid, num_pending in now_pending.items():
+            if num_pending < 1:
+                sorted_nodes = await _task_group_cache.get_task_group(dispatch_id, gid)
+                ready_task_groups.append((gid, sorted_nodes))
+
+    num_ready_tasks = sum(len(sorted_nodes) for _, sorted_nodes in ready_task_groups)
+    if num_ready_tasks:
+        await _workflow_run_cache.increment(dispatch_id, num_ready_tasks)
+
+    for gid, sorted_nodes in ready_task_groups:
+        app_log.debug(f"Queuing task group {gid} for execution")
+        await _submit_task_group(dispatch_id, sorted_nodes, gid)
+
+    # Decrement after any increments to avoid race with
+    # finalize_dispatch()
+    if num_terminal:
+        await _workflow_run_cache.increment(dispatch_id, -num_terminal)
+
 
+async def _abort_dispatch(dispatch_id: str, ex: Exception) -> RESULT_STATUS:
+    dispatch_status = await _handle_dispatch_exception(dispatch_id, ex)
+    await datasvc.persist_result(dispatch_id)
+
+    # Release the dispatch's run state as on completion
+    try:
+        await _clear_caches(dispatch_id)
+    except Exception as e:
+        app_log.debug(f"Unable to clear caches for dispatch {dispatch_id}: {e}")
+
+    fut = _futures.get(dispatch_id)
+    if fut:
+        fut.set_result(dispatch_status)
+    return dispatch_status
+
+
+async def _finalize_if_resolved(dispatch_id: str):
     unresolved = await _workflow_run_cache.get_unresolved(dispatch_id)
     if unresolved < 1:
         app_log.debug("Finalizing dispatch")
@@ -541,6 +860,7 @@ async def _handle_event(msg: Dict):
 
         finally:
             await datasvc.persist_result(dispatch_id)
+            datasvc.finalize_dispatch(dispatch_id)
             fut = _futures.get(dispatch_id)
             if fut:
                 fut.set_result(dispatch_status)
@@ -552,11 +872,17 @@ async def _clear_caches(dispatch_id: str):
     """Clean up all keys in caches."""
     await _workflow_run_cache.remove(dispatch_id)
 
-    g_node_link = await tg_utils.get_nodes_links(dispatch_id)
-    g = nx.readwrite.node_link_graph(g_node_link)
-
-    task_groups = {g.nodes[i]["task_group_id"] for i in g.nodes}
+    index = _adjacency_cache.get(dispatch_id)
+    if index:
+        task_groups = index.get_task_groups()
+    else:
+        g_node_link = await tg_utils.get_nodes_links(dispatch_id)
+        g = nx.readwrite.node_link_graph(g_node_link)
+        task_groups = {g.nodes[i]["task_group_id"] for i in g.nodes}
 
     for gid in task_groups:
         # Clean up no longer referenced keys
         await _task_group_cache.remove(dispatch_id, gid)
+
+    _adjacency_cache.remove(dispatch_id)
+    am.discard_pending_uploads(dispatch_id)
@@ -0,0 +1,159 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Read-only adjacency index of a dispatch's transport graph
+"""
+
+from array import array
+from typing import Dict, List, Optional
+
+import networkx as nx
+
+# Sentinel for edges without an `arg_index`
+_NO_ARG_INDEX = -1
+
+
+class AdjacencyIndex:
+    """Compressed sparse row (CSR) adjacency of a transport graph.
+
+    The transport graph is immutable once a dispatch starts, so the
+    dispatcher compiles it once and serves edge and successor queries
+    from integer arrays instead of the DB. Nodes are addressed by their
+    position in `node_ids`; the in-edges of the node at position `i`
+    occupy `pred_offsets[i]:pred_offsets[i+1]` of the `pred_*` arrays and
+    its out-edges occupy `succ_offsets[i]:succ_offsets[i+1]` of
+    `succ_targets`. Parallel edges are stored with multiplicity.
+
+    Edge names and parameter types are stored as indices into a shared
+    string table.
+
+    Args:
+        g: The transport graph as a `MultiDiGraph` whose nodes carry
+            `task_group_id` and whose edges carry `edge_name`,
+            `param_type`, and `arg_index`.
+    """
+
+    def __init__(self, g: nx.MultiDiGraph):
+        node_ids = sorted(g.nodes)
+        self._positions = {node_id: i for i, node_id in enumerate(node_ids)}
+        self._strings = []
+        string_codes = {}
+
+        def _encode(s: str) -> int:
+            if s not in string_codes:
+                string_codes[s] = len(self._strings)
+                self._strings.append(s)
+            return string_codes[s]
+
+        self.node_ids = array("l", node_ids)
+        self.task_group_ids = array("l", (g.nodes[n]["task_group_id"] for n in node_ids))
+
+        self.pred_offsets = array("l", [0])
+        self.pred_sources = array("l")
+        self.pred_edge_names = array("l")
+        self.pred_param_types = array("l")
+        self.pred_arg_indices = array("l")
+        for node_id in node_ids:
+            for parent, _, attrs in g.in_edges(node_id, data=True):
+                arg_index = attrs.get("arg_index")
+                self.pred_sources.append(self._positions[parent])
+                self.pred_edge_names.append(_encode(attrs["edge_name"]))
+                self.pred_param_types.append(_encode(attrs["param_type"]))
+                self.pred_arg_indices.append(_NO_ARG_INDEX if arg_index is None else arg_index)
+            self.pred_offsets.append(len(self.pred_sources))
+
+        self.succ_offsets = array("l", [0])
+        self.succ_targets = array("l")
+        for node_id in node_ids:
+            for _, child in g.out_edges(node_id):
+                self.succ_targets.append(self._positions[child])
+            self.succ_offsets.append(len(self.succ_targets))
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def get_nodes(self) -> List[int]:
+        """Return all node ids in the graph."""
+        return self.node_ids.tolist()
+
+    def get_task_group_id(self, node_id: int) -> int:
+        return self.task_group_ids[self._positions[node_id]]
+
+    def get_task_groups(self) -> set:
+        """Return the set of all task group ids in the graph."""
+        return set(self.task_group_ids)
+
+    def get_incoming_edges(self, node_id: int) -> List[Dict]:
+        """Query in-edges of a node.
+
+        Returns:
+            List[Edge] in the same format as
+            `_TransportGraph.get_incoming_edges()`.
+        """
+        i = self._positions[node_id]
+        edges = []
+        for j in range(self.pred_offsets[i], self.pred_offsets[i + 1]):
+            arg_index = self.pred_arg_indices[j]
+            edges.append(
+                {
+                    "source": self.node_ids[self.pred_sources[j]],
+                    "target": node_id,
+                    "attrs": {
+                        "edge_name": self._strings[self.pred_edge_names[j]],
+                        "param_type": self._strings[self.pred_param_types[j]],
+                        "arg_index": None if arg_index == _NO_ARG_INDEX else arg_index,
+                    },
+                }
+            )
+        return edges
+
+    def get_successors(self, node_id: int) -> List[Dict]:
+        """Get child nodes with multiplicity.
+
+        Returns:
+            List[Dict], where each dictionary is of the form
+            {"node_id": node_id, "task_group_id": task_group_id}
+        """
+        i = self._positions[node_id]
+        return [
+            {
+                "node_id": self.node_ids[self.succ_targets[j]],
+                "task_group_id": self.task_group_ids[self.succ_targets[j]],
+            }
+            for j in range(self.succ_offsets[i], self.succ_offsets[i + 1])
+        ]
+
+
+class _AdjacencyIndexCache:
+    """Adjacency indices of running dispatches, keyed by dispatch id."""
+
+    def __init__(self):
+        self._indices: Dict[str, AdjacencyIndex] = {}
+
+    def build(self, dispatch_id: str, g: nx.MultiDiGraph) -> AdjacencyIndex:
+        index = AdjacencyIndex(g)
+        self._indices[dispatch_id] = index
+        return index
+
+    def get(self, dispatch_id: str) -> Optional[AdjacencyIndex]:
+        return self._indices.get(dispatch_id)
+
+    def remove(self, dispatch_id: str):
+        self._indices.pop(dispatch_id, None)
+
+
+_adjacency_cache = _AdjacencyIndexCache()
@@ -18,15 +18,20 @@
 Helper classes for the dispatcher
 """
 
+import asyncio
 import json
 import os
 import tempfile
+from typing import Callable, Dict, List, Optional, Tuple
 
+from covalent._shared_files import logger
 from covalent_dispatcher._core.data_modules.utils import run_in_executor
 from covalent_dispatcher._dal.base import workflow_db
 from covalent_dispatcher._dal.dispatcher_state import TaskGroupState, WorkflowState
 from covalent_dispatcher._db.datastore import DataStore
 
+app_log = logger.app_log
+
 
 class _WorkflowRunState:
 
@@ -112,6 +117,41 @@ class _WorkflowRunState:
     async def remove(self, dispatch_id: str):
         await run_in_executor(self._remove, dispatch_id)
 
+    def _write_snapshot(self, dispatch_id: str, val: Optional[int]):
+        """Overwrite the stored counter; `None` deletes the record."""
+        with self.db.session() as session:
+            WorkflowState.delete_bulk(
+                session=session,
+                equality_filters={"dispatch_id": dispatch_id},
+                membership_filters={},
+            )
+            if val is not None:
+                WorkflowState.create(
+                    session,
+                    insert_kwargs={
+                        "dispatch_id": dispatch_id,
+                        "num_unresolved_tasks": val,
+                    },
+                )
+            session.commit()
+
+    def _load(self, dispatch_id: str) -> Optional[int]:
+        with self.db.session() as session:
+            records = WorkflowState.get(
+                session,
+                fields=["num_unresolved_tasks"],
+                equality_filters={"dispatch_id": dispatch_id},
+                membership_filters={},
+            )
+            return records[0].num_unresolved_tasks if records else None
+
+    async def restore(self, dispatch_id: str) -> bool:
+        """Check whether the store holds state for a dispatch.
+
+        The state is already durable, so there is nothing to reload.
+        """
+        return await run_in_executor(self._load, dispatch_id) is not None
+
 
 class TaskGroupRunState:
 
@@ -169,6 +209,36 @@ class TaskGroupRunState:
     async def decrement(self, dispatch_id: str, task_group_id: int):
         return await run_in_executor(self._decrement, dispatch_id, task_group_id)
 
+    def _decrement_bulk(self, dispatch_id: str, decrements: Dict[int, int]):
+        with self.db.session() as session:
+            for gid, delta in decrements.items():
+                TaskGroupState.incr_bulk(
+                    session=session,
+                    increments={"num_pending_parents": -delta},
+                    equality_filters={"dispatch_id": dispatch_id, "task_group_id": gid},
+                    membership_filters={},
+                )
+            records = TaskGroupState.get(
+                session,
+                fields=["task_group_id", "num_pending_parents"],
+                equality_filters={"dispatch_id": dispatch_id},
+                membership_filters={"task_group_id": list(decrements)},
+            )
+            session.commit()
+            return {rec.task_group_id: rec.num_pending_parents for rec in records}
+
+    async def decrement_bulk(self, dispatch_id: str, decrements: Dict[int, int]):
+        """Decrement the pending parent counts of several task groups at once.
+
+        Args:
+            dispatch_id: The dispatch
+            decrements: Dict{task_group_id: amount}
+
+        Returns:
+            Dict{task_group_id: num_pending_parents} after the update
+        """
+        return await run_in_executor(self._decrement_bulk, dispatch_id, decrements)
+
     async def remove(self, dispatch_id: str, task_group_id: int):
         pass
 
@@ -197,6 +267,246 @@ class TaskGroupRunState:
     async def remove(self, dispatch_id: str, task_group_id: int):
         await run_in_executor(self._remove, dispatch_id, task_group_id)
 
+    def _write_snapshot(self, dispatch_id: str, task_groups: Optional[Dict[int, Tuple]]):
+        """Overwrite all task group records for a dispatch.
+
+        Args:
+            dispatch_id: The dispatch
+            task_groups: Dict{task_group_id: (num_pending, sorted_nodes)};
+                `None` deletes the records.
+        """
+        with self.db.session() as session:
+            TaskGroupState.delete_bulk(
+                session=session,
+                equality_filters={"dispatch_id": dispatch_id},
+                membership_filters={},
+            )
+            for gid, (num_pending, sorted_nodes) in (task_groups or {}).items():
+                TaskGroupState.create(
+                    session=session,
+                    insert_kwargs={
+                        "dispatch_id": dispatch_id,
+                        "task_group_id": gid,
+                        "num_pending_parents": num_pending,
+                        "sorted_tasks": json.dumps(sorted_nodes),
+                    },
+                    flush=False,
+                )
+            session.commit()
+
+    def _load(self, dispatch_id: str) -> Dict[int, Tuple]:
+        with self.db.session() as session:
+            records = TaskGroupState.get(
+                session=session,
+                fields=["task_group_id", "num_pending_parents", "sorted_tasks"],
+                equality_filters={"dispatch_id": dispatch_id},
+                membership_filters={},
+            )
+            return {
+                rec.task_group_id: (rec.num_pending_parents, json.loads(rec.sorted_tasks))
+                for rec in records
+            }
+
+    async def restore(self, dispatch_id: str) -> bool:
+        """Check whether the store holds state for a dispatch.
+
+        The state is already durable, so there is nothing to reload.
+        """
+        return bool(await run_in_executor(self._load, dispatch_id))
+
+
+class _WriteBehind:
+    """Periodically flush dirty per-dispatch state to a durable store.
+
+    Args:
+        get_state: Returns the current state of a dispatch, or `None`
+            if the dispatch is no longer tracked.
+        write_state: Synchronous function persisting `(dispatch_id, state)`;
+            runs in the datastore worker thread.
+        interval: Seconds between flushes; a non-positive value disables
+            snapshotting.
+    """
+
+    def __init__(self, get_state: Callable, write_state: Callable, interval: float):
+        self._get_state = get_state
+        self._write_state = write_state
+        self.interval = interval
+        self._dirty = set()
+        self._task = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0
+
+    def mark_dirty(self, dispatch_id: str):
+        if not self.enabled:
+            return
+        self._dirty.add(dispatch_id)
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.interval)
+        self._task = None
+        try:
+            await self.flush()
+        except Exception as ex:
+            app_log.exception(f"Error snapshotting dispatcher state: {ex}")
+
+    async def flush(self):
+        """Write all pending snapshots."""
+        dirty, self._dirty = self._dirty, set()
+        for dispatch_id in dirty:
+            state = self._get_state(dispatch_id)
+            await run_in_executor(self._write_state, dispatch_id, state)
+
+
+class _InMemoryWorkflowRunState:
+    """In-process implementation of the `_WorkflowRunState` interface.
+
+    Counters are held in a dict owned by the event loop. Each
+    read-modify-write completes without yielding to the loop, so no
+    locking is required. If `snapshot_interval` is positive, counters are
+    written behind to `durable_store` for crash recovery.
+    """
+
+    def __init__(
+        self, durable_store: Optional[_WorkflowRunState] = None, snapshot_interval: float = 0
+    ):
+        self._unresolved: Dict[str, int] = {}
+        self.durable_store = durable_store
+        interval = snapshot_interval if durable_store else 0
+        self._snapshots = _WriteBehind(
+            self._unresolved.get,
+            durable_store._write_snapshot if durable_store else None,
+            interval,
+        )
+
+    async def get_unresolved(self, dispatch_id: str):
+        return self._unresolved[dispatch_id]
+
+    async def set_unresolved(self, dispatch_id: str, val: int):
+        self._unresolved[dispatch_id] = val
+        self._snapshots.mark_dirty(dispatch_id)
+
+    async def increment(self, dispatch_id: str, interval: int = 1):
+        self._unresolved[dispatch_id] += interval
+        self._snapshots.mark_dirty(dispatch_id)
+        return self._unresolved[dispatch_id]
+
+    async def decrement(self, dispatch_id: str):
+        self._unresolved[dispatch_id] -= 1
+        self._snapshots.mark_dirty(dispatch_id)
+        return self._unresolved[dispatch_id]
+
+    async def remove(self, dispatch_id: str):
+        self._unresolved.pop(dispatch_id, None)
+        # The next flush deletes the snapshot
+        self._snapshots.mark_dirty(dispatch_id)
+
+    async def flush(self):
+        await self._snapshots.flush()
+
+    async def restore(self, dispatch_id: str) -> bool:
+        """Reload the last snapshot of a dispatch from the durable store.
+
+        Returns:
+            Whether a snapshot was found.
+        """
+        if not self.durable_store:
+            return False
+        val = await run_in_executor(self.durable_store._load, dispatch_id)
+        if val is None:
+            return False
+        self._unresolved[dispatch_id] = val
+        return True
+
+
+class InMemoryTaskGroupRunState:
+    """In-process implementation of the `TaskGroupRunState` interface.
+
+    See `_InMemoryWorkflowRunState` for the concurrency and
+    snapshotting model.
+    """
+
+    def __init__(
+        self, durable_store: Optional[TaskGroupRunState] = None, snapshot_interval: float = 0
+    ):
+        # dispatch_id -> {task_group_id: num_pending_parents}
+        self._pending: Dict[str, Dict[int, int]] = {}
+        # dispatch_id -> {task_group_id: sorted_nodes}
+        self._sorted_tasks: Dict[str, Dict[int, List[int]]] = {}
+        self.durable_store = durable_store
+        interval = snapshot_interval if durable_store else 0
+        self._snapshots = _WriteBehind(
+            self._get_state,
+            durable_store._write_snapshot if durable_store else None,
+            interval,
+        )
+
+    def _get_state(self, dispatch_id: str) -> Optional[Dict[int, Tuple]]:
+        if dispatch_id not in self._pending:
+            return None
+        sorted_tasks = self._sorted_tasks[dispatch_id]
+        return {
+            gid: (num_pending, sorted_tasks[gid])
+            for gid, num_pending in self._pending[dispatch_id].items()
+        }
+
+    async def get_pending(self, dispatch_id: str, task_group_id: int):
+        return self._pending[dispatch_id][task_group_id]
+
+    async def set(self, dispatch_id: str, task_group_id: int, num_pending: int, sorted_nodes):
+        self._pending.setdefault(dispatch_id, {})[task_group_id] = num_pending
+        self._sorted_tasks.setdefault(dispatch_id, {})[task_group_id] = list(sorted_nodes)
+        self._snapshots.mark_dirty(dispatch_id)
+
+    async def decrement(self, dispatch_id: str, task_group_id: int):
+        pending = self._pending[dispatch_id]
+        pending[task_group_id] -= 1
+        self._snapshots.mark_dirty(dispatch_id)
+        return pending[task_group_id]
+
+    async def decrement_bulk(self, dispatch_id: str, decrements: Dict[int, int]):
+        pending = self._pending[dispatch_id]
+        for gid, delta in decrements.items():
+            pending[gid] -= delta
+        self._snapshots.mark_dirty(dispatch_id)
+        return {gid: pending[gid] for gid in decrements}
+
+    async def get_task_group(self, dispatch_id: str, task_group_id: int):
+        return list(self._sorted_tasks[dispatch_id][task_group_id])
+
+    async def remove(self, dispatch_id: str, task_group_id: int):
+        pending = self._pending.get(dispatch_id, {})
+        sorted_tasks = self._sorted_tasks.get(dispatch_id, {})
+        pending.pop(task_group_id, None)
+        sorted_tasks.pop(task_group_id, None)
+        if not pending:
+            self._pending.pop(dispatch_id, None)
+            self._sorted_tasks.pop(dispatch_id, None)
+        # Removals are written behind along with other changes; the
+        # snapshot is deleted once the dispatch has no task groups left
+        self._snapshots.mark_dirty(dispatch_id)
+
+    async def flush(self):
+        await self._snapshots.flush()
+
+    async def restore(self, dispatch_id: str) -> bool:
+        """Reload the last snapshot of a dispatch from the durable store.
+
+        Returns:
+            Whether a snapshot was found.
+        """
+        if not self.durable_store:
+            return False
+        task_groups = await run_in_executor(self.durable_store._load, dispatch_id)
+        if not task_groups:
+            return False
+        self._pending[dispatch_id] = {gid: rec[0] for gid, rec in task_groups.items()}
+        self._sorted_tasks[dispatch_id] = {gid: rec[1] for gid, rec in task_groups.items()}
+        return True
+
 
 # Default to tmpfs backed file
 cache_db_file = tempfile.NamedTemporaryFile(
@@ -212,5 +522,25 @@ if cache_db_URL == workflow_db.db_URL:
 
 cache_db = DataStore(db_URL=cache_db_URL, initialize_db=initialize_db)
 
-_task_group_cache = TaskGroupRunState(db=cache_db)
-_workflow_run_cache = _WorkflowRunState(db=cache_db)
+# "memory" (default) keeps dispatcher state in-process; "sql" keeps
+# it entirely in the cache DB.
+state_backend = os.environ.get("COVALENT_DISPATCHER_STATE_BACKEND", "memory")
+
+# Seconds between write-behind snapshots of in-memory state to the
+# cache DB. Snapshots are only useful if the cache DB outlives the
+# process, so they are disabled unless the cache DB URL is set.
+_default_snapshot_interval = "5" if "COVALENT_CACHE_DB_URL" in os.environ else "0"
+snapshot_interval = float(
+    os.environ.get("COVALENT_DISPATCHER_STATE_SNAPSHOT_INTERVAL", _default_snapshot_interval)
+)
+
+if state_backend == "sql":
+    _task_group_cache = TaskGroupRunState(db=cache_db)
+    _workflow_run_cache = _WorkflowRunState(db=cache_db)
+else:
+    _task_group_cache = InMemoryTaskGroupRunState(
+        TaskGroupRunState(db=cache_db), snapshot_interval
+    )
+    _workflow_run_cache = _InMemoryWorkflowRunState(
+        _WorkflowRunState(db=cache_db), snapshot_interval
+    )
@@ -0,0 +1,66 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Throughput metrics for the dispatcher's node event loop
+"""
+
+import time
+from collections import deque
+from typing import Dict
+
+
+class EventMetrics:
+    """Counts node status events processed by the dispatcher.
+
+    Args:
+        window: Length in seconds of the sliding window over which
+            `events_per_second` is computed.
+    """
+
+    def __init__(self, window: float = 60.0):
+        self.window = window
+        self.total_events = 0
+        self.total_batches = 0
+        self.max_batch_size = 0
+        # (timestamp, batch_size)
+        self._recent = deque()
+
+    def record(self, batch_size: int):
+        now = time.monotonic()
+        self.total_events += batch_size
+        self.total_batches += 1
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self._recent.append((now, batch_size))
+        self._expire(now)
+
+    def _expire(self, now: float):
+        while self._recent and self._recent[0][0] < now - self.window:
+            self._recent.popleft()
+
+    def snapshot(self) -> Dict:
+        self._expire(time.monotonic())
+        recent_events = sum(n for _, n in self._recent)
+        return {
+            "total_events": self.total_events,
+            "total_batches": self.total_batches,
+            "max_batch_size": self.max_batch_size,
+            "mean_batch_size": self.total_events / self.total_batches if self.total_batches else 0,
+            "events_per_second": recent_events / self.window,
+        }
+
+
+_event_metrics = EventMetrics()
@@ -32,7 +32,7 @@ from covalent.executor.utils.wrappers import wrapper_fn
 
 from . import data_manager as datasvc
 from .runner_modules import executor_proxy
-from .runner_modules.utils import get_executor
+from .runner_modules.utils import get_executor, release_executor
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
@@ -210,6 +210,9 @@ async def _run_task(
             status=RESULT_STATUS.FAILED,
             error=error_msg,
         )
+    finally:
+        release_executor(executor)
+
     app_log.debug(f"Node result: {node_result}")
     return node_result
 
@@ -28,7 +28,7 @@ from covalent._shared_files.util_classes import RESULT_STATUS
 
 from .. import data_manager as datasvc
 from ..data_modules import job_manager
-from .utils import get_executor
+from .utils import get_executor, release_executor
 
 app_log = logger.app_log
 
@@ -58,6 +58,7 @@ async def _cancel_task(
     app_log.debug(f"Cancel task {task_id} using executor {selected_executor}")
     app_log.debug(f"job_handle: {job_handle}")
 
+    executor = None
     try:
         executor = get_executor(
             node_id=task_id,
@@ -72,6 +73,9 @@ async def _cancel_task(
     except Exception as ex:
         app_log.debug(f"Exception when cancel task {dispatch_id}:{task_id}: {ex}")
         cancel_job_result = False
+    finally:
+        if executor:
+            release_executor(executor)
 
     if cancel_job_result is True:
         await job_manager.set_job_status(dispatch_id, task_id, str(RESULT_STATUS.CANCELLED))
@@ -0,0 +1,125 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Evaluation of built-in nodes in the dispatcher
+"""
+
+import asyncio
+import re
+from datetime import datetime, timezone
+from functools import partial
+from typing import Dict
+
+from covalent._shared_files import logger
+from covalent._shared_files.defaults import (
+    electron_dict_prefix,
+    electron_list_prefix,
+    postprocess_prefix,
+)
+from covalent._shared_files.util_classes import RESULT_STATUS
+from covalent.executor.utils.wrappers import wrapper_fn
+
+from .. import data_manager as datasvc
+
+app_log = logger.app_log
+
+# Built-in nodes which the dispatcher is willing to evaluate. The
+# client's `inline` flag is ignored for any other node.
+INLINE_NODE_NAMES = {
+    electron_list_prefix,
+    electron_dict_prefix,
+    f"{postprocess_prefix}reconstruct",
+}
+
+# Names of the getattr, getitem and iteration nodes generated by the SDK
+INLINE_NODE_NAME_PATTERN = re.compile(r":[A-Za-z_]\w*(\.__getattr__|\.__getitem__|\(\)\[\d+\])")
+
+
+def is_inline_eligible(node_name: str, inline: bool) -> bool:
+    """Check whether a node may be evaluated in the dispatcher.
+
+    Args:
+        node_name: The name of the node.
+        inline: The node's `inline` flag as set by the client.
+
+    Returns:
+        Whether the node is a built-in node marked for inline evaluation.
+
+    """
+
+    if not inline:
+        return False
+    return node_name in INLINE_NODE_NAMES or bool(INLINE_NODE_NAME_PATTERN.fullmatch(node_name))
+
+
+async def _get_input_values(dispatch_id: str, abstract_inputs: Dict) -> Dict:
+    node_ids = list(abstract_inputs["args"]) + list(abstract_inputs["kwargs"].values())
+    records = await datasvc.electron.get_bulk(dispatch_id, node_ids, ["output"])
+    return {node_id: record["output"] for node_id, record in zip(node_ids, records)}
+
+
+async def run_inline_task(
+    dispatch_id: str, node_id: int, node_name: str, abstract_inputs: Dict
+) -> bool:
+    """Evaluate a built-in node in the dispatcher.
+
+    Built-in nodes such as getitem, attribute access and postprocessing
+    are cheap to evaluate, so running them in the
+    dispatcher saves an executor round trip.
+
+    Args:
+        dispatch_id: The dispatch id.
+        node_id: The node to evaluate.
+        node_name: The name of the node.
+        abstract_inputs: The node ids of the task's positional and
+            keyword arguments.
+
+    Returns:
+        Whether the node was evaluated. If not, the node should be
+        submitted to its executor as usual, which will also report any
+        error raised by the task.
+
+    """
+
+    start_time = datetime.now(timezone.utc)
+    try:
+        serialized_callable = (await datasvc.electron.get(dispatch_id, node_id, ["function"]))[
+            "function"
+        ]
+        input_values = await _get_input_values(dispatch_id, abstract_inputs)
+        args = [input_values[arg] for arg in abstract_inputs["args"]]
+        kwargs = {k: input_values[v] for k, v in abstract_inputs["kwargs"].items()}
+
+        loop = asyncio.get_running_loop()
+        output = await loop.run_in_executor(
+            None, partial(wrapper_fn, serialized_callable, [], [], *args, **kwargs)
+        )
+    except Exception as ex:
+        app_log.debug(f"Unable to evaluate {dispatch_id}:{node_id} inline: {ex}")
+        return False
+
+    app_log.debug(f"Evaluated task {dispatch_id}:{node_id} inline")
+    node_result = datasvc.generate_node_result(
+        node_id=node_id,
+        node_name=node_name,
+        start_time=start_time,
+        end_time=datetime.now(timezone.utc),
+        status=RESULT_STATUS.COMPLETED,
+        output=output,
+    )
+    await datasvc.update_node_result(dispatch_id, node_result)
+    return True
@@ -23,7 +23,7 @@ from covalent_dispatcher._core.data_modules import lattice as lattice_query_modu
 
 from .. import data_manager as datasvc
 from ..data_modules import job_manager
-from .utils import get_executor
+from .utils import get_executor, release_executor
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
@@ -119,7 +119,12 @@ async def put_job_status(dispatch_id: str, task_id: int, status: Status) -> bool
     )
     selected_executor = [executor_attrs["executor"], executor_attrs["executor_data"]]
     executor = get_executor(task_id, selected_executor, None, None)
-    if executor.validate_status(status):
+    try:
+        valid_status = executor.validate_status(status)
+    finally:
+        release_executor(executor)
+
+    if valid_status:
         await job_manager.set_job_status(dispatch_id, task_id, str(status))
         return True
     else:
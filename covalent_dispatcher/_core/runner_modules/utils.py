@@ -18,6 +18,12 @@
 Defines the core functionality of the runner
 """
 
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 from covalent.executor import _executor_manager
@@ -28,16 +34,144 @@ log_stack_info = logger.log_stack_info
 debug_mode = get_config("sdk.log_level") == "debug"
 
 
+class _ExecutorPool:
+    """Pool of reusable executor instances.
+
+    Instantiating an executor plugin reloads the Covalent config and
+    may set up clients and credentials for its backend. The pool keeps
+    released instances around and leases them out again for the same
+    plugin and executor data.
+
+    Each instance is leased to one caller at a time. Leasing replaces
+    all of the executor's instance attributes with the executor data,
+    as `from_dict` does, and gives it fresh runtime state (message
+    queues, event loop and cancel pool), so nothing from a previous
+    lease carries over.
+
+    Args:
+        max_size: Max number of idle instances to keep; 0 disables pooling.
+        idle_timeout: Seconds after which idle instances are dropped.
+
+    """
+
+    def __init__(self, max_size: int, idle_timeout: float):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+
+        # id(executor) -> (pool key, release time, executor), oldest first
+        self._idle = OrderedDict()
+
+        # id(executor) -> pool key of the leased instances
+        self._leased: Dict[int, Tuple[str, str]] = {}
+
+    @staticmethod
+    def _get_key(short_name: str, object_dict: Dict) -> Optional[Tuple[str, str]]:
+        try:
+            return short_name, json.dumps(object_dict, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+
+    def _evict_expired(self, now: float) -> None:
+        while self._idle:
+            _, released_at, _ = next(iter(self._idle.values()))
+            if now - released_at < self.idle_timeout:
+                break
+            self._idle.popitem(last=False)
+
+    def _take_idle(self, key: Tuple[str, str]) -> Optional[AsyncBaseExecutor]:
+        with self._lock:
+            self._evict_expired(time.monotonic())
+            for executor_id, (idle_key, _, executor) in reversed(self._idle.items()):
+                if idle_key == key:
+                    del self._idle[executor_id]
+                    self._leased[executor_id] = key
+                    return executor
+        return None
+
+    def acquire(
+        self,
+        short_name: str,
+        object_dict: Dict,
+        loop=None,
+        cancel_pool=None,
+    ) -> AsyncBaseExecutor:
+        """Lease an executor instance.
+
+        Args:
+            short_name: The executor plugin's short name.
+            object_dict: The executor data as returned by `to_dict`.
+            loop: The event loop on which the executor will run.
+            cancel_pool: Thread pool for invoking `cancel()`.
+
+        Returns:
+            An executor which must be returned with `release()`.
+
+        """
+
+        key = self._get_key(short_name, object_dict) if self.max_size > 0 else None
+        executor = self._take_idle(key) if key else None
+
+        if executor:
+            # Replace all instance state, including anything left by
+            # the previous lease
+            app_log.debug(f"Reusing pooled executor {short_name}")
+            executor.from_dict(object_dict)
+        else:
+            executor = _executor_manager.get_executor(short_name)
+            executor.from_dict(object_dict)
+            if key:
+                with self._lock:
+                    self._leased[id(executor)] = key
+
+        executor._init_runtime(loop=loop, cancel_pool=cancel_pool)
+        return executor
+
+    def release(self, executor: AsyncBaseExecutor) -> None:
+        """Return a leased executor to the pool.
+
+        Executors which weren't leased from the pool are ignored.
+
+        """
+
+        now = time.monotonic()
+        with self._lock:
+            key = self._leased.pop(id(executor), None)
+            if key is None:
+                return
+            self._idle[id(executor)] = (key, now, executor)
+            self._evict_expired(now)
+            while len(self._idle) > self.max_size:
+                self._idle.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all idle instances."""
+        with self._lock:
+            self._idle.clear()
+
+
+_executor_pool = _ExecutorPool(
+    max_size=int(get_config("dispatcher.executor_pool_size")),
+    idle_timeout=float(get_config("dispatcher.executor_pool_idle_timeout")),
+)
+
+
 def get_executor(node_id, selected_executor, loop=None, pool=None) -> AsyncBaseExecutor:
-    # Instantiate the executor from JSON
+    """Lease an executor for a task or task group.
+
+    The executor must be handed back with `release_executor()` once
+    the caller is done with it.
+
+    """
 
     short_name, object_dict = selected_executor
 
     app_log.debug(f"Running task {node_id} using executor {short_name}, {object_dict}")
 
     # the executor is determined during scheduling and provided in the execution metadata
-    executor = _executor_manager.get_executor(short_name)
-    executor.from_dict(object_dict)
-    executor._init_runtime(loop=loop, cancel_pool=pool)
+    return _executor_pool.acquire(short_name, object_dict, loop=loop, cancel_pool=pool)
+
 
-    return executor
+def release_executor(executor: Any) -> None:
+    """Return an executor obtained from `get_executor()` for reuse."""
+    _executor_pool.release(executor)
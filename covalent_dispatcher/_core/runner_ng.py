@@ -37,7 +37,7 @@ from . import runner as runner_legacy
 from .data_modules import asset_manager as am
 from .runner_modules import executor_proxy, jobs
 from .runner_modules.cancel import cancel_tasks  # nopycln: import
-from .runner_modules.utils import get_executor
+from .runner_modules.utils import get_executor, release_executor
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
@@ -85,33 +85,40 @@ async def _submit_abstract_task_group(
         if not type(executor).SUPPORTS_MANAGED_EXECUTION:
             raise NotImplementedError("Executor does not support managed execution")
 
-        resources = {"functions": {}, "inputs": {}, "hooks": {}}
+        if type(executor).SHARES_DISPATCHER_FILESYSTEM:
+            # Tasks read their inputs from and write their outputs to
+            # the object store in place
+            resources = await am.get_local_asset_uris(dispatch_id, task_ids, known_nodes)
+            task_specs = [TaskSpec(**task_spec) for task_spec in task_seq]
 
-        # Get upload URIs
-        for task_spec in task_seq:
-            task_id = task_spec["electron_id"]
+        else:
+            resources = {"functions": {}, "inputs": {}, "hooks": {}}
 
-            function_uri = executor.get_upload_uri(task_group_metadata, f"function-{task_id}")
-            hooks_uri = executor.get_upload_uri(task_group_metadata, f"hooks-{task_id}")
+            # Get upload URIs
+            for task_spec in task_seq:
+                task_id = task_spec["electron_id"]
 
-            await am.upload_asset_for_nodes(dispatch_id, "function", {task_id: function_uri})
-            await am.upload_asset_for_nodes(dispatch_id, "hooks", {task_id: hooks_uri})
+                function_uri = executor.get_upload_uri(task_group_metadata, f"function-{task_id}")
+                hooks_uri = executor.get_upload_uri(task_group_metadata, f"hooks-{task_id}")
 
-            resources["functions"][task_id] = function_uri
-            resources["hooks"][task_id] = hooks_uri
+                await am.upload_asset_for_nodes(dispatch_id, "function", {task_id: function_uri})
+                await am.upload_asset_for_nodes(dispatch_id, "hooks", {task_id: hooks_uri})
 
-            task_specs.append(TaskSpec(**task_spec))
+                resources["functions"][task_id] = function_uri
+                resources["hooks"][task_id] = hooks_uri
 
-        node_upload_uris = {
-            node_id: executor.get_upload_uri(task_group_metadata, f"node_{node_id}")
-            for node_id in known_nodes
-        }
-        resources["inputs"] = node_upload_uris
+                task_specs.append(TaskSpec(**task_spec))
 
-        app_log.debug(
-            f"Uploading known nodes {known_nodes} for task group {dispatch_id}:{task_group_id}"
-        )
-        await am.upload_asset_for_nodes(dispatch_id, "output", node_upload_uris)
+            node_upload_uris = {
+                node_id: executor.get_upload_uri(task_group_metadata, f"node_{node_id}")
+                for node_id in known_nodes
+            }
+            resources["inputs"] = node_upload_uris
+
+            app_log.debug(
+                f"Uploading known nodes {known_nodes} for task group {dispatch_id}:{task_group_id}"
+            )
+            await am.upload_asset_for_nodes(dispatch_id, "output", node_upload_uris)
 
         ts = datetime.now(timezone.utc)
         node_results = [
@@ -193,6 +200,7 @@ async def _get_task_result(task_group_metadata: Dict, data: Any):
     task_ids = task_group_metadata["node_ids"]
     gid = task_group_metadata["task_group_id"]
     app_log.debug(f"Pulling job artifacts for task group {dispatch_id}:{gid}")
+    executor = None
     try:
         executor_attrs = await datamgr.electron.get(
             dispatch_id, gid, ["executor", "executor_data"]
@@ -240,8 +248,11 @@ async def _get_task_result(task_group_metadata: Dict, data: Any):
             for node_id in task_ids
         ]
 
-    for node_result in node_results:
-        await datamgr.update_node_result(dispatch_id, node_result)
+    finally:
+        if executor:
+            release_executor(executor)
+
+    await datamgr.update_node_result(dispatch_id, node_results)
 
 
 async def run_abstract_task_group(
@@ -273,6 +284,7 @@ async def run_abstract_task_group(
                 app_log.debug(f"Refusing to execute cancelled task {dispatch_id}:{task_id}")
                 await mark_task_ready(task_metadata, None)
 
+            release_executor(executor)
             return
 
         # Legacy runner doesn't yet support task packing
@@ -298,6 +310,7 @@ async def run_abstract_task_group(
             fut = asyncio.create_task(coro)
             _futures.add(fut)
             fut.add_done_callback(_futures.discard)
+            release_executor(executor)
             return
 
         node_results, send_retval = await _submit_abstract_task_group(
@@ -327,8 +340,7 @@ async def run_abstract_task_group(
             for node_id in task_ids
         ]
 
-    for node_result in node_results:
-        await datamgr.update_node_result(dispatch_id, node_result)
+    await datamgr.update_node_result(dispatch_id, node_results)
 
     if node_results[0]["status"] == RESULT_STATUS.RUNNING:
         task_group_metadata = {
@@ -342,6 +354,7 @@ async def run_abstract_task_group(
     if executor:
         executor._notify(Signals.EXIT)
         app_log.debug(f"Stopping proxy for task group {dispatch_id}:{task_group_id}")
+        release_executor(executor)
 
 
 async def _listen_for_job_events():
@@ -371,14 +384,16 @@ async def _listen_for_job_events():
                 task_ids = task_group_metadata["node_ids"]
                 detail = msg["detail"]
                 ts = datetime.now(timezone.utc)
-                for task_id in task_ids:
-                    node_result = datamgr.generate_node_result(
+                node_results = [
+                    datamgr.generate_node_result(
                         node_id=task_id,
                         end_time=ts,
                         status=RESULT_STATUS.FAILED,
                         error=detail,
                     )
-                    await datamgr.update_node_result(dispatch_id, node_result)
+                    for task_id in task_ids
+                ]
+                await datamgr.update_node_result(dispatch_id, node_results)
 
         except Exception as ex:
             app_log.exception("Error reading message: {ex}")
@@ -19,13 +19,15 @@
 import os
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Dict, List, NamedTuple, Optional
 
+from sqlalchemy import bindparam, select, update
 from sqlalchemy.orm import Session
 
 from covalent._shared_files import logger
 
 from .._db.models import Asset as AssetRecord
+from .._db.models import PendingAssetCopy as PendingAssetCopyRecord
 from .._object_store.local import BaseProvider, local_store
 from .controller import Record
 from .utils.file_transfer import cp
@@ -153,13 +155,205 @@ def copy_asset(src: Asset, dest: Asset):
     """
 
     if src.size > 0:
-        scheme = dest.storage_type
-        dest_uri = scheme + "://" + os.path.join(dest.storage_path, dest.object_key)
-        src.upload(dest_uri)
+        _copy_asset_data(src, dest.storage_type, dest.storage_path, dest.object_key)
     else:
         app_log.debug(f"Refusing to copy zero-sized asset {src.internal_uri}")
 
 
+def _copy_asset_data(src: Asset, storage_type: str, storage_path: str, object_key: str):
+    if src.storage_type == storage_type == StorageType.LOCAL.value:
+        # Local data is shared through hard links where possible
+        local_store.link_or_copy(src.storage_path, src.object_key, storage_path, object_key)
+    else:
+        src.upload(f"{storage_type}://" + os.path.join(storage_path, object_key))
+
+
+class AssetCopy(NamedTuple):
+    """Deferred copy of an asset's data into the destination asset's own
+    storage location.
+
+    The destination's metadata, including its location, may be replaced
+    by the source's until the data has been copied.
+    """
+
+    src: Asset
+    dest: Asset
+    storage_type: str
+    storage_path: str
+    object_key: str
+
+    @classmethod
+    def create(cls, src: Asset, dest: Asset) -> "AssetCopy":
+        return cls(src, dest, dest.storage_type, dest.storage_path, dest.object_key)
+
+
+def materialize_asset_copy(item: AssetCopy) -> None:
+    """Copy an asset's data into the destination's own storage location.
+
+    The destination asset is not updated; see `relocate_assets`.
+    """
+
+    if item.src.size > 0:
+        _copy_asset_data(item.src, item.storage_type, item.storage_path, item.object_key)
+    else:
+        _storage_provider_map[item.storage_type].touch(item.storage_path, item.object_key)
+
+
+def relocate_assets(session: Session, items: List[AssetCopy]):
+    """Point assets at their copied data.
+
+    An asset is only relocated if it still refers to the source of its
+    copy. Otherwise it has been rewritten since the copy was scheduled
+    and the copied data is stale.
+
+    Args:
+        session: SQLalchemy session
+        items: The completed copies
+    """
+
+    if not items:
+        return
+
+    table = AssetRecord.__table__
+    stmt = (
+        update(table)
+        .where(
+            table.c.id == bindparam("_id"),
+            table.c.storage_type == bindparam("_src_storage_type"),
+            table.c.storage_path == bindparam("_src_storage_path"),
+            table.c.object_key == bindparam("_src_object_key"),
+        )
+        .values(
+            storage_type=bindparam("_storage_type"),
+            storage_path=bindparam("_storage_path"),
+            object_key=bindparam("_object_key"),
+        )
+    )
+    values = [
+        {
+            "_id": item.dest.primary_key,
+            "_src_storage_type": item.src.storage_type,
+            "_src_storage_path": item.src.storage_path,
+            "_src_object_key": item.src.object_key,
+            "_storage_type": item.storage_type,
+            "_storage_path": item.storage_path,
+            "_object_key": item.object_key,
+        }
+        for item in items
+    ]
+    session.execute(stmt, values)
+
+
+def copy_assets_now(session: Session, items: List[AssetCopy]):
+    """Copy the data of assets whose metadata was copied and point them
+    at their own copies.
+
+    Args:
+        session: SQLalchemy session
+        items: The copies to make
+    """
+
+    for item in items:
+        materialize_asset_copy(item)
+    relocate_assets(session, items)
+
+
+class PendingAssetCopy(Record[PendingAssetCopyRecord]):
+    """An asset copy which has yet to be made"""
+
+    model = PendingAssetCopyRecord
+
+
+def record_asset_copies(session: Session, dispatch_id: str, items: List[AssetCopy]):
+    """Persist deferred asset copies so that they survive restarts.
+
+    Args:
+        session: SQLalchemy session
+        dispatch_id: The dispatch owning the destination assets
+        items: The deferred copies
+    """
+
+    values = [
+        {
+            "dispatch_id": dispatch_id,
+            "asset_id": item.dest.primary_key,
+            "storage_type": item.storage_type,
+            "storage_path": item.storage_path,
+            "object_key": item.object_key,
+        }
+        for item in items
+    ]
+    PendingAssetCopy.insert_bulk(session, values=values, return_ids=False)
+
+
+def load_asset_copies(
+    session: Session, *, stored_in: Optional[str] = None
+) -> Dict[str, List[AssetCopy]]:
+    """Load the persisted asset copies which have yet to be made.
+
+    The source of each copy is the asset's current data, wherever it
+    was reused from.
+
+    Args:
+        session: SQLalchemy session
+        stored_in: Only load copies of assets whose data currently lies
+            in this dispatch's local storage
+
+    Returns:
+        The pending copies keyed by the dispatch owning the assets.
+    """
+
+    stmt = select(PendingAssetCopyRecord, AssetRecord).join(
+        AssetRecord, PendingAssetCopyRecord.asset_id == AssetRecord.id
+    )
+    if stored_in is not None:
+        stmt = stmt.where(
+            AssetRecord.storage_type == StorageType.LOCAL.value,
+            AssetRecord.storage_path == local_store.base_path,
+            AssetRecord.object_key.like(f"{stored_in}/%"),
+        )
+
+    pending = {}
+    for copy_record, asset_record in session.execute(stmt).all():
+        asset = Asset(session, asset_record)
+        item = AssetCopy(
+            asset,
+            asset,
+            copy_record.storage_type,
+            copy_record.storage_path,
+            copy_record.object_key,
+        )
+        pending.setdefault(copy_record.dispatch_id, []).append(item)
+
+    return pending
+
+
+def discard_asset_copies(
+    session: Session,
+    *,
+    asset_ids: Optional[List[int]] = None,
+    dispatch_ids: Optional[List[str]] = None,
+):
+    """Forget persisted asset copies.
+
+    Args:
+        session: SQLalchemy session
+        asset_ids: Forget the copies of these assets
+        dispatch_ids: Forget the copies of all assets owned by these dispatches
+    """
+
+    membership_filters = {}
+    if asset_ids is not None:
+        membership_filters["asset_id"] = asset_ids
+    if dispatch_ids is not None:
+        membership_filters["dispatch_id"] = dispatch_ids
+    if not membership_filters:
+        return
+    PendingAssetCopy.delete_bulk(
+        session, equality_filters={}, membership_filters=membership_filters
+    )
+
+
 def copy_asset_meta(session: Session, src: Asset, dest: Asset):
     """Copy the metadata for an asset.
 
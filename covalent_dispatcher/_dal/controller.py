@@ -19,7 +19,7 @@ from __future__ import annotations
 
 from typing import Generic, List, Optional, Sequence, Type, TypeVar, Union
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 from sqlalchemy.sql.expression import Select, desc
@@ -132,6 +132,54 @@ class Record(Generic[T]):
             session.flush()
         return new_record
 
+    @classmethod
+    def insert_bulk(
+        cls, session: Session, *, values: List[dict], return_ids: bool = True
+    ) -> List[int]:
+        """Bulk INSERT.
+
+        Records are inserted with a single executemany INSERT instead of
+        one statement per ORM object.
+
+        Args:
+            session: SQLalchemy session
+            values: List of dictionaries of column values, all having the same keys
+            return_ids: Whether to retrieve the primary keys of the new records
+
+        Returns:
+            The primary keys of the new records in the order of
+            `values`, or an empty list if `return_ids` is False.
+
+        """
+
+        if not values:
+            return []
+
+        table = cls.model.__table__
+        dialect = session.get_bind().dialect
+
+        if not return_ids:
+            session.execute(insert(table), values)
+            return []
+
+        if dialect.insert_executemany_returning:
+            # The driver sends pages of rows per statement and returns
+            # the keys in the order of the parameter sets
+            result = session.execute(insert(table).returning(table.c.id), values)
+            return [row.id for row in result]
+
+        if dialect.name == "sqlite":
+            # SQLite holds the write lock until the transaction ends, so
+            # the inserted rows receive consecutive rowids
+            session.execute(insert(table), values)
+            last_id = session.execute(select(func.last_insert_rowid())).scalar()
+            return list(range(last_id - len(values) + 1, last_id + 1))
+
+        records = [cls.model(**kwargs) for kwargs in values]
+        session.add_all(records)
+        session.flush()
+        return [record.id for record in records]
+
     @classmethod
     def update_bulk(
         cls, session: Session, *, values: dict, equality_filters: dict, membership_filters: dict
@@ -152,6 +200,21 @@ class Record(Generic[T]):
             stmt = stmt.where(getattr(cls.model, attr).in_(vals))
         session.execute(stmt)
 
+    @classmethod
+    def update_many(cls, session: Session, *, mappings: List[dict]):
+        """Update many records by primary key.
+
+        Mappings with the same set of keys are sent to the DB as a
+        single executemany UPDATE.
+
+        Args:
+            session: SQLAlchemy session
+            mappings: List of dictionaries {"id": primary_key, field: value, ...}
+        """
+
+        if mappings:
+            session.bulk_update_mappings(cls.model, mappings)
+
     @classmethod
     def incr_bulk(
         cls,
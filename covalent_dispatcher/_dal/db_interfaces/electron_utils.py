@@ -35,6 +35,7 @@ _meta_record_map = {
     "status": "status",
     "executor": "executor",
     "executor_data": "executor_data",
+    "inline": "inline",
 }
 
 _db_meta_record_map = {
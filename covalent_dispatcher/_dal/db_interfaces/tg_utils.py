@@ -19,10 +19,13 @@
 
 from typing import List
 
-from sqlalchemy import select
-from sqlalchemy.orm import Load, Session
+from sqlalchemy import and_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Load, Session, aliased
 
+from ..._db.models import Asset as AssetRecord
 from ..._db.models import Electron as ElectronRecord
+from ..._db.models import ElectronAsset as ElectronAssetRecord
 from ..._db.models import ElectronDependency as EdgeRecord
 from ..._db.models import Lattice as LatticeRecord
 from .. import electron
@@ -84,3 +87,45 @@ def _all_edge_records(session: Session, lattice_id: int) -> List[EdgeRecord]:
     )
     records = session.execute(stmt).all()
     return list(map(lambda r: r.ElectronDependency, records))
+
+
+def _node_hash_records(session: Session, lattice_id: int) -> List[Row]:
+    """Select the node id, name, status, node hash, and value digest of each node."""
+    stmt = (
+        select(
+            ElectronRecord.transport_graph_node_id,
+            ElectronRecord.name,
+            ElectronRecord.status,
+            ElectronRecord.node_hash,
+            AssetRecord.digest.label("value_digest"),
+        )
+        .outerjoin(
+            ElectronAssetRecord,
+            and_(
+                ElectronAssetRecord.meta_id == ElectronRecord.id,
+                ElectronAssetRecord.key == "value",
+            ),
+        )
+        .outerjoin(AssetRecord, AssetRecord.id == ElectronAssetRecord.asset_id)
+        .where(ElectronRecord.parent_lattice_id == lattice_id)
+    )
+    return session.execute(stmt).all()
+
+
+def _edge_endpoint_records(session: Session, lattice_id: int) -> List[Row]:
+    """Select the endpoint node ids and attributes of each edge."""
+    parent = aliased(ElectronRecord)
+    child = aliased(ElectronRecord)
+    stmt = (
+        select(
+            parent.transport_graph_node_id.label("source"),
+            child.transport_graph_node_id.label("target"),
+            EdgeRecord.edge_name,
+            EdgeRecord.parameter_type,
+            EdgeRecord.arg_index,
+        )
+        .join(child, child.id == EdgeRecord.electron_id)
+        .join(parent, parent.id == EdgeRecord.parent_electron_id)
+        .where(child.parent_lattice_id == lattice_id)
+    )
+    return session.execute(stmt).all()
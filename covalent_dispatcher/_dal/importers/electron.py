@@ -18,7 +18,7 @@
 """Functions to transform ResultSchema -> Result"""
 
 import json
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -36,10 +36,7 @@ from covalent._shared_files.schemas.electron import (
     ElectronAssets,
     ElectronSchema,
 )
-from covalent_dispatcher._dal.asset import Asset
-from covalent_dispatcher._dal.electron import ElectronMeta
 from covalent_dispatcher._dal.lattice import Lattice
-from covalent_dispatcher._db import models
 from covalent_dispatcher._db.write_result_to_db import get_electron_type
 from covalent_dispatcher._object_store.base import BaseProvider, TransferDirection
 
@@ -53,25 +50,31 @@ def import_electron(
     lat: Lattice,
     object_store: BaseProvider,
     job_id: int,
-) -> Tuple[models.Electron, ElectronSchema]:
-    """Returns (electron_id, ElectronSchema)"""
+    uploads: Optional[Dict[Tuple[str, str], Tuple[str, str]]] = None,
+) -> Tuple[dict, Dict[str, dict], ElectronSchema]:
+    """Returns (electron_kwargs, asset_kwargs_by_key, ElectronSchema)
 
-    electron_assets, asset_recs = import_electron_assets(
+    The returned kwargs describe the electron and asset records to be
+    inserted by the caller.
+
+    """
+
+    electron_assets, asset_kwargs_by_key = import_electron_assets(
         session,
         dispatch_id,
         e,
         object_store,
+        uploads,
     )
 
     # Hack for legacy DB columns
-    node_storage_path = asset_recs["function"].storage_path
+    node_storage_path = asset_kwargs_by_key["function"]["storage_path"]
 
     electron_kwargs = _get_electron_meta(e, lat, node_storage_path, job_id)
-    electron_row = ElectronMeta.create(session, insert_kwargs=electron_kwargs, flush=False)
 
     return (
-        electron_row,
-        asset_recs,
+        electron_kwargs,
+        asset_kwargs_by_key,
         ElectronSchema(id=e.id, metadata=e.metadata, assets=electron_assets),
     )
 
@@ -85,6 +88,7 @@ def _get_electron_meta(
         "name": e.metadata.name,
         "executor": e.metadata.executor,
         "executor_data": json.dumps(e.metadata.executor_data),
+        "inline": e.metadata.inline,
         "status": e.metadata.status,
         "started_at": e.metadata.start_time,
         "completed_at": e.metadata.end_time,
@@ -117,17 +121,23 @@ def import_electron_assets(
     dispatch_id,
     e: ElectronSchema,
     object_store: BaseProvider,
-) -> Tuple[ElectronAssets, Dict[str, models.Asset]]:
-    """Insert asset records
+    uploads: Optional[Dict[Tuple[str, str], Tuple[str, str]]] = None,
+) -> Tuple[ElectronAssets, Dict[str, dict]]:
+    """Prepare asset records
+
 
+    Returns pair (ElectronAssets, asset_kwargs), where
+    `asset_kwargs` is a mapping from asset key to the column values of
+    the asset record.
 
-    Returns pair (ElectronAssets, asset_records), where
-    `asset_records` is a mapping from asset key to asset records.
+    `uploads` optionally maps (digest_alg, digest) to the location of
+    an asset which the client will upload. Identical assets are
+    populated from that upload instead of being uploaded again.
 
     """
 
-    # Maps asset keys to asset records
-    asset_recs = {}
+    # Maps asset keys to asset record kwargs
+    asset_kwargs_by_key = {}
 
     for asset_key, asset in e.assets:
         # Register these later
@@ -149,14 +159,35 @@ def import_electron_assets(
             "remote_uri": asset.uri,
             "size": asset.size,
         }
-        asset_recs[asset_key] = Asset.create(session, insert_kwargs=asset_kwargs, flush=False)
-
-        # Send this back to the client
-        remote_uri = object_store.get_public_uri(
-            node_storage_path,
-            object_key,
-            transfer_direction=TransferDirection.upload,
-        )
+        asset_kwargs_by_key[asset_key] = asset_kwargs
+
+        # Send this back to the client; zero-byte objects and
+        # objects whose data is already stored are created here
+        # instead of being uploaded
+        if asset.size == 0 and asset.digest:
+            object_store.touch(node_storage_path, object_key)
+            remote_uri = ""
+        elif asset.digest and object_store.link_blob(
+            node_storage_path, object_key, asset.digest_alg, asset.digest
+        ):
+            remote_uri = ""
+        elif (
+            uploads is not None
+            and (asset.digest_alg, asset.digest) in uploads
+            and object_store.link_on_upload(
+                *uploads[(asset.digest_alg, asset.digest)], node_storage_path, object_key
+            )
+        ):
+            remote_uri = ""
+        else:
+            remote_uri = object_store.get_public_uri(
+                node_storage_path,
+                object_key,
+                transfer_direction=TransferDirection.upload,
+            )
+            # Only uploads pushed by the client are tracked
+            if uploads is not None and remote_uri and asset.digest and not asset.uri:
+                uploads[(asset.digest_alg, asset.digest)] = (node_storage_path, object_key)
         asset.digest = None
         asset.remote_uri = remote_uri
 
@@ -173,8 +204,6 @@ def import_electron_assets(
             "remote_uri": None,
             "size": 0,
         }
-        asset_recs["sublattice_manifest"] = Asset.create(
-            session, insert_kwargs=asset_kwargs, flush=False
-        )
+        asset_kwargs_by_key["sublattice_manifest"] = asset_kwargs
 
-    return e.assets, asset_recs
+    return e.assets, asset_kwargs_by_key
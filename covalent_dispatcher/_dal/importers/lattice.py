@@ -108,13 +108,23 @@ def import_lattice_assets(
         }
         asset_ids[asset_key] = Asset.create(session, insert_kwargs=asset_kwargs, flush=False)
 
-        # Send this back to the client
+        # Send this back to the client; zero-byte objects and
+        # objects whose data is already stored are created here
+        # instead of being uploaded
+        if asset.size == 0 and asset.digest:
+            object_store.touch(storage_path, object_key)
+            remote_uri = ""
+        elif asset.digest and object_store.link_blob(
+            storage_path, object_key, asset.digest_alg, asset.digest
+        ):
+            remote_uri = ""
+        else:
+            remote_uri = object_store.get_public_uri(
+                storage_path,
+                object_key,
+                transfer_direction=TransferDirection.upload,
+            )
         asset.digest = None
-        remote_uri = object_store.get_public_uri(
-            storage_path,
-            object_key,
-            transfer_direction=TransferDirection.upload,
-        )
         asset.remote_uri = remote_uri
 
     # Write asset records to DB
@@ -33,8 +33,8 @@ from covalent_dispatcher._dal.result import Result, ResultMeta
 from covalent_dispatcher._object_store.base import BaseProvider, TransferDirection
 from covalent_dispatcher._object_store.local import local_store
 
-from ..asset import copy_asset_meta
-from ..tg_ops import TransportGraphOps
+from ..asset import AssetCopy, copy_asset_meta, copy_assets_now, record_asset_copies
+from ..tg_ops import TransportGraphOps, get_reusable_node_ids
 from .lattice import _get_lattice_meta, import_lattice_assets
 from .tg import import_transport_graph
 
@@ -197,13 +197,23 @@ def import_result_assets(
         }
         asset_ids[asset_key] = Asset.create(session, insert_kwargs=asset_kwargs, flush=False)
 
-        # Send this back to the client
+        # Send this back to the client; zero-byte objects and
+        # objects whose data is already stored are created here
+        # instead of being uploaded
+        if asset.size == 0 and asset.digest:
+            object_store.touch(storage_path, object_key)
+            remote_uri = ""
+        elif asset.digest and object_store.link_blob(
+            storage_path, object_key, asset.digest_alg, asset.digest
+        ):
+            remote_uri = ""
+        else:
+            remote_uri = object_store.get_public_uri(
+                storage_path,
+                object_key,
+                transfer_direction=TransferDirection.upload,
+            )
         asset.digest = None
-        remote_uri = object_store.get_public_uri(
-            storage_path,
-            object_key,
-            transfer_direction=TransferDirection.upload,
-        )
         asset.remote_uri = remote_uri
 
     # Write asset records to DB
@@ -233,7 +243,7 @@ def handle_redispatch(
     manifest: ResultSchema,
     parent_dispatch_id: str,
     reuse_previous_results: bool,
-) -> Tuple[ResultSchema, List[Tuple[Asset, Asset]]]:
+) -> Tuple[ResultSchema, List[AssetCopy]]:
     # * Compare transport graphs (tg_ops)
     # * Copy reusable nodes (tg_ops)
     # * Handle reuse_previous_results
@@ -253,7 +263,8 @@ def handle_redispatch(
 
     # Get the nodes that can potentially be reused from the previous
     # dispatch, assuming that they have previously completed.
-    reusable_nodes = TransportGraphOps(tg_old).get_reusable_nodes(tg_new)
+    with Result.session() as session:
+        reusable_nodes = get_reusable_node_ids(session, tg_old.lattice_id, tg_new.lattice_id)
 
     # No need to upload assets for reusable nodes since they can be
     # copied internally from the previous dispatch. Thus, don't return
@@ -298,6 +309,7 @@ def handle_redispatch(
     # Copy corresponding workflow assets with the same hashes and
     # don't ask the client to upload them.
 
+    workflow_copies = []
     with Result.session() as session:
         for key, asset in manifest.assets:
             new_asset = result_object.get_asset(key, session)
@@ -305,7 +317,7 @@ def handle_redispatch(
             if new_asset.digest == old_asset.digest:
                 asset.remote_uri = ""
                 app_log.debug(f"Copying workflow asset {key}")
-                assets_to_copy.append((old_asset, new_asset))
+                workflow_copies.append(AssetCopy.create(old_asset, new_asset))
                 # Don't pull asset
                 new_asset.set_remote(session, "")
 
@@ -315,19 +327,21 @@ def handle_redispatch(
             if new_asset.digest == old_asset.digest:
                 asset.remote_uri = ""
                 app_log.debug(f"Copying workflow asset {key}")
-                assets_to_copy.append((old_asset, new_asset))
+                workflow_copies.append(AssetCopy.create(old_asset, new_asset))
                 # Don't pull asset
                 new_asset.set_remote(session, "")
 
-    # Copy asset metadata
+    # The workflow's result and error are rewritten by the dispatch, so
+    # workflow assets get their own data right away.
+    with Result.session() as session:
+        for item in workflow_copies:
+            copy_asset_meta(session, item.src, item.dest)
+        copy_assets_now(session, workflow_copies)
+
+    # Assets of reused nodes refer to the parent dispatch's data until
+    # the caller copies it; the pending copies are persisted so they
+    # can be resumed after a restart.
     with Result.session() as session:
-        for item in assets_to_copy:
-            src, dest = item
-            copy_asset_meta(session, src, dest)
-
-    # Copy asset data
-    # for item in assets_to_copy:
-    #     src, dest = item
-    #     copy_asset(src, dest)
+        record_asset_copies(session, dispatch_id, assets_to_copy)
 
     return manifest, assets_to_copy
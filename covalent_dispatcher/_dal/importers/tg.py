@@ -25,11 +25,12 @@ from sqlalchemy.orm import Session
 from covalent._shared_files import logger
 from covalent._shared_files.schemas.edge import EdgeSchema
 from covalent._shared_files.schemas.transport_graph import TransportGraphSchema
+from covalent_dispatcher._dal.asset import Asset
 from covalent_dispatcher._dal.edge import ElectronDependency
-from covalent_dispatcher._dal.electron import Electron
+from covalent_dispatcher._dal.electron import Electron, ElectronAsset, ElectronMeta
 from covalent_dispatcher._dal.job import Job
 from covalent_dispatcher._dal.lattice import Lattice
-from covalent_dispatcher._db import models
+from covalent_dispatcher._dal.utils.node_hash import compute_node_hashes
 from covalent_dispatcher._object_store.base import BaseProvider
 
 from .electron import import_electron
@@ -45,7 +46,6 @@ def import_transport_graph(
     object_store: BaseProvider,
     electron_id: Optional[int],
 ) -> TransportGraphSchema:
-    electron_map = {}
     output_nodes = []
 
     # Propagate parent electron id's `cancel_requested` property to the sublattice electrons
@@ -64,112 +64,117 @@ def import_transport_graph(
         gid = node.metadata.task_group_id
         task_groups[gid].append(node)
 
-    gids = {k: list(map(lambda n: n.id, v)) for k, v in task_groups.items()}
+    # Create a job record for each task group
 
-    gid_job_record_map = {}
-
-    # Maps node ids to asset record dictionaries
-    electron_asset_links = {}
-
-    for gid in task_groups:
-        # Create a job record for each task group
-        job_kwargs = {
-            "cancel_requested": cancel_requested,
-        }
+    st = datetime.now()
+    job_ids = Job.insert_bulk(
+        session, values=[{"cancel_requested": cancel_requested} for _ in task_groups]
+    )
+    gid_job_id_map = dict(zip(task_groups, job_ids))
+    et = datetime.now()
+    delta = (et - st).total_seconds()
+    app_log.debug(f"Inserting {len(job_ids)} job records took {delta} seconds")
+
+    # Hash each node together with its predecessor subgraph so that
+    # future redispatches can be diffed without loading the graph
+    node_hashes = compute_node_hashes(
+        {node.id: (node.metadata.name, node.assets.value.digest) for node in tg.nodes},
+        (
+            (
+                e.source,
+                e.target,
+                (e.metadata.edge_name, e.metadata.param_type, e.metadata.arg_index),
+            )
+            for e in tg.links
+        ),
+    )
 
-        gid_job_record_map[gid] = Job.create(session, insert_kwargs=job_kwargs, flush=False)
+    # Locations of assets to be uploaded by the client, by digest
+    uploads = {}
 
-    # Write job records to DB and retrieve primary keys
+    # Column values of the electron and asset records, in node order
+    electron_records = []
+    asset_records = []
 
-    session.flush()
+    # (node id, asset key) for each asset record
+    asset_links = []
 
     for gid, node_group in task_groups.items():
         for node in node_group:
-            job_record = gid_job_record_map[gid]
-            e_record, asset_records_by_key, node = import_electron(
+            electron_kwargs, asset_kwargs_by_key, node = import_electron(
                 session,
                 dispatch_id,
                 node,
                 lat,
                 object_store,
-                job_id=job_record.id,
+                job_id=gid_job_id_map[gid],
+                uploads=uploads,
             )
             output_nodes.append(node)
-            electron_map[node.id] = e_record
-            electron_asset_links[node.id] = asset_records_by_key
+            electron_kwargs["node_hash"] = node_hashes[node.id]
+            electron_records.append(electron_kwargs)
+            for key, asset_kwargs in asset_kwargs_by_key.items():
+                asset_records.append(asset_kwargs)
+                asset_links.append((node.id, key))
 
-    # Compute asset ids, electron ids, and create associations
-
-    n_records = len(electron_map)
     st = datetime.now()
-    session.flush()
+    electron_ids = ElectronMeta.insert_bulk(session, values=electron_records)
+    electron_map = {
+        kwargs["transport_graph_node_id"]: electron_id
+        for kwargs, electron_id in zip(electron_records, electron_ids)
+    }
     et = datetime.now()
     delta = (et - st).total_seconds()
-    app_log.debug(f"Inserting {n_records} electron records took {delta} seconds")
-
-    n_records = sum(
-        len(asset_records_by_key) for asset_records_by_key in electron_asset_links.values()
-    )
+    app_log.debug(f"Inserting {len(electron_ids)} electron records took {delta} seconds")
 
     st = datetime.now()
-    session.flush()
+    asset_ids = Asset.insert_bulk(session, values=asset_records)
     et = datetime.now()
     delta = (et - st).total_seconds()
-    app_log.debug(f"Inserting {n_records} asset records took {delta} seconds")
-
-    meta_asset_associations = []
-    for node_id, asset_records in electron_asset_links.items():
-        electron_dal = Electron(session, electron_map[node_id])
-        meta_asset_associations.extend(
-            electron_dal.associate_asset(session, key, asset_rec.id)
-            for key, asset_rec in asset_records.items()
-        )
-    n_records = len(meta_asset_associations)
+    app_log.debug(f"Inserting {len(asset_ids)} asset records took {delta} seconds")
+
+    meta_asset_associations = [
+        {"meta_id": electron_map[node_id], "asset_id": asset_id, "key": key}
+        for (node_id, key), asset_id in zip(asset_links, asset_ids)
+    ]
 
     st = datetime.now()
-    session.flush()
+    ElectronAsset.insert_bulk(session, values=meta_asset_associations, return_ids=False)
     et = datetime.now()
     delta = (et - st).total_seconds()
+    n_records = len(meta_asset_associations)
     app_log.debug(f"Inserting {n_records} asset record links took {delta} seconds")
 
     # Insert edges
     edge_records = []
-    edges = [_import_edge(session, e, electron_map, edge_records) for e in tg.links]
-
-    n_records = 0
-    n_records = len(edge_records)
+    edges = [_import_edge(e, electron_map, edge_records) for e in tg.links]
 
     st = datetime.now()
-    session.flush()
+    ElectronDependency.insert_bulk(session, values=edge_records, return_ids=False)
     et = datetime.now()
     delta = (et - st).total_seconds()
-    app_log.debug(f"Inserting {n_records} edge records took {delta} seconds")
+    app_log.debug(f"Inserting {len(edge_records)} edge records took {delta} seconds")
 
     return TransportGraphSchema(nodes=output_nodes, links=edges)
 
 
 def _import_edge(
-    session: Session,
     edge: EdgeSchema,
-    electron_map: Dict[int, models.Electron],
-    edge_records: List[models.ElectronDependency],
+    electron_map: Dict[int, int],
+    edge_records: List[dict],
 ) -> EdgeSchema:
-    source_electron = electron_map[edge.source]
-    target_electron = electron_map[edge.target]
     edge_name = edge.metadata.edge_name
     param_type = edge.metadata.param_type
     arg_index = edge.metadata.arg_index
     insert_kwargs = {
-        "electron_id": target_electron.id,
-        "parent_electron_id": source_electron.id,
+        "electron_id": electron_map[edge.target],
+        "parent_electron_id": electron_map[edge.source],
         "edge_name": edge_name,
         "parameter_type": param_type,
         "arg_index": arg_index,
     }
 
-    edge_records.append(
-        ElectronDependency.create(session, insert_kwargs=insert_kwargs, flush=False)
-    )
+    edge_records.append(insert_kwargs)
 
     # No filtering involved
     return edge
@@ -31,6 +31,7 @@ from .._db import models
 from .asset import Asset, copy_asset_meta
 from .base import DispatchedObject
 from .controller import Record
+from .db_interfaces.electron_utils import set_filters as electron_set_filters
 from .db_interfaces.result_utils import ASSET_KEYS  # nopycln: import
 from .db_interfaces.result_utils import METADATA_KEYS  # nopycln: import
 from .db_interfaces.result_utils import _meta_record_map, get_filters, set_filters
@@ -285,6 +286,149 @@ class Result(DispatchedObject[ResultMeta, ResultAsset]):
         app_log.debug(f"_update_node took {dt} seconds")
         return True
 
+    def _update_nodes_bulk(self, node_results: List[Dict]) -> List[bool]:
+        """
+        Update several nodes in the transport graph at once.
+
+        Equivalent to calling `_update_node` for each entry of
+        `node_results` in order, but all status transitions are
+        validated with a single locked SELECT, all metadata fields are
+        written with a single executemany UPDATE, and
+        `completed_electron_num` is incremented once.
+
+        Args:
+            node_results: A list of dictionaries with the same keys as
+                the keyword arguments of `_update_node`
+
+        Returns:
+            A list of booleans indicating whether each update succeeded
+        """
+
+        app_log.debug(f"Inside update nodes bulk ({len(node_results)} nodes)")
+
+        _start_ts = datetime.now()
+
+        node_ids = list({node_result["node_id"] for node_result in node_results})
+        accepted = [False] * len(node_results)
+        names = {}
+
+        with self.session() as session:
+            # This acquires a lock on the electrons' rows to achieve atomic RMW
+            records = Electron.get_db_records(
+                session,
+                keys=["id", "node_id", "name", "status", "type"],
+                equality_filters={"parent_lattice_id": self._lattice_id},
+                membership_filters={"node_id": node_ids},
+                for_update=True,
+            )
+            records_by_node = {rec.transport_graph_node_id: rec for rec in records}
+            statuses = {node_id: Status(rec.status) for node_id, rec in records_by_node.items()}
+            sub_dispatch_statuses = self._get_sub_dispatch_statuses(
+                session, node_results, records_by_node
+            )
+
+            mappings = {}
+            assets = []
+            num_completed = 0
+            for i, node_result in enumerate(node_results):
+                node_id = node_result["node_id"]
+                rec = records_by_node[node_id]
+                names.setdefault(node_id, rec.name)
+                status = node_result.get("status")
+                if status is not None:
+                    old_status = statuses[node_id]
+                    if RESULT_STATUS.is_terminal(old_status) or old_status == status:
+                        app_log.debug(
+                            f"{self.dispatch_id}:{node_id}: illegal status update "
+                            f"{old_status} -> {status}"
+                        )
+                        continue
+                    if (
+                        rec.type == "sublattice"
+                        and RESULT_STATUS.is_terminal(status)
+                        and rec.id in sub_dispatch_statuses
+                        and sub_dispatch_statuses[rec.id] != str(status)
+                    ):
+                        continue
+                    statuses[node_id] = status
+                    if status == RESULT_STATUS.COMPLETED:
+                        num_completed += 1
+
+                accepted[i] = True
+                mapping = mappings.setdefault(node_id, {"id": rec.id})
+                for key in ("node_name", "start_time", "end_time", "status"):
+                    val = node_result.get(key)
+                    if val is None:
+                        continue
+                    key = "name" if key == "node_name" else key
+                    mapping[Electron.meta_record_map(key)] = electron_set_filters[key](val)
+                for key in ("output", "error", "stdout", "stderr"):
+                    val = node_result.get(key)
+                    if val is not None:
+                        assets.append((node_id, key, val))
+
+            Electron.meta_type.update_many(session, mappings=list(mappings.values()))
+
+            if num_completed > 0:
+                self.incr_metadata("completed_electron_num", num_completed, session)
+
+            if assets:
+                tg = self.lattice.transport_graph
+                asset_node_ids = list({node_id for node_id, _, _ in assets})
+                nodes = dict(zip(asset_node_ids, tg.get_nodes(asset_node_ids, session)))
+                for node_id, key, val in assets:
+                    nodes[node_id].set_value(key, val, session)
+
+        # Handle postprocessing node
+        for i, node_result in enumerate(node_results):
+            node_id = node_result["node_id"]
+            end_time = node_result.get("end_time")
+            if not accepted[i] or not names[node_id].startswith(postprocess_prefix):
+                continue
+            if end_time is None:
+                continue
+            status = node_result.get("status")
+            app_log.debug(f"Postprocess status: {status}")
+            tg = self.lattice.transport_graph
+            with self.session() as session:
+                workflow_result = self.get_asset("result", session)
+                node_output = tg.get_node(node_id).get_asset("output", session)
+                copy_asset_meta(session, node_output, workflow_result)
+
+            self._update_dispatch(status=status, end_time=end_time)
+
+        _end_ts = datetime.now()
+        dt = (_end_ts - _start_ts).total_seconds()
+        app_log.debug(f"_update_nodes_bulk took {dt} seconds")
+        return accepted
+
+    def _get_sub_dispatch_statuses(
+        self, session: Session, node_results: List[Dict], records_by_node: Dict
+    ) -> Dict[int, str]:
+        """Fetch the dispatch status of sublattice electrons receiving terminal updates.
+
+        Returns:
+            A dictionary {electron_id: sub_dispatch_status}
+        """
+
+        electron_ids = set()
+        for node_result in node_results:
+            rec = records_by_node[node_result["node_id"]]
+            status = node_result.get("status")
+            if rec.type == "sublattice" and RESULT_STATUS.is_terminal(status):
+                electron_ids.add(rec.id)
+
+        if not electron_ids:
+            return {}
+
+        records = ResultMeta.get(
+            session,
+            fields=["electron_id", "status"],
+            equality_filters={},
+            membership_filters={"electron_id": list(electron_ids)},
+        )
+        return {rec.electron_id: rec.status for rec in records}
+
     def _can_update_node_status(self, session: Session, node_id: int, new_status: Status) -> bool:
         """Checks whether a node status update is valid.
 
@@ -17,16 +17,19 @@
 """Module for transport graph operations."""
 
 from collections import deque
-from typing import Callable, List
+from typing import Callable, Dict, List, Set, Tuple
 
 import networkx as nx
+from sqlalchemy.orm import Session
 
 from covalent._shared_files import logger
 from covalent._shared_files.util_classes import RESULT_STATUS
 
-from .asset import copy_asset_meta
+from .asset import AssetCopy, copy_asset_meta, copy_assets_now
+from .db_interfaces.tg_utils import _edge_endpoint_records, _node_hash_records
 from .electron import ASSET_KEYS, METADATA_KEYS
 from .tg import _TransportGraph
+from .utils.node_hash import compute_node_hashes, find_reusable_nodes
 
 app_log = logger.app_log
 
@@ -76,15 +79,26 @@ class TransportGraphOps:
         copy_metadata: bool = True,
         defer_copy_objects: bool = False,
     ) -> List:
-        """Copy nodes from the transport graph in the argument."""
+        """Copy nodes from the transport graph in the argument.
+
+        If `defer_copy_objects` is set, the assets of reused nodes keep
+        referring to the old data and their copies are returned to the
+        caller. The data of all other nodes is copied right away since
+        they will run again and overwrite their assets.
+        """
 
         assets_to_copy = []
 
         for n in nodes:
             old_node = tg.get_node(n)
             old_status = tg.get_node_value(n, "status")
+            reused = (
+                copy_metadata
+                and old_status == RESULT_STATUS.COMPLETED
+                and self._has_stored_output(old_node)
+            )
 
-            if copy_metadata and old_status == RESULT_STATUS.COMPLETED:
+            if reused:
                 # Only previously completed nodes can actually be
                 # reused
 
@@ -99,18 +113,34 @@ class TransportGraphOps:
 
             # TODO: Use the ElectronAssets link table as the source of
             # truth instead of these hardcoded values
-            for k in ASSET_KEYS:
-                # Copy asset metadata
-                app_log.debug(f"Copying asset {k} for node {n}")
-                with old_node.session() as session:
+            node_copies = []
+            with old_node.session() as session:
+                for k in ASSET_KEYS:
+                    # Copy asset metadata
+                    app_log.debug(f"Copying asset {k} for node {n}")
                     old = old_node.get_asset(k, session)
                     new = self.tg.get_node(n).get_asset(k, session)
+                    node_copies.append(AssetCopy.create(old, new))
                     copy_asset_meta(session, old, new)
-                    assets_to_copy.append((old, new))
+
+                if reused and defer_copy_objects:
+                    assets_to_copy.extend(node_copies)
+                else:
+                    copy_assets_now(session, node_copies)
 
         # Return the assets to copy at a later time
         return assets_to_copy
 
+    @staticmethod
+    def _has_stored_output(node) -> bool:
+        """Check whether a node's output was stored.
+
+        Outputs consumed only within their task group might not have
+        been stored, in which case the output asset is empty.
+        """
+        with node.session() as session:
+            return (node.get_asset("output", session).size or 0) > 0
+
     @staticmethod
     def _cmp_name_and_pval(A: nx.MultiDiGraph, B: nx.MultiDiGraph, node: int) -> bool:
         """Default node comparison function for diffing transport graphs.
@@ -297,3 +327,54 @@ class TransportGraphOps:
 
         for node_attr, default_val in self._default_node_attrs.items():
             self.tg.set_node_value(node_id, node_attr, default_val)
+
+
+def _get_node_hashes(session: Session, lattice_id: int) -> Tuple[Dict[int, str], Set[int]]:
+    """Returns the node hashes of a graph and the nodes pending replacement."""
+
+    records = _node_hash_records(session, lattice_id)
+    pending_replacement = {
+        r.transport_graph_node_id
+        for r in records
+        if r.status == str(RESULT_STATUS.PENDING_REPLACEMENT)
+    }
+    node_hashes = {r.transport_graph_node_id: r.node_hash for r in records}
+
+    # Graphs imported before node hashes were persisted
+    if any(h is None for h in node_hashes.values()):
+        app_log.debug(f"Computing node hashes for lattice {lattice_id}")
+        nodes = {r.transport_graph_node_id: (r.name, r.value_digest) for r in records}
+        edges = [
+            (e.source, e.target, (e.edge_name, e.parameter_type, e.arg_index))
+            for e in _edge_endpoint_records(session, lattice_id)
+        ]
+        node_hashes = compute_node_hashes(nodes, edges)
+
+    return node_hashes, pending_replacement
+
+
+def get_reusable_node_ids(session: Session, old_lattice_id: int, new_lattice_id: int) -> List[int]:
+    """Find which nodes of a new graph are common with a previous graph.
+
+    Compares the node hashes persisted when each graph was imported,
+    so unlike `TransportGraphOps.get_reusable_nodes` neither graph
+    needs to be loaded. Nodes pending replacement in either graph and
+    their descendants are never reusable.
+
+    Args:
+        session: SQLAlchemy session
+        old_lattice_id: The lattice record id of the previous dispatch
+        new_lattice_id: The lattice record id of the new dispatch
+
+    Returns:
+        The sorted ids of the reusable nodes.
+
+    """
+
+    old_hashes, old_pending = _get_node_hashes(session, old_lattice_id)
+    new_hashes, new_pending = _get_node_hashes(session, new_lattice_id)
+    new_edges = [(e.source, e.target) for e in _edge_endpoint_records(session, new_lattice_id)]
+
+    reusable = find_reusable_nodes(old_hashes, new_hashes, new_edges, old_pending | new_pending)
+    app_log.debug(f"Found {len(reusable)} reusable nodes out of {len(new_hashes)}")
+    return sorted(reusable)
@@ -18,6 +18,8 @@
 Server-side file transfer utilities
 """
 
+import os
+import uuid
 from concurrent.futures import ThreadPoolExecutor
 
 from covalent._file_transfer import FileTransfer
@@ -27,7 +29,19 @@ app_log = logger.app_log
 am_pool = ThreadPoolExecutor()
 
 
+LOCAL_SCHEME_PREFIX = "file://"
+
+
 def cp(src_uri: str, dest_uri: str, transfer_options: dict = {}):
-    ft = FileTransfer(src_uri, dest_uri)
+    # Local files may share data with other assets through hard links,
+    # so copy to a temporary file and replace the destination
+    if dest_uri.startswith(LOCAL_SCHEME_PREFIX):
+        dest_path = dest_uri[len(LOCAL_SCHEME_PREFIX) :]
+        tmp_path = f"{dest_path}.{uuid.uuid4().hex}.tmp"
+        pre_hook, transfer_callable = FileTransfer(src_uri, LOCAL_SCHEME_PREFIX + tmp_path).cp()
+        transfer_callable()
+        os.replace(tmp_path, dest_path)
+        return
+
     pre_hook, transfer_callable = FileTransfer(src_uri, dest_uri).cp()
     transfer_callable()
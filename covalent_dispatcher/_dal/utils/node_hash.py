@@ -0,0 +1,125 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Merkle-style hashes of transport graph nodes for redispatch diffing"""
+
+import hashlib
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# (edge_name, param_type, arg_index)
+EdgeAttrs = Tuple[str, Optional[str], Optional[int]]
+
+# (source node id, target node id, edge attributes)
+EdgeTuple = Tuple[int, int, EdgeAttrs]
+
+
+def _parents_in_topological_order(
+    node_ids: Iterable[int], edges: Iterable[EdgeTuple]
+) -> Tuple[List[int], Dict[int, List[Tuple[int, EdgeAttrs]]]]:
+    """Sort nodes topologically and collect the incoming edges of each node."""
+
+    parents = {node_id: [] for node_id in node_ids}
+    children = {node_id: [] for node_id in parents}
+    for source, target, attrs in edges:
+        parents[target].append((source, attrs))
+        children[source].append(target)
+
+    num_pending = {node_id: len(p) for node_id, p in parents.items()}
+    ready = deque(node_id for node_id, n in num_pending.items() if n == 0)
+    order = []
+    while ready:
+        node_id = ready.popleft()
+        order.append(node_id)
+        for child in children[node_id]:
+            num_pending[child] -= 1
+            if num_pending[child] == 0:
+                ready.append(child)
+
+    if len(order) < len(parents):
+        raise RuntimeError("Transport graph contains a cycle")
+
+    return order, parents
+
+
+def compute_node_hashes(
+    nodes: Dict[int, Tuple[str, Optional[str]]], edges: Iterable[EdgeTuple]
+) -> Dict[int, str]:
+    """Compute a hash of each node and everything upstream of it.
+
+    A node's hash covers its name, the digest of its `value` asset,
+    and the id, hash, and connecting edge attributes of each of its
+    parents. Two nodes with the same id in different graphs therefore
+    have equal hashes only if their predecessor subgraphs are the same.
+
+    Args:
+        nodes: Dict {node_id: (name, value_digest)}
+        edges: Iterable of (source, target, (edge_name, param_type, arg_index))
+
+    Returns:
+        Dict {node_id: hexdigest}
+
+    """
+
+    order, parents = _parents_in_topological_order(nodes, edges)
+
+    hashes = {}
+    for node_id in order:
+        name, value_digest = nodes[node_id]
+        parent_entries = sorted(
+            (parent, hashes[parent], repr(attrs)) for parent, attrs in parents[node_id]
+        )
+        h = hashlib.sha1(repr((name, value_digest, parent_entries)).encode("utf-8"))
+        hashes[node_id] = h.hexdigest()
+
+    return hashes
+
+
+def find_reusable_nodes(
+    old_hashes: Dict[int, str],
+    new_hashes: Dict[int, str],
+    new_edges: Iterable[Tuple[int, int]],
+    excluded: Set[int],
+) -> Set[int]:
+    """Find the nodes of a new graph whose results can be reused from an old graph.
+
+    A node is reusable if it has the same hash in both graphs and
+    neither it nor any of its ancestors is excluded.
+
+    Args:
+        old_hashes: Node hashes of the old graph
+        new_hashes: Node hashes of the new graph
+        new_edges: Iterable of (source, target) pairs in the new graph
+        excluded: Nodes which must not be reused, such as those
+            marked for replacement
+
+    Returns:
+        The set of reusable node ids
+
+    """
+
+    order, parents = _parents_in_topological_order(
+        new_hashes, ((source, target, None) for source, target in new_edges)
+    )
+
+    reusable = set()
+    for node_id in order:
+        if node_id in excluded or old_hashes.get(node_id) != new_hashes[node_id]:
+            continue
+        if all(parent in reusable for parent, _ in parents[node_id]):
+            reusable.add(node_id)
+
+    return reusable
@@ -41,6 +41,9 @@ class DataStore:
         db_URL: Optional[str] = None,
         initialize_db: bool = False,
         declarative_base: Any = models.Base,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_pre_ping: bool = False,
         **kwargs,
     ):
         if db_URL:
@@ -48,6 +51,15 @@ class DataStore:
         else:
             self.db_URL = "sqlite+pysqlite:///" + get_config("dispatcher.db_path")
 
+        # Connection pool settings only apply to server backends; the
+        # pysqlite dialect picks its own pool class.
+        if not self.db_URL.startswith("sqlite"):
+            if pool_size is not None:
+                kwargs["pool_size"] = pool_size
+            if max_overflow is not None:
+                kwargs["max_overflow"] = max_overflow
+            kwargs["pool_pre_ping"] = pool_pre_ping
+
         self.engine = create_engine(self.db_URL, **kwargs)
         if not database_exists(self.engine.url):
             try:
@@ -62,7 +74,20 @@ class DataStore:
 
     @staticmethod
     def factory():
-        return DataStore(db_URL=environ.get("COVALENT_DATABASE_URL"), echo=DEBUG_DB)
+        pool_size = environ.get("COVALENT_DB_POOL_SIZE")
+        max_overflow = environ.get("COVALENT_DB_MAX_OVERFLOW")
+        return DataStore(
+            db_URL=environ.get("COVALENT_DATABASE_URL"),
+            pool_size=int(pool_size) if pool_size else None,
+            max_overflow=int(max_overflow) if max_overflow else None,
+            pool_pre_ping=environ.get("COVALENT_DB_POOL_PRE_PING") == "1",
+            echo=DEBUG_DB,
+        )
+
+    @property
+    def is_sqlite(self) -> bool:
+        """Whether the backend only supports a single writer."""
+        return self.engine.dialect.name == "sqlite"
 
     def get_alembic_config(self, logging_enabled: bool = True):
         alembic_ini_path = Path(path.join(__file__, "./../../../covalent_migrations/alembic.ini"))
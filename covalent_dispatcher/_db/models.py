@@ -188,6 +188,12 @@ class Electron(Base):
     # Foreign key reference to Jobs table
     job_id = Column(Integer, ForeignKey("jobs.id", name="job_id_link"), nullable=False)
 
+    # Hash of the node and its predecessor subgraph, used to diff graphs on redispatch
+    node_hash = Column(Text, nullable=True)
+
+    # Whether the dispatcher may evaluate the node itself
+    inline = Column(Boolean, nullable=False, default=False)
+
     # Timestamps
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, onupdate=func.now(), server_default=func.now())
@@ -326,3 +332,29 @@ class TaskGroupState(Base):
     # JSON list of node ids in topological order
     # Used by dispatcher
     sorted_tasks = Column(Text, nullable=False)
+
+
+# Copies of reused assets which have yet to be made. Until then, the
+# asset refers to the data of the dispatch it was reused from.
+
+
+class PendingAssetCopy(Base):
+    __tablename__ = "pending_asset_copies"
+    __table_args__ = (Index("pending_asset_copies_idx", "dispatch_id"),)
+
+    id = Column(Integer, primary_key=True)
+
+    # Dispatch owning the asset
+    dispatch_id = Column(Text, nullable=False)
+
+    # Asset record id
+    asset_id = Column(
+        Integer, ForeignKey("assets.id", name="pending_copy_asset_link"), nullable=False
+    )
+
+    # The asset's own location
+    storage_type = Column(Text, nullable=False)
+
+    storage_path = Column(Text, nullable=False)
+
+    object_key = Column(Text, nullable=False)
@@ -18,7 +18,7 @@
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 
 class TransferDirection(str, Enum):
@@ -68,3 +68,50 @@ class BaseProvider:
 
     def get_public_uri(self, storage_path: str, object_key: str, **options) -> str:
         raise NotImplementedError
+
+    def touch(self, storage_path: str, object_key: str) -> None:
+        """Create an empty object."""
+        raise NotImplementedError
+
+    def link_blob(self, storage_path: str, object_key: str, digest_alg: str, digest: str) -> bool:
+        """Populate an object from previously stored data with the same digest.
+
+        Returns:
+            Whether the object was populated, in which case it need not be
+            uploaded. Providers without deduplication return False.
+        """
+        return False
+
+    def link_on_upload(
+        self,
+        src_storage_path: str,
+        src_object_key: str,
+        dest_storage_path: str,
+        dest_object_key: str,
+    ) -> bool:
+        """Populate an object from an identical object once that is uploaded.
+
+        Returns:
+            Whether the object will be populated, in which case it need
+            not be uploaded. Providers which can't track uploads return
+            False.
+        """
+        return False
+
+    def add_blob(
+        self, storage_path: str, object_key: str, digest_alg: str, digest: str
+    ) -> List[str]:
+        """Register an object's data for deduplication.
+
+        Returns:
+            The paths of any objects populated from it (see `link_on_upload`).
+        """
+        return []
+
+    def collect_garbage(self) -> int:
+        """Free data no longer referenced by any object.
+
+        Returns:
+            The number of blobs deleted.
+        """
+        return 0
@@ -0,0 +1,127 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed blob store backing deduplicated local assets"""
+
+import os
+import shutil
+import string
+import uuid
+from typing import Optional
+
+from covalent._shared_files import logger
+
+from .hashing import DIGEST_ALGORITHMS, normalize_algorithm
+
+app_log = logger.app_log
+
+
+def _replace_with_link(src_path: str, dest_path: str) -> None:
+    """Atomically make `dest_path` a hard link to `src_path`.
+
+    Falls back to copying when the filesystem doesn't support hard links.
+    """
+
+    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+    tmp_path = f"{dest_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        os.link(src_path, tmp_path)
+    except OSError:
+        shutil.copyfile(src_path, tmp_path)
+    os.replace(tmp_path, dest_path)
+
+
+class ContentAddressedStore:
+    """Stores each distinct blob once, keyed by its digest.
+
+    Asset files are hard links to the blobs, so the filesystem link count
+    serves as the blob's reference count: a blob whose only remaining
+    link is the store's own is no longer referenced by any asset. Files
+    linked to a blob must only be replaced, never modified in place.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def blob_path(self, digest_alg: str, digest: str) -> Optional[str]:
+        if not digest_alg or not digest:
+            return None
+        algorithm = normalize_algorithm(digest_alg)
+        if algorithm not in DIGEST_ALGORITHMS or not all(c in string.hexdigits for c in digest):
+            return None
+        return os.path.join(self.root, algorithm, digest[:2], digest)
+
+    def contains(self, digest_alg: str, digest: str) -> bool:
+        path = self.blob_path(digest_alg, digest)
+        return path is not None and os.path.exists(path)
+
+    def link(self, digest_alg: str, digest: str, dest_path: str) -> bool:
+        """Link an existing blob into place.
+
+        Returns:
+            Whether the blob was found and linked to `dest_path`.
+        """
+
+        blob_path = self.blob_path(digest_alg, digest)
+        if blob_path is None:
+            return False
+        try:
+            _replace_with_link(blob_path, dest_path)
+        except FileNotFoundError:
+            return False
+        app_log.debug(f"Linked blob {digest} to {dest_path}")
+        return True
+
+    def add(self, src_path: str, digest_alg: str, digest: str) -> None:
+        """Add a file to the store.
+
+        If an identical blob already exists, `src_path` is replaced by a
+        link to it so that only one copy is kept.
+        """
+
+        blob_path = self.blob_path(digest_alg, digest)
+        if blob_path is None:
+            return
+
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        try:
+            os.link(src_path, blob_path)
+        except FileExistsError:
+            if not os.path.samefile(src_path, blob_path):
+                _replace_with_link(blob_path, src_path)
+        except OSError as e:
+            app_log.debug(f"Unable to add {src_path} to the blob store: {e}")
+
+    def collect_garbage(self) -> int:
+        """Delete blobs no longer linked from any asset.
+
+        Returns:
+            The number of blobs deleted.
+        """
+
+        num_deleted = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    if os.stat(path).st_nlink <= 1:
+                        os.unlink(path)
+                        num_deleted += 1
+                except FileNotFoundError:
+                    continue
+
+        app_log.debug(f"Deleted {num_deleted} unreferenced blobs")
+        return num_deleted
@@ -0,0 +1,153 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Incremental digests of asset data computed while it is written"""
+
+import hashlib
+import io
+from typing import BinaryIO
+
+from covalent._shared_files import logger
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+app_log = logger.app_log
+
+# Digest algorithm names as recorded in asset metadata
+_ALGORITHM_ALIASES = {
+    "sha": "sha1",
+}
+
+# Algorithms which may key content-addressed blobs
+DIGEST_ALGORITHMS = {"sha1", "sha256", "blake2b", "blake3", "xxh64", "xxh3_64", "xxh3_128"}
+
+DEFAULT_ALGORITHM = "sha1"
+
+
+class UnsupportedDigestAlgorithm(Exception):
+    """
+    Exception to raise when a digest algorithm is unknown or its
+    implementation is not installed
+    """
+
+    pass
+
+
+def normalize_algorithm(algorithm: str) -> str:
+    """Return the canonical name of a digest algorithm."""
+    algorithm = algorithm.lower()
+    return _ALGORITHM_ALIASES.get(algorithm, algorithm)
+
+
+def new_hasher(algorithm: str):
+    """Create an incremental hash object.
+
+    Besides the algorithms provided by `hashlib`, "blake3" and the
+    "xxh64", "xxh3_64", and "xxh3_128" algorithms are available when
+    the `blake3` and `xxhash` packages are respectively installed.
+
+    Args:
+        algorithm: The name of the digest algorithm.
+
+    Returns:
+        An object with `update()` and `hexdigest()` methods.
+
+    """
+
+    algorithm = normalize_algorithm(algorithm)
+
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise UnsupportedDigestAlgorithm("The blake3 package is not installed")
+        return blake3.blake3()
+
+    if algorithm in ("xxh64", "xxh3_64", "xxh3_128"):
+        if xxhash is None:
+            raise UnsupportedDigestAlgorithm("The xxhash package is not installed")
+        return getattr(xxhash, algorithm)()
+
+    try:
+        return hashlib.new(algorithm)
+    except ValueError as e:
+        raise UnsupportedDigestAlgorithm(f"Unsupported digest algorithm {algorithm}") from e
+
+
+def resolve_algorithm(algorithm: str) -> str:
+    """Validate the configured digest algorithm.
+
+    Falls back to the default algorithm if the configured one is
+    unknown or its package is not installed.
+
+    Args:
+        algorithm: The name of the configured digest algorithm.
+
+    Returns:
+        The canonical name of a supported digest algorithm.
+
+    """
+
+    name = normalize_algorithm(algorithm)
+    try:
+        if name not in DIGEST_ALGORITHMS:
+            raise UnsupportedDigestAlgorithm(f"Unsupported digest algorithm {algorithm}")
+        new_hasher(name)
+    except UnsupportedDigestAlgorithm as e:
+        app_log.warning(f"{e}; falling back to {DEFAULT_ALGORITHM} asset digests")
+        return DEFAULT_ALGORITHM
+    return name
+
+
+class HashingWriter(io.RawIOBase):
+    """Binary file wrapper which digests and counts the bytes written.
+
+    Args:
+        f: The underlying binary file.
+        algorithm: The name of the digest algorithm.
+
+    """
+
+    def __init__(self, f: BinaryIO, algorithm: str):
+        super().__init__()
+        self._f = f
+        self.algorithm = normalize_algorithm(algorithm)
+        self._hasher = new_hasher(algorithm)
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        n = self._f.write(b)
+        self._hasher.update(b)
+        self.size += memoryview(b).nbytes
+        return n
+
+    def flush(self) -> None:
+        # Also called when the writer is closed or garbage collected,
+        # possibly after the underlying file has been closed
+        if not self._f.closed:
+            self._f.flush()
+
+    def hexdigest(self) -> str:
+        return self._hasher.hexdigest()
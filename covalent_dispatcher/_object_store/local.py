@@ -16,10 +16,14 @@
 
 
 import hashlib
+import io
 import json
 import os
+import shutil
+import threading
+import uuid
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import cloudpickle
 
@@ -29,9 +33,11 @@ from covalent._shared_files.utils import format_server_url
 from covalent._workflow.transport import TransportableObject
 
 from .base import BaseProvider, Digest
+from .cas import ContentAddressedStore, _replace_with_link
+from .hashing import HashingWriter, new_hasher, resolve_algorithm
 
 BLOCK_SIZE = 65536
-ALGORITHM = "sha1"
+ALGORITHM = resolve_algorithm(get_config("dispatcher.asset_digest_algorithm"))
 
 WORKFLOW_ASSET_FILENAME_MAP = result.ASSET_FILENAME_MAP.copy()
 WORKFLOW_ASSET_FILENAME_MAP.update(lattice.ASSET_FILENAME_MAP)
@@ -39,6 +45,24 @@ ELECTRON_ASSET_FILENAME_MAP = electron.ASSET_FILENAME_MAP.copy()
 
 SERVER_URL = format_server_url(get_config("dispatcher.address"), get_config("dispatcher.port"))
 
+# Directory under the results dir holding deduplicated blobs
+BLOB_STORE_DIR = ".cas"
+
+# Directory under the results dir recording the objects waiting for an
+# identical object's upload, so that they survive a restart
+PENDING_LINKS_DIR = ".pending_links"
+
+
+def _write_text(f: HashingWriter, write_fn) -> None:
+    """Write text to a binary file using the default text encoding."""
+    text_file = io.TextIOWrapper(f)
+    try:
+        write_fn(text_file)
+        text_file.flush()
+    finally:
+        text_file.detach()
+
+
 # Moved from write_result_to_db.py
 
 
@@ -56,9 +80,55 @@ class LocalProvider(BaseProvider):
     def __init__(self):
         self.base_path = get_config("dispatcher.results_dir")
 
+        # Identical assets share one copy on disk when deduplication is enabled
+        self.blob_store = None
+        if get_config("dispatcher.asset_dedup") == "true":
+            self.blob_store = ContentAddressedStore(os.path.join(self.base_path, BLOB_STORE_DIR))
+
+        # Paths to be linked to each pending upload once it completes
+        self._pending_links: Dict[str, List[str]] = self._load_pending_links()
+        self._pending_links_lock = threading.Lock()
+
+    def _pending_links_path(self, src_path: str) -> str:
+        name = hashlib.sha1(src_path.encode()).hexdigest()
+        return os.path.join(self.base_path, PENDING_LINKS_DIR, f"{name}.json")
+
+    def _load_pending_links(self) -> Dict[str, List[str]]:
+        pending_links = {}
+        links_dir = os.path.join(self.base_path, PENDING_LINKS_DIR)
+        if not os.path.isdir(links_dir):
+            return pending_links
+        for filename in os.listdir(links_dir):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(links_dir, filename), "r") as f:
+                    record = json.load(f)
+                pending_links[record["src"]] = record["dests"]
+            except (OSError, ValueError, KeyError):
+                continue
+        return pending_links
+
+    # Must be called with _pending_links_lock held
+    def _save_pending_links(self, src_path: str) -> None:
+        path = self._pending_links_path(src_path)
+        dests = self._pending_links.get(src_path)
+        if not dests:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            return
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"src": src_path, "dests": dests}, f)
+        os.replace(tmp_path, path)
+
     def digest(self, bucket_name: str, object_key: str) -> Digest:
         path = os.path.join(bucket_name, object_key)
-        h = hashlib.new(ALGORITHM)
+        h = new_hasher(ALGORITHM)
         with open(path, "rb") as f:
             buf = f.read(BLOCK_SIZE)
             while len(buf) > 0:
@@ -110,38 +180,58 @@ class LocalProvider(BaseProvider):
         """This function writes data corresponding to the filepaths in the DB."""
 
         if data is None:
-            return Digest(algorithm="sha1", hexdigest=""), 0
+            return Digest(algorithm=ALGORITHM, hexdigest=""), 0
 
         if filename.endswith(".pkl"):
-            with open(Path(storage_path) / filename, "wb") as f:
+
+            def write(f):
                 cloudpickle.dump(data, f)
 
         elif filename.endswith(".log") or filename.endswith(".txt"):
-            if data is None:
-                data = ""
-
             if not isinstance(data, str):
                 raise InvalidFileExtension("Data must be string type.")
 
-            with open(Path(storage_path) / filename, "w+") as f:
-                f.write(data)
+            def write(f):
+                _write_text(f, lambda text_file: text_file.write(data))
 
         elif filename.endswith(".tobj"):
-            with open(Path(storage_path) / filename, "wb") as f:
+
+            def write(f):
                 f.write(data.serialize())
 
         elif filename.endswith(".json"):
-            with open(Path(storage_path) / filename, "w") as f:
-                json.dump(data, f)
+
+            def write(f):
+                _write_text(f, lambda text_file: json.dump(data, text_file))
 
         elif filename.endswith(".mdb"):
-            with open(Path(storage_path) / filename, "wb") as f:
+
+            def write(f):
                 f.write(data)
+
         else:
             raise InvalidFileExtension("The file extension is not supported.")
 
-        digest = self.digest(bucket_name=storage_path, object_key=filename)
-        size = self.size(bucket_name=storage_path, object_key=filename)
+        # Write to a temporary file and then replace the destination so
+        # that files sharing data with other assets are never modified.
+        # The digest and size are computed as the data is written.
+        path = Path(storage_path) / filename
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+
+        try:
+            with open(tmp_path, "wb") as f:
+                writer = HashingWriter(f, ALGORITHM)
+                write(writer)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        digest = Digest(algorithm=writer.algorithm, hexdigest=writer.hexdigest())
+        size = writer.size
+        if size > 0:
+            self.add_blob(storage_path, filename, digest.algorithm, digest.hexdigest)
         return digest, size
 
     def load_file(self, storage_path: str, filename: str) -> Any:
@@ -156,8 +246,9 @@ class LocalProvider(BaseProvider):
                 data = f.read()
 
         elif filename.endswith(".tobj"):
-            with open(Path(storage_path) / filename, "rb") as f:
-                data = TransportableObject.deserialize(f.read())
+            # Sections are only read when accessed, so callers that
+            # need just the string representation don't load the data
+            data = TransportableObject.load_lazy(Path(storage_path) / filename)
 
         elif filename.endswith(".json"):
             with open(Path(storage_path) / filename, "r") as f:
@@ -169,6 +260,100 @@ class LocalProvider(BaseProvider):
 
         return data
 
+    def touch(self, storage_path: str, object_key: str) -> None:
+        path = Path(storage_path) / object_key
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    def link_or_copy(
+        self,
+        src_storage_path: str,
+        src_object_key: str,
+        dest_storage_path: str,
+        dest_object_key: str,
+    ) -> None:
+        """Hard link an object to a new location, copying it if linking fails."""
+        _replace_with_link(
+            os.path.join(src_storage_path, src_object_key),
+            os.path.join(dest_storage_path, dest_object_key),
+        )
+
+    def link_blob(self, storage_path: str, object_key: str, digest_alg: str, digest: str) -> bool:
+        if self.blob_store is None:
+            return False
+        return self.blob_store.link(digest_alg, digest, os.path.join(storage_path, object_key))
+
+    def link_on_upload(
+        self,
+        src_storage_path: str,
+        src_object_key: str,
+        dest_storage_path: str,
+        dest_object_key: str,
+    ) -> bool:
+        src_path = os.path.realpath(os.path.join(src_storage_path, src_object_key))
+        with self._pending_links_lock:
+            self._pending_links.setdefault(src_path, []).append(
+                os.path.join(dest_storage_path, dest_object_key)
+            )
+            self._save_pending_links(src_path)
+        return True
+
+    def get_pending_links(self) -> Set[str]:
+        """The paths of objects waiting for an identical object's upload."""
+        with self._pending_links_lock:
+            return {dest for dests in self._pending_links.values() for dest in dests}
+
+    def discard_pending_links(self, dispatch_id: str) -> None:
+        """Forget the pending links from or to a dispatch's objects."""
+
+        dispatch_dir = os.path.realpath(os.path.join(self.base_path, dispatch_id)) + os.sep
+        with self._pending_links_lock:
+            for src_path, dests in list(self._pending_links.items()):
+                if src_path.startswith(dispatch_dir):
+                    remaining = []
+                else:
+                    remaining = [
+                        dest
+                        for dest in dests
+                        if not os.path.realpath(dest).startswith(dispatch_dir)
+                    ]
+                if len(remaining) == len(dests):
+                    continue
+                if remaining:
+                    self._pending_links[src_path] = remaining
+                else:
+                    del self._pending_links[src_path]
+                self._save_pending_links(src_path)
+
+    def add_blob(
+        self, storage_path: str, object_key: str, digest_alg: str, digest: str
+    ) -> List[str]:
+        path = os.path.join(storage_path, object_key)
+        if self.blob_store is not None:
+            self.blob_store.add(path, digest_alg, digest)
+
+        # Populate objects waiting for this one's data
+        src_path = os.path.realpath(path)
+        with self._pending_links_lock:
+            dest_paths = self._pending_links.pop(src_path, [])
+        for dest_path in dest_paths:
+            _replace_with_link(path, dest_path)
+
+        # Only forget the links once they are made
+        if dest_paths:
+            with self._pending_links_lock:
+                self._save_pending_links(src_path)
+        return dest_paths
+
+    def collect_garbage(self) -> int:
+        if self.blob_store is None:
+            return 0
+        return self.blob_store.collect_garbage()
+
+    def delete_dispatch_assets(self, dispatch_id: str) -> None:
+        """Delete the asset files of a dispatch stored under the base path."""
+        shutil.rmtree(os.path.join(self.base_path, dispatch_id), ignore_errors=True)
+
     def get_public_uri(self, storage_path: str, object_key: str, **options) -> str:
         if storage_path.startswith(self.base_path):
             return f"{SERVER_URL}/api/v0/files/{object_key}"
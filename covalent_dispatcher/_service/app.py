@@ -31,6 +31,7 @@ from covalent._shared_files.schemas.result import ResultSchema
 from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent_dispatcher._core import dispatcher as core_dispatcher
 from covalent_dispatcher._core import runner_ng as core_runner
+from covalent_dispatcher._core.data_modules import asset_manager
 
 from .._dal.exporters.result import export_result_manifest
 from .._dal.result import Result, get_result_object
@@ -40,6 +41,7 @@ from .heartbeat import Heartbeat
 from .models import (
     BulkDispatchGetSchema,
     BulkGetMetadata,
+    DispatcherMetrics,
     DispatchStatusSetSchema,
     DispatchSummary,
     ElectronUpdateSchema,
@@ -73,6 +75,12 @@ async def lifespan(app: FastAPI):
         core_dispatcher._node_event_listener()
     )
 
+    # Finish copying assets reused by redispatches
+    asset_manager.resume_asset_copies()
+
+    # Pick up dispatches interrupted by a dispatcher crash
+    await resume_all_with_status(RESULT_STATUS.RUNNING)
+
     yield
 
     # Cancel all scheduled and running dispatches
@@ -104,6 +112,33 @@ async def cancel_all_with_status(status: RESULT_STATUS):
             await dispatcher.cancel_running_dispatch(dispatch_id)
 
 
+async def resume_all_with_status(status: RESULT_STATUS):
+    """Resume all dispatches with the specified status.
+
+    Dispatches whose run state can't be restored are left alone.
+    """
+
+    with workflow_db.session() as session:
+        records = Result.get_db_records(
+            session,
+            keys=["dispatch_id"],
+            equality_filters={"status": str(status)},
+            membership_filters={},
+        )
+        dispatch_ids = [record.dispatch_id for record in records]
+
+    for dispatch_id in dispatch_ids:
+        try:
+            resumed = await core_dispatcher.resume_dispatch(dispatch_id)
+        except Exception as ex:
+            app_log.exception(f"Error resuming dispatch {dispatch_id}: {ex}")
+            resumed = False
+        if resumed:
+            app_log.debug(f"Resumed dispatch {dispatch_id}")
+        else:
+            app_log.warning(f"Unable to resume dispatch {dispatch_id}")
+
+
 async def start(dispatch_id: str):
     """Start a previously registered (re-)dispatch.
 
@@ -298,6 +333,12 @@ def get_dispatches_bulk(
     return BulkDispatchGetSchema(dispatches=summaries, metadata=bulk_meta)
 
 
+@router.get("/dispatcher/metrics")
+def get_dispatcher_metrics() -> DispatcherMetrics:
+    """Return node event throughput metrics for the dispatcher."""
+    return DispatcherMetrics(**core_dispatcher._event_metrics.snapshot())
+
+
 @router.get("/dispatches/{dispatch_id}")
 def export_manifest(dispatch_id: str) -> ResultSchema:
     result_object = _try_get_result_object(dispatch_id)
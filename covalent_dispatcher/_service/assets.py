@@ -16,19 +16,24 @@
 
 """Endpoints for uploading and downloading workflow assets"""
 
+import os
+import tarfile
 from functools import lru_cache
-from typing import Union
+from typing import Iterator, List, Tuple, Union
 
 from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
 
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 from covalent._shared_files.schemas.asset import AssetSchema
 from covalent_dispatcher._object_store.base import TransferDirection
 
+from .._core.data_modules.asset_manager import mark_uploaded
+from .._dal.electron import Electron
 from .._dal.result import get_result_object
 from .._db.datastore import workflow_db
-from .models import ElectronAssetKey
+from .models import AssetBundleRequest, ElectronAssetKey
 
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
@@ -44,6 +49,8 @@ _background_tasks = set()
 
 LRU_CACHE_SIZE = get_config("dispatcher.asset_cache_size")
 
+BUNDLE_CHUNK_SIZE = 1024 * 1024
+
 
 @router.get("/dispatches/{dispatch_id}/electrons/{node_id}/assets/{key}")
 def get_node_asset(
@@ -79,6 +86,30 @@ def get_node_asset(
         raise
 
 
+@router.post("/dispatches/{dispatch_id}/electrons/assets/bundle")
+def get_node_asset_bundle(dispatch_id: str, req: AssetBundleRequest) -> StreamingResponse:
+    """Streams a batch of electron assets as an uncompressed tar archive.
+
+    Each asset is stored as the member `node_{node_id}/{key}`; empty
+    assets are omitted.
+
+    Args:
+        dispatch_id: The dispatch's unique id.
+        req: (body) The (node_id, key) pairs to include
+    """
+
+    try:
+        members = _resolve_bundle_members(dispatch_id, req)
+    except HTTPException:
+        raise
+    except Exception as e:
+        app_log.debug(e)
+        raise HTTPException(status_code=404, detail=str(e))
+
+    app_log.debug(f"Streaming bundle of {len(members)} assets for dispatch {dispatch_id}")
+    return StreamingResponse(_stream_tar(members), media_type="application/x-tar")
+
+
 @router.post("/dispatches/{dispatch_id}/electrons/{node_id}/assets/{key}")
 def upload_node_asset(
     dispatch_id: str,
@@ -87,9 +118,17 @@ def upload_node_asset(
     content_length: int = Header(default=0),
     digest_alg: Union[str, None] = Header(default=None),
     digest: Union[str, None] = Header(default=None),
+    object_stored: bool = Header(default=False),
 ) -> AssetSchema:
     """Upload an electron asset.
 
+    Returns an empty `remote_uri` if data with the supplied digest is
+    already stored, in which case no upload is needed.
+
+    Executors sharing the dispatcher's filesystem write outputs to the
+    object store directly and set `object_stored`, in which case only
+    the metadata is recorded.
+
     Args:
         dispatch_id: The dispatch's unique id.
         node_id: The electron id.
@@ -97,6 +136,7 @@ def upload_node_asset(
         asset_file: (body) The file to be uploaded
         content_length: (header)
         digest: (header)
+        object_stored: (header)
     """
     app_log.debug(
         f"Initiating upload for {dispatch_id}:{node_id}:{key.value} ({content_length} bytes) "
@@ -108,6 +148,7 @@ def upload_node_asset(
             node_id,
             key,
             metadata,
+            object_stored,
         )
         return AssetSchema(size=content_length, remote_uri=remote_uri)
     except Exception as e:
@@ -148,7 +189,7 @@ def _filter_null_metadata(metadata):
     return {k: v for k, v in metadata.items() if v is not None}
 
 
-def _update_node_asset_metadata(dispatch_id, node_id, key, metadata) -> str:
+def _update_node_asset_metadata(dispatch_id, node_id, key, metadata, stored=False) -> str:
     result_object = get_cached_result_object(dispatch_id)
 
     app_log.debug(f"LRU cache info: {get_cached_result_object.cache_info()}")
@@ -163,7 +204,72 @@ def _update_node_asset_metadata(dispatch_id, node_id, key, metadata) -> str:
         app_log.debug(f"Updated node asset {dispatch_id}:{node_id}:{key.value}")
 
         object_store = asset.object_store
+        digest = metadata.get("digest")
+
+        if stored:
+            # The data was written in place; register it as if uploaded
+            linked_paths = []
+            if digest and metadata.get("size"):
+                linked_paths = object_store.add_blob(
+                    asset.storage_path, asset.object_key, metadata.get("digest_alg"), digest
+                )
+            mark_uploaded([os.path.join(asset.storage_path, asset.object_key), *linked_paths])
+            return ""
+
+        # Skip the transfer if the data is already stored
+        if digest and object_store.link_blob(
+            asset.storage_path, asset.object_key, metadata.get("digest_alg"), digest
+        ):
+            return ""
+
         remote_uri = object_store.get_public_uri(
             asset.storage_path, asset.object_key, direction=TransferDirection.upload
         )
         return remote_uri
+
+
+def _resolve_bundle_members(dispatch_id: str, req: AssetBundleRequest) -> List[Tuple[str, str]]:
+    result_object = get_cached_result_object(dispatch_id)
+    tg = result_object.lattice.transport_graph
+    node_ids = list({ref.node_id for ref in req.assets})
+
+    # Load the assets of all requested nodes at once
+    with result_object.session() as session:
+        nodes = tg.get_nodes(node_ids, session)
+        eid_node_id_map = {node._electron_id: node.node_id for node in nodes}
+        records = Electron.get_linked_assets(
+            session,
+            fields=[],
+            equality_filters={"parent_lattice_id": result_object._lattice_id},
+            membership_filters={"id": list(eid_node_id_map)},
+        )
+    assets = {(eid_node_id_map[rec["meta_id"]], rec["key"]): rec["asset"] for rec in records}
+
+    members = []
+    for ref in req.assets:
+        asset = assets[(ref.node_id, ref.key.value)]
+        if not asset.size:
+            continue
+        path = os.path.join(asset.storage_path, asset.object_key)
+        members.append((f"node_{ref.node_id}/{ref.key.value}", path))
+    return members
+
+
+def _stream_tar(members: List[Tuple[str, str]]) -> Iterator[bytes]:
+    # Emit tar headers and file contents chunk by chunk so that large
+    # bundles are never buffered in memory
+    for name, path in members:
+        info = tarfile.TarInfo(name)
+        info.size = os.path.getsize(path)
+        yield info.tobuf(format=tarfile.GNU_FORMAT)
+
+        with open(path, "rb") as f:
+            while chunk := f.read(BUNDLE_CHUNK_SIZE):
+                yield chunk
+
+        remainder = info.size % tarfile.BLOCKSIZE
+        if remainder:
+            yield tarfile.NUL * (tarfile.BLOCKSIZE - remainder)
+
+    # End-of-archive marker
+    yield tarfile.NUL * (2 * tarfile.BLOCKSIZE)
@@ -17,34 +17,75 @@
 """Embedded file server API"""
 
 import os
+from typing import Union
 
 import aiofiles
 import aiofiles.os
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Header, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import FileResponse
 
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 
+from .._core.data_modules.asset_manager import mark_uploaded
+from .._object_store.hashing import UnsupportedDigestAlgorithm, new_hasher, normalize_algorithm
+from .._object_store.local import ALGORITHM, BLOB_STORE_DIR, PENDING_LINKS_DIR, local_store
+
 router = APIRouter()
 
 app_log = logger.app_log
 BASE_PATH = get_config("dispatcher.results_dir")
+BLOB_STORE_PATH = os.path.join(BASE_PATH, BLOB_STORE_DIR)
+PENDING_LINKS_PATH = os.path.join(BASE_PATH, PENDING_LINKS_DIR)
 
 
-async def _transfer_data(req: Request, dest_path: str):
+async def _transfer_data(
+    req: Request, dest_path: str, digest_alg: Union[str, None], digest: Union[str, None]
+):
+    # Digest uploads as they arrive, using the client's algorithm if
+    # the client supplied a digest to verify against
+    algorithm = normalize_algorithm(digest_alg if digest and digest_alg else ALGORITHM)
+    try:
+        h = new_hasher(algorithm)
+    except UnsupportedDigestAlgorithm as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # Stream data to a temporary file, then replace the destination
     # file atomically
     tmp_path = f"{dest_path}.tmp"
     app_log.debug(f"Streaming file upload to {tmp_path}")
 
-    async with aiofiles.open(tmp_path, "wb") as f:
-        async for chunk in req.stream():
-            await f.write(chunk)
+    size = 0
+    try:
+        async with aiofiles.open(tmp_path, "wb") as f:
+            async for chunk in req.stream():
+                await f.write(chunk)
+                h.update(chunk)
+                size += len(chunk)
+
+        hexdigest = h.hexdigest()
+        if digest and hexdigest != digest.lower():
+            raise HTTPException(
+                status_code=400,
+                detail=f"Digest mismatch: expected {digest}, received data has {hexdigest}",
+            )
+
+        await aiofiles.os.replace(tmp_path, dest_path)
+
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
-    await aiofiles.os.replace(tmp_path, dest_path)
+    linked_paths = []
+    if size > 0:
+        linked_paths = local_store.add_blob(
+            BASE_PATH, os.path.relpath(dest_path, BASE_PATH), algorithm, hexdigest
+        )
+
+    # Release tasks waiting for the data
+    mark_uploaded([dest_path, *linked_paths])
 
 
 # Resolve path to an absolute path and check that it
@@ -53,6 +94,8 @@ def _sanitize_path(path: str) -> str:
     abs_path = os.path.realpath(path)
     if not abs_path.startswith(BASE_PATH) or len(abs_path) <= len(BASE_PATH):
         raise RequestValidationError(f"Invalid object key {path}")
+    if abs_path.startswith((BLOB_STORE_PATH + os.sep, PENDING_LINKS_PATH + os.sep)):
+        raise RequestValidationError(f"Invalid object key {path}")
     return abs_path
 
 
@@ -63,7 +106,18 @@ async def download_file(object_key: str):
 
 
 @router.put("/files/{object_key:path}")
-async def upload_file(req: Request, object_key: str):
+async def upload_file(
+    req: Request,
+    object_key: str,
+    digest_alg: Union[str, None] = Header(default=None),
+    digest: Union[str, None] = Header(default=None),
+):
+    """Upload a file.
+
+    If the `Digest` and `Digest-alg` headers are supplied, the data is
+    verified against them and rejected if the digests don't match.
+    """
+
     path = _sanitize_path(os.path.join(BASE_PATH, object_key))
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    await _transfer_data(req, path)
+    await _transfer_data(req, path, digest_alg, digest)
@@ -56,6 +56,16 @@ class ElectronAssetKey(str, Enum):
     stderr = "stderr"
 
 
+class ElectronAssetRef(BaseModel):
+    node_id: int
+    key: ElectronAssetKey
+
+
+class AssetBundleRequest(BaseModel):
+    # The electron assets to include in the bundle
+    assets: List[ElectronAssetRef]
+
+
 class AssetRepresentation(str, Enum):
     string = "string"
     b64pickle = "object"
@@ -99,3 +109,11 @@ class BulkDispatchGetSchema(BaseModel):
 
 class ElectronUpdateSchema(BaseModel):
     sub_dispatch_id: str
+
+
+class DispatcherMetrics(BaseModel):
+    total_events: int
+    total_batches: int
+    max_batch_size: int
+    mean_batch_size: float
+    events_per_second: float
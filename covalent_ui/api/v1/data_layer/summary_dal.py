@@ -23,6 +23,9 @@ from sqlalchemy.orm import Session
 from sqlalchemy.sql import desc, func, or_
 from sqlalchemy.util import immutabledict
 
+from covalent._shared_files import logger
+from covalent_dispatcher._core.data_modules.asset_manager import materialize_borrowed_assets
+from covalent_dispatcher._dal.asset import local_store
 from covalent_dispatcher._db.models import ElectronDependency
 from covalent_ui.api.v1.database.schema.electron import Electron
 from covalent_ui.api.v1.database.schema.lattices import Lattice
@@ -37,6 +40,26 @@ from covalent_ui.api.v1.models.dispatch_model import (
 )
 from covalent_ui.api.v1.utils.status import Status
 
+app_log = logger.app_log
+
+
+def _delete_dispatch_assets(dispatch_ids: list) -> None:
+    """Delete the asset files of deleted dispatches and free unreferenced blobs.
+
+    This only applies when asset deduplication is enabled.
+    """
+    if local_store.blob_store is None or not dispatch_ids:
+        return
+    dispatch_ids = [str(dispatch_id) for dispatch_id in dispatch_ids]
+    # Redispatches may still refer to assets of the deleted dispatches
+    still_referenced = set(materialize_borrowed_assets(dispatch_ids))
+    for dispatch_id in dispatch_ids:
+        if dispatch_id in still_referenced:
+            app_log.warning(f"Keeping assets of dispatch {dispatch_id} used by redispatches")
+            continue
+        local_store.delete_dispatch_assets(dispatch_id)
+    local_store.collect_garbage()
+
 
 class Summary:
     """Summary data access layer"""
@@ -322,6 +345,7 @@ class Summary:
                 success.append(dispatch_id)
             except Exception:
                 failure.append(dispatch_id)
+        _delete_dispatch_assets(success)
         if len(success) > 0:
             message = "Dispatch(es) have been deleted successfully!"
             if len(failure) > 0:
@@ -416,6 +440,7 @@ class Summary:
                 success = dispatches
         except Exception:
             failure = dispatches
+        _delete_dispatch_assets(success)
         if (len(failure) == 0 and len(success) == 0) or (len(failure) > 0 and len(success) == 0):
             message = "No dispatches were deleted"
         elif len(failure) > 0 and len(success) > 0:
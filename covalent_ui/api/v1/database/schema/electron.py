@@ -117,6 +117,12 @@ class Electron(Base):
     # ID for circuit_info
     job_id = Column(Integer, ForeignKey("jobs.id", name="job_id_link"), nullable=False)
 
+    # Hash of the node and its predecessor subgraph, used to diff graphs on redispatch
+    node_hash = Column(Text, nullable=True)
+
+    # Whether the dispatcher may evaluate the node itself
+    inline = Column(Boolean, nullable=False, default=False)
+
     # Timestamps
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, onupdate=func.now(), server_default=func.now())
@@ -18,10 +18,9 @@
 Tests for the core functionality of the dispatcher.
 """
 
-
 import base64
 import tempfile
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import pytest
 
@@ -30,6 +29,7 @@ from covalent._dispatcher_plugins.local import LocalDispatcher, pack_staging_dir
 from covalent._results_manager import Result
 from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent._workflow.lattice import Lattice
+from covalent._workflow.transport import TransportableObject
 from covalent_dispatcher._core.data_manager import (
     _make_sublattice_dispatch,
     _update_parent_electron,
@@ -252,6 +252,106 @@ async def test_update_node_result_handles_db_exceptions(mocker):
     mock_notify.assert_awaited_with(result_object.dispatch_id, 0, Result.FAILED, {})
 
 
+@pytest.mark.asyncio
+async def test_update_node_result_bulk(mocker):
+    """Check that lists of node results are written in bulk"""
+
+    result_object = MagicMock()
+    result_object.dispatch_id = "test_update_node_result_bulk"
+    result_object._update_nodes_bulk = MagicMock(return_value=[True, False])
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.electron.get_result_object",
+        return_value=result_object,
+    )
+    node_infos = [{"type": "function"}, {"type": "function"}, {"type": "sublattice"}]
+    mocker.patch(
+        "covalent_dispatcher._core.data_manager.electron.get_bulk", return_value=node_infos
+    )
+    mock_notify = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.notify_node_status",
+    )
+
+    node_results = [
+        {"node_id": 0, "status": Result.COMPLETED},
+        {"node_id": 1, "status": Result.COMPLETED},
+        {"node_id": 2, "status": Result.COMPLETED},
+    ]
+
+    single_updates = []
+
+    async def mock_update_single(dispatch_id, node_result):
+        if isinstance(node_result, list):
+            return await update_node_result(dispatch_id, node_result)
+        single_updates.append(node_result)
+
+    mocker.patch(
+        "covalent_dispatcher._core.data_manager.update_node_result",
+        side_effect=mock_update_single,
+    )
+
+    await update_node_result(result_object.dispatch_id, node_results)
+
+    result_object._update_nodes_bulk.assert_called_once_with(node_results[:2])
+    mock_notify.assert_awaited_once_with(result_object.dispatch_id, 0, Result.COMPLETED, {})
+    assert single_updates == [node_results[2]]
+
+
+@pytest.mark.asyncio
+async def test_update_node_result_bulk_handles_db_exceptions(mocker):
+    """Check that bulk update_node_result handles db write failures"""
+
+    result_object = MagicMock()
+    result_object.dispatch_id = "test_update_node_result_bulk_handles_db_exceptions"
+    result_object._update_nodes_bulk = MagicMock(side_effect=RuntimeError())
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.electron.get_result_object",
+        return_value=result_object,
+    )
+    mocker.patch(
+        "covalent_dispatcher._core.data_manager.electron.get_bulk",
+        return_value=[{"type": "function"}, {"type": "function"}],
+    )
+    mock_notify = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.notify_node_status",
+    )
+
+    node_results = [
+        {"node_id": 0, "status": Result.COMPLETED},
+        {"node_id": 1, "status": Result.COMPLETED},
+    ]
+    await update_node_result(result_object.dispatch_id, node_results)
+
+    assert mock_notify.await_count == 2
+    mock_notify.assert_awaited_with(result_object.dispatch_id, 1, Result.FAILED, {})
+
+
+@pytest.mark.asyncio
+async def test_update_node_result_bulk_handles_query_exceptions(mocker):
+    """Check that nodes are failed and notified if their types can't be queried"""
+
+    dispatch_id = "test_update_node_result_bulk_handles_query_exceptions"
+    mocker.patch(
+        "covalent_dispatcher._core.data_manager.electron.get_bulk",
+        side_effect=RuntimeError(),
+    )
+    mock_update_bulk = mocker.patch("covalent_dispatcher._core.data_manager.electron.update_bulk")
+    mock_notify = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.notify_node_status",
+    )
+
+    node_results = [
+        {"node_id": 0, "status": Result.COMPLETED},
+        {"node_id": 1, "status": Result.COMPLETED},
+    ]
+    await update_node_result(dispatch_id, node_results)
+
+    mock_update_bulk.assert_not_called()
+    assert mock_notify.await_args_list == [
+        call(dispatch_id, 0, Result.FAILED, {}),
+        call(dispatch_id, 1, Result.FAILED, {}),
+    ]
+
+
 def test_get_result_object(mocker):
     result_object = MagicMock()
     result_object.dispatch_id = "dispatch_1"
@@ -365,8 +465,7 @@ async def test_make_sublattice_dispatch(mocker):
     mock_node = MagicMock()
     mock_node._electron_id = 5
 
-    mock_bg_output = MagicMock()
-    mock_bg_output.object_string = tar_b64
+    mock_bg_output = TransportableObject(tar_b64)
 
     mock_node.get_value = MagicMock(return_value=mock_bg_output)
 
@@ -385,9 +484,12 @@ async def test_make_sublattice_dispatch(mocker):
         return_value=mock_manifest,
     )
 
-    mock_pull = mocker.patch("covalent_dispatcher._core.data_modules.importer._pull_assets")
+    mock_get_assets = mocker.patch(
+        "covalent_dispatcher._core.data_modules.importer._get_all_assets",
+        return_value={"lattice": [], "nodes": []},
+    )
     sub_dispatch_id = await _make_sublattice_dispatch(result_object.dispatch_id, node_result)
-    mock_pull.assert_called()
+    mock_get_assets.assert_called()
 
     assert sub_dispatch_id == mock_manifest.metadata.dispatch_id
 
@@ -400,3 +502,11 @@ async def test_ensure_dispatch(mocker):
     )
     assert await ensure_dispatch("test_ensure_dispatch") is True
     mock_ensure_run_once.assert_called_with("test_ensure_dispatch")
+
+
+def test_finalize_dispatch(mocker):
+    """Check that finalizing a dispatch evicts its cached result object"""
+
+    mock_cache = mocker.patch("covalent_dispatcher._core.data_manager._result_object_cache")
+    finalize_dispatch("dispatch_1")
+    mock_cache.remove.assert_called_once_with("dispatch_1")
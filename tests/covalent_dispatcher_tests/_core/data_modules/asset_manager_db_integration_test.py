@@ -16,7 +16,6 @@
 
 """Tests for DB-backed Result"""
 
-
 import os
 import tempfile
 
@@ -27,8 +26,18 @@ from covalent._results_manager import Result as SDKResult
 from covalent._shared_files.schemas.asset import AssetUpdate
 from covalent._workflow.lattice import Lattice as SDKLattice
 from covalent_dispatcher._core.data_modules import asset_manager as am
+from covalent_dispatcher._dal.asset import (
+    FIELDS,
+    Asset,
+    AssetCopy,
+    PendingAssetCopy,
+    StorageType,
+    copy_asset_meta,
+    local_store,
+    record_asset_copies,
+)
 from covalent_dispatcher._dal.result import Result, get_result_object
-from covalent_dispatcher._db import update
+from covalent_dispatcher._db import models, update
 from covalent_dispatcher._db.datastore import DataStore
 
 TEMP_RESULTS_DIR = os.environ.get("COVALENT_DATA_DIR") or ct.get_config("dispatcher.results_dir")
@@ -122,6 +131,34 @@ async def test_async_upload(mocker):
     mock_sync_upload.assert_called_with(dispatch_id, asset_name, uris)
 
 
+def test_get_local_asset_uris(test_db, mocker):
+    """Assets in the local object store are located by file URIs."""
+
+    sdkres = get_mock_result()
+    sdkres._initialize_nodes()
+
+    mocker.patch("covalent_dispatcher._db.write_result_to_db.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._db.upsert.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    srvres = get_mock_srvresult(sdkres, test_db)
+    tg = srvres.lattice.transport_graph
+
+    resources = am.get_local_asset_uris_sync(srvres.dispatch_id, [2], [0])
+
+    def uri(node_id, key):
+        with srvres.session() as session:
+            return tg.get_node(node_id, session).get_asset(key, session).internal_uri
+
+    assert resources == {
+        "functions": {2: uri(2, "function")},
+        "inputs": {0: uri(0, "output")},
+        "hooks": {2: uri(2, "hooks")},
+        "outputs": {2: uri(2, "output")},
+    }
+    assert resources["functions"][2].startswith("file://")
+
+
 def test_download_assets_for_node(test_db, mocker):
     sdkres = get_mock_result()
     sdkres._initialize_nodes()
@@ -208,3 +245,279 @@ async def test_async_download(mocker):
         updates,
     )
     mock_sync_download.asset_called_with(dispatch_id, node_id, updates)
+
+
+def test_copy_assets_in_background(tmp_path, mocker):
+    """Reused assets are linked into their own location after the metadata copy."""
+
+    # The copies are recorded from another thread
+    test_db = DataStore(db_URL=f"sqlite+pysqlite:///{tmp_path}/workflows.db", initialize_db=True)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    with tempfile.TemporaryDirectory() as src_dir, tempfile.TemporaryDirectory() as dest_dir:
+        with open(os.path.join(src_dir, "value.txt"), "w") as f:
+            f.write("Hello\n")
+
+        records = [
+            models.Asset(
+                storage_type=StorageType.LOCAL.value,
+                storage_path=src_dir,
+                object_key=key,
+                digest_alg="sha1",
+                digest="abc",
+                size=size,
+            )
+            for key, size in [("value.txt", 6), ("stdout.log", 0)]
+        ]
+        records += [
+            models.Asset(
+                storage_type=StorageType.LOCAL.value,
+                storage_path=dest_dir,
+                object_key=key,
+                size=0,
+            )
+            for key in ["value.txt", "stdout.log"]
+        ]
+        with test_db.session() as session:
+            session.add_all(records)
+            session.flush()
+            assets = [Asset(session, rec) for rec in records]
+
+        assets_to_copy = []
+        with test_db.session() as session:
+            for src, dest in zip(assets[:2], assets[2:]):
+                assets_to_copy.append(AssetCopy.create(src, dest))
+                copy_asset_meta(session, src, dest)
+
+        assert am.copy_assets_in_background("mock_dispatch", []) is None
+        future = am.copy_assets_in_background("mock_dispatch", assets_to_copy)
+        future.result()
+        am.wait_for_asset_copies()
+
+        assert am.get_asset_copy_progress("mock_dispatch") is None
+
+        with test_db.session() as session:
+            for asset in assets[2:]:
+                asset.refresh(session, fields=FIELDS)
+                assert asset.storage_path == dest_dir
+                assert asset.digest == "abc"
+
+        value, stdout = assets[2:]
+        assert value.load_data() == "Hello\n"
+        assert os.path.samefile(
+            os.path.join(src_dir, "value.txt"), os.path.join(dest_dir, "value.txt")
+        )
+        assert os.path.getsize(os.path.join(dest_dir, "stdout.log")) == 0
+
+
+def test_copy_assets_in_background_failure(test_db, mocker):
+    """Failed copies leave the asset pointing at the source's data."""
+
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.asset_manager.materialize_asset_copy",
+        side_effect=OSError("disk full"),
+    )
+    mock_relocate = mocker.patch(
+        "covalent_dispatcher._core.data_modules.asset_manager.relocate_assets"
+    )
+    mock_copy = mocker.MagicMock()
+
+    future = am.copy_assets_in_background("mock_dispatch", [mock_copy, mock_copy])
+    future.result()
+
+    assert mock_relocate.call_args[0][1] == []
+
+
+def _make_reused_assets(test_db, base_path, src_dispatch_id, dest_dispatch_id):
+    """Create an asset of one dispatch reused by another but not yet copied."""
+
+    src_dir = os.path.join(base_path, src_dispatch_id)
+    os.makedirs(src_dir)
+    with open(os.path.join(src_dir, "value.txt"), "w") as f:
+        f.write("Hello\n")
+
+    records = [
+        models.Asset(
+            storage_type=StorageType.LOCAL.value,
+            storage_path=base_path,
+            object_key=f"{dispatch_id}/value.txt",
+            digest_alg="sha1",
+            digest="abc",
+            size=6,
+        )
+        for dispatch_id in [src_dispatch_id, dest_dispatch_id]
+    ]
+    with test_db.session() as session:
+        session.add_all(records)
+        session.flush()
+        src, dest = [Asset(session, rec) for rec in records]
+
+    with test_db.session() as session:
+        item = AssetCopy.create(src, dest)
+        copy_asset_meta(session, src, dest)
+        record_asset_copies(session, dest_dispatch_id, [item])
+
+    return src, dest
+
+
+def _get_pending_copies(test_db):
+    with test_db.session() as session:
+        return PendingAssetCopy.get(
+            session, fields=["asset_id"], equality_filters={}, membership_filters={}
+        )
+
+
+def test_resume_asset_copies(tmp_path, mocker):
+    """Copies which failed or were interrupted are retried from the DB."""
+
+    test_db = DataStore(db_URL=f"sqlite+pysqlite:///{tmp_path}/workflows.db", initialize_db=True)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+    base_path = str(tmp_path / "results")
+    _, dest = _make_reused_assets(test_db, base_path, "parent", "child")
+
+    mock_copy = mocker.patch(
+        "covalent_dispatcher._core.data_modules.asset_manager.materialize_asset_copy",
+        side_effect=OSError("disk full"),
+    )
+    am.resume_asset_copies()
+    am.wait_for_asset_copies()
+    mocker.stop(mock_copy)
+
+    assert len(_get_pending_copies(test_db)) == 1
+    with test_db.session() as session:
+        dest.refresh(session, fields=FIELDS)
+    assert dest.object_key == "parent/value.txt"
+
+    am.resume_asset_copies()
+    am.wait_for_asset_copies()
+
+    assert _get_pending_copies(test_db) == []
+    with test_db.session() as session:
+        dest.refresh(session, fields=FIELDS)
+    assert dest.object_key == "child/value.txt"
+    assert dest.load_data() == "Hello\n"
+
+
+def test_materialize_borrowed_assets(tmp_path, mocker):
+    """Assets still referring to a deleted dispatch's data are copied first."""
+
+    test_db = DataStore(db_URL=f"sqlite+pysqlite:///{tmp_path}/workflows.db", initialize_db=True)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+    base_path = str(tmp_path / "results")
+    mocker.patch.object(local_store, "base_path", base_path)
+
+    _, child_asset = _make_reused_assets(test_db, base_path, "parent", "child")
+    _make_reused_assets(test_db, base_path, "other", "deleted_child")
+
+    assert am.materialize_borrowed_assets(["parent", "deleted_child"]) == []
+
+    # Copies of the deleted dispatches' own assets are dropped
+    assert _get_pending_copies(test_db) == []
+
+    local_store.delete_dispatch_assets("parent")
+    with test_db.session() as session:
+        child_asset.refresh(session, fields=FIELDS)
+    assert child_asset.object_key == "child/value.txt"
+    assert child_asset.load_data() == "Hello\n"
+
+
+def test_materialize_borrowed_assets_failure(tmp_path, mocker):
+    """Dispatches whose data could not be copied are reported."""
+
+    test_db = DataStore(db_URL=f"sqlite+pysqlite:///{tmp_path}/workflows.db", initialize_db=True)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+    base_path = str(tmp_path / "results")
+    mocker.patch.object(local_store, "base_path", base_path)
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.asset_manager.materialize_asset_copy",
+        side_effect=OSError("disk full"),
+    )
+
+    _make_reused_assets(test_db, base_path, "parent", "child")
+
+    assert am.materialize_borrowed_assets(["parent"]) == ["parent"]
+    assert len(_get_pending_copies(test_db)) == 1
+
+
+@pytest.mark.asyncio
+async def test_wait_for_uploads(tmp_path):
+    """Tasks wait until all of their assets have been uploaded."""
+
+    import asyncio
+
+    dispatch_id = "test_wait_for_uploads"
+    paths = {node_id: [str(tmp_path / f"node_{node_id}" / "value.tobj")] for node_id in (0, 1)}
+    paths[1].append(str(tmp_path / "node_1" / "function.tobj"))
+
+    am.expect_uploads(dispatch_id, paths)
+    assert am.has_pending_uploads(dispatch_id, [0])
+    assert not am.has_pending_uploads(dispatch_id, [2])
+
+    waiter = asyncio.create_task(am.wait_for_uploads(dispatch_id, [0, 1]))
+
+    am.mark_uploaded(paths[0] + paths[1][:1])
+    await asyncio.sleep(0)
+    assert not am.has_pending_uploads(dispatch_id, [0])
+    assert not waiter.done()
+
+    am.mark_uploaded(paths[1][1:])
+    await asyncio.wait_for(waiter, timeout=1)
+    assert not am.has_pending_uploads(dispatch_id, [0, 1])
+
+    # Returns immediately once the assets have arrived
+    await asyncio.wait_for(am.wait_for_uploads(dispatch_id, [0, 1]), timeout=1)
+
+
+def test_restore_pending_uploads(test_db, mocker):
+    """Uploads still missing after a restart are tracked again."""
+
+    sdkres = get_mock_result()
+    sdkres._initialize_nodes()
+
+    mocker.patch("covalent_dispatcher._db.write_result_to_db.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._db.upsert.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    srvres = get_mock_srvresult(sdkres, test_db)
+    dispatch_id = srvres.dispatch_id
+    tg = srvres.lattice.transport_graph
+
+    # The client was still uploading the function of nodes 0 and 2
+    missing_paths = {}
+    with test_db.session() as session:
+        for node_id in [0, 2]:
+            asset = tg.get_node(node_id, session).get_asset("function", session)
+            asset.update(session, values={"size": 1024})
+            missing_paths[node_id] = os.path.join(asset.storage_path, asset.object_key)
+    for path in missing_paths.values():
+        os.unlink(path)
+
+    # Node 0 has already started
+    am.restore_pending_uploads_sync(dispatch_id, [1, 2])
+    try:
+        assert not am.has_pending_uploads(dispatch_id, [0, 1])
+        assert am.has_pending_uploads(dispatch_id, [2])
+
+        am.mark_uploaded([missing_paths[2]])
+        assert not am.has_pending_uploads(dispatch_id, [2])
+    finally:
+        am.discard_pending_uploads(dispatch_id)
+
+
+@pytest.mark.asyncio
+async def test_discard_pending_uploads(tmp_path):
+    """Discarding a dispatch's pending uploads releases waiting tasks."""
+
+    import asyncio
+
+    dispatch_id = "test_discard_pending_uploads"
+    am.expect_uploads(dispatch_id, {0: [str(tmp_path / "value.tobj")]})
+
+    waiter = asyncio.create_task(am.wait_for_uploads(dispatch_id, [0]))
+    await asyncio.sleep(0)
+
+    am.discard_pending_uploads(dispatch_id)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert not am.has_pending_uploads(dispatch_id, [0])
+    assert str(tmp_path / "value.tobj") not in am._pending_uploads
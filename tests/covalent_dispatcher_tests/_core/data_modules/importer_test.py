@@ -16,13 +16,21 @@
 
 """Unit tests for the importer entry point"""
 
+import base64
+import os
+import tarfile
+import tempfile
 from unittest.mock import MagicMock
 
 import pytest
 
+import covalent as ct
+from covalent._dispatcher_plugins.local import LocalDispatcher, pack_staging_dir
 from covalent_dispatcher._core.data_modules.importer import (
+    _expect_uploads,
     import_derived_manifest,
     import_manifest,
+    import_staging_tarball_stream,
 )
 
 
@@ -99,9 +107,160 @@ async def test_import_derived_manifest(mocker):
         "covalent_dispatcher._core.data_modules.importer._pull_assets",
     )
 
-    mock_manifest = {}
-    await import_derived_manifest(mock_manifest, "parent_dispatch", True)
+    mock_copy = mocker.patch(
+        "covalent_dispatcher._core.data_modules.importer.copy_assets_in_background",
+    )
+
+    await import_derived_manifest({}, "parent_dispatch", True)
 
     mock_import_manifest.assert_called()
     mock_pull.assert_called()
     mock_handle_redispatch.assert_called()
+    mock_copy.assert_called_with("test_import_derived_manifest", [])
+
+
+@pytest.mark.parametrize("manifest_first", [True, False])
+def test_import_staging_tarball_stream(mocker, manifest_first):
+    """Check that assets are streamed from the tarball into storage."""
+
+    @ct.lattice
+    @ct.electron
+    def sublattice(x):
+        return x**2
+
+    sublattice.build_graph(3)
+
+    with tempfile.TemporaryDirectory(prefix="covalent-") as staging_path:
+        manifest = LocalDispatcher.prepare_manifest(sublattice, staging_path)
+        tar_file = pack_staging_dir(staging_path, manifest)
+
+        if not manifest_first:
+            # Archives from older clients may contain the manifest last
+            with tarfile.TarFile(tar_file, "w") as tar:
+                manifest_path = os.path.join(staging_path, "manifest.json")
+                tar.add(
+                    staging_path, filter=lambda x: None if x.name.endswith("manifest.json") else x
+                )
+                tar.add(manifest_path)
+
+        with open(tar_file, "rb") as tar:
+            tar_b64 = base64.b64encode(tar.read())
+
+        contents = {}
+        for root, _, files in os.walk(staging_path):
+            for name in files:
+                with open(os.path.join(root, name), "rb") as f:
+                    contents[os.path.join(root, name)] = f.read()
+
+    with tempfile.TemporaryDirectory() as storage_path:
+        imported = {}
+
+        def mock_import(manifest, parent_dispatch_id, parent_electron_id):
+            manifest.metadata.dispatch_id = "mock_sublattice_dispatch"
+            imported["manifest"] = manifest
+            return manifest
+
+        def mock_get_all_assets(dispatch_id):
+            nodes = imported["manifest"].lattice.transport_graph.nodes
+            uris = [asset.uri for _, asset in imported["manifest"].lattice.assets]
+            uris.extend(asset.uri for node in nodes for _, asset in node.assets)
+
+            assets = []
+            for i, uri in enumerate(u for u in uris if u):
+                asset = MagicMock()
+                asset.storage_type = "file"
+                asset.storage_path = storage_path
+                asset.object_key = f"{i}/{os.path.basename(uri)}"
+                asset.remote_uri = uri
+                assets.append(asset)
+            imported["assets"] = assets
+            return {"lattice": [], "nodes": assets}
+
+        mocker.patch(
+            "covalent_dispatcher._core.data_modules.importer._import_manifest",
+            side_effect=mock_import,
+        )
+        mocker.patch(
+            "covalent_dispatcher._core.data_modules.importer._get_all_assets",
+            side_effect=mock_get_all_assets,
+        )
+
+        # Split the encoded tarball into chunks not aligned to base64 groups
+        chunks = [tar_b64[i : i + 1001] for i in range(0, len(tar_b64), 1001)]
+        filtered_manifest = import_staging_tarball_stream(chunks, "parent_dispatch", 5)
+
+        assert filtered_manifest.metadata.dispatch_id == "mock_sublattice_dispatch"
+        assert len(imported["assets"]) > 0
+        for asset in imported["assets"]:
+            work_dir_path = asset.remote_uri[len("file://") :]
+            src_path = work_dir_path[work_dir_path.index(staging_path) :]
+            with open(os.path.join(storage_path, asset.object_key), "rb") as f:
+                assert f.read() == contents[src_path]
+            asset.download.assert_not_called()
+
+
+def test_import_staging_tarball_stream_no_manifest(mocker):
+    """Check that archives without a manifest are rejected."""
+
+    with tempfile.TemporaryDirectory() as staging_path:
+        with open(os.path.join(staging_path, "function.tobj"), "wb") as f:
+            f.write(b"data")
+
+        with tempfile.NamedTemporaryFile(suffix=".tar") as tar_file:
+            with tarfile.TarFile(tar_file.name, "w") as tar:
+                tar.add(staging_path)
+            tar_b64 = base64.b64encode(tar_file.read())
+
+    mock_import = mocker.patch("covalent_dispatcher._core.data_modules.importer._import_manifest")
+    with pytest.raises(RuntimeError, match="no manifest"):
+        import_staging_tarball_stream([tar_b64], "parent_dispatch", 5)
+    mock_import.assert_not_called()
+
+
+def test_expect_uploads(mocker):
+    """Check that uploads of node assets are tracked."""
+
+    @ct.electron
+    def task(x):
+        return x
+
+    @ct.lattice
+    def workflow(x):
+        return task(x)
+
+    workflow.build_graph(1)
+    with tempfile.TemporaryDirectory() as staging_path:
+        manifest = LocalDispatcher.prepare_manifest(workflow, staging_path)
+    manifest.metadata.dispatch_id = "test_expect_uploads"
+
+    # Node 0 assets are either uploaded or linked to an identical
+    # upload; the other nodes' assets are pulled by the server.
+    node_0, *other_nodes = manifest.lattice.transport_graph.nodes
+    for key, asset in node_0.assets:
+        asset.uri = None
+        asset.remote_uri = "http://localhost/api/v0/files/object" if key == "function" else ""
+    for node in other_nodes:
+        for _, asset in node.assets:
+            asset.remote_uri = "http://localhost/api/v0/files/object"
+
+    local_store = mocker.patch("covalent_dispatcher._core.data_modules.importer.local_store")
+    local_store.get_uri_components = lambda dispatch_id, node_id, key: (
+        "/results",
+        f"{dispatch_id}/node_{node_id}/{key}",
+    )
+    local_store.get_pending_links.return_value = {
+        "/results/test_expect_uploads/node_0/function_string"
+    }
+    mock_expect = mocker.patch("covalent_dispatcher._core.data_modules.importer.expect_uploads")
+
+    _expect_uploads(manifest)
+
+    mock_expect.assert_called_once_with(
+        "test_expect_uploads",
+        {
+            0: [
+                "/results/test_expect_uploads/node_0/function",
+                "/results/test_expect_uploads/node_0/function_string",
+            ]
+        },
+    )
@@ -0,0 +1,110 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests for the result object cache
+"""
+
+from unittest.mock import MagicMock
+
+from covalent_dispatcher._core.data_modules.object_cache import (
+    ResultObjectCache,
+    get_result_object,
+    refresh_dispatch_metadata,
+)
+
+
+def test_result_object_cache_reuses_objects(mocker):
+    mock_get = mocker.patch(
+        "covalent_dispatcher._core.data_modules.object_cache.get_result_object_from_db",
+        side_effect=lambda dispatch_id, bare: MagicMock(),
+    )
+    cache = ResultObjectCache(max_size=2)
+
+    res_1 = cache.get("dispatch_1")
+    assert cache.get("dispatch_1") is res_1
+    mock_get.assert_called_once_with("dispatch_1", bare=True)
+    assert "dispatch_1" in cache
+
+
+def test_result_object_cache_evicts_lru(mocker):
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.object_cache.get_result_object_from_db",
+        side_effect=lambda dispatch_id, bare: MagicMock(),
+    )
+    cache = ResultObjectCache(max_size=2)
+
+    cache.get("dispatch_1")
+    cache.get("dispatch_2")
+    cache.get("dispatch_1")
+    cache.get("dispatch_3")
+
+    assert len(cache) == 2
+    assert "dispatch_1" in cache
+    assert "dispatch_2" not in cache
+
+
+def test_result_object_cache_remove(mocker):
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.object_cache.get_result_object_from_db",
+        side_effect=lambda dispatch_id, bare: MagicMock(),
+    )
+    cache = ResultObjectCache(max_size=2)
+
+    res_1 = cache.get("dispatch_1")
+    cache.remove("dispatch_1")
+    assert "dispatch_1" not in cache
+    assert cache.get("dispatch_1") is not res_1
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_result_object_cache_disabled(mocker):
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.object_cache.get_result_object_from_db",
+        side_effect=lambda dispatch_id, bare: MagicMock(),
+    )
+    cache = ResultObjectCache(max_size=0)
+
+    assert cache.get("dispatch_1") is not cache.get("dispatch_1")
+    assert len(cache) == 0
+
+
+def test_get_result_object_bypasses_cache_for_full_objects(mocker):
+    mock_get = mocker.patch(
+        "covalent_dispatcher._core.data_modules.object_cache.get_result_object_from_db",
+    )
+    mock_cache = mocker.patch(
+        "covalent_dispatcher._core.data_modules.object_cache._result_object_cache"
+    )
+
+    get_result_object("dispatch_1", bare=False)
+    mock_get.assert_called_once_with("dispatch_1", bare=False)
+
+    get_result_object("dispatch_1")
+    mock_cache.get.assert_called_once_with("dispatch_1")
+
+
+def test_refresh_dispatch_metadata():
+    result_object = MagicMock()
+
+    refresh_dispatch_metadata(result_object, ["dispatch_id", "root_dispatch_id"])
+    result_object._refresh_metadata.assert_not_called()
+
+    refresh_dispatch_metadata(result_object, ["dispatch_id", "status"])
+    result_object._refresh_metadata.assert_called_once()
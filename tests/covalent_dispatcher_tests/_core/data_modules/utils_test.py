@@ -0,0 +1,83 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests for the datastore executors
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from covalent_dispatcher._core.data_modules import utils
+from covalent_dispatcher._core.data_modules.utils import _create_pools, _write_lane
+
+
+def test_create_pools_single_writer():
+    """SQLite backends share one thread for reads and writes."""
+
+    read_pool, write_lanes = _create_pools(True, 8, 4)
+    assert write_lanes == [read_pool]
+    assert read_pool._max_workers == 1
+
+
+def test_create_pools_multi_writer():
+    read_pool, write_lanes = _create_pools(False, 8, 4)
+    assert read_pool._max_workers == 8
+    assert len(write_lanes) == 4
+    assert all(lane._max_workers == 1 for lane in write_lanes)
+
+
+def test_write_lane_is_stable():
+    _, write_lanes = _create_pools(False, 1, 4)
+    lanes = {_write_lane("dispatch_1", write_lanes) for _ in range(10)}
+    assert len(lanes) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_executor_preserves_order(mocker):
+    """Writes for a dispatch run sequentially in submission order."""
+
+    read_pool, write_lanes = _create_pools(False, 4, 4)
+    mocker.patch("covalent_dispatcher._core.data_modules.utils.read_pool", read_pool)
+    mocker.patch("covalent_dispatcher._core.data_modules.utils.write_lanes", write_lanes)
+
+    calls = []
+
+    def write(i):
+        time.sleep(0.001 * (5 - i))
+        calls.append(i)
+
+    await asyncio.gather(*[utils.run_in_write_executor("dispatch_1", write, i) for i in range(5)])
+    assert calls == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_read_executor_runs_concurrently(mocker):
+    read_pool, write_lanes = _create_pools(False, 2, 1)
+    mocker.patch("covalent_dispatcher._core.data_modules.utils.read_pool", read_pool)
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def read():
+        # Deadlocks unless both reads run at the same time
+        barrier.wait()
+        return True
+
+    assert await asyncio.gather(utils.run_in_read_executor(read), utils.run_in_read_executor(read))
@@ -351,3 +351,13 @@ async def test_get_initial_tasks_and_deps(mocker, test_db):
     # Account for injected postprocess electron
     assert pending_parents == {0: 1, 1: 0, 2: 1, 3: 3}
     assert sorted_task_groups == {0: [0], 1: [1], 2: [2], 3: [3]}
+
+    # Edge queries are now served from the adjacency index
+    from covalent_dispatcher._core.dispatcher import _adjacency_cache
+
+    index = _adjacency_cache.get(dispatch_id)
+    tg = result_object.lattice.transport_graph
+    for node_id in range(4):
+        assert index.get_successors(node_id) == tg.get_successors(node_id, ["task_group_id"])
+        assert len(index.get_incoming_edges(node_id)) == len(tg.get_incoming_edges(node_id))
+    _adjacency_cache.remove(dispatch_id)
@@ -0,0 +1,77 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the dispatcher's adjacency index"""
+
+import networkx as nx
+
+from covalent_dispatcher._core.dispatcher_modules.adjacency import (
+    AdjacencyIndex,
+    _AdjacencyIndexCache,
+)
+
+
+def get_test_graph():
+    g = nx.MultiDiGraph()
+    g.add_node(0, task_group_id=0)
+    g.add_node(1, task_group_id=1)
+    g.add_node(2, task_group_id=2)
+    g.add_node(3, task_group_id=2)
+    g.add_edge(0, 2, edge_name="x", param_type="arg", arg_index=0)
+    g.add_edge(1, 2, edge_name="y", param_type="arg", arg_index=1)
+    g.add_edge(1, 2, edge_name="z", param_type="kwarg", arg_index=None)
+    g.add_edge(2, 3, edge_name="x", param_type="arg", arg_index=0)
+    return g
+
+
+def test_adjacency_index_incoming_edges():
+    g = get_test_graph()
+    index = AdjacencyIndex(g)
+
+    assert len(index) == 4
+    assert index.get_nodes() == [0, 1, 2, 3]
+    assert index.get_incoming_edges(0) == []
+
+    edges = index.get_incoming_edges(2)
+    expected = [
+        {"source": s, "target": 2, "attrs": d}
+        for s in g.predecessors(2)
+        for d in g.get_edge_data(s, 2).values()
+    ]
+    assert sorted(edges, key=lambda e: e["attrs"]["edge_name"]) == sorted(
+        expected, key=lambda e: e["attrs"]["edge_name"]
+    )
+
+
+def test_adjacency_index_successors():
+    index = AdjacencyIndex(get_test_graph())
+
+    assert index.get_successors(1) == [
+        {"node_id": 2, "task_group_id": 2},
+        {"node_id": 2, "task_group_id": 2},
+    ]
+    assert index.get_successors(3) == []
+    assert index.get_task_group_id(3) == 2
+    assert index.get_task_groups() == {0, 1, 2}
+
+
+def test_adjacency_index_cache():
+    cache = _AdjacencyIndexCache()
+    index = cache.build("dispatch", get_test_graph())
+    assert cache.get("dispatch") is index
+
+    cache.remove("dispatch")
+    assert cache.get("dispatch") is None
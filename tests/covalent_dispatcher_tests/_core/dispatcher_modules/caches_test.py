@@ -0,0 +1,156 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the dispatcher state caches"""
+
+import tempfile
+
+import pytest
+
+from covalent_dispatcher._core.dispatcher_modules.caches import (
+    InMemoryTaskGroupRunState,
+    TaskGroupRunState,
+    _InMemoryWorkflowRunState,
+    _WorkflowRunState,
+)
+from covalent_dispatcher._db.datastore import DataStore
+
+
+@pytest.fixture
+def test_db_file():
+    """File-backed DB which can be accessed from the datastore worker thread."""
+    with tempfile.NamedTemporaryFile(mode="w+b") as tmp_file:
+        yield DataStore(db_URL=f"sqlite+pysqlite:///{tmp_file.name}", initialize_db=True)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_workflow_run_state():
+    cache = _InMemoryWorkflowRunState()
+    await cache.set_unresolved("dispatch", 0)
+    assert await cache.increment("dispatch", 3) == 3
+    assert await cache.decrement("dispatch") == 2
+    assert await cache.get_unresolved("dispatch") == 2
+
+    await cache.remove("dispatch")
+    with pytest.raises(KeyError):
+        await cache.get_unresolved("dispatch")
+
+
+@pytest.mark.asyncio
+async def test_in_memory_task_group_run_state():
+    cache = InMemoryTaskGroupRunState()
+    await cache.set("dispatch", 0, 2, [0, 1])
+    await cache.set("dispatch", 2, 0, [2])
+
+    assert await cache.decrement("dispatch", 0) == 1
+    assert await cache.get_pending("dispatch", 0) == 1
+    assert await cache.get_task_group("dispatch", 0) == [0, 1]
+
+    await cache.remove("dispatch", 0)
+    with pytest.raises(KeyError):
+        await cache.get_pending("dispatch", 0)
+    assert await cache.get_pending("dispatch", 2) == 0
+
+
+@pytest.mark.asyncio
+async def test_in_memory_state_snapshot_and_restore(test_db_file):
+    wf_store = _WorkflowRunState(test_db_file)
+    tg_store = TaskGroupRunState(test_db_file)
+
+    wf_cache = _InMemoryWorkflowRunState(wf_store, snapshot_interval=60)
+    tg_cache = InMemoryTaskGroupRunState(tg_store, snapshot_interval=60)
+
+    await wf_cache.set_unresolved("dispatch", 0)
+    await wf_cache.increment("dispatch", 2)
+    await tg_cache.set("dispatch", 0, 0, [0])
+    await tg_cache.set("dispatch", 1, 1, [1, 2])
+    await tg_cache.decrement("dispatch", 1)
+
+    await wf_cache.flush()
+    await tg_cache.flush()
+
+    assert await wf_store.get_unresolved("dispatch") == 2
+    assert await tg_store.get_pending("dispatch", 1) == 0
+    assert await tg_store.get_task_group("dispatch", 1) == [1, 2]
+
+    # Simulate a dispatcher restart
+    new_wf_cache = _InMemoryWorkflowRunState(wf_store, snapshot_interval=60)
+    new_tg_cache = InMemoryTaskGroupRunState(tg_store, snapshot_interval=60)
+    assert await new_wf_cache.restore("dispatch")
+    assert await new_tg_cache.restore("dispatch")
+    assert await new_wf_cache.get_unresolved("dispatch") == 2
+    assert await new_tg_cache.get_pending("dispatch", 0) == 0
+    assert await new_tg_cache.get_task_group("dispatch", 1) == [1, 2]
+
+    # Removals are written behind
+    await new_wf_cache.remove("dispatch")
+    assert await _InMemoryWorkflowRunState(wf_store).restore("dispatch")
+    await new_wf_cache.flush()
+    assert not await _InMemoryWorkflowRunState(wf_store).restore("dispatch")
+
+    # Cancel pending write-behind tasks
+    for cache in [wf_cache, tg_cache, new_wf_cache, new_tg_cache]:
+        if cache._snapshots._task:
+            cache._snapshots._task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_task_group_removal_is_written_behind(test_db_file, mocker):
+    tg_store = TaskGroupRunState(test_db_file)
+    tg_cache = InMemoryTaskGroupRunState(tg_store, snapshot_interval=60)
+    mock_remove = mocker.spy(tg_store, "_remove")
+
+    await tg_cache.set("dispatch", 0, 0, [0])
+    await tg_cache.set("dispatch", 1, 1, [1])
+    await tg_cache.flush()
+
+    await tg_cache.remove("dispatch", 0)
+    await tg_cache.flush()
+    assert tg_store._load("dispatch") == {1: (1, [1])}
+
+    await tg_cache.remove("dispatch", 1)
+    await tg_cache.flush()
+    assert tg_store._load("dispatch") == {}
+    mock_remove.assert_not_called()
+
+    if tg_cache._snapshots._task:
+        tg_cache._snapshots._task.cancel()
+
+
+@pytest.mark.asyncio
+async def test_sql_workflow_run_state(test_db_file):
+    cache = _WorkflowRunState(test_db_file)
+    await cache.set_unresolved("dispatch", 0)
+    assert await cache.increment("dispatch", 3) == 3
+    assert await cache.decrement("dispatch") == 2
+    await cache.remove("dispatch")
+    assert cache._load("dispatch") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "sql"])
+async def test_task_group_decrement_bulk(test_db_file, backend):
+    if backend == "memory":
+        cache = InMemoryTaskGroupRunState()
+    else:
+        cache = TaskGroupRunState(test_db_file)
+
+    await cache.set("dispatch", 0, 3, [0])
+    await cache.set("dispatch", 1, 1, [1])
+    await cache.set("dispatch", 2, 1, [2])
+
+    assert await cache.decrement_bulk("dispatch", {0: 2, 1: 1}) == {0: 1, 1: 0}
+    assert await cache.get_pending("dispatch", 2) == 1
@@ -0,0 +1,41 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for dispatcher event metrics"""
+
+from covalent_dispatcher._core.dispatcher_modules.metrics import EventMetrics
+
+
+def test_event_metrics(mocker):
+    mock_time = mocker.patch(
+        "covalent_dispatcher._core.dispatcher_modules.metrics.time.monotonic", return_value=0
+    )
+    metrics = EventMetrics(window=10)
+    metrics.record(4)
+    metrics.record(16)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["total_events"] == 20
+    assert snapshot["total_batches"] == 2
+    assert snapshot["max_batch_size"] == 16
+    assert snapshot["mean_batch_size"] == 10
+    assert snapshot["events_per_second"] == 2
+
+    # Older events fall out of the sliding window
+    mock_time.return_value = 11
+    metrics.record(5)
+    assert metrics.snapshot()["events_per_second"] == 0.5
+    assert metrics.snapshot()["total_events"] == 25
@@ -20,24 +20,30 @@ Tests for the core functionality of the dispatcher.
 This will be replaced in the next patch.
 """
 
-
+import asyncio
 from unittest.mock import call
 
 import pytest
 
 import covalent as ct
 from covalent._results_manager import Result
+from covalent._shared_files.defaults import sublattice_prefix
 from covalent._workflow.lattice import Lattice
 from covalent_dispatcher._core.dispatcher import (
+    _abort_dispatch,
     _clear_caches,
     _finalize_dispatch,
+    _get_event_batch,
     _handle_cancelled_node,
     _handle_event,
+    _handle_event_batch,
     _handle_failed_node,
     _handle_node_status_update,
+    _handle_node_status_updates,
     _submit_initial_tasks,
     _submit_task_group,
     cancel_dispatch,
+    resume_dispatch,
     run_dispatch,
     run_workflow,
 )
@@ -338,6 +344,86 @@ async def test_handle_event(mocker, unresolved_count):
         mock_finalize.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_handle_node_status_updates(mocker):
+    """Test that a batch of updates is coalesced into single counter updates"""
+    import networkx as nx
+
+    from covalent_dispatcher._core.dispatcher import (
+        _adjacency_cache,
+        _task_group_cache,
+        _workflow_run_cache,
+    )
+
+    dispatch_id = "test_handle_node_status_updates"
+
+    # 0 -> 2 <- 1, 0 -> 3, 3 and 4 are packed
+    g = nx.MultiDiGraph()
+    for node_id, gid in [(0, 0), (1, 1), (2, 2), (3, 3), (4, 3)]:
+        g.add_node(node_id, task_group_id=gid)
+    g.add_edge(0, 2, edge_name="x", param_type="arg", arg_index=0)
+    g.add_edge(1, 2, edge_name="y", param_type="arg", arg_index=1)
+    g.add_edge(0, 3, edge_name="x", param_type="arg", arg_index=0)
+    g.add_edge(3, 4, edge_name="x", param_type="arg", arg_index=0)
+    _adjacency_cache.build(dispatch_id, g)
+
+    await _task_group_cache.set(dispatch_id, 0, 0, [0])
+    await _task_group_cache.set(dispatch_id, 1, 0, [1])
+    await _task_group_cache.set(dispatch_id, 2, 2, [2])
+    await _task_group_cache.set(dispatch_id, 3, 1, [3, 4])
+    await _workflow_run_cache.set_unresolved(dispatch_id, 2)
+
+    mock_submit = mocker.patch("covalent_dispatcher._core.dispatcher._submit_task_group")
+    mock_incr = mocker.spy(_workflow_run_cache, "increment")
+
+    msgs = [
+        {"dispatch_id": dispatch_id, "node_id": 0, "status": Result.RUNNING, "detail": {}},
+        {"dispatch_id": dispatch_id, "node_id": 0, "status": Result.COMPLETED, "detail": {}},
+        {"dispatch_id": dispatch_id, "node_id": 1, "status": Result.COMPLETED, "detail": {}},
+    ]
+    await _handle_node_status_updates(dispatch_id, msgs)
+
+    assert mock_submit.await_count == 2
+    mock_submit.assert_any_await(dispatch_id, [2], 2)
+    mock_submit.assert_any_await(dispatch_id, [3, 4], 3)
+    assert mock_incr.await_args_list == [call(dispatch_id, 3), call(dispatch_id, -2)]
+    assert await _workflow_run_cache.get_unresolved(dispatch_id) == 3
+
+    await _workflow_run_cache.remove(dispatch_id)
+    for gid in range(4):
+        await _task_group_cache.remove(dispatch_id, gid)
+    _adjacency_cache.remove(dispatch_id)
+
+
+@pytest.mark.asyncio
+async def test_handle_event_batch(mocker):
+    mock_handle_updates = mocker.patch(
+        "covalent_dispatcher._core.dispatcher._handle_node_status_updates",
+    )
+    mock_finalize = mocker.patch(
+        "covalent_dispatcher._core.dispatcher._finalize_if_resolved",
+        return_value=Result.COMPLETED,
+    )
+    msgs = [{"dispatch_id": "mock_dispatch", "node_id": 2, "status": Result.COMPLETED}]
+
+    assert await _handle_event_batch("mock_dispatch", msgs) == Result.COMPLETED
+    mock_handle_updates.assert_awaited_with("mock_dispatch", msgs)
+    mock_finalize.assert_awaited_with("mock_dispatch")
+
+
+@pytest.mark.asyncio
+async def test_get_event_batch(mocker):
+    import asyncio
+
+    queue = asyncio.Queue()
+    mocker.patch("covalent_dispatcher._core.dispatcher._global_status_queue", queue)
+    for i in range(5):
+        queue.put_nowait(i)
+
+    assert await _get_event_batch(3, 0.01) == [0, 1, 2]
+    assert await _get_event_batch(3, 0.01) == [3, 4]
+
+
 @pytest.mark.asyncio
 async def test_handle_event_exception(mocker):
     import asyncio
@@ -561,6 +647,166 @@ async def test_submit_task_group(mocker):
     assert mock_get_abs_input.await_count == len(nodes)
 
 
+@pytest.mark.asyncio
+async def test_submit_task_group_internal_outputs(mocker):
+    """Check that outputs consumed only within the task group are not persisted"""
+    dispatch_id = "dispatch_1"
+    gid = 2
+    nodes = [2, 3, 4, 5]
+
+    mocker.patch("covalent_dispatcher._core.dispatcher.DISCARD_INTERNAL_OUTPUTS", True)
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher._get_abstract_task_inputs",
+        return_value={"args": [], "kwargs": {}},
+    )
+
+    mock_attrs = {
+        "name": "task",
+        "executor": "local",
+        "executor_data": {},
+    }
+    names = {2: "task", 3: "task", 4: f"{sublattice_prefix}task", 5: "task"}
+    successors = {2: [3], 3: [5, 6], 4: [5], 5: []}
+
+    async def get_electron_attrs(dispatch_id, node_id, keys):
+        return {key: mock_attrs[key] for key in keys}
+
+    async def get_bulk(dispatch_id, node_ids, keys):
+        if keys == ["name"]:
+            return [{"name": names[node_id]} for node_id in node_ids]
+        return [{"status": Result.NEW_OBJ} for _ in node_ids]
+
+    async def get_node_successors(dispatch_id, node_id):
+        return [{"node_id": child} for child in successors[node_id]]
+
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.get",
+        get_electron_attrs,
+    )
+    mocker.patch("covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk", get_bulk)
+    mocker.patch("covalent_dispatcher._core.dispatcher._get_node_successors", get_node_successors)
+    mock_run_abs_task = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.runner_ng.run_abstract_task_group",
+    )
+
+    await _submit_task_group(dispatch_id, nodes, gid)
+
+    task_seq = mock_run_abs_task.call_args.kwargs["task_seq"]
+    persisted = {task["electron_id"]: task["persist_output"] for task in task_seq}
+    assert persisted == {2: False, 3: True, 4: True, 5: True}
+
+
+@pytest.mark.parametrize(
+    "name,evaluated,expect_inline",
+    [
+        (":task.__getitem__", True, True),
+        (":task.__getitem__", False, True),
+        ("task", True, False),
+    ],
+)
+@pytest.mark.asyncio
+async def test_submit_task_group_inline(mocker, name, evaluated, expect_inline):
+    """Check that built-in nodes are evaluated in the dispatcher when possible"""
+    dispatch_id = "dispatch_1"
+    node_id = 2
+
+    mocker.patch("covalent_dispatcher._core.dispatcher.INLINE_TASKS", True)
+    abs_task_input = {"args": [1], "kwargs": {}}
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher._get_abstract_task_inputs",
+        return_value=abs_task_input,
+    )
+
+    mock_attrs = {
+        "name": name,
+        "inline": True,
+        "executor": "local",
+        "executor_data": {},
+    }
+
+    async def get_electron_attrs(dispatch_id, node_id, keys):
+        return {key: mock_attrs[key] for key in keys}
+
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.get",
+        get_electron_attrs,
+    )
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
+        return_value=[{"status": Result.NEW_OBJ}],
+    )
+    mock_run_inline = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.run_inline_task", return_value=evaluated
+    )
+    mock_run_abs_task = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.runner_ng.run_abstract_task_group",
+    )
+
+    await _submit_task_group(dispatch_id, [node_id], node_id)
+
+    if not expect_inline:
+        # The client's inline flag is ignored for other nodes
+        mock_run_inline.assert_not_awaited()
+        mock_run_abs_task.assert_called()
+        return
+
+    mock_run_inline.assert_awaited_with(dispatch_id, node_id, name, abs_task_input)
+    if evaluated:
+        mock_run_abs_task.assert_not_called()
+    else:
+        # Fall back to the node's executor
+        mock_run_abs_task.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_submit_task_group_waits_for_uploads(mocker, tmp_path):
+    """Check that task groups are only submitted once their assets arrive"""
+
+    from covalent_dispatcher._core.data_modules import asset_manager as am
+
+    dispatch_id = "test_submit_task_group_waits_for_uploads"
+    gid = 2
+    nodes = [3, 2]
+
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher._get_abstract_task_inputs",
+        return_value={"args": [], "kwargs": {}},
+    )
+
+    mock_attrs = {
+        "name": "task",
+        "executor": "local",
+        "executor_data": {},
+    }
+
+    async def get_electron_attrs(dispatch_id, node_id, keys):
+        return {key: mock_attrs[key] for key in keys}
+
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.get",
+        get_electron_attrs,
+    )
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
+        return_value=[{"status": Result.NEW_OBJ}] * len(nodes),
+    )
+    mock_run_abs_task = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.runner_ng.run_abstract_task_group",
+    )
+
+    path = str(tmp_path / "function.tobj")
+    am.expect_uploads(dispatch_id, {2: [path]})
+
+    await _submit_task_group(dispatch_id, nodes, gid)
+    await asyncio.sleep(0)
+    mock_run_abs_task.assert_not_called()
+
+    am.mark_uploaded([path])
+    for _ in range(5):
+        await asyncio.sleep(0)
+    mock_run_abs_task.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_submit_task_group_skips_reusable(mocker):
     """Check that submit_task_group skips reusable groups"""
@@ -649,6 +895,99 @@ async def test_submit_parameter(mocker):
     mock_update.assert_awaited()
 
 
+@pytest.mark.asyncio
+async def test_resume_dispatch_from_snapshot(mocker):
+    """Check that a dispatch continues from snapshotted state after a restart"""
+    import tempfile
+
+    import networkx as nx
+
+    from covalent_dispatcher._core.dispatcher_modules.caches import (
+        InMemoryTaskGroupRunState,
+        TaskGroupRunState,
+        _InMemoryWorkflowRunState,
+        _WorkflowRunState,
+    )
+
+    dispatch_id = "test_resume_dispatch_from_snapshot"
+
+    # 0 -> 1 -> 2, each in its own task group
+    g = nx.MultiDiGraph()
+    for node_id in range(3):
+        g.add_node(node_id, task_group_id=node_id)
+    for parent in range(2):
+        g.add_edge(parent, parent + 1, edge_name="x", param_type="arg", arg_index=0)
+
+    statuses = {0: Result.COMPLETED, 1: Result.RUNNING, 2: Result.NEW_OBJ}
+
+    async def get_bulk(dispatch_id, node_ids, keys):
+        return [{"status": statuses[i], "sub_dispatch_id": None} for i in node_ids]
+
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.tg_utils.get_nodes_links",
+        return_value=nx.readwrite.node_link_data(g),
+    )
+    mocker.patch("covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk", get_bulk)
+    mock_submit = mocker.patch("covalent_dispatcher._core.dispatcher._submit_task_group")
+    mocker.patch("covalent_dispatcher._core.dispatcher._finalize_dispatch")
+    mocker.patch("covalent_dispatcher._core.dispatcher.datasvc.persist_result")
+    mocker.patch("covalent_dispatcher._core.dispatcher.datasvc.finalize_dispatch")
+    mock_restore_uploads = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.am.restore_pending_uploads"
+    )
+
+    with tempfile.NamedTemporaryFile(mode="w+b") as tmp_file:
+        db = DataStore(db_URL=f"sqlite+pysqlite:///{tmp_file.name}", initialize_db=True)
+        wf_store = _WorkflowRunState(db)
+        tg_store = TaskGroupRunState(db)
+
+        # Snapshot taken before the completion of node 0 was handled
+        old_wf_cache = _InMemoryWorkflowRunState(wf_store, snapshot_interval=60)
+        old_tg_cache = InMemoryTaskGroupRunState(tg_store, snapshot_interval=60)
+        await old_wf_cache.set_unresolved(dispatch_id, 1)
+        for gid, num_pending in enumerate([0, 1, 1]):
+            await old_tg_cache.set(dispatch_id, gid, num_pending, [gid])
+        await old_wf_cache.flush()
+        await old_tg_cache.flush()
+        for cache in [old_wf_cache, old_tg_cache]:
+            cache._snapshots._task.cancel()
+
+        # Restart with empty caches
+        wf_cache = _InMemoryWorkflowRunState(wf_store)
+        tg_cache = InMemoryTaskGroupRunState(tg_store)
+        mocker.patch("covalent_dispatcher._core.dispatcher._workflow_run_cache", wf_cache)
+        mocker.patch("covalent_dispatcher._core.dispatcher._task_group_cache", tg_cache)
+
+        assert await resume_dispatch(dispatch_id)
+
+    # Uploads are only awaited for tasks which have yet to start
+    mock_restore_uploads.assert_awaited_once_with(dispatch_id, [2])
+
+    # The lost execution of task group 1 is resubmitted
+    mock_submit.assert_awaited_once_with(dispatch_id, [1], 1)
+    assert await tg_cache.get_pending(dispatch_id, 2) == 1
+    assert await wf_cache.get_unresolved(dispatch_id) == 1
+
+    # Node events continue to drive the dispatch
+    await _handle_node_status_update(dispatch_id, 1, Result.COMPLETED, {})
+    mock_submit.assert_awaited_with(dispatch_id, [2], 2)
+    await _handle_node_status_update(dispatch_id, 2, Result.COMPLETED, {})
+    assert await wf_cache.get_unresolved(dispatch_id) == 0
+
+
+@pytest.mark.asyncio
+async def test_resume_dispatch_without_snapshot(mocker):
+    """Check that dispatches without a snapshot are not resumed"""
+    mock_restore = mocker.patch(
+        "covalent_dispatcher._core.dispatcher._task_group_cache.restore", return_value=False
+    )
+    mock_submit = mocker.patch("covalent_dispatcher._core.dispatcher._submit_task_group")
+
+    assert not await resume_dispatch("dispatch")
+    mock_restore.assert_awaited_once_with("dispatch")
+    mock_submit.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_clear_caches(mocker):
     import networkx as nx
@@ -674,6 +1013,24 @@ async def test_clear_caches(mocker):
     assert mock_task_groups_remove.await_count == 2
 
 
+@pytest.mark.parametrize("clear_error", [None, RuntimeError("db error")])
+@pytest.mark.asyncio
+async def test_abort_dispatch_clears_caches(mocker, clear_error):
+    """Check that aborted dispatches release their run state"""
+
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher._handle_dispatch_exception",
+        return_value=Result.FAILED,
+    )
+    mocker.patch("covalent_dispatcher._core.dispatcher.datasvc.persist_result")
+    mock_clear = mocker.patch(
+        "covalent_dispatcher._core.dispatcher._clear_caches", side_effect=clear_error
+    )
+
+    assert await _abort_dispatch("dispatch", RuntimeError("error")) == Result.FAILED
+    mock_clear.assert_awaited_once_with("dispatch")
+
+
 @pytest.mark.asyncio
 async def test_cancel_dispatch(mocker):
     """Test cancelling a dispatch, including sub-lattices"""
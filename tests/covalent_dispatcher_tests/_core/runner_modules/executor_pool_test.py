@@ -0,0 +1,106 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the pool of reusable executor instances
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from covalent.executor import _executor_manager
+from covalent.executor.executor_plugins.local import LocalExecutor
+from covalent_dispatcher._core.runner_modules.utils import (
+    _ExecutorPool,
+    get_executor,
+    release_executor,
+)
+
+
+@pytest.fixture
+def executor_pool(mocker):
+    """Replace the global executor pool with an empty one."""
+    pool = _ExecutorPool(max_size=2, idle_timeout=60)
+    mocker.patch("covalent_dispatcher._core.runner_modules.utils._executor_pool", pool)
+    mocker.patch.object(_executor_manager, "executor_plugins_map", {"local": LocalExecutor})
+    return pool
+
+
+def _selected_executor(workdir):
+    return ["local", LocalExecutor(workdir=workdir).to_dict()]
+
+
+def test_get_executor_reuses_released_instances(executor_pool):
+    executor = get_executor(0, _selected_executor("/tmp/a"))
+    send_queue = executor._send_queue
+
+    # No state carries over to the next lease
+    executor.workdir = "/tmp/changed"
+    executor._client = "client"
+    release_executor(executor)
+
+    reused = get_executor(1, _selected_executor("/tmp/a"))
+    assert reused is executor
+    assert reused.workdir == "/tmp/a"
+    assert not hasattr(reused, "_client")
+    assert reused._send_queue is not send_queue
+
+
+def test_get_executor_leases_exclusively(executor_pool):
+    executor_1 = get_executor(0, _selected_executor("/tmp/a"))
+    executor_2 = get_executor(1, _selected_executor("/tmp/a"))
+    assert executor_1 is not executor_2
+
+    release_executor(executor_1)
+    executor_3 = get_executor(2, _selected_executor("/tmp/b"))
+    assert executor_3 is not executor_1
+    assert executor_3.workdir == "/tmp/b"
+
+
+def test_executor_pool_bounded_size(executor_pool):
+    executors = [get_executor(i, _selected_executor("/tmp/a")) for i in range(3)]
+    for executor in executors:
+        release_executor(executor)
+
+    # The least recently released instance is dropped
+    reused = {id(get_executor(i, _selected_executor("/tmp/a"))) for i in range(3)}
+    assert id(executors[0]) not in reused
+    assert {id(executors[1]), id(executors[2])} < reused
+
+
+def test_executor_pool_idle_timeout(executor_pool, mocker):
+    mock_time = mocker.patch("covalent_dispatcher._core.runner_modules.utils.time.monotonic")
+    mock_time.return_value = 100.0
+
+    executor = get_executor(0, _selected_executor("/tmp/a"))
+    release_executor(executor)
+
+    mock_time.return_value = 161.0
+    assert get_executor(1, _selected_executor("/tmp/a")) is not executor
+
+
+def test_executor_pool_disabled(executor_pool):
+    executor_pool.max_size = 0
+
+    executor = get_executor(0, _selected_executor("/tmp/a"))
+    release_executor(executor)
+    assert get_executor(1, _selected_executor("/tmp/a")) is not executor
+
+
+def test_release_unknown_executor(executor_pool):
+    release_executor(MagicMock())
+    assert not executor_pool._idle
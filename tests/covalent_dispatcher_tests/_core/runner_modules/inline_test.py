@@ -0,0 +1,95 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for evaluating built-in nodes in the dispatcher
+"""
+
+import pytest
+
+from covalent._shared_files.util_classes import RESULT_STATUS
+from covalent._workflow.transportable_object import TransportableObject
+from covalent_dispatcher._core.runner_modules import inline
+
+
+def get_item(e, key):
+    return e[key]
+
+
+def _mock_datasvc(mocker, outputs):
+    async def get(dispatch_id, node_id, keys):
+        return {"function": TransportableObject(get_item)}
+
+    async def get_bulk(dispatch_id, node_ids, keys):
+        return [{"output": outputs[node_id]} for node_id in node_ids]
+
+    mocker.patch("covalent_dispatcher._core.runner_modules.inline.datasvc.electron.get", get)
+    mocker.patch(
+        "covalent_dispatcher._core.runner_modules.inline.datasvc.electron.get_bulk", get_bulk
+    )
+    return mocker.patch(
+        "covalent_dispatcher._core.runner_modules.inline.datasvc.update_node_result"
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_inline_task(mocker):
+    dispatch_id = "test_run_inline_task"
+    outputs = {0: TransportableObject([1, 2, 3]), 1: TransportableObject(1)}
+    mock_update = _mock_datasvc(mocker, outputs)
+
+    abstract_inputs = {"args": [0], "kwargs": {"key": 1}}
+    assert await inline.run_inline_task(dispatch_id, 2, ":task.__getitem__", abstract_inputs)
+
+    node_result = mock_update.call_args.args[1]
+    assert node_result["node_id"] == 2
+    assert node_result["status"] == RESULT_STATUS.COMPLETED
+    assert node_result["output"].get_deserialized() == 2
+
+
+@pytest.mark.asyncio
+async def test_run_inline_task_exception(mocker):
+    """Test that errors are left for the executor to report."""
+
+    dispatch_id = "test_run_inline_task_exception"
+    outputs = {0: TransportableObject([1, 2, 3]), 1: TransportableObject(5)}
+    mock_update = _mock_datasvc(mocker, outputs)
+
+    abstract_inputs = {"args": [0, 1], "kwargs": {}}
+    assert not await inline.run_inline_task(dispatch_id, 2, ":task.__getitem__", abstract_inputs)
+    mock_update.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "node_name,flag,eligible",
+    [
+        (":electron_list:", True, True),
+        (":electron_dict:", True, True),
+        (":postprocess:reconstruct", True, True),
+        (":task.__getitem__", True, True),
+        (":task.__getattr__", True, True),
+        (":task()[1]", True, True),
+        (":task.__getitem__", False, False),
+        ("task", True, False),
+        ("task_+_1", True, False),
+        (":sublattice:workflow", True, False),
+        (":postprocess:", True, False),
+    ],
+)
+def test_is_inline_eligible(node_name, flag, eligible):
+    """Test that only built-in nodes are evaluated in the dispatcher."""
+
+    assert inline.is_inline_eligible(node_name, flag) == eligible
@@ -232,6 +232,50 @@ async def test_submit_abstract_task_group(mocker, task_cancelled):
         assert send_retval == "42"
 
 
+@pytest.mark.asyncio
+async def test_submit_abstract_task_group_local_assets(mocker):
+    """Check that executors sharing the dispatcher's filesystem get
+    object store URIs instead of uploaded copies"""
+
+    class MockLocalExecutor(MockManagedExecutor):
+        SHARES_DISPATCHER_FILESYSTEM = True
+
+    me = MockLocalExecutor()
+    me.send = AsyncMock(return_value="42")
+
+    resources = {
+        "functions": {0: "file:///results/node_0/function.tobj"},
+        "inputs": {1: "file:///results/node_1/output.tobj"},
+        "hooks": {0: "file:///results/node_0/hooks.json"},
+        "outputs": {0: "file:///results/node_0/output.tobj"},
+    }
+    mock_get_uris = mocker.patch(
+        "covalent_dispatcher._core.data_modules.asset_manager.get_local_asset_uris",
+        return_value=resources,
+    )
+    mock_upload = mocker.patch(
+        "covalent_dispatcher._core.data_modules.asset_manager.upload_asset_for_nodes",
+    )
+
+    task = {"electron_id": 0, "args": [1], "kwargs": {}}
+    _, send_retval = await _submit_abstract_task_group(
+        dispatch_id="dispatch",
+        task_group_id=0,
+        task_seq=[task],
+        known_nodes=[1],
+        executor=me,
+    )
+
+    assert send_retval == "42"
+    mock_get_uris.assert_awaited_once_with("dispatch", [0], [1])
+    mock_upload.assert_not_awaited()
+    me.send.assert_awaited_with(
+        [TaskSpec(**task)],
+        ResourceMap(**resources),
+        {"dispatch_id": "dispatch", "task_group_id": 0, "node_ids": [0]},
+    )
+
+
 @pytest.mark.asyncio
 async def test_submit_requires_opt_in(mocker):
     """Checks submit rejects old-style executors"""
@@ -363,7 +407,7 @@ async def test_get_task_result(mocker):
 
     me.receive.assert_awaited_with(task_group_metadata, job_meta)
 
-    mock_update.assert_awaited_with(dispatch_id, expected_node_result)
+    mock_update.assert_awaited_with(dispatch_id, [expected_node_result])
     mock_download.assert_awaited()
     # Test exception during get
     me.receive = AsyncMock(side_effect=RuntimeError())
@@ -472,7 +516,7 @@ async def test_event_listener(mocker):
 
     await asyncio.wait_for(fut, 1)
 
-    mock_update.assert_awaited_with(task_group_metadata["dispatch_id"], node_result)
+    mock_update.assert_awaited_with(task_group_metadata["dispatch_id"], [node_result])
 
     await mock_event_queue.put({"BAD_EVENT": "asdf"})
     await mock_event_queue.put({"event": "BYE"})
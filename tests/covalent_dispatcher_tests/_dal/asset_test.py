@@ -21,7 +21,15 @@ import tempfile
 
 import pytest
 
-from covalent_dispatcher._dal.asset import FIELDS, Asset, StorageType, copy_asset, copy_asset_meta
+from covalent_dispatcher._dal.asset import (
+    FIELDS,
+    Asset,
+    AssetCopy,
+    StorageType,
+    copy_asset,
+    copy_asset_meta,
+    relocate_assets,
+)
 from covalent_dispatcher._db import models
 from covalent_dispatcher._db.datastore import DataStore
 
@@ -171,3 +179,34 @@ def test_copy_asset_metadata(test_db):
         assert dest_asset.digest_alg == "sha"
         assert dest_asset.digest == "srcdigest"
         assert dest_asset.size == 256
+
+
+def test_relocate_assets(test_db):
+    """Assets are only relocated if they still refer to the copied data."""
+
+    records = [
+        get_asset_record("/tmp", "parent/key"),
+        get_asset_record("/tmp", "child/key"),
+        get_asset_record("/tmp", "child/other_key"),
+    ]
+    with test_db.session() as session:
+        session.add_all(records)
+        session.flush()
+        src, dest, rewritten = [Asset(session, rec) for rec in records]
+
+    items = [AssetCopy.create(src, dest), AssetCopy.create(src, rewritten)]
+    with test_db.session() as session:
+        copy_asset_meta(session, src, dest)
+        copy_asset_meta(session, src, rewritten)
+        # The asset was rewritten after its copy was scheduled
+        rewritten.update(session, values={"object_key": "child/new_key"})
+
+    with test_db.session() as session:
+        relocate_assets(session, items)
+
+    with test_db.session() as session:
+        dest.refresh(session, fields=FIELDS)
+        rewritten.refresh(session, fields=FIELDS)
+
+    assert dest.object_key == "child/key"
+    assert rewritten.object_key == "child/new_key"
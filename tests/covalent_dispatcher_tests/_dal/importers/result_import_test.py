@@ -23,12 +23,14 @@ import pytest
 
 import covalent as ct
 from covalent._results_manager.result import Result as SDKResult
-from covalent._serialize.result import serialize_result
+from covalent._serialize.result import serialize_result, strip_local_uris
 from covalent._shared_files.schemas.result import ResultSchema
 from covalent._shared_files.util_classes import RESULT_STATUS
+from covalent_dispatcher._dal.electron import ElectronMeta
 from covalent_dispatcher._dal.importers.result import handle_redispatch, import_result
 from covalent_dispatcher._dal.job import Job
 from covalent_dispatcher._dal.result import get_result_object
+from covalent_dispatcher._dal.tg_ops import get_reusable_node_ids
 from covalent_dispatcher._db.datastore import DataStore
 from covalent_dispatcher._object_store.local import SERVER_URL
 
@@ -123,6 +125,145 @@ def test_import_result(mocker, test_db):
         assert edge == filtered_tg.links[i]
 
 
+def test_import_result_bulk_records(mocker, test_db):
+    """Test that records inserted in bulk are linked correctly."""
+
+    dispatch_id = "test_import_result_bulk_records"
+
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    @ct.electron
+    def task(x, y=0):
+        return x + y
+
+    @ct.lattice
+    def workflow(n):
+        results = [task(i) for i in range(n)]
+        return task(results[0], y=results[-1])
+
+    workflow.build_graph(5)
+    sdk_res = SDKResult(workflow, dispatch_id=dispatch_id)
+
+    with (
+        tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir,
+        tempfile.TemporaryDirectory(prefix="covalent-") as srv_dir,
+    ):
+        res = serialize_result(sdk_res, sdk_dir)
+        import_result(res, srv_dir, None)
+
+    srv_res = get_result_object(dispatch_id, bare=False)
+    srv_tg = srv_res.lattice.transport_graph
+    sdk_tg = sdk_res.lattice.transport_graph
+
+    def edges(tg):
+        return sorted((u, v, d["edge_name"]) for u, v, d in tg._graph.edges(data=True))
+
+    assert edges(srv_tg) == edges(sdk_tg)
+
+    with test_db.Session() as session:
+        for node_id in sdk_tg._graph.nodes:
+            node = srv_tg.get_node(node_id)
+            assert node.get_value("name") == sdk_tg.get_node_value(node_id, "name")
+            object_key = node.get_asset("function", session).object_key
+            assert object_key.startswith(f"{dispatch_id}/node_{node_id}/")
+
+        records = ElectronMeta.get(
+            session, fields={"job_id"}, equality_filters={}, membership_filters={}
+        )
+        assert len({rec.job_id for rec in records}) == len(sdk_tg._graph.nodes)
+
+
+def test_import_result_zero_byte_assets(mocker, test_db):
+    """Zero-byte assets are created by the server instead of being uploaded."""
+
+    dispatch_id = "test_import_result_zero_byte_assets"
+
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+    mock_touch = mocker.patch("covalent_dispatcher._object_store.local.LocalProvider.touch")
+
+    with (
+        tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir,
+        tempfile.TemporaryDirectory(prefix="covalent-") as srv_dir,
+    ):
+        res = get_mock_result(dispatch_id, sdk_dir)
+        empty_digest = "da39a3ee5e6b4b0d3255bfef95601890afd80709"
+        res.lattice.assets.doc.size = 0
+        res.lattice.assets.doc.digest = empty_digest
+        res.lattice.transport_graph.nodes[0].assets.stdout.size = 0
+        res.lattice.transport_graph.nodes[0].assets.stdout.digest = empty_digest
+        filtered_res = import_result(res, srv_dir, None)
+
+    filtered_lat = filtered_res.lattice
+    assert filtered_lat.assets.doc.remote_uri == ""
+    assert filtered_lat.transport_graph.nodes[0].assets.stdout.remote_uri == ""
+    assert filtered_lat.assets.workflow_function.remote_uri.startswith(SERVER_URL)
+    assert filtered_lat.transport_graph.nodes[0].assets.function.remote_uri.startswith(SERVER_URL)
+    assert mock_touch.call_count == 2
+
+
+def test_import_result_stored_assets(mocker, test_db):
+    """Assets whose data is already stored are linked instead of uploaded."""
+
+    dispatch_id = "test_import_result_stored_assets"
+
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+    mock_link = mocker.patch(
+        "covalent_dispatcher._object_store.local.LocalProvider.link_blob",
+        side_effect=lambda storage_path, object_key, *args: object_key.endswith("function.tobj"),
+    )
+
+    with (
+        tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir,
+        tempfile.TemporaryDirectory(prefix="covalent-") as srv_dir,
+    ):
+        res = get_mock_result(dispatch_id, sdk_dir)
+        filtered_res = import_result(res, srv_dir, None)
+
+    filtered_lat = filtered_res.lattice
+    assert filtered_lat.transport_graph.nodes[0].assets.function.remote_uri == ""
+    assert filtered_lat.transport_graph.nodes[0].assets.value.remote_uri.startswith(SERVER_URL)
+    assert mock_link.called
+
+
+def test_import_result_duplicate_assets(mocker, test_db):
+    """Identical node assets in a manifest are uploaded once."""
+
+    dispatch_id = "test_import_result_duplicate_assets"
+
+    @ct.electron(executor="local")
+    def task(x):
+        return x
+
+    @ct.lattice
+    def workflow(x):
+        return task(task(x))
+
+    workflow.build_graph(x=1)
+
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+    mock_link = mocker.patch(
+        "covalent_dispatcher._object_store.local.LocalProvider.link_on_upload",
+        return_value=True,
+    )
+
+    with (
+        tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir,
+        tempfile.TemporaryDirectory(prefix="covalent-") as srv_dir,
+    ):
+        res = serialize_result(SDKResult(workflow, dispatch_id=dispatch_id), sdk_dir)
+        filtered_res = import_result(strip_local_uris(res), srv_dir, None)
+
+    nodes = filtered_res.lattice.transport_graph.nodes
+    function_uris = [
+        node.assets.function.remote_uri for node in nodes if node.metadata.name == "task"
+    ]
+    assert function_uris[0].startswith(SERVER_URL)
+    assert function_uris[1] == ""
+
+    src_object_keys = {call.args[1] for call in mock_link.call_args_list}
+    assert any(key.endswith("function.tobj") for key in src_object_keys)
+
+
 def test_import_previously_imported_result(mocker, test_db):
     dispatch_id = "test_import_previous_result"
     sub_dispatch_id = "test_import_previous_result_sub"
@@ -194,6 +335,48 @@ def test_import_subdispatch_cancel_req(mocker, test_db):
         assert len(uncancelled) == 0
 
 
+@pytest.mark.parametrize("legacy", [False, True])
+def test_get_reusable_node_ids(mocker, test_db, legacy):
+    """Test diffing a redispatched graph using the persisted node hashes."""
+
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    @ct.electron
+    def task(x):
+        return x
+
+    @ct.lattice
+    def workflow(x, y):
+        return task(x), task(y)
+
+    manifests = []
+    for i, y in enumerate([2, 3]):
+        workflow.build_graph(1, y)
+        sdk_res = SDKResult(workflow, dispatch_id=f"test_get_reusable_node_ids_{i}")
+        with (
+            tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir,
+            tempfile.TemporaryDirectory(prefix="covalent-") as srv_dir,
+        ):
+            manifests.append(import_result(serialize_result(sdk_res, sdk_dir), srv_dir, None))
+
+    old_tg = get_result_object(manifests[0].metadata.dispatch_id).lattice.transport_graph
+    new_tg = get_result_object(manifests[1].metadata.dispatch_id).lattice.transport_graph
+
+    with test_db.Session() as session:
+        if legacy:
+            ElectronMeta.update_bulk(
+                session,
+                values={"node_hash": None},
+                equality_filters={"parent_lattice_id": old_tg.lattice_id},
+                membership_filters={},
+            )
+        reusable_nodes = get_reusable_node_ids(session, old_tg.lattice_id, new_tg.lattice_id)
+
+    # Only task(x) and its parameter are unchanged
+    x_node = next(e.source for e in manifests[1].lattice.transport_graph.links if e.target == 0)
+    assert reusable_nodes == sorted([0, x_node])
+
+
 @pytest.mark.parametrize(
     "parent_status,new_status",
     [
@@ -213,6 +396,10 @@ def test_handle_redispatch_identical(mocker, test_db, parent_status, new_status)
     mock_copy_workflow_asset_meta = mocker.patch(
         "covalent_dispatcher._dal.importers.result.copy_asset_meta"
     )
+    mock_copy_workflow_assets = mocker.patch(
+        "covalent_dispatcher._dal.importers.result.copy_assets_now"
+    )
+    mock_copy_node_assets = mocker.patch("covalent_dispatcher._dal.tg_ops.copy_assets_now")
 
     with (
         tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir,
@@ -230,6 +417,10 @@ def test_handle_redispatch_identical(mocker, test_db, parent_status, new_status)
         tg = parent_result_object.lattice.transport_graph
         for n in tg._graph.nodes:
             tg.set_node_value(n, "status", parent_status)
+            # Completed nodes have stored outputs
+            node = tg.get_node(n)
+            with node.session() as session:
+                node.update_assets({"output": {"size": 1}}, session)
 
     with tempfile.TemporaryDirectory(prefix="covalent-") as srv_dir_2:
         # Import the redispatch manifest and filter it through handle_redispatch
@@ -253,11 +444,71 @@ def test_handle_redispatch_identical(mocker, test_db, parent_status, new_status)
             n_electron_assets += 1
             assert asset.remote_uri == ""
 
-    assert mock_copy_workflow_asset_meta.call_count == n_workflow_assets + n_electron_assets
+    assert mock_copy_workflow_asset_meta.call_count == n_workflow_assets
+    assert len(mock_copy_workflow_assets.call_args[0][1]) == n_workflow_assets
 
     result_object = get_result_object(redispatch_id, bare=False)
     tg = result_object.lattice.transport_graph
     for n in tg._graph.nodes:
         assert tg.get_node_value(n, "status") == new_status
 
-    assert len(assets_to_copy) == n_workflow_assets + n_electron_assets
+    # Only copies of reused nodes' assets are deferred
+    if new_status == RESULT_STATUS.PENDING_REUSE:
+        assert len(assets_to_copy) == n_electron_assets
+        mock_copy_node_assets.assert_not_called()
+    else:
+        assert assets_to_copy == []
+        assert mock_copy_node_assets.call_count == len(tg._graph.nodes)
+
+
+def test_handle_redispatch_without_reuse_keeps_parent_data(mocker, test_db, tmp_path):
+    """Test that re-running nodes of a redispatch don't overwrite the parent's data."""
+
+    from covalent._workflow.transportable_object import TransportableObject
+    from covalent_dispatcher._dal.asset import Asset, local_store
+
+    dispatch_id = "test_redispatch_without_reuse"
+    redispatch_id = "test_redispatch_without_reuse_2"
+
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+    mocker.patch.object(local_store, "base_path", str(tmp_path))
+
+    with tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir:
+        manifest = get_mock_result(dispatch_id, sdk_dir)
+        redispatch_manifest = copy.deepcopy(manifest)
+        redispatch_manifest.metadata.dispatch_id = redispatch_id
+        redispatch_manifest.metadata.root_dispatch_id = redispatch_id
+
+        import_result(manifest, str(tmp_path), None)
+
+    # Populate the parent's data as if it had been uploaded and run
+    with test_db.session() as session:
+        for record in Asset.get(session, fields=[], equality_filters={}, membership_filters={}):
+            local_store.touch(record.storage_path, record.object_key)
+
+    parent_tg = get_result_object(dispatch_id, bare=False).lattice.transport_graph
+    for n in parent_tg._graph.nodes:
+        parent_tg.set_node_value(n, "status", RESULT_STATUS.COMPLETED)
+        node = parent_tg.get_node(n)
+        with node.session() as session:
+            output = node.get_asset("output", session)
+            output.store_data(TransportableObject(f"parent output {n}"), session)
+
+    import_result(redispatch_manifest, str(tmp_path), None)
+    handle_redispatch(redispatch_manifest, dispatch_id, False)
+
+    # The redispatch's nodes run again and store new outputs
+    tg = get_result_object(redispatch_id, bare=False).lattice.transport_graph
+    for n in tg._graph.nodes:
+        assert tg.get_node_value(n, "status") == RESULT_STATUS.NEW_OBJECT
+        node = tg.get_node(n)
+        with node.session() as session:
+            output = node.get_asset("output", session)
+            assert output.object_key.startswith(f"{redispatch_id}/")
+            output.store_data(TransportableObject(f"new output {n}"), session)
+
+    for n in parent_tg._graph.nodes:
+        node = parent_tg.get_node(n)
+        with node.session() as session:
+            output = node.get_asset("output", session).load_data()
+        assert output.get_deserialized() == f"parent output {n}"
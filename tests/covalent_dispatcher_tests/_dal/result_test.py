@@ -553,6 +553,162 @@ def test_result_filters_parent_electron_updates(test_db, mocker):
     assert subl_node.get_value("output").get_deserialized() == 42
 
 
+def test_result_update_nodes_bulk(test_db, mocker):
+    """Check that bulk node updates match sequential single-node updates."""
+
+    from covalent_dispatcher._dal.asset import local_store
+
+    res = get_mock_result()
+    res._initialize_nodes()
+
+    mocker.patch("covalent_dispatcher._db.write_result_to_db.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._db.upsert.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    update.persist(res)
+
+    with test_db.session() as session:
+        record = (
+            session.query(models.Lattice)
+            .where(models.Lattice.dispatch_id == "mock_dispatch")
+            .first()
+        )
+        srvres = Result(session, record)
+
+    timestamp = datetime.now()
+    node_results = [
+        {"node_id": 0, "node_name": "test_name", "start_time": timestamp, "status": "RUNNING"},
+        {"node_id": 1, "start_time": timestamp, "status": RESULT_STATUS.RUNNING},
+        {
+            "node_id": 0,
+            "end_time": timestamp,
+            "status": RESULT_STATUS.COMPLETED,
+            "output": TransportableObject(5),
+            "stdout": "Hello\n",
+        },
+        {"node_id": 1, "end_time": timestamp, "status": RESULT_STATUS.COMPLETED},
+        # Illegal: node 1 is already COMPLETED
+        {"node_id": 1, "status": RESULT_STATUS.FAILED, "error": "test_error"},
+    ]
+
+    assert srvres._update_nodes_bulk(node_results) == [True, True, True, True, False]
+
+    with test_db.session() as session:
+        lattice_record = session.query(models.Lattice).first()
+        electron_records = {
+            rec.transport_graph_node_id: rec
+            for rec in session.query(models.Electron).where(
+                models.Electron.transport_graph_node_id.in_([0, 1])
+            )
+        }
+        electron_record = electron_records[0]
+
+        assert electron_record.name == "test_name"
+        assert electron_record.status == "COMPLETED"
+        assert electron_record.started_at is not None
+        assert electron_record.completed_at is not None
+        assert electron_records[1].status == "COMPLETED"
+
+        result = local_store.load_file(
+            storage_path=electron_record.storage_path, filename=electron_record.results_filename
+        )
+        assert result.get_deserialized() == 5
+        stdout = local_store.load_file(
+            storage_path=electron_record.storage_path, filename=electron_record.stdout_filename
+        )
+        assert stdout == "Hello\n"
+
+        assert lattice_record.completed_electron_num == 2
+
+    assert srvres.lattice.transport_graph.get_node_value(1, "error") != "test_error"
+
+
+def test_result_update_nodes_bulk_handles_postprocessing(test_db, mocker):
+    """Check postprocessing node updates in bulk mode."""
+
+    res = get_mock_result()
+    res._initialize_nodes()
+
+    mocker.patch("covalent_dispatcher._db.upsert.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    update.persist(res)
+
+    with test_db.session() as session:
+        record = (
+            session.query(models.Lattice)
+            .where(models.Lattice.dispatch_id == "mock_dispatch")
+            .first()
+        )
+        srvres = Result(session, record)
+
+    timestamp = datetime.now()
+    node_results = [
+        {"node_id": 0, "end_time": timestamp, "status": RESULT_STATUS.COMPLETED},
+        {
+            "node_id": 2,
+            "start_time": timestamp,
+            "end_time": timestamp,
+            "output": TransportableObject(1),
+            "status": RESULT_STATUS.COMPLETED,
+        },
+    ]
+
+    assert srvres._update_nodes_bulk(node_results) == [True, True]
+
+    assert srvres.get_value("status") == RESULT_STATUS.COMPLETED
+    assert srvres.get_value("result").get_deserialized() == 1
+    assert srvres.get_value("completed_electron_num") == 2
+
+
+def test_result_update_nodes_bulk_filters_parent_electron_updates(test_db, mocker):
+    """Check filtering of bulk status updates for sublattice electrons"""
+
+    res = get_mock_result()
+    sub_res = get_mock_result()
+    res.lattice.transport_graph.set_node_value(0, "name", ":sublattice:")
+    sub_res._dispatch_id = "sub_mock_dispatch"
+    res._initialize_nodes()
+    sub_res._initialize_nodes()
+
+    mocker.patch("covalent_dispatcher._db.write_result_to_db.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._db.upsert.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    update.persist(res)
+    update.persist(sub_res)
+
+    with test_db.session() as session:
+        record = (
+            session.query(models.Lattice)
+            .where(models.Lattice.dispatch_id == "mock_dispatch")
+            .first()
+        )
+        sub_record = (
+            session.query(models.Lattice)
+            .where(models.Lattice.dispatch_id == "sub_mock_dispatch")
+            .first()
+        )
+
+        srvres = Result(session, record)
+        subl_node = srvres.lattice.transport_graph.get_node(0, session)
+
+        sub_srvres = Result(session, sub_record)
+        sub_srvres.set_value("electron_id", subl_node._electron_id, session)
+        sub_srvres._electron_id = subl_node._electron_id
+
+    sub_srvres._update_dispatch(status=RESULT_STATUS.RUNNING)
+
+    # The terminal update should be rejected because the electron
+    # status doesn't match the subdispatch
+    node_results = [
+        {"node_id": 0, "status": RESULT_STATUS.RUNNING},
+        {"node_id": 0, "status": RESULT_STATUS.COMPLETED},
+    ]
+    assert srvres._update_nodes_bulk(node_results) == [True, False]
+    assert subl_node.get_value("status") == RESULT_STATUS.RUNNING
+
+
 def test_result_controller_bulk_get(test_db, mocker):
     record_1 = models.Lattice(
         dispatch_id="dispatch_1",
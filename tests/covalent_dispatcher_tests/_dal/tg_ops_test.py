@@ -220,6 +220,8 @@ def test_copy_nodes_from(tg, mocker):
     mock_new_asset.storage_type = StorageType.LOCAL.value
     mock_new_asset.storage_path = "/tmp"
     mock_new_asset.object_key = "result_new.pkl"
+    mock_old_asset.size = 1
+    mock_new_asset.size = 1
 
     mock_old_node = MagicMock()
     mock_new_node = MagicMock()
@@ -232,6 +234,7 @@ def test_copy_nodes_from(tg, mocker):
     mocker.patch("covalent_dispatcher._dal.tg_ops.ASSET_KEYS", MOCK_ASSET_KEYS)
 
     mock_copy_asset_meta = mocker.patch("covalent_dispatcher._dal.tg_ops.copy_asset_meta")
+    mock_copy_assets_now = mocker.patch("covalent_dispatcher._dal.tg_ops.copy_assets_now")
 
     tg_new = _TransportGraph(lattice_id=2)
 
@@ -276,6 +279,70 @@ def test_copy_nodes_from(tg, mocker):
     assert tg_ops.tg._graph.nodes(data=True)[2]["name"] == "replacement"
 
     assert mock_copy_asset_meta.call_count == 2
+    assert mock_copy_assets_now.call_count == 2
+
+
+def test_copy_nodes_from_discarded_output(tg, mocker):
+    """Test that completed nodes whose outputs were not stored are not reused."""
+
+    mock_asset = MagicMock()
+    mock_asset.size = 0
+    mock_node = MagicMock()
+    mock_node.get_asset = MagicMock(return_value=mock_asset)
+
+    mocker.patch("covalent_dispatcher._dal.tg_ops.METADATA_KEYS", {"status"})
+    mocker.patch("covalent_dispatcher._dal.tg_ops.ASSET_KEYS", {"output"})
+    mock_copy_asset_meta = mocker.patch("covalent_dispatcher._dal.tg_ops.copy_asset_meta")
+    mock_copy_assets_now = mocker.patch("covalent_dispatcher._dal.tg_ops.copy_assets_now")
+
+    tg_old = _TransportGraph(lattice_id=2)
+    tg_old.get_node = MagicMock(return_value=mock_node)
+    tg_old.get_node_value = MagicMock(return_value=RESULT_STATUS.COMPLETED)
+
+    tg.get_node = MagicMock(return_value=mock_node)
+    tg.set_node_value = MagicMock()
+
+    assets_to_copy = TransportGraphOps(tg).copy_nodes_from(tg_old, [0], defer_copy_objects=True)
+
+    # The node will run again, so its data is copied right away
+    tg.set_node_value.assert_not_called()
+    assert assets_to_copy == []
+    mock_copy_asset_meta.assert_called_once()
+    mock_copy_assets_now.assert_called_once()
+
+
+@pytest.mark.parametrize("copy_metadata", [True, False])
+def test_copy_nodes_from_defers_reused_nodes(tg, mocker, copy_metadata):
+    """Test that only copies of reused nodes' assets are deferred."""
+
+    mock_asset = MagicMock()
+    mock_asset.size = 1
+    mock_node = MagicMock()
+    mock_node.get_asset = MagicMock(return_value=mock_asset)
+
+    mocker.patch("covalent_dispatcher._dal.tg_ops.METADATA_KEYS", {"status"})
+    mocker.patch("covalent_dispatcher._dal.tg_ops.ASSET_KEYS", {"output"})
+    mocker.patch("covalent_dispatcher._dal.tg_ops.copy_asset_meta")
+    mock_copy_assets_now = mocker.patch("covalent_dispatcher._dal.tg_ops.copy_assets_now")
+
+    tg_old = _TransportGraph(lattice_id=2)
+    tg_old.get_node = MagicMock(return_value=mock_node)
+    tg_old.get_node_value = MagicMock(return_value=RESULT_STATUS.COMPLETED)
+
+    tg.get_node = MagicMock(return_value=mock_node)
+    tg.set_node_value = MagicMock()
+
+    assets_to_copy = TransportGraphOps(tg).copy_nodes_from(
+        tg_old, [0], copy_metadata=copy_metadata, defer_copy_objects=True
+    )
+
+    if copy_metadata:
+        tg.set_node_value.assert_called_once_with(0, "status", RESULT_STATUS.PENDING_REUSE)
+        assert len(assets_to_copy) == 1
+        mock_copy_assets_now.assert_not_called()
+    else:
+        assert assets_to_copy == []
+        mock_copy_assets_now.assert_called_once()
 
 
 def test_max_cbms(tg_ops):
@@ -0,0 +1,79 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for transport graph node hashes"""
+
+import pytest
+
+from covalent_dispatcher._dal.utils.node_hash import compute_node_hashes, find_reusable_nodes
+
+EDGE_X = ("x", "arg", 0)
+EDGE_Y = ("y", "kwarg", None)
+
+
+def _diamond(value_digest="abc", edge=EDGE_X):
+    """0 -> 1, 0 -> 2, (1, 2) -> 3"""
+    nodes = {0: (":parameter:1", value_digest), 1: ("f", None), 2: ("g", None), 3: ("h", None)}
+    edges = [(0, 1, edge), (0, 2, EDGE_X), (1, 3, EDGE_X), (2, 3, EDGE_Y)]
+    return nodes, edges
+
+
+def test_compute_node_hashes():
+    """Test that hashes change with a node's predecessor subgraph"""
+
+    hashes = compute_node_hashes(*_diamond())
+    assert hashes == compute_node_hashes(*_diamond())
+    assert len(set(hashes.values())) == 4
+
+    # Changing a parameter changes the hash of all its descendants
+    changed = compute_node_hashes(*_diamond(value_digest="def"))
+    assert all(changed[i] != hashes[i] for i in range(4))
+
+    # Changing an edge only changes the hashes downstream of it
+    changed = compute_node_hashes(*_diamond(edge=EDGE_Y))
+    assert changed[0] == hashes[0] and changed[2] == hashes[2]
+    assert changed[1] != hashes[1] and changed[3] != hashes[3]
+
+    # Hashes don't depend on the order of edges
+    nodes, edges = _diamond()
+    assert compute_node_hashes(nodes, reversed(edges)) == hashes
+
+
+def test_compute_node_hashes_cycle():
+    """Test that cyclic graphs are rejected"""
+
+    with pytest.raises(RuntimeError):
+        compute_node_hashes({0: ("f", None), 1: ("g", None)}, [(0, 1, EDGE_X), (1, 0, EDGE_X)])
+
+
+def test_find_reusable_nodes():
+    """Test finding the reusable nodes of a modified graph"""
+
+    old_hashes = compute_node_hashes(*_diamond())
+    nodes, edges = _diamond(edge=EDGE_Y)
+    new_hashes = compute_node_hashes(nodes, edges)
+    new_edges = [(source, target) for source, target, _ in edges]
+
+    assert find_reusable_nodes(old_hashes, old_hashes, new_edges, set()) == {0, 1, 2, 3}
+    assert find_reusable_nodes(old_hashes, new_hashes, new_edges, set()) == {0, 2}
+
+    # Descendants of excluded nodes are not reusable
+    assert find_reusable_nodes(old_hashes, old_hashes, new_edges, {2}) == {0, 1}
+
+    # Nodes missing from the old graph are not reusable
+    new_hashes = dict(old_hashes)
+    new_hashes[4] = "new"
+    assert find_reusable_nodes(old_hashes, new_hashes, new_edges, set()) == {0, 1, 2, 3}
@@ -27,3 +27,30 @@ def test_datastore_init():
 
     ds = DataStore(db_URL=None)
     assert ds.db_URL == "sqlite+pysqlite:///" + get_config("dispatcher.db_path")
+
+
+def test_datastore_pool_settings(mocker):
+    """Test that connection pool settings are passed to server backends."""
+
+    mock_create_engine = mocker.patch("covalent_dispatcher._db.datastore.create_engine")
+    mocker.patch("covalent_dispatcher._db.datastore.database_exists", return_value=True)
+
+    DataStore(
+        db_URL="postgresql://localhost/covalent",
+        pool_size=10,
+        max_overflow=5,
+        pool_pre_ping=True,
+    )
+    mock_create_engine.assert_called_with(
+        "postgresql://localhost/covalent", pool_size=10, max_overflow=5, pool_pre_ping=True
+    )
+
+    DataStore(db_URL="sqlite+pysqlite:///:memory:", pool_size=10, max_overflow=5)
+    mock_create_engine.assert_called_with("sqlite+pysqlite:///:memory:")
+
+
+def test_datastore_is_sqlite():
+    """Test backend detection."""
+
+    ds = DataStore(db_URL="sqlite+pysqlite:///:memory:")
+    assert ds.is_sqlite
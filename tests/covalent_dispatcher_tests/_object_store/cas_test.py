@@ -0,0 +1,100 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the content-addressed blob store"""
+
+import os
+import tempfile
+
+from covalent_dispatcher._object_store.cas import ContentAddressedStore
+
+DIGEST = "0123456789abcdef0123456789abcdef01234567"
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def test_add_and_link():
+    """Test that stored blobs can be linked into new locations"""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = ContentAddressedStore(os.path.join(temp_dir, ".cas"))
+        src_path = os.path.join(temp_dir, "dispatch_1", "function.tobj")
+        dest_path = os.path.join(temp_dir, "dispatch_2", "function.tobj")
+
+        assert not store.link("sha", DIGEST, dest_path)
+
+        _write(src_path, b"data")
+        store.add(src_path, "sha", DIGEST)
+        assert store.contains("sha1", DIGEST)
+
+        assert store.link("sha", DIGEST, dest_path)
+        assert os.path.samefile(src_path, dest_path)
+        with open(dest_path, "rb") as f:
+            assert f.read() == b"data"
+
+
+def test_add_duplicate():
+    """Test that adding identical data keeps one copy"""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = ContentAddressedStore(os.path.join(temp_dir, ".cas"))
+        path_1 = os.path.join(temp_dir, "dispatch_1", "hooks.json")
+        path_2 = os.path.join(temp_dir, "dispatch_2", "hooks.json")
+        _write(path_1, b"{}")
+        _write(path_2, b"{}")
+
+        store.add(path_1, "sha1", DIGEST)
+        store.add(path_2, "sha1", DIGEST)
+
+        assert os.path.samefile(path_1, path_2)
+        assert os.stat(store.blob_path("sha1", DIGEST)).st_nlink == 3
+
+
+def test_unsupported_digest():
+    """Test that unknown digest algorithms are not deduplicated"""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = ContentAddressedStore(os.path.join(temp_dir, ".cas"))
+        path = os.path.join(temp_dir, "dispatch_1", "value.tobj")
+        _write(path, b"data")
+
+        store.add(path, "md5", DIGEST)
+        assert not store.contains("md5", DIGEST)
+        assert not store.link("md5", DIGEST, path)
+        assert store.blob_path("sha1", "../../dispatch_1") is None
+
+
+def test_collect_garbage():
+    """Test that only unreferenced blobs are deleted"""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        store = ContentAddressedStore(os.path.join(temp_dir, ".cas"))
+        path_1 = os.path.join(temp_dir, "dispatch_1", "value.tobj")
+        path_2 = os.path.join(temp_dir, "dispatch_2", "value.tobj")
+        digest_2 = "f" * 40
+        _write(path_1, b"1")
+        _write(path_2, b"2")
+        store.add(path_1, "sha1", DIGEST)
+        store.add(path_2, "sha1", digest_2)
+
+        os.unlink(path_1)
+        assert store.collect_garbage() == 1
+        assert not store.contains("sha1", DIGEST)
+        assert store.contains("sha1", digest_2)
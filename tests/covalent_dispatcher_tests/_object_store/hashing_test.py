@@ -0,0 +1,76 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for incremental asset digests"""
+
+import hashlib
+import io
+
+import pytest
+
+from covalent_dispatcher._object_store.hashing import (
+    HashingWriter,
+    UnsupportedDigestAlgorithm,
+    new_hasher,
+    resolve_algorithm,
+)
+
+
+def test_hashing_writer():
+    """Test that the writer digests and counts the data it writes"""
+
+    buf = io.BytesIO()
+    writer = HashingWriter(buf, "sha")
+    writer.write(b"Hello, ")
+    writer.write(memoryview(b"world"))
+
+    assert buf.getvalue() == b"Hello, world"
+    assert writer.algorithm == "sha1"
+    assert writer.size == 12
+    assert writer.hexdigest() == hashlib.sha1(b"Hello, world").hexdigest()
+
+
+def test_hashing_writer_close_after_file(tmp_path):
+    """Test that closing the writer after its file does not raise"""
+
+    with open(tmp_path / "data", "wb") as f:
+        writer = HashingWriter(f, "sha")
+        writer.write(b"data")
+    writer.close()
+    assert writer.closed
+
+
+def test_new_hasher_unsupported(mocker):
+    """Test that unknown or uninstalled algorithms are rejected"""
+
+    with pytest.raises(UnsupportedDigestAlgorithm):
+        new_hasher("unknown")
+
+    mocker.patch("covalent_dispatcher._object_store.hashing.blake3", None)
+    with pytest.raises(UnsupportedDigestAlgorithm):
+        new_hasher("blake3")
+
+
+def test_resolve_algorithm(mocker):
+    """Test that unsupported configured algorithms fall back to sha1"""
+
+    assert resolve_algorithm("sha") == "sha1"
+    assert resolve_algorithm("SHA256") == "sha256"
+    assert resolve_algorithm("md5") == "sha1"
+    assert resolve_algorithm("unknown") == "sha1"
+
+    mocker.patch("covalent_dispatcher._object_store.hashing.xxhash", None)
+    assert resolve_algorithm("xxh64") == "sha1"
@@ -16,11 +16,19 @@
 
 """Tests for local object store provider"""
 
+import hashlib
+import os
 import tempfile
 
 import pytest
 
-from covalent_dispatcher._object_store.local import InvalidFileExtension, local_store
+from covalent._workflow.transportable_object import TransportableObject
+from covalent_dispatcher._object_store.cas import ContentAddressedStore
+from covalent_dispatcher._object_store.local import (
+    InvalidFileExtension,
+    LocalProvider,
+    local_store,
+)
 
 
 def test_store_file_invalid_extension():
@@ -68,3 +76,151 @@ def test_store_and_load_file():
         data = b"test"
         local_store.store_file(storage_path=temp_dir, filename="pickle.mdb", data=data)
         assert local_store.load_file(storage_path=temp_dir, filename="pickle.mdb") == data
+
+
+@pytest.mark.parametrize(
+    "filename,data",
+    [
+        ("test.pkl", {"a": 1}),
+        ("test.txt", "Hello\nworld"),
+        ("test.json", {"a": [1, 2]}),
+        ("test.tobj", TransportableObject(1)),
+        ("test.mdb", b"metadata"),
+    ],
+)
+def test_store_file_digest(filename, data):
+    """Test that the digest and size computed while writing match the file."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        digest, size = local_store.store_file(storage_path=temp_dir, filename=filename, data=data)
+
+        with open(os.path.join(temp_dir, filename), "rb") as f:
+            contents = f.read()
+
+        assert size == len(contents)
+        assert digest.algorithm == "sha1"
+        assert digest.hexdigest == hashlib.sha1(contents).hexdigest()
+        assert digest == local_store.digest(temp_dir, filename)
+        assert os.listdir(temp_dir) == [filename]
+
+
+def test_load_file_tobj_lazily():
+    """Transportable objects are only read when their sections are accessed."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        to = TransportableObject({"a": 1})
+        local_store.store_file(storage_path=temp_dir, filename="value.tobj", data=to)
+
+        loaded = local_store.load_file(storage_path=temp_dir, filename="value.tobj")
+        assert "_object" not in loaded.__dict__
+        assert loaded.object_string == to.object_string
+        assert "_object" not in loaded.__dict__
+
+        assert loaded.get_deserialized() == {"a": 1}
+        assert loaded == to
+
+
+def test_store_file_dedup():
+    """Test that identical data is stored once when deduplication is enabled."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        provider = LocalProvider()
+        provider.base_path = temp_dir
+        provider.blob_store = ContentAddressedStore(os.path.join(temp_dir, ".cas"))
+        for dispatch_id in ["d1", "d2"]:
+            os.makedirs(f"{temp_dir}/{dispatch_id}")
+
+        digest, _ = provider.store_file(f"{temp_dir}/d1", "value.tobj", TransportableObject(1))
+        provider.store_file(f"{temp_dir}/d2", "value.tobj", TransportableObject(1))
+        assert os.path.samefile(f"{temp_dir}/d1/value.tobj", f"{temp_dir}/d2/value.tobj")
+
+        assert provider.link_blob(f"{temp_dir}/d3", "value.tobj", "sha", digest.hexdigest)
+        assert provider.load_file(f"{temp_dir}/d3", "value.tobj").get_deserialized() == 1
+
+        # Rewriting an asset must not change the others sharing its data
+        provider.store_file(f"{temp_dir}/d1", "value.tobj", TransportableObject(2))
+        assert provider.load_file(f"{temp_dir}/d2", "value.tobj").get_deserialized() == 1
+
+        provider.delete_dispatch_assets("d2")
+        provider.delete_dispatch_assets("d3")
+        assert provider.collect_garbage() == 1
+
+
+def test_link_blob_without_dedup():
+    """Test that nothing is linked when deduplication is disabled."""
+
+    provider = LocalProvider()
+    provider.blob_store = None
+    assert not provider.link_blob("/tmp", "value.tobj", "sha", "0" * 40)
+    assert provider.collect_garbage() == 0
+
+
+def test_link_on_upload():
+    """Test that objects are populated once an identical upload completes."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        provider = LocalProvider()
+        provider.base_path = temp_dir
+        provider.blob_store = None
+        assert provider.link_on_upload(temp_dir, "d1/function.tobj", temp_dir, "d1/node_1.tobj")
+        assert provider.link_on_upload(temp_dir, "d1/function.tobj", temp_dir, "d2/node_2.tobj")
+        dest_paths = [f"{temp_dir}/d1/node_1.tobj", f"{temp_dir}/d2/node_2.tobj"]
+        assert provider.get_pending_links() == set(dest_paths)
+
+        # Simulate the upload
+        os.makedirs(f"{temp_dir}/d1")
+        with open(f"{temp_dir}/d1/function.tobj", "wb") as f:
+            f.write(b"data")
+        assert provider.add_blob(temp_dir, "d1/function.tobj", "sha1", "0" * 40) == dest_paths
+
+        for path in ["d1/node_1.tobj", "d2/node_2.tobj"]:
+            assert os.path.samefile(f"{temp_dir}/d1/function.tobj", f"{temp_dir}/{path}")
+
+        # Links are only made once
+        assert provider._pending_links == {}
+        assert os.listdir(f"{temp_dir}/.pending_links") == []
+
+
+def test_pending_links_persisted(mocker):
+    """Test that pending links are restored after a restart."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        mocker.patch("covalent_dispatcher._object_store.local.get_config", return_value=temp_dir)
+        provider = LocalProvider()
+        assert provider.base_path == temp_dir
+        provider.link_on_upload(temp_dir, "d1/function.tobj", temp_dir, "d1/node_1.tobj")
+
+        restarted = LocalProvider()
+        assert restarted.get_pending_links() == {f"{temp_dir}/d1/node_1.tobj"}
+
+        os.makedirs(f"{temp_dir}/d1")
+        with open(f"{temp_dir}/d1/function.tobj", "wb") as f:
+            f.write(b"data")
+        restarted.add_blob(temp_dir, "d1/function.tobj", "sha1", "0" * 40)
+        assert os.path.samefile(f"{temp_dir}/d1/function.tobj", f"{temp_dir}/d1/node_1.tobj")
+        assert LocalProvider().get_pending_links() == set()
+
+
+def test_discard_pending_links(mocker):
+    """Test that a dispatch's pending links are dropped when it finishes."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        mocker.patch("covalent_dispatcher._object_store.local.get_config", return_value=temp_dir)
+        provider = LocalProvider()
+        provider.link_on_upload(temp_dir, "d1/function.tobj", temp_dir, "d1/node_1.tobj")
+        provider.link_on_upload(temp_dir, "d2/function.tobj", temp_dir, "d1/node_2.tobj")
+        provider.link_on_upload(temp_dir, "d2/function.tobj", temp_dir, "d2/node_2.tobj")
+
+        provider.discard_pending_links("d1")
+        assert provider.get_pending_links() == {f"{temp_dir}/d2/node_2.tobj"}
+        assert LocalProvider().get_pending_links() == {f"{temp_dir}/d2/node_2.tobj"}
+
+
+def test_touch():
+    """Test creating empty objects."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        local_store.touch(temp_dir, "dispatch/node_0/value.tobj")
+        assert local_store.size(temp_dir, "dispatch/node_0/value.tobj") == 0
+        with open(f"{temp_dir}/dispatch/node_0/value.tobj", "rb") as f:
+            assert f.read() == b""
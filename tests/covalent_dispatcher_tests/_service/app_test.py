@@ -31,7 +31,11 @@ import covalent as ct
 from covalent._dispatcher_plugins.local import LocalDispatcher
 from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent_dispatcher._db.dispatchdb import DispatchDB
-from covalent_dispatcher._service.app import _try_get_result_object, cancel_all_with_status
+from covalent_dispatcher._service.app import (
+    _try_get_result_object,
+    cancel_all_with_status,
+    resume_all_with_status,
+)
 from covalent_ui.app import fastapi_app as fast_app
 
 DISPATCH_ID = "f34671d1-48f2-41ce-89d9-9a8cb5c60e5d"
@@ -67,7 +71,10 @@ def app():
 
 
 @pytest.fixture
-def client():
+def client(mocker):
+    # Don't look for interrupted dispatches or asset copies in the DB on startup
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.asset_manager.resume_asset_copies")
     with TestClient(fast_app) as c:
         yield c
 
@@ -109,6 +116,7 @@ def test_cancel_dispatch(mocker, app, client):
     """
     mocker.patch("covalent_dispatcher.entry_point.cancel_running_dispatch")
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     response = client.put(
         f"/api/v2/dispatches/{DISPATCH_ID}/status",
         json={"status": "CANCELLED"},
@@ -122,6 +130,7 @@ def test_cancel_tasks(mocker, app, client):
     """
     mocker.patch("covalent_dispatcher.entry_point.cancel_running_dispatch")
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     response = client.put(
         f"/api/v2/dispatches/{DISPATCH_ID}/status",
         json={"status": "CANCELLED", "task_ids": [0, 1]},
@@ -136,6 +145,7 @@ async def test_cancel_exception(mocker, client):
         "covalent_dispatcher.entry_point.cancel_running_dispatch", side_effect=Exception("mock")
     )
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
 
     with pytest.raises(Exception):
         response = client.put(
@@ -161,6 +171,7 @@ def test_register(mocker, app, client, mock_manifest):
         "covalent_dispatcher._service.app.dispatcher.register_dispatch", return_value=mock_manifest
     )
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     resp = client.post("/api/v2/dispatches", data=mock_manifest.json())
 
     assert resp.json() == json.loads(mock_manifest.json())
@@ -172,6 +183,7 @@ def test_register_exception(mocker, app, client, mock_manifest):
         "covalent_dispatcher._service.app.dispatcher.register_dispatch", side_effect=RuntimeError()
     )
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     resp = client.post("/api/v2/dispatches", data=mock_manifest.json())
     assert resp.status_code == 400
 
@@ -183,6 +195,7 @@ def test_register_redispatch(mocker, app, client, mock_manifest):
         return_value=mock_manifest,
     )
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     resp = client.post(f"/api/v2/dispatches/{dispatch_id}/redispatches", data=mock_manifest.json())
     mock_register_redispatch.assert_awaited_with(mock_manifest, dispatch_id, False)
     assert resp.json() == json.loads(mock_manifest.json())
@@ -195,6 +208,7 @@ def test_register_redispatch_reuse(mocker, app, client, mock_manifest):
         return_value=mock_manifest,
     )
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     resp = client.post(
         f"/api/v2/dispatches/{dispatch_id}/redispatches",
         data=mock_manifest.json(),
@@ -211,6 +225,7 @@ def test_register_redispatch_exception(mocker, app, client, mock_manifest):
         side_effect=RuntimeError(),
     )
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     resp = client.post(f"/api/v2/dispatches/{dispatch_id}/redispatches", data=mock_manifest.json())
     assert resp.status_code == 400
 
@@ -220,6 +235,7 @@ def test_start(mocker, app, client):
     mock_start = mocker.patch("covalent_dispatcher._service.app.dispatcher.start_dispatch")
     mock_create_task = mocker.patch("asyncio.create_task")
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     resp = client.put(f"/api/v2/dispatches/{dispatch_id}/status", json={"status": "RUNNING"})
     assert resp.json() == dispatch_id
 
@@ -235,6 +251,7 @@ def test_export_manifest(mocker, app, client, mock_manifest):
         "covalent_dispatcher._service.app.export_result_manifest", return_value=mock_manifest
     )
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     resp = client.get(f"/api/v2/dispatches/{dispatch_id}")
     assert resp.json() == json.loads(mock_manifest.json())
 
@@ -245,10 +262,29 @@ def test_export_manifest_bad_dispatch_id(mocker, app, client, mock_manifest):
     mock_result_object.get_value = MagicMock(return_value=str(RESULT_STATUS.NEW_OBJECT))
     mocker.patch("covalent_dispatcher._service.app._try_get_result_object", return_value=None)
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     resp = client.get(f"/api/v2/dispatches/{dispatch_id}")
     assert resp.status_code == 404
 
 
+def test_get_dispatcher_metrics(mocker, app, client):
+    mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
+    metrics = {
+        "total_events": 20,
+        "total_batches": 2,
+        "max_batch_size": 16,
+        "mean_batch_size": 10.0,
+        "events_per_second": 2.0,
+    }
+    mocker.patch(
+        "covalent_dispatcher._service.app.core_dispatcher._event_metrics.snapshot",
+        return_value=metrics,
+    )
+    resp = client.get("/api/v2/dispatcher/metrics")
+    assert resp.json() == metrics
+
+
 def test_try_get_result_object(mocker, app, client, mock_manifest):
     dispatch_id = "test_try_get_result_object"
     mock_result_object = MagicMock()
@@ -256,6 +292,7 @@ def test_try_get_result_object(mocker, app, client, mock_manifest):
         "covalent_dispatcher._service.app.get_result_object", return_value=mock_result_object
     )
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     assert _try_get_result_object(dispatch_id) == mock_result_object
 
 
@@ -264,6 +301,7 @@ def test_try_get_result_object_not_found(mocker, app, client, mock_manifest):
     mock_result_object = MagicMock()
     mocker.patch("covalent_dispatcher._service.app.get_result_object", side_effect=KeyError())
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
     assert _try_get_result_object(dispatch_id) is None
 
 
@@ -281,3 +319,22 @@ async def test_cancel_all_with_status(mocker, test_db):
     await cancel_all_with_status(RESULT_STATUS.RUNNING)
 
     mock_cancel.assert_awaited_with("mock_dispatch")
+
+
+@pytest.mark.asyncio
+async def test_resume_all_with_status(mocker, test_db):
+    mock_recs = [MagicMock(), MagicMock()]
+    mock_recs[0].dispatch_id = "resumable"
+    mock_recs[1].dispatch_id = "unresumable"
+
+    mocker.patch("covalent_dispatcher._service.app.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.result.Result.get_db_records", return_value=mock_recs)
+    mock_resume = mocker.patch(
+        "covalent_dispatcher._service.app.core_dispatcher.resume_dispatch",
+        side_effect=[True, RuntimeError()],
+    )
+
+    await resume_all_with_status(RESULT_STATUS.RUNNING)
+
+    assert mock_resume.await_count == 2
+    mock_resume.assert_awaited_with("unresumable")
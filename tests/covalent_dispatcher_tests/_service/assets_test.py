@@ -16,6 +16,10 @@
 
 """Unit tests for the FastAPI asset endpoints"""
 
+import io
+import os
+import tarfile
+import tempfile
 from contextlib import contextmanager
 from typing import Generator
 from unittest.mock import MagicMock
@@ -64,7 +68,10 @@ def app():
 
 
 @pytest.fixture
-def client():
+def client(mocker):
+    # Don't look for interrupted dispatches or asset copies in the DB on startup
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.asset_manager.resume_asset_copies")
     with TestClient(fast_app) as c:
         yield c
 
@@ -150,6 +157,71 @@ def test_post_node_asset(test_db, mocker, client, mock_result_object):
     assert resp.json()["remote_uri"] == "http://localhost:48008/files/output"
 
 
+def test_post_node_asset_stored_digest(test_db, mocker, client, mock_result_object):
+    """
+    Test that uploads of already stored data are skipped
+    """
+
+    key = "function"
+    node_id = 0
+    dispatch_id = "test_post_node_asset_stored_digest"
+
+    mocker.patch("covalent_dispatcher._service.assets.workflow_db", test_db)
+    mocker.patch(
+        "covalent_dispatcher._service.assets.get_result_object", return_value=mock_result_object
+    )
+    mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+
+    mock_asset = mock_result_object.lattice.transport_graph.get_node().get_asset()
+    mock_asset.object_store.link_blob.return_value = True
+
+    headers = {"Digest-alg": "sha", "Digest": "0123abcd", "Content-Length": "0"}
+    resp = client.post(
+        f"/api/v2/dispatches/{dispatch_id}/electrons/{node_id}/assets/{key}", headers=headers
+    )
+    assert resp.json()["remote_uri"] == ""
+    mock_asset.object_store.link_blob.assert_called_once_with(
+        mock_asset.storage_path, mock_asset.object_key, "sha", "0123abcd"
+    )
+
+
+def test_post_node_asset_object_stored(test_db, mocker, client, mock_result_object):
+    """
+    Test that outputs written in place are registered as uploaded
+    """
+
+    key = "output"
+    node_id = 0
+    dispatch_id = "test_post_node_asset_object_stored"
+
+    mocker.patch("covalent_dispatcher._service.assets.workflow_db", test_db)
+    mocker.patch(
+        "covalent_dispatcher._service.assets.get_result_object", return_value=mock_result_object
+    )
+    mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    mock_mark_uploaded = mocker.patch("covalent_dispatcher._service.assets.mark_uploaded")
+
+    mock_asset = mock_result_object.lattice.transport_graph.get_node().get_asset()
+    mock_asset.storage_path = "/tmp/results/dispatch"
+    mock_asset.object_key = "node_0/output.tobj"
+    mock_asset.object_store.add_blob.return_value = ["/tmp/results/other/output.tobj"]
+
+    headers = {"Digest-alg": "sha1", "Digest": "0123abcd", "Object-stored": "true"}
+    resp = client.post(
+        f"/api/v2/dispatches/{dispatch_id}/electrons/{node_id}/assets/{key}",
+        headers=headers,
+        content=b"output",
+    )
+    assert resp.json()["remote_uri"] == ""
+    mock_asset.object_store.link_blob.assert_not_called()
+    mock_asset.object_store.add_blob.assert_called_once_with(
+        "/tmp/results/dispatch", "node_0/output.tobj", "sha1", "0123abcd"
+    )
+    mock_mark_uploaded.assert_called_once_with(
+        ["/tmp/results/dispatch/node_0/output.tobj", "/tmp/results/other/output.tobj"]
+    )
+
+
 def test_post_node_asset_bad_dispatch_id(mocker, client):
     """
     Test post node asset
@@ -167,6 +239,69 @@ def test_post_node_asset_bad_dispatch_id(mocker, client):
     assert resp.status_code == 400
 
 
+def test_get_node_asset_bundle(mocker, client, test_db):
+    """
+    Test streaming several node assets as a tar archive
+    """
+
+    dispatch_id = "test_get_node_asset_bundle"
+    contents = {0: b"output_0", 1: b"x" * 1000}
+
+    with tempfile.TemporaryDirectory() as storage_path:
+        records = []
+        for node_id, data in contents.items():
+            with open(os.path.join(storage_path, f"output_{node_id}"), "wb") as f:
+                f.write(data)
+            asset = MagicMock(
+                storage_path=storage_path, object_key=f"output_{node_id}", size=len(data)
+            )
+            records.append({"meta_id": 100 + node_id, "key": "output", "asset": asset})
+            records.append({"meta_id": 100 + node_id, "key": "stdout", "asset": MagicMock(size=0)})
+
+        def get_nodes(node_ids, session):
+            return [MagicMock(_electron_id=100 + node_id, node_id=node_id) for node_id in node_ids]
+
+        res_obj = MagicMock()
+        res_obj.lattice.transport_graph.get_nodes = get_nodes
+
+        mocker.patch("covalent_dispatcher._service.assets.workflow_db", test_db)
+        mocker.patch("covalent_dispatcher._service.assets.get_result_object", return_value=res_obj)
+        mock_get_linked_assets = mocker.patch(
+            "covalent_dispatcher._service.assets.Electron.get_linked_assets", return_value=records
+        )
+        mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+
+        body = {
+            "assets": [
+                {"node_id": 0, "key": "output"},
+                {"node_id": 1, "key": "output"},
+                {"node_id": 1, "key": "stdout"},
+            ]
+        }
+        resp = client.post(f"/api/v2/dispatches/{dispatch_id}/electrons/assets/bundle", json=body)
+
+    assert resp.status_code == 200
+    with tarfile.open(fileobj=io.BytesIO(resp.content), mode="r|") as tar:
+        received = {member.name: tar.extractfile(member).read() for member in tar}
+
+    assert received == {"node_0/output": contents[0], "node_1/output": contents[1]}
+
+    # The assets of all nodes are loaded with one query
+    mock_get_linked_assets.assert_called_once()
+
+
+def test_get_node_asset_bundle_bad_key(mocker, client):
+    """
+    Test that invalid asset keys are rejected
+    """
+
+    dispatch_id = "test_get_node_asset_bundle_bad_key"
+    mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    body = {"assets": [{"node_id": 0, "key": "bad_key"}]}
+    resp = client.post(f"/api/v2/dispatches/{dispatch_id}/electrons/assets/bundle", json=body)
+    assert resp.status_code == 422
+
+
 def test_get_cached_result_obj(mocker, test_db):
     mocker.patch("covalent_dispatcher._service.assets.workflow_db", test_db)
     mocker.patch("covalent_dispatcher._service.assets.get_result_object", side_effect=KeyError())
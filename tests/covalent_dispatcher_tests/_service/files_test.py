@@ -0,0 +1,106 @@
+# Copyright 2021 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the embedded file server"""
+
+import hashlib
+import os
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+from covalent_ui.app import fastapi_app as fast_app
+
+
+@pytest.fixture
+def client(mocker):
+    # Don't look for interrupted dispatches or asset copies in the DB on startup
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.asset_manager.resume_asset_copies")
+    with TestClient(fast_app) as c:
+        yield c
+
+
+@pytest.fixture
+def base_path(mocker):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        mocker.patch("covalent_dispatcher._service.files.BASE_PATH", temp_dir)
+        mocker.patch(
+            "covalent_dispatcher._service.files.BLOB_STORE_PATH", os.path.join(temp_dir, ".cas")
+        )
+        yield temp_dir
+
+
+def test_upload_file(client, base_path):
+    """Test uploading a file with and without a digest to verify"""
+
+    data = b"Hello"
+    resp = client.put("/api/v0/files/dispatch/node_0/value.tobj", content=data)
+    assert resp.status_code == 200
+
+    headers = {"Digest-alg": "sha", "Digest": hashlib.sha1(data).hexdigest()}
+    resp = client.put("/api/v0/files/dispatch/node_1/value.tobj", content=data, headers=headers)
+    assert resp.status_code == 200
+
+    for node_id in (0, 1):
+        with open(os.path.join(base_path, f"dispatch/node_{node_id}/value.tobj"), "rb") as f:
+            assert f.read() == data
+
+
+def test_upload_file_digest_mismatch(client, base_path):
+    """Test that uploads not matching the supplied digest are rejected"""
+
+    headers = {"Digest-alg": "sha", "Digest": hashlib.sha1(b"Hello").hexdigest()}
+    resp = client.put("/api/v0/files/dispatch/value.tobj", content=b"Goodbye", headers=headers)
+    assert resp.status_code == 400
+    assert os.listdir(os.path.join(base_path, "dispatch")) == []
+
+    headers = {"Digest-alg": "unknown", "Digest": "abcd"}
+    resp = client.put("/api/v0/files/dispatch/value.tobj", content=b"Hello", headers=headers)
+    assert resp.status_code == 400
+
+
+def test_upload_file_dedup(client, base_path, mocker):
+    """Test that uploaded data is added to the blob store"""
+
+    mock_add_blob = mocker.patch("covalent_dispatcher._service.files.local_store.add_blob")
+
+    data = b"Hello"
+    resp = client.put("/api/v0/files/dispatch/value.tobj", content=data)
+    assert resp.status_code == 200
+    mock_add_blob.assert_called_once_with(
+        base_path, os.path.join("dispatch", "value.tobj"), "sha1", hashlib.sha1(data).hexdigest()
+    )
+
+
+def test_upload_file_marks_uploaded(client, base_path, mocker):
+    """Test that uploads release tasks waiting for the data"""
+
+    linked_path = os.path.join(base_path, "dispatch", "node_1", "value.tobj")
+    mocker.patch(
+        "covalent_dispatcher._service.files.local_store.add_blob", return_value=[linked_path]
+    )
+    mock_mark_uploaded = mocker.patch("covalent_dispatcher._service.files.mark_uploaded")
+
+    resp = client.put("/api/v0/files/dispatch/node_0/value.tobj", content=b"Hello")
+    assert resp.status_code == 200
+    mock_mark_uploaded.assert_called_once_with(
+        [
+            os.path.join(os.path.realpath(base_path), "dispatch", "node_0", "value.tobj"),
+            linked_path,
+        ]
+    )
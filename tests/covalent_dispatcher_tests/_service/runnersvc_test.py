@@ -16,7 +16,6 @@
 
 """Unit tests for the FastAPI runner endpoints"""
 
-
 import pytest
 from fastapi.testclient import TestClient
 
@@ -31,7 +30,10 @@ def app():
 
 
 @pytest.fixture
-def client():
+def client(mocker):
+    # Don't look for interrupted dispatches or asset copies in the DB on startup
+    mocker.patch("covalent_dispatcher._service.app.resume_all_with_status")
+    mocker.patch("covalent_dispatcher._service.app.asset_manager.resume_asset_copies")
     with TestClient(fast_app) as c:
         yield c
 
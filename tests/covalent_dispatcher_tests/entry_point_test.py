@@ -16,7 +16,6 @@
 
 """Unit tests for the FastAPI app."""
 
-
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock
@@ -41,31 +40,29 @@ async def test_cancel_running_dispatch(mocker):
 
 
 @pytest.mark.asyncio
-async def test_start_dispatch_waits(mocker):
-    """Check that start_dispatch waits for any assets to be copied."""
+async def test_start_dispatch_does_not_wait_for_copies(mocker):
+    """Check that start_dispatch doesn't wait for reused assets to be copied."""
 
-    dispatch_id = "test_start_dispatch_waits"
+    dispatch_id = "test_start_dispatch_does_not_wait_for_copies"
 
     def mock_copy():
         import time
 
         time.sleep(3)
 
-    mock_futures = {}
     ex = ThreadPoolExecutor(max_workers=1)
-    mocker.patch("covalent_dispatcher._core.copy_futures", mock_futures)
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.asset_manager._pending_copies",
+        {dispatch_id: ex.submit(mock_copy)},
+    )
 
     mock_run_dispatch = mocker.patch("covalent_dispatcher._core.run_dispatch")
 
-    fut = ex.submit(mock_copy)
-    mock_futures[dispatch_id] = fut
-    fut.add_done_callback(lambda x: mock_futures.pop(dispatch_id))
-
     start_time = datetime.now()
     await start_dispatch(dispatch_id)
     end_time = datetime.now()
 
-    assert (end_time - start_time).total_seconds() > 2
+    assert (end_time - start_time).total_seconds() < 2
 
     mock_run_dispatch.assert_called()
 
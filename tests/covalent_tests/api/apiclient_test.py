@@ -0,0 +1,153 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests for the Covalent API client"""
+
+import os
+from unittest.mock import MagicMock
+
+import aiohttp
+import pytest
+import pytest_asyncio
+import requests
+from aiohttp import web
+from requests.adapters import HTTPAdapter
+
+from covalent._api import apiclient
+from covalent._api.apiclient import AsyncCovalentAPIClient, CovalentAPIClient
+
+
+@pytest.fixture(autouse=True)
+def clear_sessions():
+    apiclient.close_sessions()
+    yield
+    apiclient.close_sessions()
+
+
+def test_api_client_reuses_sessions():
+    """Clients for the same dispatcher share one pooled session."""
+
+    client_1 = CovalentAPIClient("http://localhost:48008")
+    client_2 = CovalentAPIClient("http://localhost:48008")
+    client_3 = CovalentAPIClient("http://localhost:48009")
+
+    assert client_1.session is client_2.session
+    assert client_1.session is not client_3.session
+
+    adapter = client_1.session.get_adapter("http://localhost:48008")
+    assert adapter.max_retries.total == int(apiclient.get_config("sdk.http_retries"))
+    assert adapter._pool_maxsize == int(apiclient.get_config("sdk.http_pool_size"))
+
+
+def test_api_client_custom_adapter():
+    adapter = HTTPAdapter()
+    client = CovalentAPIClient("http://localhost:48008", adapter=adapter)
+    assert client.session.get_adapter("https://localhost:48008") is adapter
+    assert client.session is not CovalentAPIClient("http://localhost:48008").session
+
+
+def test_api_client_sessions_reset_after_fork(mocker):
+    client = CovalentAPIClient("http://localhost:48008")
+    session = client.session
+
+    mocker.patch("covalent._api.apiclient._sessions_pid", os.getpid() + 1)
+    assert client.session is not session
+
+
+@pytest.mark.parametrize("method", ["get", "post", "put", "patch", "delete"])
+def test_api_client_methods(mocker, method):
+    mock_response = MagicMock()
+    mock_method = mocker.patch(
+        f"covalent._api.apiclient.requests.Session.{method}", return_value=mock_response
+    )
+    mocker.patch.dict(os.environ, {"COVALENT_EXTRA_HEADERS": '{"x-test": "1"}'})
+
+    client = CovalentAPIClient("http://localhost:48008")
+    r = getattr(client, method)("/api/v2/test", headers={"a": "b"}, json={})
+
+    assert r is mock_response
+    mock_method.assert_called_once_with(
+        "http://localhost:48008/api/v2/test", headers={"a": "b", "x-test": "1"}, json={}
+    )
+    mock_response.raise_for_status.assert_called_once()
+
+
+def test_api_client_connection_error(mocker):
+    mocker.patch(
+        "covalent._api.apiclient.requests.Session.get",
+        side_effect=requests.exceptions.ConnectionError(),
+    )
+    mock_print = mocker.patch("covalent._api.apiclient.print")
+    client = CovalentAPIClient("http://localhost:48008")
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get("/api/v2/test")
+    mock_print.assert_called_once()
+
+
+@pytest_asyncio.fixture
+async def test_server():
+    attempts = {"flaky": 0}
+
+    async def ok(request):
+        return web.json_response({"method": request.method})
+
+    async def flaky(request):
+        attempts["flaky"] += 1
+        if attempts["flaky"] < 3:
+            return web.Response(status=503)
+        return web.json_response({"attempts": attempts["flaky"]})
+
+    app = web.Application()
+    app.router.add_route("*", "/ok", ok)
+    app.router.add_route("*", "/flaky", flaky)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_async_api_client(test_server):
+    async with AsyncCovalentAPIClient(test_server) as client:
+        client.backoff_factor = 0
+        r = await client.post("/ok")
+        assert await r.json() == {"method": "POST"}
+
+        # Idempotent requests are retried on 503
+        r = await client.get("/flaky")
+        assert await r.json() == {"attempts": 3}
+
+        session = client.session
+        assert client.session is session
+
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_async_api_client_raises(test_server):
+    async with AsyncCovalentAPIClient(test_server) as client:
+        client.retries = 0
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.get("/flaky")
+
+    async with AsyncCovalentAPIClient(test_server, auto_raise=False) as client:
+        client.retries = 0
+        r = await client.put("/flaky")
+        assert r.status == 503
@@ -18,6 +18,7 @@
 """Unit tests for local module in dispatcher_plugins."""
 
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 import pytest
@@ -27,6 +28,8 @@ from requests.exceptions import ConnectionError, HTTPError
 import covalent as ct
 from covalent._dispatcher_plugins.local import LocalDispatcher, get_redispatch_request_body_v2
 from covalent._results_manager.result import Result
+from covalent._shared_files.config import get_config
+from covalent._shared_files.schemas.asset import AssetSchema
 from covalent._shared_files.utils import format_server_url
 
 
@@ -197,6 +200,66 @@ def test_register(mocker):
     mock_upload.assert_called()
 
 
+def test_register_start_before_upload(mocker):
+    """Test starting a dispatch before uploading its assets"""
+
+    @ct.electron
+    def task(a, b, c):
+        return a + b + c
+
+    @ct.lattice
+    def workflow(a, b):
+        return task(a, b, c=4)
+
+    workflow.build_graph(1, 2)
+    with tempfile.TemporaryDirectory() as staging_dir:
+        manifest = LocalDispatcher.prepare_manifest(workflow, staging_dir)
+
+    manifest.metadata.dispatch_id = "test_register_start"
+
+    calls = mocker.MagicMock()
+    mocker.patch(
+        "covalent._dispatcher_plugins.local.LocalDispatcher.prepare_manifest",
+        return_value=manifest,
+    )
+    mocker.patch("covalent._dispatcher_plugins.local.LocalDispatcher.register_manifest")
+    mocker.patch("covalent._dispatcher_plugins.local.LocalDispatcher.start", calls.start)
+    mocker.patch(
+        "covalent._dispatcher_plugins.local.LocalDispatcher.upload_assets", calls.upload_assets
+    )
+    mock_cancel = mocker.patch("covalent._dispatcher_plugins.local.cancel")
+
+    dispatch_id = LocalDispatcher.register(workflow, "http://localhost", start=True)(1, 2)
+    assert dispatch_id == "test_register_start"
+    assert [c[0] for c in calls.method_calls] == ["start", "upload_assets"]
+    mock_cancel.assert_not_called()
+
+    # Failed uploads cancel the dispatch
+    calls.upload_assets.side_effect = RuntimeError("upload failed")
+    with pytest.raises(RuntimeError):
+        LocalDispatcher.register(workflow, "http://localhost", start=True)(1, 2)
+    mock_cancel.assert_called_once_with("test_register_start", dispatcher_addr="http://localhost")
+
+
+def test_dispatch_pipelined(mocker):
+    """Test that pipelined dispatches are started at registration"""
+
+    mocker.patch(
+        "covalent._dispatcher_plugins.local.get_config",
+        side_effect=lambda key: "true" if key == "sdk.pipelined_dispatch" else get_config(key),
+    )
+    mock_register = mocker.patch("covalent._dispatcher_plugins.local.LocalDispatcher.register")
+    mock_start = mocker.patch("covalent._dispatcher_plugins.local.LocalDispatcher.start")
+
+    @ct.lattice
+    def workflow(a):
+        return a
+
+    LocalDispatcher.dispatch(workflow, "http://localhost")(1)
+    mock_register.assert_called_once_with(workflow, "http://localhost", start=True)
+    mock_start.assert_not_called()
+
+
 def test_redispatch(mocker):
     """test redispatching a lattice with register api"""
 
@@ -338,13 +401,150 @@ def test_upload_assets(mocker):
         endpoint = f"/api/v2/dispatches/{dispatch_id}/lattice/assets/dummy"
         r = Response()
         r.status_code = 200
-        mock_put = mocker.patch("requests.put", return_value=r)
+        mock_put = mocker.patch("requests.Session.put", return_value=r)
 
         LocalDispatcher.upload_assets(manifest)
 
         assert mock_put.call_count == num_assets
 
 
+def test_upload_assets_order(mocker):
+    """Test that node assets are uploaded in topological order"""
+
+    @ct.electron
+    def task(x):
+        return x
+
+    @ct.lattice
+    def workflow(x):
+        return task(task(x))
+
+    workflow.build_graph(1)
+    with tempfile.TemporaryDirectory() as staging_dir:
+        manifest = LocalDispatcher.prepare_manifest(workflow, staging_dir)
+
+    # Reverse the node ids so that they aren't topologically sorted
+    tg = manifest.lattice.transport_graph
+    max_id = max(node.id for node in tg.nodes)
+    for node in tg.nodes:
+        node.id = max_id - node.id
+    for edge in tg.links:
+        edge.source = max_id - edge.source
+        edge.target = max_id - edge.target
+
+    mock_upload = mocker.patch("covalent._dispatcher_plugins.local.LocalDispatcher._upload")
+    LocalDispatcher.upload_assets(manifest)
+    assets = mock_upload.call_args[0][0]
+
+    asset_ids = {id(asset): node.id for node in tg.nodes for _, asset in node.assets}
+    positions = {}
+    for i, asset in enumerate(assets):
+        positions.setdefault(asset_ids.get(id(asset)), i)
+
+    for edge in tg.links:
+        assert positions[edge.source] < positions[edge.target]
+
+    # Workflow assets come last
+    num_node_assets = len(asset_ids)
+    assert all(id(asset) in asset_ids for asset in assets[:num_node_assets])
+    assert len(assets) == num_node_assets + len(list(manifest.lattice.assets)) + len(
+        list(manifest.assets)
+    )
+
+
+def test_upload_skips_assets(mocker):
+    """Test that assets without data or upload URIs are skipped"""
+
+    mock_upload_asset = mocker.patch("covalent._dispatcher_plugins.local._upload_asset")
+    assets = [
+        AssetSchema(uri="file:///tmp/a", remote_uri="http://localhost/a", size=10),
+        AssetSchema(uri="file:///tmp/b", remote_uri="http://localhost/b", size=5),
+        AssetSchema(uri="file:///tmp/c", remote_uri="", size=10),
+        AssetSchema(uri=None, remote_uri="http://localhost/d", size=0),
+        AssetSchema(uri="file:///tmp/e", remote_uri="http://localhost/e", size=0),
+    ]
+
+    stats = LocalDispatcher._upload(assets)
+
+    assert mock_upload_asset.call_count == 2
+    mock_upload_asset.assert_any_call("file:///tmp/a", "http://localhost/a")
+    mock_upload_asset.assert_any_call("file:///tmp/b", "http://localhost/b")
+    assert stats["uploaded"] == 2
+    assert stats["skipped"] == 3
+    assert stats["bytes"] == 15
+
+
+def test_upload_is_concurrent(mocker):
+    """Test that assets are uploaded by several workers"""
+
+    import threading
+
+    mocker.patch(
+        "covalent._dispatcher_plugins.local.get_config",
+        side_effect=lambda key: 2 if key == "sdk.asset_upload_workers" else get_config(key),
+    )
+
+    # Deadlocks unless two uploads run at the same time
+    barrier = threading.Barrier(2, timeout=5)
+    mocker.patch(
+        "covalent._dispatcher_plugins.local._upload_asset",
+        side_effect=lambda *args: barrier.wait(),
+    )
+    assets = [
+        AssetSchema(uri=f"file:///tmp/{i}", remote_uri=f"http://localhost/{i}", size=1)
+        for i in range(2)
+    ]
+
+    assert LocalDispatcher._upload(assets)["uploaded"] == 2
+
+
+def test_upload_workers_capped_by_pool_size(mocker):
+    """Test that there are no more upload workers than pooled connections"""
+
+    pool_sizes = {"sdk.asset_upload_workers": 16, "sdk.http_pool_size": 10}
+    mocker.patch(
+        "covalent._dispatcher_plugins.local.get_config",
+        side_effect=lambda key: pool_sizes.get(key) or get_config(key),
+    )
+    mocker.patch("covalent._dispatcher_plugins.local._upload_asset")
+    mock_pool = mocker.patch(
+        "covalent._dispatcher_plugins.local.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+    )
+    assets = [AssetSchema(uri="file:///tmp/a", remote_uri="http://localhost/a", size=10)]
+
+    LocalDispatcher._upload(assets)
+    mock_pool.assert_called_once_with(max_workers=10)
+
+
+def test_upload_asset_pooled_session(mocker, tmp_path):
+    """Test that assets are uploaded using the pooled session"""
+
+    from covalent._dispatcher_plugins.local import _upload_asset
+
+    path = tmp_path / "asset.tobj"
+    path.write_bytes(b"x" * 100)
+    mock_session = mocker.patch(
+        "covalent._dispatcher_plugins.local.APIClient.session", new_callable=mocker.PropertyMock
+    )
+    mock_put = mock_session.return_value.put
+
+    _upload_asset(f"file://{path}", "http://localhost:48008/api/v0/files/asset.tobj")
+
+    assert mock_put.call_args.args == ("http://localhost:48008/api/v0/files/asset.tobj",)
+    assert mock_put.call_args.kwargs["headers"] == {"Content-Length": "100"}
+    mock_put.return_value.raise_for_status.assert_called_once()
+
+
+def test_upload_raises_errors(mocker):
+    mocker.patch(
+        "covalent._dispatcher_plugins.local._upload_asset", side_effect=RuntimeError("error")
+    )
+    assets = [AssetSchema(uri="file:///tmp/a", remote_uri="http://localhost/a", size=10)]
+
+    with pytest.raises(RuntimeError):
+        LocalDispatcher._upload(assets)
+
+
 def test_get_redispatch_request_body_norebuild(mocker):
     """Test constructing the request body for redispatch"""
 
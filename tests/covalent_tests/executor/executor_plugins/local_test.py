@@ -38,7 +38,7 @@ from covalent.executor.executor_plugins.local import (
     run_task_group,
 )
 from covalent.executor.schemas import ResourceMap
-from covalent.executor.utils.serialize import serialize_node_asset
+from covalent.executor.utils.serialize import deserialize_node_asset, serialize_node_asset
 from covalent.executor.utils.wrappers import wrapper_fn
 
 
@@ -385,6 +385,152 @@ def test_run_task_group(mocker):
         assert f.read() == "Bye\n"
 
 
+def test_run_task_group_local_assets(mocker, tmp_path):
+    """Test that assets in the local object store are used in place"""
+
+    import hashlib
+
+    def task(x, y):
+        return x + y
+
+    dispatch_id = "test_run_task_group_local_assets"
+    server_url = "http://localhost:48008"
+
+    hooks = {"deps": {}, "call_before": [], "call_after": []}
+    files = {
+        "function": serialize_node_asset(TransportableObject(task), "function"),
+        "hooks": serialize_node_asset(hooks, "hooks"),
+        "node_1": serialize_node_asset(TransportableObject(1), "output"),
+        "node_2": serialize_node_asset(TransportableObject(2), "output"),
+    }
+    for name, data in files.items():
+        (tmp_path / name).write_bytes(data)
+
+    output_path = tmp_path / "node_0" / "output.tobj"
+    resources = ResourceMap(
+        functions={0: f"file://{tmp_path}/function"},
+        inputs={1: f"file://{tmp_path}/node_1", 2: f"file://{tmp_path}/node_2"},
+        hooks={0: f"file://{tmp_path}/hooks"},
+        outputs={0: f"file://{output_path}"},
+    )
+
+    def mock_req_post(url, headers={}, **kwargs):
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"remote_uri": f"{server_url}/files/{url}"}
+        return mock_resp
+
+    mock_get = mocker.patch("requests.get")
+    mock_post = mocker.patch("requests.post", side_effect=mock_req_post)
+    mocker.patch("requests.put")
+    mock_file_transfer = mocker.patch("covalent.executor.utils.wrappers.FileTransfer")
+    mock_file_transfer.return_value.cp.return_value = (None, MagicMock())
+    mocker.patch("covalent.executor.utils.wrappers.get_config", return_value="sha256")
+
+    task_spec = TaskSpec(electron_id=0, args=[1, 2], kwargs={})
+    task_group_metadata = {"dispatch_id": dispatch_id, "node_ids": [0], "task_group_id": 0}
+    run_task_group(
+        task_specs=[task_spec.model_dump()],
+        output_uris=[tuple(str(tmp_path / name) for name in ("result", "stdout", "stderr"))],
+        results_dir=str(tmp_path),
+        task_group_metadata=task_group_metadata,
+        server_url=server_url,
+        resources=resources.model_dump(),
+    )
+
+    mock_get.assert_not_called()
+
+    ser_output = output_path.read_bytes()
+    assert TransportableObject.deserialize(ser_output).get_deserialized() == 3
+
+    # Only the metadata of the output is sent
+    output_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/0/assets/output"
+    mock_post.assert_any_call(
+        output_url,
+        headers={
+            "Content-Length": str(len(ser_output)),
+            "Digest-alg": "sha256",
+            "Digest": hashlib.sha256(ser_output).hexdigest(),
+            "Object-stored": "true",
+        },
+    )
+    assert os.listdir(output_path.parent) == ["output.tobj"]
+    transferred = [c.args[0] for c in mock_file_transfer.call_args_list]
+    assert f"file://{output_path}" not in transferred
+
+
+def test_run_task_group_in_memory_handoff(mocker, tmp_path):
+    """Test that outputs are passed in memory between tasks of a group"""
+
+    def task(x, y):
+        return x + y
+
+    dispatch_id = "test_run_task_group_in_memory_handoff"
+    server_url = "http://localhost:48008"
+
+    hooks = {"deps": {}, "call_before": [], "call_after": []}
+    files = {
+        "function": serialize_node_asset(TransportableObject(task), "function"),
+        "hooks": serialize_node_asset(hooks, "hooks"),
+        "node_1": serialize_node_asset(TransportableObject(1), "output"),
+        "node_2": serialize_node_asset(TransportableObject(2), "output"),
+    }
+    for name, data in files.items():
+        (tmp_path / name).write_bytes(data)
+
+    output_paths = {node_id: tmp_path / f"node_{node_id}" / "output.tobj" for node_id in (0, 3)}
+    resources = ResourceMap(
+        functions={node_id: f"file://{tmp_path}/function" for node_id in (0, 3)},
+        inputs={1: f"file://{tmp_path}/node_1", 2: f"file://{tmp_path}/node_2"},
+        hooks={node_id: f"file://{tmp_path}/hooks" for node_id in (0, 3)},
+        outputs={node_id: f"file://{path}" for node_id, path in output_paths.items()},
+    )
+
+    def mock_req_post(url, headers={}, **kwargs):
+        mock_resp = MagicMock()
+        mock_resp.json.return_value = {"remote_uri": f"{server_url}/files/{url}"}
+        return mock_resp
+
+    mock_get = mocker.patch("requests.get")
+    mock_post = mocker.patch("requests.post", side_effect=mock_req_post)
+    mocker.patch("requests.put")
+    mock_file_transfer = mocker.patch("covalent.executor.utils.wrappers.FileTransfer")
+    mock_file_transfer.return_value.cp.return_value = (None, MagicMock())
+    mock_deserialize = mocker.patch(
+        "covalent.executor.utils.wrappers.deserialize_node_asset",
+        wraps=deserialize_node_asset,
+    )
+
+    # Node 0's output is only consumed by node 3
+    task_specs = [
+        TaskSpec(electron_id=0, args=[1, 2], kwargs={}, persist_output=False),
+        TaskSpec(electron_id=3, args=[0], kwargs={"y": 2}),
+    ]
+    task_group_metadata = {"dispatch_id": dispatch_id, "node_ids": [0, 3], "task_group_id": 0}
+    run_task_group(
+        task_specs=[task_spec.model_dump() for task_spec in task_specs],
+        output_uris=[
+            tuple(str(tmp_path / f"{name}_{node_id}") for name in ("result", "stdout", "stderr"))
+            for node_id in (0, 3)
+        ],
+        results_dir=str(tmp_path),
+        task_group_metadata=task_group_metadata,
+        server_url=server_url,
+        resources=resources.model_dump(),
+    )
+
+    mock_get.assert_not_called()
+    output_loads = [c for c in mock_deserialize.call_args_list if c.args[1] == "output"]
+    assert len(output_loads) == 3
+
+    assert not output_paths[0].exists()
+    ser_output = output_paths[3].read_bytes()
+    assert TransportableObject.deserialize(ser_output).get_deserialized() == 5
+
+    # The discarded output is recorded as empty
+    output_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/0/assets/output"
+    mock_post.assert_any_call(output_url, headers={"Content-Length": "0"})
+
+
 def test_run_task_group_exception(mocker):
     """Test the wrapper submitted to local"""
 
@@ -640,6 +786,7 @@ def test_send_internal(
         local_exec.workdir,
         test_case["task_group_metadata"],
         test_case["expected_server_url"],
+        test_case["resources"].model_dump(),
     )
 
 
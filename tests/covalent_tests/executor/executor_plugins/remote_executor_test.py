@@ -68,10 +68,11 @@ def test_remote_executor_init():
 
 
 @pytest.mark.asyncio
-async def test_run_async_subprocess():
+async def test_run_async_subprocess(tmp_path):
     """Test remote executor async subprocess call"""
 
-    test_dir, test_file, non_existent_file = "file_dir", "file.txt", "non_existent_file.txt"
+    test_dir, test_file = tmp_path / "file_dir", "file.txt"
+    non_existent_file = tmp_path / "non_existent_file.txt"
     create_file = (
         f"rm -rf {test_dir} && mkdir {test_dir} && cd {test_dir} && touch {test_file} && echo 'hello remote "
         f"executor' >> {test_file} "
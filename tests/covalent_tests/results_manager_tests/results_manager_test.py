@@ -16,7 +16,9 @@
 
 """Tests for results manager."""
 
+import io
 import os
+import tarfile
 import tempfile
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
@@ -25,6 +27,7 @@ import pytest
 
 import covalent as ct
 from covalent._api.apiclient import CovalentAPIClient
+from covalent._results_manager import results_manager
 from covalent._results_manager.results_manager import (
     MissingLatticeRecordError,
     Result,
@@ -150,6 +153,73 @@ def test_result_manager_assets_local_copies():
         assert output.get_deserialized() == 2
 
 
+def _make_bundle(members):
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    buf.seek(0)
+    return buf
+
+
+def test_result_manager_download_node_assets_bundle(mocker):
+    """Test downloading node assets through the bundle endpoint."""
+    with tempfile.TemporaryDirectory() as server_dir:
+        manifest = get_test_manifest(server_dir)
+        dispatch_id = manifest.metadata.dispatch_id
+        for node in manifest.lattice.transport_graph.nodes:
+            node.assets.output.remote_uri = f"http://localhost:48008/files/{node.id}/output"
+
+        with open(f"{server_dir}/node_0/results.tobj", "rb") as f:
+            output_bytes = f.read()
+
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.raw = _make_bundle({"node_0/output": output_bytes, "../escape": b"bad"})
+    mock_response.__enter__.return_value = mock_response
+    mock_post = mocker.patch(
+        "covalent._api.apiclient.requests.Session.post", return_value=mock_response
+    )
+
+    with tempfile.TemporaryDirectory() as results_dir:
+        os.makedirs(f"{results_dir}/node_0")
+        rm = ResultManager(manifest, results_dir, "http://localhost:48008")
+        rm.download_node_assets([(0, "output")])
+        rm.load_node_asset(0, "output")
+
+        assert not os.path.exists(f"{results_dir}/../escape")
+
+    url = mock_post.call_args[0][0]
+    assert url == f"http://localhost:48008/api/v2/dispatches/{dispatch_id}/electrons/assets/bundle"
+    assert mock_post.call_args[1]["json"] == {"assets": [{"node_id": 0, "key": "output"}]}
+    output = rm.result_object.lattice.transport_graph.get_node_value(0, "output")
+    assert output.get_deserialized() == 2
+
+
+def test_result_manager_download_node_assets_fallback(mocker):
+    """Test falling back to single downloads when bundles are unsupported."""
+    with tempfile.TemporaryDirectory() as server_dir:
+        manifest = get_test_manifest(server_dir)
+        node = manifest.lattice.transport_graph.nodes[0]
+        node.assets.output.remote_uri = "http://localhost:48008/files/0/output"
+
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        mock_response.__enter__.return_value = mock_response
+        mocker.patch("covalent._api.apiclient.requests.Session.post", return_value=mock_response)
+        mock_download = mocker.patch("covalent._results_manager.results_manager.download_asset")
+
+        with tempfile.TemporaryDirectory() as results_dir:
+            rm = ResultManager(manifest, results_dir, "http://localhost:48008")
+            rm.download_node_assets([(0, "output")])
+
+    mock_download.assert_called_once_with(
+        "http://localhost:48008/files/0/output", f"{results_dir}/node_0/results.tobj"
+    )
+
+
 def test_result_manager_save_manifest():
     """Test saving and loading manifests"""
     dispatch_id = "test_result_manager_save_load"
@@ -186,6 +256,57 @@ def test_get_result(mocker):
             assert res_obj.result == 42
 
 
+def test_get_result_lazy(mocker):
+    dispatch_id = "test_result_manager_lazy"
+    with tempfile.TemporaryDirectory() as server_dir:
+        manifest = get_test_manifest(server_dir)
+        mocker.patch(
+            "covalent._results_manager.results_manager._get_result_export_from_dispatcher",
+            side_effect=lambda *args: manifest.model_copy(deep=True),
+        )
+        spy = mocker.spy(results_manager, "download_asset")
+
+        with tempfile.TemporaryDirectory() as results_dir:
+            res_obj = get_result(dispatch_id, results_dir=results_dir, lazy=True)
+            num_eager_downloads = spy.call_count
+            assert res_obj.lattice.transport_graph.get_node_value(0, "output") is None
+
+            assert res_obj.result == 42
+            assert res_obj.get_node_result(0)["output"].get_deserialized() == 2
+            assert spy.call_count == num_eager_downloads + 2
+
+            # A second retrieval reuses the downloaded outputs
+            res_obj = get_result(dispatch_id, results_dir=results_dir, lazy=True)
+            spy.reset_mock()
+            assert res_obj.result == 42
+            assert res_obj.get_node_result(0)["output"].get_deserialized() == 2
+            assert spy.call_count == 0
+
+
+def test_get_result_lazy_without_digest(mocker):
+    """Outputs without a digest are downloaded without being cached."""
+
+    dispatch_id = "test_result_manager_lazy_without_digest"
+    with tempfile.TemporaryDirectory() as server_dir:
+        manifest = get_test_manifest(server_dir)
+        manifest.assets.result.digest = None
+        manifest.lattice.transport_graph.nodes[0].assets.output.digest = None
+        mocker.patch(
+            "covalent._results_manager.results_manager._get_result_export_from_dispatcher",
+            side_effect=lambda *args: manifest.model_copy(deep=True),
+        )
+        spy = mocker.spy(results_manager, "download_asset")
+
+        with tempfile.TemporaryDirectory() as results_dir:
+            res_obj = get_result(dispatch_id, results_dir=results_dir, lazy=True)
+            num_eager_downloads = spy.call_count
+
+            assert res_obj.result == 42
+            assert res_obj.get_node_result(0)["output"].get_deserialized() == 2
+            assert spy.call_count == num_eager_downloads + 2
+            assert not [name for name in os.listdir(results_dir) if name.endswith(".tmp")]
+
+
 def test_get_result_sublattice(mocker):
     dispatch_id = "test_result_manager_sublattice"
     sub_dispatch_id = "test_result_manager_sublattice_sub"
@@ -16,6 +16,7 @@
 
 """Unit tests for lattice serializer"""
 
+import os
 import platform
 import tempfile
 
@@ -96,3 +97,43 @@ def test_serialize_lattice_custom_assets():
 
         node_1 = manifest.transport_graph.nodes[1]
         assert not node_1.assets._custom
+
+
+def test_serialize_lattice_shared_assets():
+    """Identical assets are written once and empty assets not at all."""
+
+    @ct.electron
+    def identity(x):
+        return x
+
+    @ct.lattice
+    def workflow(x, y):
+        res1 = identity(x)
+        res2 = identity(y)
+        return res1, res2
+
+    workflow.build_graph(2, 3)
+    workflow.transport_graph.set_node_value(0, "stdout", "")
+
+    with tempfile.TemporaryDirectory() as d:
+        model = serialize_lattice(workflow, d)
+        nodes = {node.id: node for node in model.transport_graph.nodes}
+        function_ids = [i for i, node in nodes.items() if node.metadata.name == "identity"]
+        assert len(function_ids) == 2
+
+        first, second = (nodes[i].assets.function for i in function_ids)
+        assert first.digest == second.digest
+        assert first.uri == second.uri
+        assert os.path.exists(first.uri[len("file://") :])
+
+        stdout = nodes[0].assets.stdout
+        assert stdout.size == 0 and stdout.digest and not stdout.uri
+        assert not os.path.exists(os.path.join(d, "node_0", "stdout.log"))
+
+        lat = deserialize_lattice(model)
+        assert lat.transport_graph.get_node_value(0, "stdout") == ""
+        for i in function_ids:
+            assert (
+                lat.transport_graph.get_node_value(i, "function").get_serialized()
+                == workflow.transport_graph.get_node_value(i, "function").get_serialized()
+            )
@@ -646,6 +646,49 @@ def test_electron_pow_method(mocker):
     mock_electron_get_op_function.assert_called_with(ANY, 2, "**")
 
 
+def test_builtin_electrons_are_inline():
+    """Test that only the built-in nodes without hooks are marked inline"""
+
+    @ct.electron
+    def create_array():
+        return [3, 4]
+
+    @ct.electron(call_before=[ct.DepsCall(print)])
+    def create_hooked_array():
+        return [3, 4]
+
+    @ct.electron
+    def add(a, b):
+        return a + b
+
+    @ct.lattice
+    def workflow():
+        arr = create_array()
+        hooked_arr = create_hooked_array()
+        return add([arr[0], hooked_arr[1]], arr[1] * 2)
+
+    workflow.build_graph()
+    tg = workflow.transport_graph
+
+    inline_nodes = [
+        node_id
+        for node_id in tg._graph.nodes
+        if tg.get_node_value(node_id, "metadata").get("inline", False)
+    ]
+
+    # TG:
+    # 0: create_array
+    # 1: create_hooked_array
+    # 2: arr.__getitem__
+    # 4: hooked_arr.__getitem__
+    # 6: arr.__getitem__
+    # 8: arr[1] * 2
+    # 10: add
+    # 11: electron_list
+    # 12: postprocess
+    assert inline_nodes == [2, 6, 8, 11, 12]
+
+
 @pytest.mark.parametrize(
     "module_inputs",
     [
@@ -0,0 +1,164 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for automatic task packing."""
+
+import pytest
+
+import covalent as ct
+from covalent._shared_files.config import get_config
+from covalent._workflow.packing import _supports_task_groups, pack_linear_chains
+from covalent.executor import DaskExecutor, LocalExecutor, _executor_manager
+
+
+@ct.electron(executor="local")
+def add_one(x):
+    return x + 1
+
+
+@ct.electron(executor="dask")
+def add_two(x):
+    return x + 2
+
+
+@ct.electron(executor="local", auto_pack=False)
+def add_three(x):
+    return x + 3
+
+
+@pytest.fixture(autouse=True)
+def executor_plugins(mocker):
+    """Register the built-in executor plugins."""
+    mocker.patch.object(
+        _executor_manager,
+        "executor_plugins_map",
+        {"local": LocalExecutor, "dask": DaskExecutor},
+    )
+
+
+def _task_groups(workflow):
+    """Map the names of the non-parameter nodes to their task group ids."""
+    tg = workflow.transport_graph
+    return [
+        (tg.get_node_value(node_id, "name"), tg.get_node_value(node_id, "task_group_id"))
+        for node_id in sorted(tg._graph.nodes)
+        if not tg.get_node_value(node_id, "name").startswith(":parameter:")
+    ]
+
+
+def test_pack_linear_chains():
+    """Test that a chain of electrons is packed into one task group."""
+
+    @ct.lattice
+    def workflow(x):
+        return add_one(add_one(add_one(x)))
+
+    workflow.build_graph(1)
+    packed = pack_linear_chains(workflow.transport_graph, 16)
+
+    assert packed == {2: 0, 3: 0}
+    assert _task_groups(workflow) == [
+        ("add_one", 0),
+        ("add_one", 0),
+        ("add_one", 0),
+        (":postprocess:reconstruct", 4),
+    ]
+
+
+def test_supports_task_groups(mocker):
+    """Test that only executors supporting managed execution are packed."""
+
+    mocker.patch.object(LocalExecutor, "SUPPORTS_MANAGED_EXECUTION", False)
+
+    assert _supports_task_groups("dask")
+    assert not _supports_task_groups("local")
+    assert not _supports_task_groups("unknown")
+
+
+def test_pack_linear_chains_branches():
+    """Test that nodes with several consumers or inputs are not packed."""
+
+    @ct.lattice
+    def workflow(x):
+        res = add_one(x)
+        return add_one(res), add_one(res)
+
+    workflow.build_graph(1)
+
+    assert pack_linear_chains(workflow.transport_graph, 16) == {}
+
+
+def test_pack_linear_chains_wait_for():
+    """Test that wait-for edges other than the postprocessing node's block packing."""
+
+    @ct.lattice
+    def workflow(x):
+        res = add_one(x)
+        out = add_one(res)
+        add_one(x).wait_for(res)
+        return out
+
+    workflow.build_graph(1)
+
+    assert pack_linear_chains(workflow.transport_graph, 16) == {}
+
+
+def test_pack_linear_chains_constraints():
+    """Test that chains break at different executors and excluded nodes."""
+
+    @ct.lattice
+    def workflow(x):
+        return add_one(add_one(add_one(add_two(add_one(x)))))
+
+    workflow.build_graph(1)
+    packed = pack_linear_chains(workflow.transport_graph, 16, excluded=[4])
+
+    assert packed == {}
+
+
+def test_pack_linear_chains_max_group_size():
+    """Test that long chains are split into groups of bounded size."""
+
+    @ct.lattice
+    def workflow(x):
+        for _ in range(5):
+            x = add_one(x)
+        return x
+
+    workflow.build_graph(1)
+    pack_linear_chains(workflow.transport_graph, 2)
+
+    assert [gid for _, gid in _task_groups(workflow)[:5]] == [0, 0, 3, 3, 5]
+
+
+def test_build_graph_auto_task_packing(mocker):
+    """Test that lattices pack their graphs if auto task packing is enabled."""
+
+    def mock_get_config(key):
+        if key == "sdk.auto_task_packing":
+            return "true"
+        return get_config(key)
+
+    mocker.patch("covalent._workflow.lattice.get_config", mock_get_config)
+
+    @ct.lattice
+    def workflow(x):
+        return add_three(add_one(add_one(x)))
+
+    workflow.build_graph(1)
+
+    # The opted out electron is not packed
+    assert _task_groups(workflow)[:3] == [("add_one", 0), ("add_one", 0), ("add_three", 3)]
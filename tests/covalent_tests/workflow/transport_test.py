@@ -16,7 +16,13 @@
 
 """Unit tests for transport graph."""
 
+import base64
+import copy
+import json
+import os
+import pickle
 import platform
+import tempfile
 from unittest.mock import call
 
 import cloudpickle
@@ -32,10 +38,27 @@ from covalent._workflow.transport import (
     encode_metadata,
     pickle_modules_by_value,
 )
+from covalent._workflow.transportable_object import STRING_OFFSET_BYTES, TOArchiveUtils
 from covalent.executor import LocalExecutor
 from covalent.triggers import BaseTrigger
 
 
+class ZeroCopyByteArray(bytearray):
+    """Bytearray pickled out-of-band under protocol 5."""
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self)._reconstruct, (pickle.PickleBuffer(self),), None
+        return type(self)._reconstruct, (bytearray(self),), None
+
+    @classmethod
+    def _reconstruct(cls, obj):
+        with memoryview(obj) as m:
+            if type(m.obj) is cls:
+                return m.obj
+            return cls(m)
+
+
 def subtask(x):
     """Workflow subtask."""
 
@@ -107,7 +130,7 @@ def test_transportable_object_get_serialized(transportable_object):
     """Test serialized transportable object retrieval."""
 
     to = transportable_object
-    assert to.get_serialized() == to._object
+    assert base64.b64decode(to.get_serialized()) == to._object
 
 
 def test_transportable_object_get_deserialized(transportable_object):
@@ -177,7 +200,119 @@ def test_transportable_object_sedeser_string_only():
     ser = to.serialize()
     new_to = TransportableObject.deserialize(ser, string_only=True)
     assert new_to.object_string == to.object_string
-    assert new_to._object == ""
+    assert new_to._object == b""
+
+
+def test_transportable_object_out_of_band_buffers():
+    """Test that large buffers are kept out-of-band without copies"""
+
+    data = ZeroCopyByteArray(b"x" * 1024)
+    to = TransportableObject({"data": data})
+    assert len(to._buffers) == 1
+    assert to._buffers[0].raw().obj is data
+
+    new_to = TransportableObject.deserialize(to.serialize())
+    assert len(new_to._buffers) == 1
+    assert new_to == to
+
+    copied = new_to.get_deserialized()["data"]
+    assert copied == data
+    copied[0] = ord("y")
+    assert new_to.get_deserialized()["data"] == data
+
+    # Zero-copy loads hand the archived buffers to the unpickler as-is
+    assert new_to.get_deserialized(zero_copy=True)["data"] == data
+    assert pickle.loads(pickle.dumps(new_to)).get_deserialized() == {"data": data}
+    assert base64.b64decode(new_to.get_serialized())
+    assert TransportableObject.from_dict(new_to.to_dict()).get_deserialized() == {"data": data}
+
+
+def test_transportable_object_deserialize_v1():
+    """Test reading archives and objects from the base64 format"""
+
+    header = json.dumps({"py_version": "3.8", "attrs": {"doc": "", "name": ""}}).encode("utf-8")
+    object_string = b"123"
+    data = base64.b64encode(cloudpickle.dumps(123))
+    string_offset = 2 * STRING_OFFSET_BYTES + len(header)
+    data_offset = string_offset + len(object_string)
+    archive = (
+        string_offset.to_bytes(8, "big")
+        + data_offset.to_bytes(8, "big")
+        + header
+        + object_string
+        + data
+    )
+
+    to = TransportableObject.deserialize(archive)
+    assert to.get_deserialized() == 123
+    assert to.object_string == "123"
+    assert to.python_version == "3.8"
+    assert to.get_serialized() == data.decode("utf-8")
+
+    # Pickles of legacy objects hold the base64 string
+    legacy_state = {"_object": data.decode("utf-8"), "_object_string": "123", "_header": {}}
+    legacy_to = TransportableObject(None)
+    legacy_to.__setstate__(copy.deepcopy(legacy_state))
+    assert legacy_to.get_deserialized() == 123
+
+
+def test_transportable_object_load_lazy():
+    """Test reading sections of a stored transportable object on demand"""
+
+    to = TransportableObject([1, 2, 3])
+    ser = to.serialize()
+    data_offset, _ = TOArchiveUtils.data_byte_range(ser)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "value.tobj")
+
+        # Corrupt the data section; it must not be read for the string
+        with open(path, "wb") as f:
+            f.write(ser[:data_offset] + b"\x00" * 16)
+        lazy_to = TransportableObject.load_lazy(path)
+        assert lazy_to.object_string == to.object_string
+        assert lazy_to.header == to.header
+
+        with open(path, "wb") as f:
+            f.write(ser)
+        lazy_to = TransportableObject.load_lazy(path)
+        assert lazy_to.get_deserialized() == [1, 2, 3]
+        assert lazy_to == to
+
+        lazy_to = TransportableObject.load_lazy(path)
+        assert TransportableObject.from_dict(lazy_to.to_dict()) == to
+        lazy_to = TransportableObject.load_lazy(path)
+        assert pickle.loads(pickle.dumps(lazy_to)) == to
+
+
+def test_transportable_object_iter_object_string():
+    """Test streaming the object string of a stored transportable object"""
+
+    to = TransportableObject("x" * 1000 + "é")
+    expected = to.object_string.encode("utf-8")
+    assert b"".join(to.iter_object_string(chunk_size=7)) == expected
+
+    ser = to.serialize()
+    data_offset, _ = TOArchiveUtils.data_byte_range(ser)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "value.tobj")
+
+        # Only the string section is read
+        with open(path, "wb") as f:
+            f.write(ser[:data_offset] + b"\x00" * 16)
+        lazy_to = TransportableObject.load_lazy(path)
+        chunks = list(lazy_to.iter_object_string(chunk_size=64))
+        assert b"".join(chunks) == expected
+        assert max(len(chunk) for chunk in chunks) == 64
+        assert "_object_string" not in lazy_to.__dict__
+
+        # The string section is truncated
+        with open(path, "wb") as f:
+            f.write(ser[: data_offset - 1])
+        lazy_to = TransportableObject.load_lazy(path)
+        with pytest.raises(EOFError):
+            list(lazy_to.iter_object_string())
 
 
 def test_transportable_object_sedeser_header_only():
@@ -0,0 +1,125 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# Throughput of the dispatcher state backends
+#
+# Replays the counter traffic generated by `_handle_node_status_update`
+# for wide (one root fanning out to N leaves) and deep (a chain of N
+# tasks) graphs and reports the number of node events processed per
+# second by each backend.
+
+import asyncio
+import os
+import tempfile
+import time
+
+import yaml
+
+from covalent_dispatcher._core.dispatcher_modules.caches import (
+    InMemoryTaskGroupRunState,
+    TaskGroupRunState,
+    _InMemoryWorkflowRunState,
+    _WorkflowRunState,
+)
+from covalent_dispatcher._db.datastore import DataStore
+
+benchmark_name = "dispatcher_state"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+sizes = [10**i for i in range(1, 5)]
+
+
+def wide_graph(n):
+    """Successor lists for a root node with `n` children"""
+    return {0: list(range(1, n + 1)), **{i: [] for i in range(1, n + 1)}}
+
+
+def deep_graph(n):
+    """Successor lists for a chain of `n` nodes"""
+    return {i: [i + 1] if i < n - 1 else [] for i in range(n)}
+
+
+async def replay(successors, task_group_cache, workflow_run_cache):
+    dispatch_id = "benchmark"
+    pending = {i: 0 for i in successors}
+    for children in successors.values():
+        for child in children:
+            pending[child] += 1
+
+    for gid, num_pending in pending.items():
+        await task_group_cache.set(dispatch_id, gid, num_pending, [gid])
+    await workflow_run_cache.set_unresolved(dispatch_id, 0)
+
+    ready = [gid for gid, num_pending in pending.items() if num_pending == 0]
+    await workflow_run_cache.increment(dispatch_id, len(ready))
+
+    num_events = 0
+    start = time.perf_counter()
+    while ready:
+        node_id = ready.pop()
+        for child in successors[node_id]:
+            if await task_group_cache.decrement(dispatch_id, child) < 1:
+                sorted_nodes = await task_group_cache.get_task_group(dispatch_id, child)
+                await workflow_run_cache.increment(dispatch_id, len(sorted_nodes))
+                ready.append(child)
+        await workflow_run_cache.decrement(dispatch_id)
+        await workflow_run_cache.get_unresolved(dispatch_id)
+        num_events += 1
+    elapsed = time.perf_counter() - start
+
+    await workflow_run_cache.remove(dispatch_id)
+    for gid in successors:
+        await task_group_cache.remove(dispatch_id, gid)
+
+    return num_events / elapsed
+
+
+async def main():
+    with tempfile.NamedTemporaryFile(mode="w+b", suffix=".db") as db_file:
+        db = DataStore(db_URL=f"sqlite+pysqlite:///{db_file.name}", initialize_db=True)
+
+        backends = {
+            "memory": lambda: (InMemoryTaskGroupRunState(), _InMemoryWorkflowRunState()),
+            "sql": lambda: (TaskGroupRunState(db), _WorkflowRunState(db)),
+        }
+
+        for shape, make_graph in [("wide", wide_graph), ("deep", deep_graph)]:
+            for n in sizes:
+                for backend, make_caches in backends.items():
+                    # The SQL backend is too slow for the largest graphs
+                    if backend == "sql" and n > 1000:
+                        continue
+                    events_per_sec = await replay(make_graph(n), *make_caches())
+                    print(f"{shape} n={n} {backend}: {events_per_sec:.0f} events/s")
+                    filename = f"{benchmark_dir}/{shape}_{n}_{backend}.yaml"
+                    with open(filename, "w") as f:
+                        yaml.dump(
+                            {
+                                "shape": shape,
+                                "n": n,
+                                "backend": backend,
+                                "events_per_sec": events_per_sec,
+                            },
+                            f,
+                        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
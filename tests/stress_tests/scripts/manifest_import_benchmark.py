@@ -0,0 +1,103 @@
+# Copyright 2024 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+# Registration time of large workflow manifests
+#
+# Imports synthetic manifests of N independent tasks into a fresh SQLite
+# database and reports the time taken by `import_result`, which
+# inserts the job, electron, asset, asset link, and edge records.
+
+import os
+import tempfile
+import time
+
+import yaml
+
+import covalent as ct
+import covalent_dispatcher._dal.base as dal_base
+from covalent._results_manager.result import Result
+from covalent._serialize.result import serialize_result
+from covalent._shared_files.schemas.edge import EdgeMetadata, EdgeSchema
+from covalent_dispatcher._dal.importers.result import import_result
+from covalent_dispatcher._db.datastore import DataStore
+
+benchmark_name = "manifest_import"
+benchmark_dir = f"benchmark_results/{benchmark_name}/current"
+
+if not os.path.isdir(benchmark_dir):
+    os.makedirs(benchmark_dir)
+
+sizes = [10**i for i in range(2, 6)]
+
+
+@ct.electron
+def task(x):
+    return x
+
+
+@ct.lattice
+def workflow(x):
+    return task(task(x))
+
+
+def synthetic_manifest(dispatch_id, n, staging_dir):
+    """Manifest of `n` copies of a task, each depending on the previous one"""
+
+    workflow.build_graph(1)
+    manifest = serialize_result(Result(workflow, dispatch_id=dispatch_id), staging_dir)
+    tg = manifest.lattice.transport_graph
+    template = tg.nodes[0]
+
+    nodes = []
+    for i in range(n):
+        node = template.model_copy(deep=True)
+        node.id = i
+        node.metadata.task_group_id = i
+        nodes.append(node)
+
+    tg.nodes = nodes
+    tg.links = [
+        EdgeSchema(source=i, target=i + 1, metadata=EdgeMetadata(edge_name="x", arg_index=0))
+        for i in range(n - 1)
+    ]
+    return manifest
+
+
+def main():
+    for n in sizes:
+        with (
+            tempfile.NamedTemporaryFile(suffix=".db") as db_file,
+            tempfile.TemporaryDirectory() as staging_dir,
+            tempfile.TemporaryDirectory() as results_dir,
+        ):
+            dal_base.workflow_db = DataStore(
+                db_URL=f"sqlite+pysqlite:///{db_file.name}", initialize_db=True
+            )
+            dispatch_id = f"benchmark_{n}"
+            manifest = synthetic_manifest(dispatch_id, n, staging_dir)
+
+            start = time.perf_counter()
+            import_result(manifest, results_dir, None)
+            elapsed = time.perf_counter() - start
+
+        print(f"n={n}: {elapsed:.2f} s")
+        with open(f"{benchmark_dir}/import_{n}.yaml", "w") as f:
+            yaml.dump({"n": n, "seconds": elapsed}, f)
+
+
+if __name__ == "__main__":
+    main()